@@ -24,6 +24,7 @@ except ImportError:
 
 from .alias import Alias
 from .logger import active_logger
+from .name_index import NameIndex
 from .net import NET_PREFIX, Net
 from .design_class import NetClasses
 from .netpinlist import NetPinList
@@ -299,9 +300,12 @@ class Bus(SkidlBaseObject):
         )
 
         for attr, name, do_str_match in search_params:
-            buses = filter_list(
-                circuit.buses, do_str_match=do_str_match, **{attr: name}
-            )
+            if NameIndex.is_searchable(name):
+                buses = circuit.bus_names.get(attr, name)
+            else:
+                buses = filter_list(
+                    circuit.buses, do_str_match=do_str_match, **{attr: name}
+                )
             if buses:
                 return list_or_scalar(buses)
 
@@ -626,6 +630,12 @@ class Bus(SkidlBaseObject):
         """
         super(Bus, type(self)).name.fdel(self)
 
+    def _names_changed(self):
+        """Update the index of bus names in the circuit after the name or aliases change."""
+        circuit = self.__dict__.get("circuit")
+        if circuit is not None and self in circuit.bus_names:
+            circuit.bus_names.add(self)
+
     @property
     def width(self):
         """
@@ -26,16 +26,18 @@ except ImportError:
     pass
 
 from .bus import Bus
+from .connectivity import Connectivity
 from .design_class import NetClasses, PartClasses
 from .erc import dflt_circuit_erc
 from .logger import active_logger, erc_logger, stop_log_file_output
+from .name_index import NameIndex
 from .net import NCNet, Net
 from .node import Node
 from .part import Part, PartUnit
 from .pckg_info import __version__
 from .pin import pin_types
-from .schlib import SchLib
-from .scriptinfo import get_script_dir, get_script_name, get_skidl_trace
+from .schlib import SchLib, write_backup_lib
+from .scriptinfo import get_creation_trace, get_script_dir, get_script_name
 from .skidlbaseobj import SkidlBaseObject
 from .utilities import (
     detect_os,
@@ -165,6 +167,14 @@ class Circuit(SkidlBaseObject):
         self.nets = []
         self.buses = []
         self.interfaces = []
+        self.connectivity = Connectivity()  # Index of connected nets and pins.
+        self._distinct_nets = None  # Cached result of get_nets().
+        self._erc_results = {}  # Net/part -> messages from its last incremental ERC.
+        self._erc_dirty = set()  # Nets, pins and parts changed since the last ERC.
+        # Indexes for looking up parts, nets and buses by name.
+        self.part_names = NameIndex("ref", "aliases")
+        self.net_names = NameIndex("name", "aliases")
+        self.bus_names = NameIndex("name", "aliases")
         self._netclasses = NetClasses()
         self._partclasses = PartClasses()
         self.nodes = set()  # Set of all nodes in the circuit hierarchy.
@@ -209,6 +219,11 @@ class Circuit(SkidlBaseObject):
         # Also clear any cached libraries.
         SchLib.reset()
 
+        # Forget the sheet paths remembered for the hierarchy of the old circuitry.
+        from .tools.kicad_sheetpath import clear_sheetpath_caches
+
+        clear_sheetpath_caches()
+
         # Clear out any old backup lib so the new one will get reloaded when it's needed.
         config.backup_lib = None
 
@@ -350,13 +365,18 @@ class Circuit(SkidlBaseObject):
     def add_parts(self, *parts):
         """
         Add parts to the circuit.
-        
+
+        Parts added together (like the copies made by Part.copy()) share a
+        single creation trace and are added to the active node in one step.
+
         Args:
             *parts: Part objects to add to the circuit.
             
         Raises:
             ValueError: If attempting to add an unmovable part.
         """
+        added_parts = []
+        trace = None
         for part in parts:
             # Add the part to this circuit if the part is movable and
             # it's not already in this circuit.
@@ -371,20 +391,27 @@ class Circuit(SkidlBaseObject):
                     part.circuit = self  # Record the Circuit object for this part.
                     part.ref = part.ref  # Adjusts the part reference if necessary.
 
-                    # Add the part to the currently active node.
-                    self.active_node.parts.append(part)
+                    # Record the currently active node for the part.
                     part.node = self.active_node
 
                     # Store part instantiation trace.
-                    part.skidl_trace = get_skidl_trace()
+                    if trace is None:
+                        trace = get_creation_trace()
+                    part.skidl_trace = trace
 
                     self.parts.append(part)
+                    self.part_names.add(part)
+                    added_parts.append(part)
+                    self.erc_changed(part)
                 else:
                     active_logger.raise_(
                         ValueError,
                         f"Can't add unmovable part {part.ref} to this circuit.",
                     )
 
+        # Add the parts to the currently active node.
+        self.active_node.parts.extend(added_parts)
+
     def rmv_parts(self, *parts):
         """
         Remove parts from the circuit.
@@ -404,6 +431,8 @@ class Circuit(SkidlBaseObject):
                     part.circuit = None
                     part.hierarchy = None
                     self.parts.remove(part)
+                    self.part_names.remove(part)
+                    self.erc_changed(part)
                 else:
                     active_logger.warning(
                         f"Removing non-existent part {part.ref} from this circuit."
@@ -445,9 +474,12 @@ class Circuit(SkidlBaseObject):
                     net.node = self.active_node
 
                     # Store net instantiation trace.
-                    net.skidl_trace = get_skidl_trace()
+                    net.skidl_trace = get_creation_trace()
 
                     self.nets.append(net)
+                    self.net_names.add(net)
+                    self._distinct_nets = None
+                    self.erc_changed(net)
 
                 else:
                     active_logger.raise_(
@@ -470,9 +502,13 @@ class Circuit(SkidlBaseObject):
                 if net.circuit == self and net in self.nets:
                     net.node.nets.remove(net)
                     net.node = None
+                    self.erc_changed(net, *net._pins)
+                    self.connectivity.discard(net)
                     net.circuit = None
                     net.hierarchy = None
                     self.nets.remove(net)
+                    self.net_names.remove(net)
+                    self._distinct_nets = None
                 else:
                     active_logger.warning(
                         f"Removing non-existent net {net.name} from this circuit."
@@ -515,10 +551,11 @@ class Circuit(SkidlBaseObject):
                     bus.node = self.active_node
 
                     # Store bus instantiation trace.
-                    bus.skidl_trace = get_skidl_trace()
+                    bus.skidl_trace = get_creation_trace()
 
                     # Add the bus to the circuit.
                     self.buses.append(bus)
+                    self.bus_names.add(bus)
 
                     # Add the individual bus nets to the circuit.
                     for net in bus.nets:
@@ -542,6 +579,7 @@ class Circuit(SkidlBaseObject):
                     bus.circuit = None
                     bus.hierarchy = None
                     self.buses.remove(bus)
+                    self.bus_names.remove(bus)
                     for net in bus.nets:
                         self -= net
                 else:
@@ -615,13 +653,23 @@ class Circuit(SkidlBaseObject):
         Get all distinct nets in the circuit.
         
         This excludes the no-connect net, empty nets, and nets that are electrically
-        connected to other nets already in the result list.
+        connected to other nets already in the result list. Nets are grouped by
+        their key in the circuit connectivity index, so this takes a single pass
+        over the nets. The result is cached until nets are added to or removed from
+        the circuit or connections between nets and pins are changed.
         
         Returns:
             list: List of distinct nets in the circuit.
         """
 
+        connectivity = self.connectivity
+        if self._distinct_nets is not None:
+            distinct_nets, version = self._distinct_nets
+            if version == connectivity.version:
+                return list(distinct_nets)
+
         distinct_nets = []
+        groups = set()
         for net in self.nets:
             if net is self.NC:
                 # Exclude no-connect net.
@@ -629,15 +677,17 @@ class Circuit(SkidlBaseObject):
             if not net.pins:
                 # Exclude empty nets with no attached pins.
                 continue
-            for n in distinct_nets:
-                # Exclude net if its already attached to a previously selected net.
-                if net.is_attached(n):
-                    break
-            else:
-                # This net is not attached to any of the other distinct nets,
-                # so it is also distinct.
-                distinct_nets.append(net)
-        return distinct_nets
+            group = connectivity.group(net)
+            if group in groups:
+                # Exclude net if it's attached to a previously selected net.
+                continue
+            # This net is not attached to any of the other distinct nets,
+            # so it is also distinct.
+            groups.add(group)
+            distinct_nets.append(net)
+
+        self._distinct_nets = (distinct_nets, connectivity.version)
+        return list(distinct_nets)
 
     def merge_net_names(self):
         """
@@ -677,6 +727,22 @@ class Circuit(SkidlBaseObject):
 
         # Remove merged nets from the circuit.
         self.nets = list(set(self.nets) - merged_nets)
+        for net in merged_nets:
+            self.net_names.remove(net)
+        self._distinct_nets = None
+
+    def erc_changed(self, *objs):
+        """
+        Record nets, pins or parts that changed so an incremental ERC rechecks them.
+
+        Changes are only recorded after an incremental ERC has stored the
+        results it will reuse.
+
+        Args:
+            *objs: Nets, pins or parts that were changed.
+        """
+        if self._erc_results:
+            self._erc_dirty.update(objs)
 
     def ERC(self, *args, **kwargs):
         """
@@ -688,7 +754,8 @@ class Circuit(SkidlBaseObject):
         
         Args:
             *args: Arguments to pass to the ERC functions.
-            **kwargs: Keyword arguments to pass to the ERC functions.
+            **kwargs: Keyword arguments to pass to the ERC functions. The workers
+                and incremental options are only passed to dflt_circuit_erc().
         """
 
         # Save the currently active logger and activate the ERC logger.
@@ -710,6 +777,25 @@ class Circuit(SkidlBaseObject):
         # Restore the logger that was active before the ERC.
         active_logger.pop()
 
+    def _exec_erc_functions(self, *args, workers=None, incremental=False, **kwargs):
+        """
+        Execute the ERC functions of the circuit.
+
+        Only the default circuit ERC takes the workers and incremental options,
+        so ERC functions added with add_erc_function() are called without them.
+
+        Args:
+            *args: Arbitrary argument list passed to each ERC function.
+            workers (int, optional): Number of threads used by dflt_circuit_erc().
+            incremental (bool, optional): Make dflt_circuit_erc() only recheck what changed.
+            **kwargs: Arbitrary keyword arguments passed to each ERC function.
+        """
+        for f in self.erc_list:
+            if f is dflt_circuit_erc:
+                f(self, *args, workers=workers, incremental=incremental, **kwargs)
+            else:
+                f(self, *args, **kwargs)
+
     def cull_unconnected_parts(self):
         """
         Remove parts that aren't connected to anything in the circuit.
@@ -758,10 +844,13 @@ class Circuit(SkidlBaseObject):
             file_ (str or file object, optional): Same as file arg. Kept for backward compatibility.
             tool (str, optional): The EDA tool to generate the netlist for.
             do_backup (bool, optional): If True, create a library with all parts in the circuit.
+            stream (bool, optional): If True, write the netlist directly to the file
+                as it's generated instead of holding all of it in memory. Only tools
+                with a netlist writer (like KiCad) support this. Defaults to False.
             **kwargs: Additional arguments passed to the tool-specific netlist generator.
             
         Returns:
-            str: The generated netlist as a string.
+            str: The generated netlist as a string or None if the netlist was streamed to the file.
         """
 
         from . import skidl
@@ -785,16 +874,25 @@ class Circuit(SkidlBaseObject):
         tool = kwargs.pop("tool", skidl.config.tool)
         file_ = kwargs.pop("file_", kwargs.pop("file", None))
         do_backup = kwargs.pop("do_backup", True)
+        stream = kwargs.pop("stream", False)
 
         # Pass these settings from the Circuit object if they are not already set.
         kwargs["track_abs_path"] = kwargs.get("track_abs_path", self.track_abs_path)
         kwargs["track_src"] = kwargs.get("track_src", self.track_src)
 
-        netlist = tool_modules[tool].gen_netlist(self, **kwargs)
+        write_netlist = getattr(tool_modules[tool], "write_netlist", None)
+        stream = stream and write_netlist and not self.no_files
+        if stream:
+            # Write the netlist to the file as it's generated.
+            netlist = None
+            with opened(file_ or (get_script_name() + ".net"), "w") as f:
+                write_netlist(self, f, **kwargs)
+        else:
+            netlist = tool_modules[tool].gen_netlist(self, **kwargs)
 
         active_logger.report_summary("generating netlist")
 
-        if not self.no_files:
+        if not (stream or self.no_files):
             with opened(file_ or (get_script_name() + ".net"), "w") as f:
                 f.write(str(netlist))
 
@@ -849,16 +947,19 @@ class Circuit(SkidlBaseObject):
 
         active_logger.report_summary("creating PCB")
 
-    def generate_xml(self, file_=None, tool=None):
+    def generate_xml(self, file_=None, tool=None, stream=False):
         """
         Generate an XML representation of the circuit.
         
         Args:
             file_ (str or file object, optional): File to write XML data to.
             tool (str, optional): Backend tool to use for XML generation.
+            stream (bool, optional): If True, write the XML directly to the file
+                as it's generated instead of holding all of it in memory. Only tools
+                with an XML writer (like KiCad) support this. Defaults to False.
             
         Returns:
-            str: The generated XML as a string.
+            str: The generated XML as a string or None if the XML was streamed to the file.
         """
 
         from . import skidl
@@ -871,9 +972,18 @@ class Circuit(SkidlBaseObject):
         self.merge_net_names()
 
         tool = tool or skidl.config.tool
-        netlist = tool_modules[tool].gen_xml(self)
 
-        if not self.no_files:
+        write_xml = getattr(tool_modules[tool], "write_xml", None)
+        stream = stream and write_xml and not self.no_files
+        if stream:
+            # Write the XML to the file as it's generated.
+            netlist = None
+            with opened(file_ or (get_script_name() + ".xml"), "w") as f:
+                write_xml(self, f)
+        else:
+            netlist = tool_modules[tool].gen_xml(self)
+
+        if not (stream or self.no_files):
             with opened(file_ or (get_script_name() + ".xml"), "w") as f:
                 f.write(netlist)
 
@@ -1427,7 +1537,9 @@ class Circuit(SkidlBaseObject):
         Save all parts in the circuit as a SKiDL library file.
         
         This creates a backup library that can be used to restore the parts
-        in the circuit.
+        in the circuit. Only the parts that aren't already in an existing
+        backup library are exported, and the library file is only rewritten
+        if it changes.
         
         Args:
             file_ (str or file object, optional): File to write the library to.
@@ -1435,20 +1547,15 @@ class Circuit(SkidlBaseObject):
         """
 
         from . import skidl
-        from skidl import SKIDL
 
         if self.no_files:
             return
 
         self.merge_net_names()
 
-        lib = SchLib(tool=SKIDL)  # Create empty library.
-        for p in self.parts:
-            lib += p
-
         file_ = file_ or skidl.config.backup_lib_file_name
 
-        lib.export(libname=skidl.config.backup_lib_name, file_=file_)
+        write_backup_lib(self.parts, skidl.config.backup_lib_name, file_)
 
     def to_tuple(self):
         """
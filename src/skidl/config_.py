@@ -192,6 +192,11 @@ class SkidlConfig(Config):
         # Make the directory.
         os.makedirs(self.part_search_db_dir, exist_ok=True)
 
+        # If no configuration files were found, set default directory for the SVG of part
+        # symbols that are stored for later runs. (It's made when SVG is first stored.)
+        if "svg_cache_dir" not in self:
+            self.svg_cache_dir = os.path.join(self.skidl_storage_dir, "svg_cache_dir")
+
         # If no configuration files were found, set some default part lib search paths.
         if "lib_search_paths" not in self:
             self["lib_search_paths"] = {
@@ -208,6 +213,23 @@ class SkidlConfig(Config):
         if "backup_lib" not in self:
             self.backup_lib = None
 
+        # If no configuration files were found, record where parts, nets, etc. are created.
+        if "record_trace" not in self:
+            self.record_trace = True
+
+        # If no configuration files were found, load all the parts of a library file at once.
+        if "lazy_libs" not in self:
+            self.lazy_libs = False
+
+        # If no configuration files were found, check the circuit on a single thread during ERC.
+        if "erc_workers" not in self:
+            self.erc_workers = 1
+
+        # If no configuration files were found, scan libraries for the part search DB
+        # in this process.
+        if "part_search_workers" not in self:
+            self.part_search_workers = 1
+
         # If no configuration files were found, set some default footprint search paths.
         if "footprint_search_paths" not in self:
             self["footprint_search_paths"] = {
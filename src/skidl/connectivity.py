@@ -0,0 +1,278 @@
+# -*- coding: utf-8 -*-
+
+# The MIT License (MIT) - Copyright (c) Dave Vandenbout.
+
+"""
+Connectivity index for the nets and pins of a circuit.
+
+This module provides the Connectivity class, a disjoint-set (union-find) structure
+owned by each Circuit that tracks which nets and pins are electrically connected.
+Connections are merged incrementally as pins are attached to nets and as nets are
+joined together, so queries like Net.pins, Net.nets and Net.is_attached() can be
+answered in near-constant time instead of re-traversing the net/pin graph.
+
+Union-find structures can't split a set, so disconnecting a pin from a net just
+marks its group as dirty. The group is rebuilt from the actual net/pin links the
+next time one of its members is queried.
+"""
+
+import collections
+
+from .pin import PhantomPin
+from .utilities import export_to_all
+
+
+__all__ = ["Traversal"]
+
+# Lists of all the nets and pins that are electrically connected to each other.
+Traversal = collections.namedtuple("Traversal", ["nets", "pins"])
+
+
+@export_to_all
+class Connectivity(object):
+    """
+    Disjoint-set index of the electrically-connected groups of nets and pins.
+
+    Each group is identified by a root object. Along with the parent links used
+    by the union-find algorithm, the index stores the nets and pins in each group
+    so the members of a group can be returned without a traversal.
+    """
+
+    def __init__(self):
+        self._parent = {}  # Links from each net/pin to its parent in the group tree.
+        self._nets = {}  # Root -> ordered dict of the nets in the group.
+        self._pins = {}  # Root -> ordered dict of the pins in the group.
+        self._dirty = set()  # Roots of groups that must be rebuilt before use.
+        self._traversals = {}  # Root -> cached Traversal of the group.
+        self.version = 0  # Incremented whenever a connection is made or removed.
+
+    def __contains__(self, obj):
+        """Return True if the net or pin is recorded in the index."""
+        return obj in self._parent
+
+    def _find(self, obj):
+        """
+        Return the root of the group containing a net or pin.
+
+        Args:
+            obj (Net, Pin): Net or pin to look up.
+
+        Returns:
+            Net, Pin or None: The root of the group, or None if obj isn't in the index.
+        """
+        parent = self._parent
+        if obj not in parent:
+            return None
+        # Find the root while halving the length of the path to it.
+        while True:
+            up = parent[obj]
+            if up is obj:
+                return obj
+            up_up = parent[up]
+            parent[obj] = up_up
+            obj = up_up
+
+    def _add(self, obj, is_net):
+        """Add a net or pin to the index as a group with a single member."""
+        self._parent[obj] = obj
+        self._nets[obj] = {obj: None} if is_net else {}
+        self._pins[obj] = {} if is_net else {obj: None}
+        return obj
+
+    def _union(self, root1, root2):
+        """
+        Merge two groups and return the root of the merged group.
+
+        The smaller group is always merged into the larger one to keep the
+        group trees shallow.
+        """
+        if root1 is root2:
+            return root1
+        size1 = len(self._nets[root1]) + len(self._pins[root1])
+        size2 = len(self._nets[root2]) + len(self._pins[root2])
+        if size1 < size2:
+            root1, root2 = root2, root1
+        self._parent[root2] = root1
+        self._nets[root1].update(self._nets.pop(root2))
+        self._pins[root1].update(self._pins.pop(root2))
+        self._traversals.pop(root1, None)
+        self._traversals.pop(root2, None)
+        if root2 in self._dirty:
+            # A dirty group contaminates the group it's merged into.
+            self._dirty.discard(root2)
+            self._dirty.add(root1)
+        return root1
+
+    def _rebuild(self, root):
+        """
+        Rebuild a dirty group from the net-to-pin links of its nets.
+
+        Pins may have been removed from the nets of the group, so it may split
+        into several groups. Pins that are no longer on any net are dropped
+        from the index.
+        """
+        nets = self._nets.pop(root)
+        pins = self._pins.pop(root)
+        self._dirty.discard(root)
+        self._traversals.pop(root, None)
+        for obj in nets:
+            del self._parent[obj]
+        for obj in pins:
+            del self._parent[obj]
+
+        # Disconnecting pins can only split a group, so only the nets that
+        # were in the group need to be examined.
+        for net in nets:
+            self._add(net, is_net=True)
+        for net in nets:
+            for pin in net._pins:
+                self.connect(net, pin)
+
+    def _clean_find(self, obj):
+        """Return the root of the group containing obj after rebuilding it if it's dirty."""
+        root = self._find(obj)
+        if root in self._dirty:
+            self._rebuild(root)
+            root = self._find(obj)
+        return root
+
+    def connect(self, net, pin):
+        """
+        Record that a pin has been attached to a net.
+
+        Args:
+            net (Net): The net the pin was attached to.
+            pin (Pin): The pin that was attached.
+        """
+        self.version += 1
+        net_root = self._find(net)
+        if net_root is None:
+            net_root = self._add(net, is_net=True)
+        pin_root = self._find(pin)
+        if pin_root is None:
+            # Add a new pin straight to the group of the net.
+            self._parent[pin] = net_root
+            self._pins[net_root][pin] = None
+            self._traversals.pop(net_root, None)
+            return
+        self._union(net_root, pin_root)
+
+    def disconnect(self, net, pin):
+        """
+        Record that a pin has been removed from a net.
+
+        The group containing the net is marked dirty and will be rebuilt
+        the next time it is queried.
+
+        Args:
+            net (Net): The net the pin was removed from.
+            pin (Pin): The pin that was removed.
+        """
+        self.version += 1
+        root = self._find(net)
+        if root is None:
+            return
+        self._dirty.add(root)
+        self._traversals.pop(root, None)
+
+    def discard(self, net):
+        """
+        Remove a net from the index if it isn't connected to anything.
+
+        Args:
+            net (Net): The net to remove.
+        """
+        root = self._clean_find(net)
+        if root is None:
+            return
+        if len(self._nets[root]) == 1 and not self._pins[root]:
+            del self._parent[net]
+            del self._nets[net]
+            del self._pins[net]
+            self._traversals.pop(net, None)
+            self.version += 1
+
+    def group(self, obj):
+        """
+        Return a key that is the same for all the nets and pins connected to obj.
+
+        Args:
+            obj (Net, Pin): Net or pin to look up.
+
+        Returns:
+            Net or Pin: The root of the group containing obj, or obj itself
+                if it isn't connected to anything.
+        """
+        root = self._clean_find(obj)
+        return obj if root is None else root
+
+    def traverse(self, net):
+        """
+        Return all the nets and pins that are electrically connected to a net.
+
+        Args:
+            net (Net): The net whose connections are requested.
+
+        Returns:
+            Traversal: Lists of the connected nets (including net) and pins.
+                Phantom pins used to tie nets together are not included.
+        """
+        root = self._clean_find(net)
+        if root is None:
+            return Traversal(nets=[net], pins=[])
+        try:
+            return self._traversals[root]
+        except KeyError:
+            pass
+        trv = Traversal(
+            nets=list(self._nets[root]),
+            pins=[p for p in self._pins[root] if not isinstance(p, PhantomPin)],
+        )
+        self._traversals[root] = trv
+        return trv
+
+    def is_attached(self, obj1, obj2):
+        """
+        Return True if two nets or pins are electrically connected.
+
+        Args:
+            obj1 (Net, Pin): First net or pin.
+            obj2 (Net, Pin): Second net or pin.
+
+        Returns:
+            bool: True if both objects are in the same connected group.
+        """
+        if obj1 is obj2:
+            return True
+        root = self._clean_find(obj1)
+        return root is not None and root is self._clean_find(obj2)
+
+
+def traverse(net):
+    """
+    Find all the nets and pins connected to a net by searching the net/pin links.
+
+    This is used for nets that aren't part of a Circuit and so have no
+    connectivity index to consult.
+
+    Args:
+        net (Net): The net whose connections are requested.
+
+    Returns:
+        Traversal: Lists of the connected nets (including net) and pins.
+    """
+    nets = {net: None}
+    pins = {}
+    frontier = [net]
+    while frontier:
+        for pin in frontier.pop()._pins:
+            if pin in pins:
+                continue
+            pins[pin] = None
+            for n in pin.nets:
+                if n not in nets:
+                    nets[n] = None
+                    frontier.append(n)
+    return Traversal(
+        nets=list(nets), pins=[p for p in pins if not isinstance(p, PhantomPin)]
+    )
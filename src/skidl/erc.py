@@ -15,8 +15,15 @@ from .logger import active_logger
 from .utilities import export_to_all
 
 
+# Maximum number of pins from each group listed in a pin conflict message.
+MAX_CONFLICT_PINS = 10
+
+# Logger counters of the messages that are stored by an incremental ERC.
+ERC_COUNTERS = ("error", "warning", "bare_error", "bare_warning")
+
+
 @export_to_all
-def dflt_circuit_erc(circuit):
+def dflt_circuit_erc(circuit, workers=None, incremental=False):
     """
     Perform electrical rules check on an entire circuit.
     
@@ -26,24 +33,244 @@ def dflt_circuit_erc(circuit):
     
     Args:
         circuit (Circuit): The circuit to check for rule violations.
+        workers (int, optional): Number of threads used to check the nets,
+            parts and interfaces. The messages are output in the same order
+            as when they're checked one after another. Defaults to
+            skidl.config.erc_workers.
+        incremental (bool, optional): If true, only recheck the nets and parts
+            that changed since the last incremental ERC along with the nets and
+            parts connected to them. The messages stored for everything else
+            are output again. Defaults to False.
     """
 
+    import skidl
     from .net import Net
 
     # Check the nets for errors:
     #   1. Merge all multi-segment nets.
-    #   2. Find the set of unique net names.
+    #   2. Find the unique net names in the order the nets were created.
     #   3. Get the net associated with each name and do an ERC on it.
     # This prevents flagging the same error multiple times by running
     # ERC on different segments of a multi-segment net.
     circuit.merge_net_names()
-    net_names = set([net.name for net in circuit.nets])
-    for name in net_names:
-        Net.get(name, circuit=circuit).ERC()
+    net_names = dict.fromkeys(net.name for net in circuit.nets)
+    nets = [Net.get(name, circuit=circuit) for name in net_names]
+
+    # Check parts & interfaces for errors after the nets.
+    pieces = nets + circuit.parts + circuit.interfaces
+
+    workers = workers or skidl.config.get("erc_workers", 1)
+    if incremental:
+        _incremental_erc(circuit, nets, pieces, workers)
+        return
+
+    # A full check makes any stored results from incremental checks stale.
+    circuit._erc_results.clear()
+    circuit._erc_dirty.clear()
+
+    if workers > 1 and len(pieces) > 1:
+        _parallel_erc(nets, pieces, workers)
+    else:
+        for piece in pieces:
+            piece.ERC()
+
+
+def _erc_batch(holder, check, batch):
+    """
+    Check a batch of objects, stopping at the first one that raises an exception.
+
+    Args:
+        holder (LogRecordHolder): Holds the messages logged for each object.
+        check (function): Checks an object given its index and the object.
+        batch (list): (index, object) pairs of the objects to check.
+
+    Returns:
+        tuple or None: (index, exception) for the object that raised an exception.
+    """
+    for index, piece in batch:
+        try:
+            holder.run(index, check, index, piece)
+        except Exception as e:
+            return index, e
+    return None
+
+
+def _held_erc(nets, tasks, workers, check=lambda index, piece: piece.ERC()):
+    """
+    Check objects and hold the messages logged for each one.
+
+    Args:
+        nets (list): The nets among the objects.
+        tasks (list): (index, object) pairs of the objects to check.
+        workers (int): Number of threads.
+        check (function, optional): Checks an object given its index and the object.
+            Defaults to running the object's ERC.
+
+    Returns:
+        tuple: The LogRecordHolder with the messages for each index and the
+            (index, exception) for the first object that raised an exception
+            or None if all the checks finished.
+    """
+
+    from concurrent.futures import ThreadPoolExecutor
+    from functools import partial
+
+    from .logger import LogRecordHolder
+
+    with LogRecordHolder(active_logger.current_logger) as holder:
+        if workers > 1 and len(tasks) > 1:
+            # Update the connections of the nets now so the checks only read them.
+            for net in nets:
+                net.pins
+
+            # Split the objects into contiguous batches, several for each thread.
+            batch_size = max(1, -(-len(tasks) // (workers * 4)))
+            batches = [tasks[i : i + batch_size] for i in range(0, len(tasks), batch_size)]
+
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                failures = [
+                    f for f in pool.map(partial(_erc_batch, holder, check), batches) if f
+                ]
+        else:
+            failures = [f for f in [_erc_batch(holder, check, tasks)] if f]
+
+    return holder, min(failures, key=lambda f: f[0], default=None)
+
+
+def _parallel_erc(nets, pieces, workers):
+    """
+    Check objects in batches on a pool of threads.
+
+    The messages logged for each object are held until all the checks are done
+    and then output in the same order as a serial check. If a check raises an
+    exception, the messages up to and including that check are output and the
+    exception is re-raised just as if the checks had been run serially.
+
+    Args:
+        nets (list): The nets among the objects.
+        pieces (list): Nets, parts and interfaces to check.
+        workers (int): Number of threads.
+    """
+
+    holder, failure = _held_erc(nets, list(enumerate(pieces)), workers)
+
+    # Output the messages in order up to the first object that failed its check.
+    fail_index, exc = failure or (len(pieces) - 1, None)
+    for index in range(fail_index + 1):
+        holder.release(index)
+    if exc:
+        raise exc
+
+
+def _erc_recheck(dirty):
+    """
+    Find the nets and parts whose ERC results may be changed by a set of changed objects.
+
+    Args:
+        dirty (set): Nets, pins and parts that changed.
 
-    # Check parts & interfaces for errors:
-    for piece in circuit.parts + circuit.interfaces:
-        piece.ERC()
+    Returns:
+        set: The changed nets and parts, every segment of the changed nets, and
+            the nets and parts connected to them.
+    """
+
+    from .net import Net
+    from .pin import Pin
+
+    # Changes to a pin or part affect the checks of the part and its nets.
+    nets = set()
+    recheck = set()
+    for obj in dirty:
+        if isinstance(obj, Pin):
+            if obj.part is not None:
+                recheck.add(obj.part)
+            nets.update(obj.nets)
+        elif isinstance(obj, Net):
+            nets.add(obj)
+        else:
+            recheck.add(obj)
+            nets.update(net for pin in obj.pins for net in pin.nets)
+
+    # Changes to a net affect the checks of all its segments and its parts.
+    for net in nets:
+        recheck.add(net)
+        if net.circuit is None:
+            continue  # Net was removed from the circuit.
+        for segment in net.nets:
+            recheck.add(segment)
+        for pin in net.pins:
+            if pin.part is not None:
+                recheck.add(pin.part)
+    return recheck
+
+
+def _incremental_erc(circuit, nets, pieces, workers):
+    """
+    Check the objects that changed since the last incremental ERC and reuse the results for the rest.
+
+    The messages from checking each net and part are stored in the circuit
+    along with the number of errors and warnings (which also counts messages
+    that were filtered out by the logger level). Objects that aren't stored,
+    or that are affected by changes recorded since then, are checked again.
+    The messages for all the objects are output in the same order as a full
+    check and added to the error and warning counts. Interfaces are always
+    checked.
+
+    Args:
+        circuit (Circuit): The circuit being checked.
+        nets (list): The nets among the objects.
+        pieces (list): Nets, parts and interfaces to check.
+        workers (int): Number of threads.
+    """
+
+    from .interface import Interface
+
+    results = circuit._erc_results
+    recheck = _erc_recheck(circuit._erc_dirty)
+    circuit._erc_dirty.clear()
+
+    tasks = [
+        (index, piece)
+        for index, piece in enumerate(pieces)
+        if piece in recheck or piece not in results
+    ]
+    counters = [getattr(active_logger, name) for name in ERC_COUNTERS]
+    counts = {}
+
+    def check(index, piece):
+        # Count the messages from this check using the counts of the thread running it.
+        before = [counter.thread_count for counter in counters]
+        try:
+            piece.ERC()
+        finally:
+            counts[index] = [c.thread_count - b for c, b in zip(counters, before)]
+
+    holder, failure = _held_erc(nets, tasks, workers, check)
+    fail_index, exc = failure or (len(pieces) - 1, None)
+
+    # Output the new or stored messages in order up to the first object that failed its check.
+    logger = active_logger.current_logger
+    for index, piece in enumerate(pieces[: fail_index + 1]):
+        if index in counts:
+            records = holder.take(index)
+            if not isinstance(piece, Interface):
+                results[piece] = records, counts[index]
+        else:
+            # Stored messages weren't logged through the counters so count them here.
+            records, num_calls = results[piece]
+            for counter, num in zip(counters, num_calls):
+                counter.add(num)
+        for record in records:
+            logger.handle(record)
+
+    if exc:
+        # Start over with a full check next time.
+        results.clear()
+        raise exc
+
+    # Forget nets and parts that are no longer in the circuit.
+    for piece in set(results) - set(pieces):
+        del results[piece]
 
 
 @export_to_all
@@ -117,9 +344,7 @@ def dflt_net_erc(net):
         )
     else:
         # Multiple pins on the net, so check for conflicts.
-        for i in range(num_pins):
-            for j in range(i + 1, num_pins):
-                pins[i].chk_conflict(pins[j])
+        chk_pin_conflicts(pins)
 
     # Check to see if the net has sufficient drive.
 
@@ -134,3 +359,106 @@ def dflt_net_erc(net):
             active_logger.warning(
                 f"Insufficient drive current on net {net.name} for pin {p.erc_desc()}."
                 )
+
+
+def _conflict_pins_desc(pins):
+    """
+    Describe a group of pins for a pin conflict message.
+
+    Args:
+        pins (list): Pins with the same function.
+
+    Returns:
+        str: The description of a single pin or a list of the pin descriptions
+            that's cut short if there are too many pins.
+    """
+    if len(pins) == 1:
+        return pins[0].erc_desc()
+    descs = [pin.erc_desc() for pin in pins[:MAX_CONFLICT_PINS]]
+    if len(pins) > MAX_CONFLICT_PINS:
+        descs.append(f"{len(pins) - MAX_CONFLICT_PINS} more")
+    return f"{len(pins)} pins ({', '.join(descs)})"
+
+
+@export_to_all
+def chk_pin_conflicts(pins):
+    """
+    Check for electrical rule conflicts between the pins attached to a net.
+
+    Instead of checking every pair of pins, the pins are grouped by their
+    function and the conflict matrix is checked once for each pair of functions
+    found on the net. A single message is issued for each conflicting pair of
+    functions that lists the pins involved, so a net with many conflicting pins
+    doesn't generate a message for every pair of them. A conflict between just
+    two pins gets the same message as Pin.chk_conflict().
+
+    Args:
+        pins (list): The pins attached to a net.
+    """
+
+    from .pin import conflict_matrix, pin_info
+    from .skidlbaseobj import OK, WARNING
+
+    # Group the pins by function. The functions are kept in the order they're
+    # first found, and the positions of the first and last pins with each
+    # function are recorded so the order of the pins in each pair is known.
+    groups = {}
+    first = {}
+    last = {}
+    for i, pin in enumerate(p for p in pins if p.do_erc):
+        func = pin.func
+        try:
+            groups[func].append(pin)
+        except KeyError:
+            groups[func] = [pin]
+            first[func] = i
+        last[func] = i
+
+    def report(func1, func2):
+        """Issue a message if pins with these functions conflict when the func1 pin comes first."""
+
+        [erc_result, erc_msg] = conflict_matrix[func1][func2]
+
+        # Return if the pins are compatible.
+        if erc_result == OK:
+            return
+
+        # Otherwise, generate an error or warning message.
+        if not erc_msg:
+            erc_msg = " ".join(
+                (
+                    pin_info[func1]["function"],
+                    "connected to",
+                    pin_info[func2]["function"],
+                )
+            )
+        pins1, pins2 = groups[func1], groups[func2]
+        n = pins1[0].net.name
+        if func1 == func2:
+            if len(pins1) == 2:
+                p1, p2 = (pin.erc_desc() for pin in pins1)
+            else:
+                p1, p2 = _conflict_pins_desc(pins1), "each other"
+        else:
+            p1, p2 = _conflict_pins_desc(pins1), _conflict_pins_desc(pins2)
+        msg = f"Pin conflict on net {n}, {p1} <==> {p2} ({erc_msg})"
+        if erc_result == WARNING:
+            active_logger.warning(msg)
+        else:
+            active_logger.error(msg)
+
+    funcs = list(groups)
+    for i, func1 in enumerate(funcs):
+        # Check pins having the same function against each other.
+        if len(groups[func1]) > 1:
+            report(func1, func1)
+        for func2 in funcs[i + 1 :]:
+            # A func1 pin always comes before a func2 pin. If some func2 pin
+            # also comes before a func1 pin and the conflict matrix gives a
+            # different result for that order, check it too.
+            report(func1, func2)
+            if (
+                first[func2] < last[func1]
+                and conflict_matrix[func2][func1] != conflict_matrix[func1][func2]
+            ):
+                report(func2, func1)
@@ -11,7 +11,7 @@ points/vectors, transformation matrices, and unit conversions between millimeter
 and thousandths-of-inch (mils).
 """
 
-from math import sqrt, sin, cos, radians
+from math import sqrt, sin, cos, floor, radians
 from copy import copy
 
 from .utilities import export_to_all
@@ -959,3 +959,179 @@ class Segment:
 
         # Overlap conditions based on segment endpoints.
         return other_min < self_max and other_max > self_min
+
+
+@export_to_all
+class BBoxIndex:
+    """
+    A spatial index of bounding boxes stored in the cells of a uniform grid.
+
+    Each bounding box is stored under a key in every grid cell it touches, so
+    the boxes that might intersect a given box are found by looking only in the
+    cells that box touches instead of checking every box in the index. Boxes can
+    be moved or removed as the objects they surround change. Boxes that would
+    touch too many cells are kept in a separate list that's always checked.
+
+    Args:
+        cell_size (float): Width and height of the grid cells. This works best
+            when it's about the size of a typical box in the index.
+        items (iterable, optional): (key, BBox) pairs to put in the index.
+    """
+
+    # Boxes touching more cells than this are checked on every search.
+    MAX_CELLS = 256
+
+    def __init__(self, cell_size, items=()):
+        if not cell_size > 0:
+            raise ValueError(f"Grid cells of a BBoxIndex must have a positive size, not {cell_size}.")
+        self.cell_size = cell_size
+        self.bboxes = {}  # Bounding box for each key.
+        self.spans = {}  # Range of grid cells touched by the bounding box of each key.
+        self.cells = {}  # Set of keys in each grid cell.
+        self.big_keys = set()  # Keys with boxes that touch too many cells.
+        for key, bbox in items:
+            self.insert(key, bbox)
+
+    @classmethod
+    def from_bboxes(cls, items):
+        """
+        Create an index with grid cells sized to fit the bounding boxes.
+
+        Args:
+            items (iterable): (key, BBox) pairs to put in the index.
+
+        Returns:
+            BBoxIndex: Index with cells the average width/height of the boxes.
+        """
+        items = list(items)
+        sizes = [
+            max(bbox.w, bbox.h)
+            for _, bbox in items
+            if bbox.min.x <= bbox.max.x and bbox.min.y <= bbox.max.y
+        ]
+        sizes = [size for size in sizes if 0 < size < float("inf")]
+        cell_size = sum(sizes) / len(sizes) if sizes else 1
+        return cls(cell_size, items)
+
+    def _span(self, bbox):
+        """Return the range of grid cells touched by a bounding box, or None if it touches too many."""
+        try:
+            span = (
+                floor(bbox.min.x / self.cell_size),
+                floor(bbox.max.x / self.cell_size),
+                floor(bbox.min.y / self.cell_size),
+                floor(bbox.max.y / self.cell_size),
+            )
+        except (OverflowError, ValueError):
+            # Infinite or empty (uninitialized) bounding box.
+            return None
+        x0, x1, y0, y1 = span
+        if (x1 - x0 + 1) * (y1 - y0 + 1) > self.MAX_CELLS:
+            return None
+        return span
+
+    def insert(self, key, bbox):
+        """
+        Add a bounding box to the index under a key.
+
+        Args:
+            key: Hashable key for the box (usually the object it surrounds).
+            bbox (BBox): The bounding box.
+        """
+        if key in self.bboxes:
+            self.remove(key)
+        self.bboxes[key] = bbox
+        span = self._span(bbox)
+        self.spans[key] = span
+        if span is None:
+            self.big_keys.add(key)
+            return
+        x0, x1, y0, y1 = span
+        for x in range(x0, x1 + 1):
+            for y in range(y0, y1 + 1):
+                self.cells.setdefault((x, y), set()).add(key)
+
+    def remove(self, key):
+        """
+        Remove the bounding box stored under a key from the index.
+
+        Args:
+            key: Key of the box.
+        """
+        del self.bboxes[key]
+        span = self.spans.pop(key)
+        if span is None:
+            self.big_keys.discard(key)
+            return
+        x0, x1, y0, y1 = span
+        for x in range(x0, x1 + 1):
+            for y in range(y0, y1 + 1):
+                cell = self.cells[(x, y)]
+                cell.discard(key)
+                if not cell:
+                    del self.cells[(x, y)]
+
+    def move(self, key, bbox):
+        """
+        Replace the bounding box stored under a key.
+
+        The grid cells are only updated if the box moves into different cells.
+
+        Args:
+            key: Key of the box.
+            bbox (BBox): The new bounding box.
+        """
+        if self.spans.get(key, False) == self._span(bbox):
+            self.bboxes[key] = bbox
+        else:
+            self.insert(key, bbox)
+
+    def candidates(self, bbox):
+        """
+        Return the keys of boxes in the grid cells touched by a bounding box.
+
+        Args:
+            bbox (BBox): The bounding box to search around.
+
+        Returns:
+            set: Keys of boxes that might intersect the bounding box.
+        """
+        span = self._span(bbox)
+        if span is None:
+            if bbox.min.x > bbox.max.x or bbox.min.y > bbox.max.y:
+                return set()  # An empty box can't intersect anything.
+            return set(self.bboxes)
+        keys = set(self.big_keys)
+        x0, x1, y0, y1 = span
+        cells = self.cells
+        for x in range(x0, x1 + 1):
+            for y in range(y0, y1 + 1):
+                cell = cells.get((x, y))
+                if cell:
+                    keys |= cell
+        return keys
+
+    def query(self, bbox):
+        """
+        Return the keys of boxes in the index that intersect a bounding box.
+
+        Args:
+            bbox (BBox): The bounding box to search around.
+
+        Returns:
+            set: Keys of boxes for which bbox.intersects() is True.
+        """
+        bboxes = self.bboxes
+        return {key for key in self.candidates(bbox) if bbox.intersects(bboxes[key])}
+
+    def __getitem__(self, key):
+        """Return the bounding box stored under a key."""
+        return self.bboxes[key]
+
+    def __contains__(self, key):
+        """Return True if a bounding box is stored under the key."""
+        return key in self.bboxes
+
+    def __len__(self):
+        """Return the number of bounding boxes in the index."""
+        return len(self.bboxes)
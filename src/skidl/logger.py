@@ -15,6 +15,8 @@ import logging
 import os
 import queue
 import sys
+import threading
+from collections import defaultdict
 
 from .scriptinfo import get_script_name, get_skidl_trace
 from .skidlbaseobj import WARNING
@@ -39,6 +41,8 @@ class CountCalls(object):
     def __init__(self, func):
         self.func = func
         self.count = 0
+        self.lock = threading.Lock()  # Keeps counts right when called from several threads.
+        self.thread = threading.local()  # Calls made by each thread.
 
     def __call__(self, *args, **kwargs):
         """
@@ -51,9 +55,26 @@ class CountCalls(object):
         Returns:
             The return value from the wrapped function.
         """
-        self.count += 1
+        with self.lock:
+            self.count += 1
+        self.thread.count = self.thread_count + 1
         return self.func(*args, **kwargs)
 
+    @property
+    def thread_count(self):
+        """Number of calls made by the current thread."""
+        return getattr(self.thread, "count", 0)
+
+    def add(self, num_calls):
+        """
+        Count calls that were made earlier without calling the function again.
+
+        Args:
+            num_calls (int): Number of calls to add to the counter.
+        """
+        with self.lock:
+            self.count += num_calls
+
     def reset(self):
         """Reset the call counter to zero."""
         self.count = 0
@@ -97,6 +118,100 @@ class SkidlLogFileHandler(logging.FileHandler):
         self.filename = None
 
 
+@export_to_all
+class LogRecordHolder(logging.Filter):
+    """
+    Logger filter that holds the messages logged by tasks running in other threads.
+
+    The records logged while a task runs are held under the index of the task
+    so they can be released in task order once all the tasks are done. This
+    gives the same output as running the tasks one after another no matter
+    how they were spread across threads. Records that aren't logged by a task
+    pass through as usual.
+
+    Args:
+        logger (SkidlLogger): Logger whose messages are held.
+
+    Examples:
+        >>> with LogRecordHolder(logger) as holder:
+        ...     # Run holder.run(index, func) for each task in some threads.
+        >>> for index in range(num_tasks):
+        ...     holder.release(index)
+    """
+
+    # Index of the task being run by each thread.
+    _task = threading.local()
+
+    def __init__(self, logger):
+        super().__init__()
+        self.logger = logger
+        self.records = defaultdict(list)
+
+    def __enter__(self):
+        self.logger.addFilter(self)
+        return self
+
+    def __exit__(self, *exc_info):
+        self.logger.removeFilter(self)
+
+    def filter(self, record):
+        """
+        Hold a log record if it was logged by a task.
+
+        Args:
+            record (logging.LogRecord): The record being logged.
+
+        Returns:
+            bool: True if the record should be output now.
+        """
+        index = getattr(self._task, "index", None)
+        if index is None:
+            return True
+        self.records[index].append(record)
+        return False
+
+    def run(self, index, func, *args, **kwargs):
+        """
+        Run a task in the current thread and hold any messages it logs.
+
+        Args:
+            index (int): Index of the task that determines when its messages are output.
+            func (function): Function that performs the task.
+            *args: Arguments to pass to the function.
+            **kwargs: Keyword arguments to pass to the function.
+
+        Returns:
+            The return value from the function.
+        """
+        self._task.index = index
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self._task.index = None
+
+    def take(self, index):
+        """
+        Remove the messages held for a task without outputting them.
+
+        Args:
+            index (int): Index of the task.
+
+        Returns:
+            list: The log records held for the task.
+        """
+        return self.records.pop(index, [])
+
+    def release(self, index):
+        """
+        Output the messages held for a task.
+
+        Args:
+            index (int): Index of the task.
+        """
+        for record in self.take(index):
+            self.logger.handle(record)
+
+
 class SkidlLogger(logging.getLoggerClass()):
     """
     SKiDL logger with enhanced functionality for managing file output and context.
@@ -9,7 +9,10 @@ Classes:
     PinMixin: Adds pin management functionality to parts and other objects.
 """
 
+import functools
+import re
 import sys
+
 from .logger import active_logger
 from .skidlbaseobj import SkidlBaseObject
 from .utilities import (
@@ -22,6 +25,99 @@ from .utilities import (
     Rgx,
 )
 
+
+@functools.lru_cache(maxsize=256)
+def _compile_pin_regex(regex):
+    """
+    Compile a regex that must match an entire pin number, name or alias.
+
+    Args:
+        regex (str): Regular expression for matching pin identifiers.
+
+    Returns:
+        re.Pattern: Compiled pattern that matches the same strings as utilities.fullmatch().
+    """
+    return re.compile(
+        "(?:" + regex + r")\Z", flags=re.IGNORECASE | re.MULTILINE | re.DOTALL
+    )
+
+
+class _PinIndex(object):
+    """
+    Lookup tables for finding the pins of a part by number, alias or name.
+
+    Each table maps a lowercased pin identifier to the list of pins having that
+    identifier, so exact (case-insensitive) matches are found without scanning
+    every pin. Pins are stored in the same order as the list they were indexed
+    from so lookups return pins in the same order as a scan of the list would.
+
+    Args:
+        pins (list): List of Pin objects to index.
+    """
+
+    def __init__(self, pins):
+        self.pins = pins  # The indexed list (used to detect a replaced list).
+        self.num_pins = len(pins)  # Used to detect pins added/removed in place.
+        self.tables = {"num": {}, "aliases": {}, "name": {}}
+        nums, aliases, names = (self.tables[k] for k in ("num", "aliases", "name"))
+
+        int_nums = []
+        for pin in pins:
+            nums.setdefault(str(pin.num).lower(), []).append(pin)
+            names.setdefault(str(pin.name).lower(), []).append(pin)
+            # Aliases that only differ in case must not add the pin twice.
+            # Peek at the aliases so pins keep sharing them with other copies.
+            for alias in {str(a).lower() for a in pin._get_aliases()}:
+                aliases.setdefault(alias, []).append(pin)
+            try:
+                int_nums.append(int(pin.num))
+            except ValueError:
+                pass
+
+        # Minimum and maximum integer pin numbers for expanding slices of pins.
+        if int_nums:
+            self.min_pin, self.max_pin = min(int_nums), max(int_nums)
+        else:
+            self.min_pin, self.max_pin = 0, 0
+
+    def is_valid_for(self, pins):
+        """Return True if the index was built from the current contents of a pin list."""
+        return pins is self.pins and len(pins) == self.num_pins
+
+    def match(self, attr, pin_id):
+        """
+        Return the pins whose attribute matches a pin identifier, ignoring case.
+
+        Args:
+            attr (str): Pin attribute to match ("num", "aliases" or "name").
+            pin_id (int or str): Pin identifier to look up.
+
+        Returns:
+            list: Pins with a matching attribute. Don't modify this list!
+        """
+        return self.tables[attr].get(str(pin_id).lower(), [])
+
+    def search(self, attr, regex):
+        """
+        Return the pins whose attribute fully matches a regular expression.
+
+        Args:
+            attr (str): Pin attribute to search ("aliases" or "name").
+            regex (str): Regular expression the attribute must fully match.
+
+        Returns:
+            list: Pins with a matching attribute.
+        """
+        match = _compile_pin_regex(str(regex)).match
+        if attr == "aliases":
+            return [
+                pin
+                for pin in self.pins
+                if any(match(str(a)) for a in pin._get_aliases())
+            ]
+        return [pin for pin in self.pins if match(str(getattr(pin, attr)))]
+
+
 class PinMixin():
     """
     Mixin class that adds pin-related methods and functionality to a class.
@@ -185,8 +281,13 @@ class PinMixin():
         """
         from skidl.netpinlist import NetPinList
 
-        # Look for the attribute name in the list of pin aliases.
-        pins = [pin for pin in self if pin.aliases == attr]
+        # Look for the attribute name in the index of pin aliases. The index
+        # ignores case, so keep only the pins with an exact alias match.
+        pins = [
+            pin
+            for pin in self._get_pin_index().match("aliases", attr)
+            if attr in pin._get_aliases()
+        ]
 
         if pins:
             if len(pins) == 1:
@@ -263,6 +364,7 @@ class PinMixin():
         for pin in flatten(pins):
             pin.part = self
             self.pins.append(pin)
+        self._invalidate_pin_index()
         return self
 
     def create_pins(self, base_name, pin_count=None, connections=None):
@@ -398,6 +500,7 @@ class PinMixin():
             pin_id = set((pin.num, *pin.aliases))
             if not pin_id.isdisjoint(pin_ids):
                 del self.pins[i]
+        self._invalidate_pin_index()
 
     def swap_pins(self, pin_id1, pin_id2):
         """
@@ -436,6 +539,7 @@ class PinMixin():
                     pins[i1].num,
                     pins[i1].name,
                 )
+                self._invalidate_pin_index()
                 # The swap has been made, so we're done.
                 return
 
@@ -461,6 +565,7 @@ class PinMixin():
             if pin_id in (pin.num, *pin.aliases):
                 # Found pin so change its name
                 pin.name = new_pin_name
+                self._invalidate_pin_index()
                 return
 
     def renumber_pin(self, pin_id, new_pin_num):
@@ -485,6 +590,7 @@ class PinMixin():
             if pin_id in (pin.num, *pin.aliases):
                 # Found pin so change its number
                 pin.num = new_pin_num
+                self._invalidate_pin_index()
                 return
 
     def get_pins(self, *pin_ids, **criteria):
@@ -531,7 +637,6 @@ class PinMixin():
             >>> pattern_pins = part.get_pins('A[0-9]+', match_regex=True)  # Regex
         """
 
-        from .alias import Alias
         from .netpinlist import NetPinList
 
         # Extract option for suppressing error messages.
@@ -549,20 +654,23 @@ class PinMixin():
         if not pin_ids:
             pin_ids = [Rgx(".*")]
 
-        # Determine the minimum and maximum pin ids if they don't already exist.
-        if "min_pin" not in dir(self) or "max_pin" not in dir(self):
-            self.min_pin, self.max_pin = self._find_min_max_pins()
+        # Get the index of pin numbers, aliases and names.
+        index = self._get_pin_index()
+
+        def with_criteria(tmp_pins, do_str_match=True):
+            # Keep only the pins that also match any additional criteria.
+            if criteria and tmp_pins:
+                return filter_list(tmp_pins, do_str_match=do_str_match, **criteria)
+            return tmp_pins
 
         # Go through the list of pin IDs one-by-one.
         pins = NetPinList()
-        for p_id in expand_indices(self.min_pin, self.max_pin, match_regex, *pin_ids):
+        for p_id in expand_indices(index.min_pin, index.max_pin, match_regex, *pin_ids):
 
             # If only names are being searched, the search of pin numbers is skipped.
             if not only_search_names:
                 # Does pin ID (either integer or string) match a pin number...
-                tmp_pins = filter_list(
-                    self.pins, num=str(p_id), do_str_match=True, **criteria
-                )
+                tmp_pins = with_criteria(index.match("num", p_id))
                 if tmp_pins:
                     pins.extend(tmp_pins)
                     continue
@@ -570,20 +678,22 @@ class PinMixin():
             # if only numbers are being searched, then search of pin names is skipped.
             if not only_search_numbers:
                 # OK, assume it's not a pin number but a pin name or alias.
-                # Look for an exact match.
+                # Look for an exact match (or a regex match if the ID is an Rgx).
 
-                # Check pin aliases for an exact match.
-                tmp_pins = filter_list(
-                    self.pins, aliases=p_id, do_str_match=True, **criteria
-                )
+                # Check pin aliases for a match.
+                if isinstance(p_id, Rgx):
+                    tmp_pins = with_criteria(index.search("aliases", p_id))
+                else:
+                    tmp_pins = with_criteria(index.match("aliases", p_id))
                 if tmp_pins:
                     pins.extend(tmp_pins)
                     continue
 
-                # Check pin names for an exact match.
-                tmp_pins = filter_list(
-                    self.pins, name=p_id, do_str_match=True, **criteria
-                )
+                # Check pin names for a match.
+                if isinstance(p_id, Rgx):
+                    tmp_pins = with_criteria(index.search("name", p_id))
+                else:
+                    tmp_pins = with_criteria(index.match("name", p_id))
                 if tmp_pins:
                     pins.extend(tmp_pins)
                     continue
@@ -593,17 +703,8 @@ class PinMixin():
                     continue
 
                 # OK, pin ID is not a pin number and doesn't exactly match a pin
-                # name or alias. Does it match as a regex?
-                p_id_re = p_id
-
-                # Check pin aliases for a regex match.
-                tmp_pins = filter_list(self.pins, aliases=Alias(p_id_re), **criteria)
-                if tmp_pins:
-                    pins.extend(tmp_pins)
-                    continue
-
-                # Check the pin names for a regex match.
-                tmp_pins = filter_list(self.pins, name=p_id_re, **criteria)
+                # name or alias. Check the pin names for a regex match.
+                tmp_pins = with_criteria(index.search("name", p_id), do_str_match=False)
                 if tmp_pins:
                     pins.extend(tmp_pins)
                     continue
@@ -651,6 +752,29 @@ class PinMixin():
                 # Split pin name and add subnames as aliases to the pin.
                 pin.split_name(delimiters)
 
+    def _get_pin_index(self):
+        """
+        Get the index used to look up pins by number, alias or name.
+
+        The index is rebuilt if the list of pins has been replaced or has
+        changed length since the index was made, or if the index was
+        invalidated because a pin was renamed or renumbered.
+
+        Returns:
+            _PinIndex: Index of the pins of this object.
+        """
+        # Access the attributes directly since this is also called from __getattr__.
+        self_pins = object.__getattribute__(self, "pins")
+        index = self.__dict__.get("_pin_index")
+        if index is None or not index.is_valid_for(self_pins):
+            index = _PinIndex(self_pins)
+            self.__dict__["_pin_index"] = index
+        return index
+
+    def _invalidate_pin_index(self):
+        """Discard the pin index so it will be rebuilt when it's next needed."""
+        self.__dict__.pop("_pin_index", None)
+
     def _find_min_max_pins(self):
         """
         Find the minimum and maximum numeric pin numbers.
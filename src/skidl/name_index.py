@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+
+# The MIT License (MIT) - Copyright (c) Dave Vandenbout.
+
+"""
+Name index for the parts, nets and buses of a circuit.
+
+This module provides the NameIndex class that each Circuit uses to find its
+parts, nets and buses by reference, name or alias without scanning the lists
+of them. Objects report changes to their names and aliases so the index is
+kept up-to-date as they're renamed.
+"""
+
+from itertools import count
+
+from .utilities import Rgx, export_to_all, to_list
+
+
+@export_to_all
+class NameIndex(object):
+    """
+    Case-insensitive lookup of objects by the values of some of their attributes.
+
+    Each table maps the lowercased string form of an attribute value (like a net
+    name or one of its aliases) to the objects having that value. Lookups return
+    objects in the order they were first added to the index, which is the same
+    order they were appended to the list of objects in the circuit.
+
+    Args:
+        *attrs (str): Names of the object attributes to index.
+    """
+
+    def __init__(self, *attrs):
+        self.tables = {attr: {} for attr in attrs}
+        self._entries = {}  # Object -> list of (table, key) entries for the object.
+        self._order = {}  # Object -> sequence number from when it was added.
+        self._counter = count()
+
+    def __contains__(self, obj):
+        """Return True if the object is in the index."""
+        return obj in self._entries
+
+    def __len__(self):
+        """Return the number of objects in the index."""
+        return len(self._entries)
+
+    def _rmv_entries(self, obj):
+        """Remove all the table entries for an object."""
+        for table, key in self._entries.pop(obj, ()):
+            objs = table[key]
+            del objs[obj]
+            if not objs:
+                del table[key]
+
+    def add(self, obj):
+        """
+        Add an object to the index, or update its entries if it's already there.
+
+        Args:
+            obj: Object to index using the current values of its attributes.
+        """
+        self._rmv_entries(obj)
+        if obj not in self._order:
+            self._order[obj] = next(self._counter)
+
+        entries = []
+        for attr, table in self.tables.items():
+            try:
+                values = to_list(getattr(obj, attr))
+            except AttributeError:
+                continue
+            for key in {str(v).lower() for v in values}:
+                table.setdefault(key, {})[obj] = None
+                entries.append((table, key))
+        self._entries[obj] = entries
+
+    def remove(self, obj):
+        """
+        Remove an object from the index.
+
+        Args:
+            obj: Object to remove. Nothing happens if it isn't in the index.
+        """
+        self._rmv_entries(obj)
+        self._order.pop(obj, None)
+
+    def get(self, attr, *values):
+        """
+        Return the objects having an attribute value that matches, ignoring case.
+
+        Args:
+            attr (str): Name of the indexed attribute to search.
+            values (str or int): One or more values to look for.
+
+        Returns:
+            list: Objects matching any of the values in the order they were
+                added to the index.
+        """
+        table = self.tables[attr]
+        objs = {}
+        for value in values:
+            objs.update(table.get(str(value).lower(), {}))
+        if len(objs) <= 1:
+            return list(objs)
+        return sorted(objs, key=self._order.__getitem__)
+
+    @staticmethod
+    def is_searchable(value):
+        """
+        Return True if an index can be used to search for a value.
+
+        Regular expressions and values that aren't strings or integers are
+        matched in other ways by filter_list(), so they can't be looked up
+        in the index.
+        """
+        return isinstance(value, (int, str)) and not isinstance(value, Rgx)
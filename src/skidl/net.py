@@ -85,13 +85,14 @@ Integration:
     - Tools: Export to KiCad, Altium, Eagle, etc.
 """
 
-import collections
 from collections.abc import Iterable
 import re
 from copy import copy, deepcopy
 
+from .connectivity import Traversal, traverse
 from .erc import dflt_net_erc
 from .logger import active_logger
+from .name_index import NameIndex
 from .design_class import NetClass, NetClasses
 from .skidlbaseobj import SkidlBaseObject
 from .utilities import (
@@ -113,8 +114,6 @@ __all__ = ["NET_PREFIX"]
 # Prefix for implicit nets.
 NET_PREFIX = "N$"
 
-Traversal = collections.namedtuple("Traversal", ["nets", "pins"])
-
 
 @export_to_all
 class Net(SkidlBaseObject):
@@ -215,6 +214,9 @@ class Net(SkidlBaseObject):
     # Set the default ERC functions for all Net instances.
     erc_list = [dflt_net_erc]
 
+    # Attributes that change the outcome of the ERC of the net.
+    _erc_attrs = frozenset(("do_erc", "_drive", "_name"))
+
     def __init__(self, name=None, circuit=None, *pins_nets_buses, **attribs):
         """
         Initialize a new Net object with optional name and connections.
@@ -567,22 +569,25 @@ class Net(SkidlBaseObject):
             to ensure you get the net from the correct context.
 
         Performance:
-            The search is optimized for typical circuit sizes but may be slower
-            for very large circuits with thousands of nets. Consider maintaining
-            direct references for frequently accessed nets in performance-critical
-            applications.
+            Names and aliases are looked up in an index kept by the circuit,
+            so the search takes about the same time regardless of the number
+            of nets. Regular expressions (Rgx) still require a search of
+            every net in the circuit.
         """
-        from .alias import Alias
 
         circuit = circuit or default_circuit
 
         search_params = (("name", name, True), ("aliases", name, True))
 
         for attr, name, do_str_match in search_params:
-            # filter_list() always returns a list. A net can consist of multiple
-            # interconnected Net objects. If the list is non-empty,
-            # just return the first Net object on the list.
-            nets = filter_list(circuit.nets, do_str_match=do_str_match, **{attr: name})
+            if NameIndex.is_searchable(name):
+                nets = circuit.net_names.get(attr, name)
+            else:
+                nets = filter_list(
+                    circuit.nets, do_str_match=do_str_match, **{attr: name}
+                )
+            # A net can consist of multiple interconnected Net objects.
+            # If the list is non-empty, just return the first Net object on the list.
             try:
                 return nets[0]
             except IndexError:
@@ -709,7 +714,9 @@ class Net(SkidlBaseObject):
             TypeError: If the given object is not a Pin, Net, or Bus.
         """
         if isinstance(pin_net_bus, Net):
-            return pin_net_bus in self.nets
+            if pin_net_bus.circuit is not self.circuit or self.circuit is None:
+                return pin_net_bus in self.nets
+            return self.circuit.connectivity.is_attached(self, pin_net_bus)
         if isinstance(pin_net_bus, Pin):
             return pin_net_bus.is_attached(self)
         if isinstance(pin_net_bus, Bus):
@@ -820,7 +827,7 @@ class Net(SkidlBaseObject):
 
         # Skip some Net attributes that would cause an infinite recursion exception
         # or net naming clashes.
-        skip_attrs = ("circuit", "traversal", "_name", "_aliases")
+        skip_attrs = ("circuit", "_name", "_aliases")
         
         copies = []
         for i in range(num_copies):
@@ -951,19 +958,16 @@ class Net(SkidlBaseObject):
 
             # If this net has pins, just attach the other net to one of them.
             if self._pins:
-                self._pins[0].nets.append(net)
-                net._pins.append(self._pins[0])
+                link_pin(net, self._pins[0])
             # If the other net has pins, attach this net to a pin on the other net.
             elif net._pins:
-                net._pins[0].nets.append(self)
-                self._pins.append(net._pins[0])
+                link_pin(self, net._pins[0])
             # If neither net has any pins, then attach a phantom pin to one net
             # and then connect the nets together.
             else:
                 p = PhantomPin()
                 connect_pin(p)
-                self._pins[0].nets.append(net)
-                net._pins.append(self._pins[0])
+                link_pin(net, self._pins[0])
 
             # Update the drive of the joined nets. When setting the drive of a
             # net the net drive will be the maximum of its current drive or the
@@ -978,15 +982,23 @@ class Net(SkidlBaseObject):
             self.netclasses = net.netclasses
             net.netclasses = self.netclasses
 
+        def link_pin(net, pin):
+            """Link a pin and a net and record it in the circuit connectivity."""
+            net._pins.append(pin)
+            pin.nets.append(net)
+            self.circuit.connectivity.connect(net, pin)
+            self.circuit.erc_changed(net, pin)
+
         def connect_pin(pin):
             """Connect a pin to this net."""
             if pin not in self._pins:
                 if not pin.is_connected():
                     # Remove the pin from the no-connect net if it is attached to it.
                     pin.disconnect()
-                self._pins.append(pin)
-                pin.nets.append(self)
+                link_pin(self, pin)
                 pin.stub = self.stub  # Update pin stub net for generating schematics.
+                # Catch pins that are now attached to both normal and no-connect nets.
+                pin.is_connected()
             return
 
         self.test_validity()
@@ -1023,14 +1035,6 @@ class Net(SkidlBaseObject):
                     f"Cannot attach non-Pin/non-Net {type(pn)} to Net {self.name}.",
                 )
 
-        # If something has been connected to a net, then recompute its traversal so the
-        # correct number of connected pins and nets is recorded.
-        try:
-            del self.traversal
-        except AttributeError:
-            pass  # No traversal to delete.
-        self._traverse()
-
         # Add the net to the global netlist. (It won't be added again
         # if it's already there.)
         self.circuit += self
@@ -1052,12 +1056,11 @@ class Net(SkidlBaseObject):
         except ValueError:
             return  # Pin wasn't in the list, so abort.
 
-        # If a pin has been disconnected from a net, then remove any existing traversal
-        # so it will be recomputed the next time it is needed.
-        try:
-            del self.traversal
-        except AttributeError:
-            pass  # No traversal to delete.
+        # Let the circuit know the pin is gone so the nets and pins connected
+        # to this net will be recomputed the next time they're needed.
+        if self.circuit is not None:
+            self.circuit.connectivity.disconnect(self, pin)
+            self.circuit.erc_changed(self, pin)
 
     def merge_names(self):
         """
@@ -1119,6 +1122,7 @@ class Net(SkidlBaseObject):
             # Assign the name directly to each net. Using the name property
             # would cause the names to be changed so they were unique.
             net._name = selected_name  # pylint: disable=protected-access
+            net._names_changed()
 
     def create_network(self):
         """
@@ -1185,56 +1189,20 @@ class Net(SkidlBaseObject):
 
     def _traverse(self):
         """
-        Traverse all nets and pins connected to this net.
-        
-        This method builds a complete list of all pins and nets that are
-        electrically connected to this net, either directly or indirectly.
-        
+        Get all nets and pins connected to this net.
+
+        The connections are looked up in the connectivity index of the circuit
+        this net belongs to. Nets outside of any circuit have no index, so their
+        connections are found by searching the links between nets and pins.
+
         Returns:
             Traversal: A namedtuple containing lists of all connected nets and pins.
         """
 
-        try:
-            return self.traversal  # Return pre-existing traversal.
-        except AttributeError:
-            pass  # Compute the traversal if it's not available.
-
-        from .pin import PhantomPin
-
         self.test_validity()
-        prev_nets = set([self])
-        nets = set([self])
-        prev_pins = set([])
-        pins = set(self._pins)
-        while pins != prev_pins:
-
-            # Add the nets attached to any unvisited pins.
-            for pin in pins - prev_pins:
-                # No use visiting a pin that is not connected to a net.
-                if pin.is_connected():
-                    nets |= set(pin.nets)
-
-            # Update the set of previously visited pins.
-            prev_pins = copy(pins)
-
-            # Add the pins attached to any unvisited nets.
-            for net in nets - prev_nets:
-                pins |= set(net._pins)
-
-            # Update the set of previously visited nets.
-            prev_nets = copy(nets)
-
-        # Remove any phantom pins that may have existed for tieing nets together.
-        pins = set([p for p in pins if not isinstance(p, PhantomPin)])
-
-        # Store the traversal.
-        self.traversal = Traversal(nets=list(nets), pins=list(pins))
-
-        # Every net connected to this one should have the same traversal.
-        for n in self.traversal.nets:
-            n.traversal = self.traversal
-
-        return self.traversal
+        if self.circuit is None:
+            return traverse(self)
+        return self.circuit.connectivity.traverse(self)
 
     @property
     def width(self):
@@ -1285,6 +1253,18 @@ class Net(SkidlBaseObject):
         self.test_validity()
         super(Net, type(self)).name.fdel(self)
 
+    def _names_changed(self):
+        """Update the index of net names in the circuit after the name or aliases change."""
+        circuit = self.__dict__.get("circuit")
+        if circuit is not None and self in circuit.net_names:
+            circuit.net_names.add(self)
+
+    def _erc_changed(self):
+        """Tell the circuit containing the net that it must be rechecked by an incremental ERC."""
+        circuit = self.__dict__.get("circuit")
+        if circuit is not None:
+            circuit.erc_changed(self)
+
     @property
     def pins(self):
         """
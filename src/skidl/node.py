@@ -16,7 +16,7 @@ from simp_sexp import Sexp
 from .design_class import PartClasses
 from .design_class import NetClasses
 from .mixins import PinMixin
-from .scriptinfo import get_skidl_trace
+from .scriptinfo import get_creation_trace
 from .skidlbaseobj import SkidlBaseObject
 from .utilities import export_to_all, get_unique_name
 
@@ -36,6 +36,13 @@ class Node(PinMixin, SkidlBaseObject):
     circuit design with clear structural relationships.
     """
 
+    # Attributes of a node that make up the hierarchical names of it and the nodes below it.
+    _hier_attrs = frozenset(("_name", "tag", "parent"))
+
+    # Changes whenever one of those attributes changes in any node so the stored
+    # hierarchical names of every node are known to be out of date.
+    _hier_version = 0
+
     def __init__(
         self,
         name=None,
@@ -85,7 +92,7 @@ class Node(PinMixin, SkidlBaseObject):
         self.children = []  # New nodes are childless.
 
         # Store the stack trace for where this node was instantiated.
-        self.skidl_trace = get_skidl_trace()
+        self.skidl_trace = get_creation_trace()
 
         # Create lists to hold the parts, nets, and buses that are instantiated in this node.
         self.parts = []
@@ -106,6 +113,29 @@ class Node(PinMixin, SkidlBaseObject):
         for k, v in attrs.items():
             setattr(self, k, v)
 
+    def __setattr__(self, key, value):
+        """
+        Set an attribute and note any change to the names of the hierarchy.
+
+        Args:
+            key: The attribute name to set.
+            value: The value to assign to the attribute.
+        """
+        super().__setattr__(key, value)
+        if key in self._hier_attrs:
+            Node._hier_version += 1
+
+    def __delattr__(self, key):
+        """
+        Delete an attribute and note any change to the names of the hierarchy.
+
+        Args:
+            key: The attribute name to delete.
+        """
+        super().__delattr__(key)
+        if key in self._hier_attrs:
+            Node._hier_version += 1
+
     def __enter__(self):
         """
         Create a context for hierarchical grouping of parts and nets.
@@ -301,11 +331,18 @@ class Node(PinMixin, SkidlBaseObject):
         This provides a string representation of the hierarchical path by extracting
         the names from each node in the hierarchy chain.
         
+        The tuple is stored so it doesn't have to be rebuilt for every part in the node
+        until a name, tag or parent of a node changes.
+
         Returns:
             tuple: A tuple of strings representing the names of nodes in the
                   hierarchical path from root to this node.
         """
-        return tuple(n.tag_or_name for n in self.hiernodes)
+        hiertuple = self.__dict__.get("_hiertuple")
+        if hiertuple is None or hiertuple[0] != Node._hier_version:
+            hiertuple = (Node._hier_version, tuple(n.tag_or_name for n in self.hiernodes))
+            self.__dict__["_hiertuple"] = hiertuple
+        return hiertuple[1]
     
     @property
     def partclasses(self):
@@ -19,6 +19,7 @@ from .design_class import PartClass, PartClasses
 from .erc import dflt_part_erc
 from .logger import active_logger
 from .mixins import PinMixin
+from .name_index import NameIndex
 from .node import HIER_SEP
 from .skidlbaseobj import SkidlBaseObject
 from .utilities import (
@@ -182,6 +183,9 @@ class Part(PinMixin, SkidlBaseObject):
     # Set the default ERC functions for all Part instances.
     erc_list = [dflt_part_erc]
 
+    # Attributes that change the outcome of the ERC of the part.
+    _erc_attrs = frozenset(("do_erc", "_ref", "_name"))
+
     def __init__(
         self,
         lib=None,
@@ -530,9 +534,14 @@ class Part(PinMixin, SkidlBaseObject):
 
         parts = []
         for attr, value, do_str_match in search_params:
-            parts.extend(
-                filter_list(circuit.parts, do_str_match=do_str_match, **{attr: value})
-            )
+            if attr in circuit.part_names.tables and NameIndex.is_searchable(value):
+                # Use the circuit's index of part references and aliases.
+                parts.extend(circuit.part_names.get(attr, value))
+            else:
+                # Descriptions are matched as regexes, so they have to be searched.
+                parts.extend(
+                    filter_list(circuit.parts, do_str_match=do_str_match, **{attr: value})
+                )
 
         return list_or_scalar(parts)
 
@@ -632,6 +641,7 @@ class Part(PinMixin, SkidlBaseObject):
         from .circuit import Circuit
         from .part import NETLIST
         from .pin import Pin
+        from .schlib import SchLib
         from .tools.spice import add_xspice_io
 
         # If the number of copies is None, then a single copy will be made
@@ -655,19 +665,48 @@ class Part(PinMixin, SkidlBaseObject):
                 "Can't make a negative number ({num_copies}) of copies of a part!"
             )
 
-        # Now make copies of the part one-by-one.
+        # Find the attributes of the part that need special handling just once
+        # rather than for every copy. Each copy gets shallow copies of the
+        # container attributes (lists, dicts, etc.) except for the pins, units
+        # and fields which are made anew for each copy and the library which
+        # is shared. Any Pin and PartUnit attributes are removed so new ones
+        # can be made in the copy without generating warning messages, and
+        # references to the part itself (like a part that's a unit of itself)
+        # become references to the copy.
+        remade_attrs = ("pins", "unit", "fields")
+        copy_attrs = []
+        rmv_attrs = []
+        self_attrs = []
+        for k, v in self.__dict__.items():
+            if isinstance(v, (Pin, PartUnit)):
+                rmv_attrs.append(k)
+            elif v is self:
+                self_attrs.append(k)
+            elif k in remade_attrs or isinstance(v, SchLib):
+                continue
+            elif isinstance(v, Iterable) and not isinstance(v, str):
+                copy_attrs.append(k)
+
+        # Copy each pin for all the part copies at once. The copies of a pin
+        # share a template of its static attributes.
+        pin_copies = [pin._make_copies(num_copies) for pin in self.pins]
+
+        # Now make the copies of the part.
         copies = []
         for i in range(num_copies):
 
-            # Make a copy of the part.
-            cpy = copy(self)  # Start with shallow copy.
-            for k,v in self.__dict__.items():
-                if isinstance(v, (Pin, PartUnit)):
-                    # These require special handling later.
-                    continue
-                if isinstance(v, Iterable) and not isinstance(v, str):
-                    # Copy the list with shallow copies of its items to the copy.
-                    setattr(cpy, k, copy(v))
+            # Make a shallow copy of the part. (This does the same as copy(self),
+            # but much faster.)
+            cpy = self.__class__.__new__(self.__class__)
+            cpy_attrs = cpy.__dict__
+            cpy_attrs.update(self.__dict__)
+            for k in copy_attrs:
+                # Copy the list with shallow copies of its items to the copy.
+                cpy_attrs[k] = copy(cpy_attrs[k])
+            for k in rmv_attrs:
+                del cpy_attrs[k]
+            for k in self_attrs:
+                cpy_attrs[k] = cpy
 
             # Remove any existing part tag so the copy won't be linked to the
             # same footprint in the PCB as the source.
@@ -676,27 +715,18 @@ class Part(PinMixin, SkidlBaseObject):
             except AttributeError:
                 pass
 
-            # Remove any existing Pin and PartUnit attributes so new ones
-            # can be made in the copy without generating warning messages.
-            rmv_attrs = [
-                k
-                for k, v in list(cpy.__dict__.items())
-                if isinstance(v, (Pin, PartUnit))
-            ]
-            for attr in rmv_attrs:
-                delattr(cpy, attr)
-
             # The shallow copy will just put references to the pins of the
-            # original into the copy, so create independent copies of the pins.
+            # original into the copy, so add the independent copies of the pins.
             cpy.pins = []
-            # Add pin with part attribute set to the newly copied part.
-            cpy += [p.copy(part=cpy) for p in self.pins]
+            # Add pins with part attribute set to the newly copied part.
+            cpy += [pins[i] for pins in pin_copies]
 
-            # If the part copy is intended as a template, then disconnect its pins
-            # from any circuit nets.
-            if dest == TEMPLATE:
-                for p in cpy.pins:
-                    p.disconnect()
+            # Connect the pins to the same nets as the original pins unless the
+            # part copy is intended as a template.
+            if dest != TEMPLATE:
+                for pin, cpy_pin in zip(self.pins, cpy.pins):
+                    if pin.nets:
+                        pin.nets[0] += cpy_pin
 
             # Make new objects for searching the copy's pin numbers and names.
             cpy.p = PinNumberSearch(cpy)
@@ -717,14 +747,19 @@ class Part(PinMixin, SkidlBaseObject):
             # Copied part starts off not being in any circuit.
             cpy.circuit = None
 
-            # If copy is destined for a netlist, then add it to the Circuit its
-            # source came from or else add it to the default Circuit object.
-            if dest == NETLIST:
-                # Place the copied part in the explicitly-stated circuit,
-                # or the same circuit as the original,
-                # or else into the default circuit.
-                circuit = circuit or self.circuit or default_circuit
-                circuit += cpy
+            copies.append(cpy)
+
+        # If the copies are destined for a netlist, then add them all at once
+        # to the Circuit their source came from or else add them to the default
+        # Circuit object.
+        if dest == NETLIST and copies:
+            # Place the copied parts in the explicitly-stated circuit,
+            # or the same circuit as the original,
+            # or else into the default circuit.
+            circuit = circuit or self.circuit or default_circuit
+            circuit.add_parts(*copies)
+
+        for i, cpy in enumerate(copies):
 
             # Add any XSPICE I/O as pins to the part.
             add_xspice_io(cpy, io)
@@ -741,9 +776,6 @@ class Part(PinMixin, SkidlBaseObject):
                         )
                 setattr(cpy, k, v)
 
-            # Add the part copy to the list of copies.
-            copies.append(cpy)
-
         # Return a list of the copies made or just a single copy.
         if return_list:
             return copies
@@ -920,6 +952,30 @@ class Part(PinMixin, SkidlBaseObject):
 
         pass
 
+    def _names_changed(self):
+        """Update the indexes of part names in the circuit or library after the reference or aliases change."""
+        for container in (self.__dict__.get("circuit"), self.__dict__.get("lib")):
+            part_names = getattr(container, "part_names", None)
+            if part_names is not None and self in part_names:
+                part_names.add(self)
+
+    def _erc_changed(self):
+        """Tell the circuit containing the part that it must be rechecked by an incremental ERC."""
+        circuit = self.__dict__.get("circuit")
+        if circuit is not None:
+            circuit.erc_changed(self)
+
+    def _invalidate_pin_index(self):
+        """
+        Discard the pin indexes of the part and its units.
+
+        The units share their pins with the part, so their indexes become
+        stale whenever a pin of the part is renamed or renumbered.
+        """
+        PinMixin._invalidate_pin_index(self)
+        for unit in self.__dict__.get("unit", {}).values():
+            PinMixin._invalidate_pin_index(unit)
+
     def create_network(self):
         """
         Create a network from the pins of a part.
@@ -965,21 +1021,18 @@ class Part(PinMixin, SkidlBaseObject):
         """
         return f"{self.name}/{self.ref}"
 
-    def export(self, addtl_part_attrs=None):
+    def export_attrs(self, addtl_part_attrs=None):
         """
-        Return a string to recreate a Part object.
+        Return the values of the part attributes that are exported to a library.
 
         Args:
             addtl_part_attrs (list, optional): List of additional part attribute names to include in export.
 
         Returns:
-            str: String that can be evaluated to rebuild the Part object.
+            dict: Attribute names and values needed to rebuild the part (not including
+                its name, pins and units).
         """
 
-        # Make sure the part is fully instantiated. Otherwise, attributes like
-        # pins may be missing because they haven't been parsed from the part definition.
-        self.parse()
-
         # List of attributes to export that are necessary for rebuilding a part.
         keys = [
             "aliases",
@@ -995,6 +1048,23 @@ class Part(PinMixin, SkidlBaseObject):
         if addtl_part_attrs:
             keys.extend(addtl_part_attrs)
 
+        return {k: getattr(self, k, None) for k in keys}
+
+    def export(self, addtl_part_attrs=None):
+        """
+        Return a string to recreate a Part object.
+
+        Args:
+            addtl_part_attrs (list, optional): List of additional part attribute names to include in export.
+
+        Returns:
+            str: String that can be evaluated to rebuild the Part object.
+        """
+
+        # Make sure the part is fully instantiated. Otherwise, attributes like
+        # pins may be missing because they haven't been parsed from the part definition.
+        self.parse()
+
         # Export the part as a SKiDL template.
         attribs = []
         attribs.append(f"'name':{repr(self.name)}")
@@ -1002,8 +1072,7 @@ class Part(PinMixin, SkidlBaseObject):
         attribs.append("'tool':SKIDL")
 
         # Collect all the part attributes and the list of pins and units as Python code.
-        for k in keys:
-            v = getattr(self, k, None)
+        for k, v in self.export_attrs(addtl_part_attrs).items():
             attribs.append(f"'{k}':{repr(v)}")
         if self.pins:
             pin_strs = [p.export() for p in self.pins]
@@ -1066,6 +1135,7 @@ class Part(PinMixin, SkidlBaseObject):
         # Now name the object with the given reference or some variation
         # of it that doesn't collide with anything else in the list.
         self._ref = get_unique_name(self.circuit.parts, "ref", self.ref_prefix, r)
+        self._names_changed()
         return
 
     @ref.deleter
@@ -1075,6 +1145,7 @@ class Part(PinMixin, SkidlBaseObject):
         """
         rmv_unique_name(self.circuit.parts, "ref", self._ref)
         self._ref = None
+        self._names_changed()
 
     @property
     def value(self):
@@ -1379,18 +1450,32 @@ class PartUnit(Part):
         for pin in self.pins:
             pin.part = self.parent
 
-    def export(self):
+    def _invalidate_pin_index(self):
+        """Discard the pin indexes of the parent part and all its units."""
+        PinMixin._invalidate_pin_index(self)
+        self.parent._invalidate_pin_index()
+
+    def export_def(self):
         """
-        Return a string describing the PartUnit for exporting purposes.
-        
+        Return the definition of the PartUnit that's used to recreate it.
+
         Returns:
-            str: Dictionary representation of the unit as a string.
+            dict: Label, number and pin numbers of the unit.
         """
         d = dict()
         d["label"] = self.label
         d["num"] = self.num
         d["pin_nums"] = [pin.num for pin in self.pins]
-        return repr(d)
+        return d
+
+    def export(self):
+        """
+        Return a string describing the PartUnit for exporting purposes.
+        
+        Returns:
+            str: Dictionary representation of the unit as a string.
+        """
+        return repr(self.export_def())
 
     @property
     def ref(self):
@@ -11,6 +11,8 @@ regular expression searches and filtering on different properties.
 """
 
 from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+import functools
 import os
 import os.path
 import re
@@ -20,10 +22,10 @@ import threading
 import time
 
 from .logger import active_logger
-from .utilities import export_to_all, fullmatch, rmv_quotes, to_list, expand_path
+from .utilities import export_to_all, rmv_quotes, to_list, expand_path
 
 
-__all__ = ["search", "show", "PartSearchDB"]
+__all__ = ["search", "show", "PartSearchDB", "FootprintSearchDB"]
 
 
 def _parse_search_terms(terms):
@@ -101,6 +103,139 @@ def get_all_lib_files(tool=None):
     return lib_files
 
 
+def _scan_lib_file(tool, lib_file):
+    """
+    Get the searchable information about the parts in a library file without loading it.
+
+    This is run by PartSearchDB.add_libs(), either directly or in its worker processes.
+
+    Args:
+        tool (str): The ECAD tool format of the library.
+        lib_file (str): Absolute path to the library file.
+
+    Returns:
+        list: A (name, aliases, description, keywords) tuple for each part in the library,
+            or None if there's no scanner for the tool's library files or the file
+            couldn't be scanned.
+    """
+
+    from .tools import tool_modules
+
+    scan_sch_lib = getattr(tool_modules[tool], "scan_sch_lib", None)
+    if not scan_sch_lib or not os.path.isfile(lib_file):
+        return None
+    try:
+        return scan_sch_lib(lib_file)
+    except Exception:
+        # Leave it to SchLib to load the file and report any problems with it.
+        return None
+
+
+def _connect_search_db(db_dir, db_name, tool):
+    """
+    Connect to a search database for a tool, creating the database file if needed.
+
+    Args:
+        db_dir (str): Directory of the database file. Defaults to
+            skidl.config.part_search_db_dir or the current directory.
+        db_name (str): Base name of the database file. The tool name is appended to it.
+        tool (str): The ECAD tool whose libraries are stored in the database.
+
+    Returns:
+        sqlite3.Connection: Connection to the database.
+    """
+
+    import skidl
+
+    db_dir = db_dir or getattr(skidl.config, "part_search_db_dir", ".")
+    db_path = expand_path(os.path.join(db_dir, f"{db_name}_{tool}.db"))
+
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+
+    # Use write-ahead logging so searches aren't blocked by updates and
+    # committing large updates is cheaper.
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = NORMAL")
+
+    # Fire the delete triggers that update full-text indexes when
+    # INSERT OR REPLACE removes an existing row.
+    conn.execute("PRAGMA recursive_triggers = ON")
+
+    return conn
+
+
+def _init_fts_index(cur, table, columns, options=""):
+    """
+    Create a full-text index of some columns of a table if SQLite supports FTS5.
+
+    The {table}_fts index is an external-content FTS5 table, so it only stores
+    the index and reads the text from the table (which must have an integer id
+    column). Triggers on the table keep the index in sync when rows are added,
+    removed or changed. The index is rebuilt from the table whenever the
+    triggers have to be created since the table could have been changed without
+    them (e.g., the DB was created by an earlier version or by an SQLite without
+    FTS5).
+
+    Args:
+        cur (sqlite3.Cursor): Cursor for the database.
+        table (str): Name of the table to index.
+        columns (tuple): Names of the columns to index.
+        options (str, optional): More options for the FTS5 table, like prefix indexes
+            or the tokenizer.
+
+    Returns:
+        bool: True if the full-text index is available.
+    """
+
+    fts_table = f"{table}_fts"
+    fts_triggers = tuple(f"{fts_table}_{op}" for op in ("insert", "delete", "update"))
+    cols = ", ".join(columns)
+    new_vals = ", ".join(f"new.{col}" for col in columns)
+    old_vals = ", ".join(f"old.{col}" for col in columns)
+
+    try:
+        cur.execute(
+            f"""
+            CREATE VIRTUAL TABLE IF NOT EXISTS {fts_table} USING fts5(
+                {cols},
+                content='{table}',
+                content_rowid='id'{", " + options if options else ""}
+            )
+            """
+        )
+    except sqlite3.OperationalError:
+        # Remove triggers left by an SQLite with FTS5 because they would
+        # stop any rows from being added or removed.
+        for trigger in fts_triggers:
+            cur.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        return False
+
+    cur.execute(
+        "SELECT COUNT(*) FROM sqlite_master WHERE type = 'trigger' AND name IN (?, ?, ?)",
+        fts_triggers,
+    )
+    if cur.fetchone()[0] == len(fts_triggers):
+        return True
+
+    cur.executescript(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS {fts_table}_insert AFTER INSERT ON {table} BEGIN
+            INSERT INTO {fts_table}(rowid, {cols}) VALUES (new.id, {new_vals});
+        END;
+        CREATE TRIGGER IF NOT EXISTS {fts_table}_delete AFTER DELETE ON {table} BEGIN
+            INSERT INTO {fts_table}({fts_table}, rowid, {cols}) VALUES ('delete', old.id, {old_vals});
+        END;
+        CREATE TRIGGER IF NOT EXISTS {fts_table}_update AFTER UPDATE ON {table} BEGIN
+            INSERT INTO {fts_table}({fts_table}, rowid, {cols}) VALUES ('delete', old.id, {old_vals});
+            INSERT INTO {fts_table}(rowid, {cols}) VALUES (new.id, {new_vals});
+        END;
+        INSERT INTO {fts_table}({fts_table}) VALUES ('rebuild');
+        """
+    )
+    return True
+
+
 # Keep a dictionary of part search databases for different tools.
 part_search_dbs = {}
 
@@ -113,6 +248,17 @@ class PartSearchDB:
       - libraries(lib_file TEXT PRIMARY KEY, mtime REAL)
       - parts(id INTEGER PRIMARY KEY, part_name TEXT, lib_file TEXT, search_text TEXT)
 
+    If SQLite supports FTS5 with the trigram tokenizer, the search text of the
+    parts is also indexed by the parts_fts full-text virtual table that's kept
+    up-to-date by triggers on the parts table. Searches then only check the parts
+    that the index finds for the terms. Otherwise, searches scan the whole parts
+    table. Either way, the terms are matched as substrings with LIKE, so both
+    find the same parts.
+
+    Libraries are added by scanning their files (optionally on a pool of processes) for
+    just the information that's searched, and all their parts are stored in one transaction.
+    The DB uses write-ahead logging so it can be searched while it's being updated.
+
     The DB path is taken from skidl.config.part_search_db_dir. If that attribute is
     not present, defaults to the current directory.
     """
@@ -124,15 +270,8 @@ class PartSearchDB:
 
         self.tool = tool or skidl.get_default_tool()
 
-        # Resolve path to database. Libraries for each tool have their own database.
-        db_name = db_name or "part_search"
-        db_name = f"{db_name}_{self.tool}.db"
-        db_dir = db_dir or getattr(skidl.config, "part_search_db_dir", ".")
-        db_path = expand_path(os.path.join(db_dir, db_name))
-
-        # Connect/create DB.
-        self._conn = sqlite3.connect(db_path)
-        self._conn.row_factory = sqlite3.Row
+        # Connect/create DB. Libraries for each tool have their own database.
+        self._conn = _connect_search_db(db_dir, db_name or "part_search", self.tool)
         self._cur = self._conn.cursor()
 
         # Use existing database or create a new one.
@@ -186,8 +325,34 @@ class PartSearchDB:
                     f"Could not create unique index on parts(part_name, lib_file): {e}"
                 )
 
+            self.fts = self._init_fts()
+
             self._conn.commit()
 
+    def _init_fts(self):
+        """
+        Create the trigram index of the parts table if SQLite supports it.
+
+        An index of whole words made by an earlier version is replaced.
+
+        Returns:
+            bool: True if the full-text index is available.
+        """
+
+        self._cur.execute("SELECT sql FROM sqlite_master WHERE name = 'parts_fts'")
+        row = self._cur.fetchone()
+        if row and "trigram" not in row[0]:
+            self._cur.execute("DROP TABLE parts_fts")
+            for op in ("insert", "delete", "update"):
+                self._cur.execute(f"DROP TRIGGER IF EXISTS parts_fts_{op}")
+
+        fts = _init_fts_index(self._cur, "parts", ("search_text",), "tokenize='trigram'")
+        if not fts:
+            active_logger.bare_warning(
+                "SQLite FTS5 with trigrams is not available, so part searches will scan every part."
+            )
+        return fts
+
     def _get_lib_file_status(self):
         """
         Return lists of missing, stale, and fresh library files.
@@ -231,15 +396,92 @@ class PartSearchDB:
         not_fresh_files = set(get_all_lib_files(self.tool)) - set(fresh_files)
         self.add_libs(*not_fresh_files)
 
-    def add_libs(self, *lib_files):
+    def add_libs(self, *lib_files, tool=None, workers=None):
         """
         Add or replace libraries listed in lib_files (iterable of filenames).
         Each lib is added or updated in the libraries table and
         its parts are added or updated in the parts table.
+
+        If the tool module has a scan_sch_lib() function, the library files are
+        scanned for the names, aliases, descriptions and keywords of their parts,
+        either in this process or by a pool of processes. Otherwise, the libraries
+        are loaded with SchLib. Then the parts from all the libraries are stored
+        in a single transaction.
+
+        Args:
+            lib_files (str): Library file names. They should be absolute paths
+                (or something SchLib can use).
+            tool (str, optional): The ECAD tool format of the libraries.
+                Defaults to the DB's tool.
+            workers (int, optional): Number of processes used to scan the library
+                files. Defaults to skidl.config.part_search_workers, or to 1 if
+                that's None. With more than one, the processes are started with
+                the default method of the platform, so a script that adds libraries
+                this way on a platform that doesn't fork must guard its main code
+                with `if __name__ == "__main__":`.
         """
 
-        for lib_file in lib_files:
-            self.add_lib(lib_file)
+        import skidl
+
+        tool = tool or self.tool
+        if workers is None:
+            workers = skidl.config.get("part_search_workers") or 1
+
+        # Scan the library files, in parallel if there are enough of them.
+        abs_fns = [expand_path(lib_file) for lib_file in lib_files]
+        scan = functools.partial(_scan_lib_file, tool)
+        pool = None
+        if workers > 1 and len(abs_fns) > 1:
+            pool = ProcessPoolExecutor(max_workers=min(workers, len(abs_fns)))
+        if pool:
+            chunksize = max(1, -(-len(abs_fns) // (workers * 4)))
+            scanned_libs = pool.map(scan, abs_fns, chunksize=chunksize)
+        else:
+            scanned_libs = map(scan, abs_fns)
+
+        libs = []
+        try:
+            for lib_path, abs_fn, parts in zip(lib_files, abs_fns, scanned_libs):
+
+                # Give some feedback so user knows something is happening.
+                print(" " * 79, f"\rAdding {lib_path} ...", sep="", end="\r")
+
+                if parts is None:
+                    abs_fn, parts = self._load_lib_parts(lib_path, tool)
+
+                # Compute mtime. If file missing, use current time as fallback.
+                try:
+                    mtime = os.path.getmtime(abs_fn)
+                except OSError:
+                    mtime = time.time()
+
+                parts_to_insert = []
+                for name, aliases, descr, keywords in parts:
+                    aliases = " ".join(aliases)
+                    # Build search text: name, aliases, description, keywords.
+                    search_text = " ".join(filter(None, [name, aliases, descr, keywords]))
+                    parts_to_insert.append((name, abs_fn, search_text, aliases, descr, keywords))
+                libs.append((abs_fn, mtime, parts_to_insert))
+        finally:
+            if pool:
+                pool.shutdown()
+
+        with self._lock:
+            # All the libraries are stored in the transaction started by the
+            # first INSERT and ended by the commit.
+            for abs_fn, mtime, parts_to_insert in libs:
+                # Insert/update library record.
+                self._cur.execute(
+                    "INSERT OR REPLACE INTO libraries(lib_file, mtime) VALUES(?, ?)",
+                    (abs_fn, mtime),
+                )
+                # Bulk insert parts using INSERT OR REPLACE so entries keyed by
+                # (part_name, lib_file) are replaced rather than duplicated.
+                self._cur.executemany(
+                    "INSERT OR REPLACE INTO parts(part_name, lib_file, search_text, aliases, description, keywords) VALUES(?, ?, ?, ?, ?, ?)",
+                    parts_to_insert,
+                )
+            self._conn.commit()
 
     def add_lib(self, lib_path, tool=None):
         """
@@ -248,26 +490,30 @@ class PartSearchDB:
         If the library is already in the database, then update it and all its parts.
         """
 
-        from .schlib import SchLib
+        self.add_libs(lib_path, tool=tool)
 
-        # Use provided tool or fall back to the DB's tool.
-        tool = tool or self.tool
+    def _load_lib_parts(self, lib_path, tool):
+        """
+        Load a library with SchLib and get the searchable information about its parts.
 
-        # Load the library using SchLib so it resolves and parses parts.
-        lib = SchLib(filename=lib_path, tool=tool)
-        # Use absolute filename stored by SchLib if present.
-        abs_fn = expand_path(getattr(lib, "filename", lib_path))
+        Args:
+            lib_path (str): Library file name (or something SchLib can use).
+            tool (str): The ECAD tool format of the library.
+
+        Returns:
+            tuple: The absolute filename of the library and a list with a
+                (name, aliases, description, keywords) tuple for each part.
+        """
 
-        # Give some feedback so user knows something is happening.
-        print(" " * 79, f"\rAdding {lib_path} ...", sep="", end="\r")
+        from .schlib import SchLib
 
-        # Compute mtime. If file missing, use current time as fallback.
-        try:
-            mtime = os.path.getmtime(abs_fn)
-        except OSError:
-            mtime = time.time()
+        # Load the library using SchLib so it resolves and parses parts.
+        lib = SchLib(filename=lib_path, tool=tool)
+        # Use absolute filename stored by SchLib if present. (SchLib.filename is
+        # whatever name the library was first loaded with.)
+        abs_fn = expand_path(getattr(lib, "filepath", lib_path))
 
-        parts_to_insert = []
+        parts = []
         # Parse parts to collect searchable text.
         for part in lib:
             try:
@@ -276,32 +522,11 @@ class PartSearchDB:
             except Exception:
                 # Skip parts with parse errors.
                 continue
-            aliases = (
-                " ".join(list(part.aliases)) if getattr(part, "aliases", None) else ""
-            )
+            aliases = list(part.aliases) if getattr(part, "aliases", None) else []
             descr = getattr(part, "description", "") or ""
             keywords = getattr(part, "keywords", "") or ""
-            # Build search text: name, aliases, description, keywords.
-            search_text = " ".join(filter(None, [part.name, aliases, descr, keywords]))
-            parts_to_insert.append((part.name, abs_fn, search_text, aliases, descr, keywords))
-
-        with self._lock:
-            # Insert/update library record.
-            self._cur.execute(
-                "INSERT OR REPLACE INTO libraries(lib_file, mtime) VALUES(?, ?)",
-                (abs_fn, mtime),
-            )
-            # Bulk insert parts using INSERT OR REPLACE so entries keyed by
-            # (part_name, lib_file) are replaced rather than duplicated.
-            if parts_to_insert:
-                self._cur.executemany(
-                    "INSERT OR REPLACE INTO parts(part_name, lib_file, search_text, aliases, description, keywords) VALUES(?, ?, ?, ?, ?, ?)",
-                    parts_to_insert,
-                )
-                self._conn.commit()
-            else:
-                # No parts found: commit library entry change.
-                self._conn.commit()
+            parts.append((part.name, aliases, descr, keywords))
+        return abs_fn, parts
 
     def update_libs(self):
         """
@@ -332,8 +557,8 @@ class PartSearchDB:
         # Use SchLib to resolve the filename (it will raise if not found).
         try:
             lib = SchLib(filename=lib_file, tool=self.tool)
-            # Use absolute path recorded in SchLib.filename if available.
-            resolved = getattr(lib, "filename", lib_file)
+            # Use absolute path recorded in SchLib.filepath if available.
+            resolved = getattr(lib, "filepath", lib_file)
         except Exception:
             # Fall back to the raw lib_file path (maybe it's already absolute).
             resolved = lib_file
@@ -493,6 +718,11 @@ class PartSearchDB:
         Search parts for the given query string.
         Supports quoted phrases and '|' as OR.
 
+        Each term matches anywhere in the search text of a part (case-insensitively
+        for ASCII letters). The parts with all the terms of an OR-group in their
+        name come first, with the shortest names ahead. If the full-text index is available, it's used to find
+        the parts that might match so the others don't have to be checked.
+
         Returns a list of (part_name, lib_file) tuples for matches.
         """
 
@@ -506,28 +736,112 @@ class PartSearchDB:
             return []
 
         tokens_groups = self._tokenize_query(query)
+        if not tokens_groups:
+            return []
 
-        with self._lock:
-            where_clauses = []
-            params = []
-            for group in tokens_groups:
-                subclauses = []
-                for term in group:
-                    subclauses.append("search_text LIKE ?")
-                    params.append(f"%{term}%")
-                where_clauses.append("(" + " AND ".join(subclauses) + ")")
-            where_sql = " OR ".join(where_clauses)
-            sql = f"SELECT part_name, lib_file, aliases, description, keywords FROM parts WHERE {where_sql}"
-            if limit:
-                sql += f" LIMIT {int(limit)}"
-            self._cur.execute(sql, params)
-            rows = self._cur.fetchall()
+        if self.fts:
+            rows = self._search_fts(tokens_groups, limit)
+        else:
+            rows = self._search_like(tokens_groups, limit)
 
         return [PartResult(r["part_name"], r["lib_file"], 
                            os.path.basename(r["lib_file"]), 
                            os.path.splitext(os.path.basename(r["lib_file"]))[0],
                            r["aliases"], r["description"], r["keywords"]) for r in rows]
 
+    @staticmethod
+    def _fts_query(tokens_groups):
+        """
+        Convert the OR-groups of terms from _tokenize_query() into an FTS5 MATCH expression.
+
+        A trigram index can only look up text with at least three characters, so
+        each term is split at the LIKE wildcards % and _ and the pieces shorter
+        than that are left out. Each piece is a quoted string so it's matched as
+        a substring. Any part whose search text contains the terms of an OR-group
+        contains all these pieces, so the index finds every part that can match.
+
+        Example:
+            [["opamp", "dual"], ["LM358"]] -> ("opamp" AND "dual") OR ("LM358")
+
+        Returns:
+            str: The MATCH expression or None if an OR-group has no pieces
+                long enough to look up.
+        """
+
+        def fts_pieces(term):
+            return [
+                '"' + piece.replace('"', '""') + '"'
+                for piece in re.split(r"[%_]", term)
+                if len(piece) >= 3
+            ]
+
+        group_exprs = []
+        for group in tokens_groups:
+            pieces = [piece for term in group for piece in fts_pieces(term)]
+            if not pieces:
+                return None
+            group_exprs.append("(" + " AND ".join(pieces) + ")")
+        return " OR ".join(group_exprs)
+
+    def _search_fts(self, tokens_groups, limit=None):
+        """
+        Return the rows of the parts matching the OR-groups of terms using the full-text index.
+
+        Only the parts the index finds for the terms are checked with LIKE, so
+        this returns the same rows as _search_like(). If an OR-group has no
+        terms that can be looked up in the index, every part is checked.
+        """
+
+        return self._select_parts(tokens_groups, limit, self._fts_query(tokens_groups))
+
+    def _search_like(self, tokens_groups, limit=None):
+        """
+        Return the rows of the parts with search text containing the OR-groups of terms.
+        """
+
+        return self._select_parts(tokens_groups, limit)
+
+    def _select_parts(self, tokens_groups, limit=None, fts_query=None):
+        """
+        Return the rows of the parts with search text containing the OR-groups of terms.
+
+        Args:
+            tokens_groups (list): OR-groups of terms from _tokenize_query().
+            limit (int, optional): Maximum number of rows to return.
+            fts_query (str, optional): MATCH expression for the full-text index
+                that selects the parts to check.
+
+        Returns:
+            list: Rows with the part name, library file, aliases, description and
+                keywords. Parts with all the terms of an OR-group in their name
+                come before the others, and each of these is ordered by the
+                length of the part names.
+        """
+
+        def any_group_in(column):
+            clauses = []
+            for group in tokens_groups:
+                clauses.append("(" + " AND ".join(f"{column} LIKE ?" for _ in group) + ")")
+                params.extend(f"%{term}%" for term in group)
+            return "(" + " OR ".join(clauses) + ")"
+
+        params = []
+        where_sql = any_group_in("search_text")
+        if fts_query:
+            where_sql = f"id IN (SELECT rowid FROM parts_fts WHERE parts_fts MATCH ?) AND {where_sql}"
+            params.insert(0, fts_query)
+        order_sql = any_group_in("part_name") + " DESC, length(part_name), id"
+        sql = f"""
+            SELECT part_name, lib_file, aliases, description, keywords FROM parts
+            WHERE {where_sql}
+            ORDER BY {order_sql}
+            """
+        if limit:
+            sql += f" LIMIT {int(limit)}"
+        with self._lock:
+            self._cur.execute(sql, params)
+            return self._cur.fetchall()
+
     def close(self):
         """
         Close the database connection.
@@ -762,10 +1076,307 @@ class FootprintCache(dict):
             }
 
 
-# Cache for storing footprints read from .kicad_mod files.
+# Cache for storing the footprint libraries listed in the fp-lib-table files.
 footprint_cache = FootprintCache()
 
 
+def _read_footprint_lines(filename):
+    """
+    Read the lines of a footprint module file.
+
+    Args:
+        filename (str): Path to the .kicad_mod file.
+
+    Returns:
+        list: Lines of the file with any trailing whitespace removed so they
+            won't interfere with fullmatch().
+    """
+    with open(filename, "rb") as fp:
+        text = fp.read().decode("utf-8", errors="replace")
+    return [l.rstrip() for l in text.splitlines()]
+
+
+def _scan_footprint(lib_name, module_name, filename):
+    """
+    Get the searchable information about a footprint module from its file.
+
+    Args:
+        lib_name (str): Nickname of the footprint library.
+        module_name (str): Name of the footprint module.
+        filename (str): Path to the .kicad_mod file.
+
+    Returns:
+        tuple: The number of pads, the description, the tags and the text searched
+            for the module.
+    """
+
+    module_text = _read_footprint_lines(filename)
+
+    # Count the pads so it can be added to the text being searched.
+    # Join all the module text lines, search for the number of
+    # occurrences of "(pad", and then count them.
+    # A set is used so pads with the same num/name are only counted once.
+    # Place the pad count before everything else so the space that
+    # terminates it won't be stripped off later. This is necessary
+    # so (for example) "#pads=20 " won't match "#pads=208".
+    num_pads = len(set(re.findall(r"\(\s*pad\s+([^\s)]+)", " ".join(module_text))))
+    num_pads_str = f"#pads={num_pads}"
+
+    # Create a string with the module name, library name, number of pads,
+    # description and tags.
+    search_text = "\n".join([num_pads_str, lib_name, module_name])
+    descr = tags = ""
+    for line in module_text:
+        if "(descr " in line or "(tags " in line:
+            search_text = "\n".join([search_text, line])
+        if "(descr " in line:
+            descr = line.split("(descr ")[1].rsplit(")", 1)[0]
+        if "(tags " in line:
+            tags = line.split("(tags ")[1].rsplit(")", 1)[0]
+
+    return num_pads, descr, tags, search_text
+
+
+def _literal_search_terms(terms):
+    """
+    Get the search terms that are plain text instead of regular expressions.
+
+    Args:
+        terms (str): Space-separated search terms as used by _parse_search_terms().
+
+    Returns:
+        list: The terms made of only letters, digits and the characters _-=#
+            and spaces, with at least three characters. Any text with all the
+            terms contains each of these, so they can be looked up in a
+            trigram index.
+    """
+    terms = re.sub(r"\s*\|\s*", r"|", terms.strip())
+    terms = [rmv_quotes(t) for t in re.findall(r"\".*?\"|\'.*?\'|\S+", terms)]
+    return [t for t in terms if re.fullmatch(r"[\w\-=# ]{3,}", t)]
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_search_regex(regex):
+    """Compile the regex for a footprint search the way fullmatch() would apply it."""
+    return re.compile("(?:" + regex + r")\Z", flags=re.IGNORECASE | re.MULTILINE | re.DOTALL)
+
+
+def _regexp(regex, text):
+    """Implement the SQLite REGEXP operator for footprint searches."""
+    return _compile_search_regex(regex).match(text) is not None
+
+
+class FootprintSearchDB:
+    """
+    Manage a footprint search SQLite database.
+
+    The DB contains two tables:
+      - fp_libs(lib_name TEXT PRIMARY KEY, path TEXT, mtime REAL)
+      - footprints(id INTEGER PRIMARY KEY, lib_name TEXT, module_name TEXT, mtime REAL,
+                   num_pads INTEGER, descr TEXT, tags TEXT, search_text TEXT)
+
+    When a library is updated, the modification time of each of its module files
+    is checked and only the files with a new modification time are read. (The
+    modification time of the library directory isn't enough since it doesn't
+    change when a module file is edited in place.) If SQLite supports FTS5 with the trigram
+    tokenizer, the search text is indexed by the footprints_fts table so the
+    plain-text terms of a search can be looked up before applying the regular
+    expression for the search to the remaining footprints.
+
+    The DB is stored in the same directory as the part search DB.
+    """
+
+    _lock = threading.RLock()
+
+    def __init__(self, db_dir=None, db_name=None, tool=None):
+        import skidl
+
+        self.tool = tool or skidl.get_default_tool()
+
+        # Connect/create DB. Footprints for each tool have their own database.
+        self._conn = _connect_search_db(db_dir, db_name or "footprint_search", self.tool)
+        try:
+            self._conn.create_function("REGEXP", 2, _regexp, deterministic=True)
+        except (TypeError, sqlite3.NotSupportedError):
+            # Python 3.7 and older or an SQLite older than 3.8.3 can't mark the function
+            # as deterministic, which only lets SQLite skip some calls of it.
+            self._conn.create_function("REGEXP", 2, _regexp)
+        self._cur = self._conn.cursor()
+
+        # Use existing database or create a new one.
+        self._detect_and_init_db()
+
+    def _detect_and_init_db(self):
+        """
+        Create tables if they don't exist.
+        """
+
+        with self._lock:
+            self._cur.execute(
+                """
+                CREATE TABLE IF NOT EXISTS fp_libs (
+                    lib_name TEXT PRIMARY KEY,
+                    path TEXT,
+                    mtime REAL
+                )
+                """
+            )
+            self._cur.execute(
+                """
+                CREATE TABLE IF NOT EXISTS footprints (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    lib_name TEXT,
+                    module_name TEXT,
+                    mtime REAL,
+                    num_pads INTEGER,
+                    descr TEXT,
+                    tags TEXT,
+                    search_text TEXT,
+                    FOREIGN KEY(lib_name) REFERENCES fp_libs(lib_name)
+                )
+                """
+            )
+            self._cur.execute(
+                """
+                CREATE UNIQUE INDEX IF NOT EXISTS footprints_lib_module_unique
+                ON footprints(lib_name, module_name)
+                """
+            )
+            self.fts = _init_fts_index(
+                self._cur, "footprints", ("search_text",), "tokenize='trigram'"
+            )
+            self._conn.commit()
+
+    def rmv_other_libs(self, lib_names):
+        """
+        Remove the footprint libraries that aren't in lib_names from the database.
+        """
+
+        with self._lock:
+            self._cur.execute("SELECT lib_name FROM fp_libs")
+            for row in self._cur.fetchall():
+                if row["lib_name"] not in lib_names:
+                    self._cur.execute("DELETE FROM footprints WHERE lib_name = ?", (row["lib_name"],))
+                    self._cur.execute("DELETE FROM fp_libs WHERE lib_name = ?", (row["lib_name"],))
+            self._conn.commit()
+
+    def update_lib(self, lib_name, path, module_names):
+        """
+        Bring the footprints stored for a library up to date with its directory.
+
+        Args:
+            lib_name (str): Nickname of the footprint library.
+            path (str): Path to the library directory.
+            module_names (iterable): Names of the footprint modules in the directory.
+        """
+
+        try:
+            lib_mtime = os.path.getmtime(path)
+        except OSError:
+            lib_mtime = time.time()
+
+        with self._lock:
+            self._cur.execute("SELECT path FROM fp_libs WHERE lib_name = ?", (lib_name,))
+            row = self._cur.fetchone()
+            if row and row["path"] != path:
+                # The nickname is used for a different directory, so start over.
+                self._cur.execute("DELETE FROM footprints WHERE lib_name = ?", (lib_name,))
+
+            self._cur.execute(
+                "SELECT module_name, mtime FROM footprints WHERE lib_name = ?", (lib_name,)
+            )
+            stored_mtimes = {row["module_name"]: row["mtime"] for row in self._cur.fetchall()}
+
+            footprints_to_insert = []
+            for module_name in module_names:
+                filename = os.path.join(path, module_name + ".kicad_mod")
+                try:
+                    mtime = os.path.getmtime(filename)
+                except OSError:
+                    continue
+                if stored_mtimes.pop(module_name, None) == mtime:
+                    continue
+                num_pads, descr, tags, search_text = _scan_footprint(
+                    lib_name, module_name, filename
+                )
+                footprints_to_insert.append(
+                    (lib_name, module_name, mtime, num_pads, descr, tags, search_text)
+                )
+
+            # Whatever's left of the stored modules is no longer in the directory.
+            self._cur.executemany(
+                "DELETE FROM footprints WHERE lib_name = ? AND module_name = ?",
+                [(lib_name, module_name) for module_name in stored_mtimes],
+            )
+            self._cur.executemany(
+                "INSERT OR REPLACE INTO footprints(lib_name, module_name, mtime, num_pads, descr, tags, search_text) VALUES(?, ?, ?, ?, ?, ?, ?)",
+                footprints_to_insert,
+            )
+            self._cur.execute(
+                "INSERT OR REPLACE INTO fp_libs(lib_name, path, mtime) VALUES(?, ?, ?)",
+                (lib_name, path, lib_mtime),
+            )
+            self._conn.commit()
+
+    def search(self, terms, lib_name=None):
+        """
+        Search the footprints for the given regex terms.
+
+        Args:
+            terms (str): Space-separated search terms as used by search_footprints().
+            lib_name (str, optional): Only search the footprints in this library.
+
+        Returns:
+            list: (lib_name, module_name, descr, tags) rows for the matching footprints
+                sorted by library and module name.
+        """
+
+        where_clauses = []
+        params = []
+        if lib_name is not None:
+            where_clauses.append("lib_name = ?")
+            params.append(lib_name)
+        literal_terms = _literal_search_terms(terms) if self.fts else []
+        if literal_terms:
+            # Only apply the regex to the footprints containing all the plain-text terms.
+            where_clauses.append(
+                "id IN (SELECT rowid FROM footprints_fts WHERE footprints_fts MATCH ?)"
+            )
+            params.append(" AND ".join(f'"{term}"' for term in literal_terms))
+        where_clauses.append("search_text REGEXP ?")
+        params.append(_parse_search_terms(terms))
+
+        sql = f"""
+            SELECT lib_name, module_name, descr, tags FROM footprints
+            WHERE {" AND ".join(where_clauses)}
+            ORDER BY lib_name, module_name
+            """
+        with self._lock:
+            self._cur.execute(sql, params)
+            return self._cur.fetchall()
+
+    def close(self):
+        """
+        Close the database connection.
+        """
+
+        try:
+            self._conn.commit()
+            self._conn.close()
+        except Exception:
+            pass
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
+# Keep a dictionary of footprint search databases for different tools.
+footprint_search_dbs = {}
+
+
 @export_to_all
 def search_footprints_iter(terms, tool=None):
     """
@@ -774,6 +1385,11 @@ def search_footprints_iter(terms, tool=None):
     This generator function yields information about libraries being searched and footprints
     found that match the search terms.
 
+    The footprints are searched in the footprint search database. Before each
+    library is searched for the first time in a session (or after the footprint
+    search paths change), the database is updated with any footprint files that
+    were added, removed or changed in the library directory.
+
     Args:
         terms (str): Space-separated search terms to match against footprint attributes.
         tool (str, optional): The ECAD tool format for the footprint libraries to search.
@@ -788,17 +1404,24 @@ def search_footprints_iter(terms, tool=None):
 
     tool = tool or skidl.config.tool
 
-    terms = _parse_search_terms(terms)
+    if tool not in footprint_search_dbs:
+        footprint_search_dbs[tool] = FootprintSearchDB(tool=tool)
+    db = footprint_search_dbs[tool]
 
     # If the cache isn't valid, then make it valid by gathering all the
-    # footprint files from all the directories in the search paths.
-    if not footprint_cache.valid:
+    # footprint libraries from all the directories in the search paths.
+    update_db = not footprint_cache.valid
+    if update_db:
         footprint_cache.clear()
         footprint_cache.load(skidl.footprint_search_paths[tool])
+        db.rmv_other_libs(footprint_cache)
 
     # Get the number of footprint libraries to be searched..
     num_fp_libs = len(footprint_cache)
 
+    # Footprints found in all the libraries, grouped by library.
+    found = None
+
     # Now search through the libraries for footprints that match the search terms.
     for idx, fp_lib in enumerate(footprint_cache):
 
@@ -811,54 +1434,32 @@ def search_footprints_iter(terms, tool=None):
         path = footprint_cache[fp_lib]["path"]
         modules = footprint_cache[fp_lib]["modules"]
 
-        # Search each module in the library.
-        for module_name in modules:
-
-            # If the cache isn't valid, then read each footprint file and store
-            # it's contents in the cache.
-            if not footprint_cache.valid:
-                file = os.path.join(path, module_name + ".kicad_mod")
-                with open(file, "r") as fp:
-                    try:
-                        # Remove any linefeeds that would interfere with fullmatch() later on.
-                        modules[module_name] = [l.rstrip() for l in fp.readlines()]
-                    except UnicodeDecodeError:
-                        try:
-                            modules[module_name] = [
-                                l.decode("utf-8").rstrip() for l in fp.readlines()
-                            ]
-                        except AttributeError:
-                            modules[module_name] = ""
-
-            # Get the contents of the footprint file from the cache.
-            module_text = tuple(modules[module_name])
-
-            # Count the pads so it can be added to the text being searched.
-            # Join all the module text lines, search for the number of
-            # occurrences of "(pad", and then count them.
-            # A set is used so pads with the same num/name are only counted once.
-            # Place the pad count before everything else so the space that
-            # terminates it won't be stripped off later. This is necessary
-            # so (for example) "#pads=20 " won't match "#pads=208".
-            num_pads = len(
-                set(re.findall(r"\(\s*pad\s+([^\s)]+)", " ".join(module_text)))
-            )
-            num_pads_str = f"#pads={num_pads}"
-
-            # Create a string with the module name, library name, number of pads,
-            # description and tags.
-            search_text = "\n".join([num_pads_str, fp_lib, module_name])
-            for line in module_text:
-                if "(descr " in line or "(tags " in line:
-                    search_text = "\n".join([search_text, line])
-
-            # Search the string for a match with the search terms.
-            if fullmatch(
-                terms, search_text, flags=re.IGNORECASE | re.MULTILINE | re.DOTALL
-            ):
-                yield "MODULE", fp_lib, module_text, module_name
-
-    # At the end, all modules have been scanned and the footprint cache is valid.
+        if update_db:
+            # Update the stored footprints for the library if it hasn't been
+            # done yet and then search them.
+            db.update_lib(fp_lib, path, modules)
+            rows = db.search(terms, fp_lib)
+        else:
+            # All the libraries are up to date, so search them all at once.
+            if found is None:
+                found = {}
+                for row in db.search(terms):
+                    found.setdefault(row["lib_name"], []).append(row)
+            rows = found.get(fp_lib, [])
+
+        for row in rows:
+            module_name = row["module_name"]
+            # Read the contents of the footprint file for the caller.
+            if modules.get(module_name) is None:
+                try:
+                    modules[module_name] = _read_footprint_lines(
+                        os.path.join(path, module_name + ".kicad_mod")
+                    )
+                except OSError:
+                    continue
+            yield "MODULE", fp_lib, tuple(modules[module_name]), module_name
+
+    # At the end, all the libraries are in the database and the footprint cache is valid.
     footprint_cache.valid = True
 
 
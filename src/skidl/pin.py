@@ -19,6 +19,7 @@ from copy import copy
 from enum import IntEnum
 from functools import total_ordering
 
+from .alias import Alias
 from .logger import active_logger
 from .skidlbaseobj import ERROR, OK, WARNING, SkidlBaseObject
 from .utilities import (
@@ -178,6 +179,14 @@ pin_info = {
     },
 }
 
+# Pin attributes that always belong to a single pin and are never shared
+# with other copies of the same pin through a template.
+_instance_attrs = frozenset(("fields", "nets", "part", "_aliases", "_template"))
+
+# Types of attribute values that can't be changed in place, so copies of
+# a pin can share them safely.
+_shareable_types = (str, int, float, type(None))
+
 
 @export_to_all
 @total_ordering
@@ -197,6 +206,13 @@ class Pin(SkidlBaseObject):
         do_erc (bool): When False, the pin is not checked for ERC violations.
         stub (bool): When True, the pin is only for internal schematic connections.
         aliases (list): Alternative names for this pin.
+
+    Notes:
+        Copies of a pin share a template holding the values of attributes that
+        can't be changed in place (name, number, function, coordinates, etc.).
+        Each copy only stores its part, its nets, and any attributes that are
+        assigned to it after it was made. Assigning an attribute of a copy
+        overrides the template value for that copy alone.
     """
 
     # Maximum allowable pin number.
@@ -206,6 +222,9 @@ class Pin(SkidlBaseObject):
     funcs = pin_types  # A synonym for types.
     drives = pin_drives
 
+    # Attributes that change the outcome of the ERC of the pin's part and nets.
+    _erc_attrs = frozenset(("func", "do_erc", "_drive", "_name", "_num"))
+
     def __init__(self, **attribs):
         super().__init__()
 
@@ -228,6 +247,111 @@ class Pin(SkidlBaseObject):
         for k, v in list(attribs.items()):
             setattr(self, k, v)
 
+    def __getattr__(self, key):
+        """
+        Retrieve an attribute from the template shared with other copies of the pin.
+
+        This is only called if the attribute isn't stored in the pin itself.
+        If the template doesn't have it, the pin fields are searched.
+
+        Args:
+            key: The attribute name to retrieve.
+
+        Returns:
+            The value of the attribute.
+
+        Raises:
+            AttributeError: If the attribute doesn't exist.
+        """
+        try:
+            return self.__dict__["_template"][key]
+        except KeyError:
+            return SkidlBaseObject.__getattr__(self, key)
+
+    def __delattr__(self, key):
+        """
+        Delete an attribute of the pin.
+
+        If the attribute is in the shared template, the pin gets its own copy of
+        the template attributes first so the other pins sharing it are unaffected.
+
+        Args:
+            key: The attribute name to delete.
+        """
+        if key in self.__dict__.get("_template", ()):
+            self._detach_template()
+        super().__delattr__(key)
+
+    def _share_attrs(self):
+        """
+        Move the attributes that copies of this pin can share into a template.
+
+        Returns:
+            dict: The template of shared attributes or None if there are none.
+        """
+        attrs = self.__dict__
+        shared = {
+            k: v
+            for k, v in attrs.items()
+            if k not in _instance_attrs and isinstance(v, _shareable_types)
+        }
+        if "_aliases" in attrs:
+            shared["_aliases"] = frozenset(attrs["_aliases"])
+        template = attrs.get("_template")
+        if shared:
+            # Attributes stored in the pin override those in its current template.
+            # Pins already sharing the current template keep using it.
+            if template:
+                shared = {**template, **shared}
+            for k in shared:
+                attrs.pop(k, None)
+            attrs["_template"] = template = shared
+        return template
+
+    def _detach_template(self):
+        """Give the pin its own copies of the attributes in its shared template."""
+        attrs = self.__dict__
+        template = attrs.pop("_template", None) or {}
+        for k, v in template.items():
+            if k == "_aliases":
+                v = Alias(list(v))
+            attrs.setdefault(k, v)
+
+    def _get_aliases(self):
+        """
+        Get the aliases of the pin without copying any that are shared with other pins.
+
+        Returns:
+            set: The pin aliases. Don't modify them!
+        """
+        attrs = self.__dict__
+        try:
+            return attrs["_aliases"]
+        except KeyError:
+            return attrs.get("_template", {}).get("_aliases", ())
+
+    @SkidlBaseObject.aliases.getter
+    def aliases(self):
+        """
+        Get the aliases for this pin.
+
+        Aliases shared with other copies of the pin are copied into the pin the
+        first time they're requested so they can be changed in place.
+
+        Returns:
+            An Alias object containing all alternate names for this pin.
+        """
+        attrs = self.__dict__
+        try:
+            return attrs["_aliases"]
+        except KeyError:
+            pass
+        shared = attrs.get("_template", {}).get("_aliases")
+        if shared is None:
+            return Alias([])  # No aliases, so just return an empty list.
+        aliases = attrs["_aliases"] = Alias(list(shared))
+        return aliases
+
     def __str__(self):
         """
         Return a description of this pin as a string.
@@ -511,31 +635,8 @@ class Pin(SkidlBaseObject):
                 f"Can't make a negative number ({num_copies}) of copies of a pin!"
             )
 
-        # Skip some Pin attributes that would cause an infinite recursion exception
-        # or naming clashes.
-        skip_attrs = ('nets', 'num')
-
-        copies = []
-        for _ in range(num_copies):
-
-            # Create a new pin to store the copy.
-            cpy = Pin()
-
-            # Copy stuff from the original pin to the copy.
-            for k,v in self.__dict__.items():
-                if k in skip_attrs:
-                    continue
-                if isinstance(v, Iterable) and not isinstance(v, str):
-                    # Copy the list with shallow copies of its items to the copy.
-                    setattr(cpy, k, copy(v))
-                else:
-                    setattr(cpy, k, v)
-
-            # Copy gets the same pin number if the source is an actual pin.
-            # Otherwise, the copy will keep the random pin number it was given
-            # when it was created.
-            if self.is_assigned():
-                cpy.num = self.num
+        copies = self._make_copies(num_copies)
+        for cpy in copies:
 
             # Attach additional attributes to the pin.
             for k, v in list(attribs.items()):
@@ -545,13 +646,74 @@ class Pin(SkidlBaseObject):
             if self.nets:
                 self.nets[0] += cpy
 
-            copies.append(cpy)
-
         # Return a list of the copies made or just a single copy.
         if return_list:
             return copies
         return copies[0]
 
+    def _make_copies(self, num_copies):
+        """
+        Make unconnected copies of the pin that share a template of its static attributes.
+
+        Args:
+            num_copies (int): Number of copies to make of the pin.
+
+        Returns:
+            list[Pin]: The copies. They refer to the same part as the original
+                pin and aren't connected to any nets.
+
+        Notes:
+            The copies get the same number as the original pin, even if that's
+            the random number given to a pin that was created without one. (Pin
+            numbers are stored as strings, so such a pin counts as assigned and
+            copies of it always got its number.)
+        """
+
+        # Static attributes are shared by the copies through a template.
+        template = self._share_attrs()
+
+        # Copies get the alias for their number like they did when their number
+        # was assigned, even if the aliases of the original pin were replaced
+        # after it got its number. (The copies share another template for this.)
+        num = (template or self.__dict__).get("_num")
+        if template and num:
+            aliases = template.get("_aliases", frozenset())
+            if f"p{num}" not in aliases:
+                template = {**template, "_aliases": aliases | {f"p{num}"}}
+
+        # Skip the nets since the copies aren't connected to them. Any
+        # aliases of the pin are in the template.
+        skip_attrs = ("nets", "_template")
+        attrs = [(k, v) for k, v in self.__dict__.items() if k not in skip_attrs]
+
+        copies = []
+        for _ in range(num_copies):
+
+            # Create a new pin to store the copy. Pin.__init__() isn't needed
+            # since the copy gets all its attributes from the original pin.
+            cpy = Pin.__new__(Pin)
+            cpy_attrs = cpy.__dict__
+            cpy_attrs["nets"] = []
+            if template:
+                cpy_attrs["_template"] = template
+
+            # Copy the rest of the stuff from the original pin to the copy.
+            # This includes the pin number so the copy of an actual pin gets
+            # the same number.
+            for k, v in attrs:
+                if k == "part":
+                    # Refer to the same part instead of making a copy of it.
+                    cpy_attrs[k] = v
+                elif isinstance(v, Iterable) and not isinstance(v, str):
+                    # Copy the list with shallow copies of its items to the copy.
+                    cpy_attrs[k] = copy(v)
+                else:
+                    cpy_attrs[k] = v
+
+            copies.append(cpy)
+
+        return copies
+
     def is_assigned(self):
         """
         Return true if the pin has been assigned a valid pin number.
@@ -892,6 +1054,9 @@ class Pin(SkidlBaseObject):
         if num:
             self.aliases += f"p{num}"  # Add new num to aliases.
 
+        # Pin lookups in the part must see the new number.
+        self._names_changed()
+
     @num.deleter
     def num(self):
         """
@@ -904,6 +1069,28 @@ class Pin(SkidlBaseObject):
             pass
 
 
+    def _names_changed(self):
+        """
+        Tell the part containing this pin that the pin's number, name or aliases changed.
+
+        The part keeps an index for looking up its pins that has to be rebuilt
+        whenever a pin identifier changes.
+        """
+        part = self.__dict__.get("part")
+        if part is not None:
+            try:
+                part._invalidate_pin_index()
+            except AttributeError:
+                # The pin is attached to something that doesn't index its pins.
+                pass
+
+    def _erc_changed(self):
+        """Tell the circuit containing the pin's part that it must be rechecked by an incremental ERC."""
+        part = self.__dict__.get("part")
+        circuit = part.__dict__.get("circuit") if part is not None else None
+        if circuit is not None:
+            circuit.erc_changed(self)
+
     @property
     def pins(self):
         """
@@ -15,6 +15,7 @@ from collections import defaultdict
 from copy import copy
 
 from skidl import Pin
+from skidl.logger import active_logger
 from skidl.utilities import export_to_all, rmv_attr, sgn
 from .debug_draw import (
     draw_end,
@@ -24,7 +25,7 @@ from .debug_draw import (
     draw_start,
     draw_text,
 )
-from skidl.geometry import BBox, Point, Segment, Tx, Vector
+from skidl.geometry import BBox, BBoxIndex, Point, Segment, Tx, Vector
 
 
 __all__ = [
@@ -543,6 +544,27 @@ def net_force_dist(part, **options):
 attractive_force = net_force_dist
 
 
+def get_other_parts(part, part_bbox, parts, **options):
+    """Return the other parts that might overlap a part.
+
+    Args:
+        part (Part): Part whose overlaps are being found.
+        part_bbox (BBox): Bounding box of the part.
+        parts (list): List of parts to check for overlaps.
+        options (dict): Dict of options and values that enable/disable functions.
+
+    Returns:
+        set: The parts whose bounding boxes intersect the part's if the parts are
+            in options["bbox_index"], otherwise all the other parts.
+    """
+    bbox_index = options.get("bbox_index")
+    if bbox_index is None:
+        return set(parts) - {part}
+    other_parts = bbox_index.query(part_bbox)
+    other_parts.discard(part)
+    return other_parts
+
+
 @export_to_all
 def overlap_force(part, parts, **options):
     """Compute the repulsive force on a part from overlapping other parts.
@@ -551,6 +573,8 @@ def overlap_force(part, parts, **options):
         part (Part): Part affected by forces from other overlapping parts.
         parts (list): List of parts to check for overlaps.
         options (dict): Dict of options and values that enable/disable functions.
+            If options["bbox_index"] is a BBoxIndex of the parts, it's used to find
+            the parts that overlap this one instead of checking every part.
 
     Returns:
         Vector: Force upon given part.
@@ -561,7 +585,7 @@ def overlap_force(part, parts, **options):
 
     # Compute the overlap force of the bbox of this part with every other part.
     total_force = Vector(0, 0)
-    for other_part in set(parts) - {part}:
+    for other_part in get_other_parts(part, part_bbox, parts, **options):
         other_part_bbox = other_part.place_bbox * other_part.tx
 
         # No force unless parts overlap.
@@ -595,6 +619,8 @@ def overlap_force_rand(part, parts, **options):
         part (Part): Part affected by forces from other overlapping parts.
         parts (list): List of parts to check for overlaps.
         options (dict): Dict of options and values that enable/disable functions.
+            If options["bbox_index"] is a BBoxIndex of the parts, it's used to find
+            the parts that overlap this one instead of checking every part.
 
     Returns:
         Vector: Force upon given part.
@@ -605,7 +631,7 @@ def overlap_force_rand(part, parts, **options):
 
     # Compute the overlap force of the bbox of this part with every other part.
     total_force = Vector(0, 0)
-    for other_part in set(parts) - {part}:
+    for other_part in get_other_parts(part, part_bbox, parts, **options):
         other_part_bbox = other_part.place_bbox * other_part.tx
 
         # No force unless parts overlap.
@@ -642,6 +668,68 @@ repulsive_force = overlap_force
 # repulsive_force = overlap_force_rand
 
 
+@functools.lru_cache(maxsize=None)
+def get_array_forces_class():
+    """Return the class for computing placement forces with arrays, or None if NumPy is missing."""
+    try:
+        from .place_array import ArrayForces
+    except ImportError:
+        active_logger.warning(
+            "numpy module is missing. Can't vectorize placement forces without it."
+        )
+        return None
+    return ArrayForces
+
+
+def get_array_forces(parts, mobile_parts, force_func, **options):
+    """Get an object for computing the forces on the mobile parts with arrays.
+
+    This is only done if the vectorize_forces option is enabled and the force function
+    is one that the array computations reproduce. Otherwise, the forces are computed
+    part-by-part using the force function.
+
+    Args:
+        parts (list): All the parts that exert forces on each other.
+        mobile_parts (list): Set of Parts that can be moved.
+        force_func: Function for calculating forces between parts.
+        options (dict): Dict of options and values that enable/disable functions.
+
+    Returns:
+        ArrayForces: Object for computing forces on the mobile parts, or None.
+    """
+
+    if not options.get("vectorize_forces") or repulsive_force is not overlap_force:
+        return None
+
+    if force_func is total_part_force and attractive_force is net_force_dist:
+        similarity = None
+    elif (
+        isinstance(force_func, functools.partial)
+        and force_func.func is total_similarity_force
+    ):
+        similarity = force_func.keywords["similarity"]
+    else:
+        return None
+
+    ArrayForces = get_array_forces_class()
+    if not ArrayForces:
+        return None
+    return ArrayForces(parts, mobile_parts, similarity, **options)
+
+
+def sum_force_magnitudes(parts, force_func, scale, alpha, **options):
+    """Return the sum of the magnitudes of the forces on the parts."""
+
+    array_forces = get_array_forces(parts, parts, force_func, **options)
+    if array_forces:
+        return array_forces.magnitude(array_forces.forces(scale, alpha))
+
+    return sum(
+        force_func(p, parts, alpha=alpha, scale=scale, **options).magnitude
+        for p in parts
+    )
+
+
 def scale_attractive_repulsive_forces(parts, force_func, **options):
     """Set scaling between attractive net forces and repulsive part overlap forces."""
 
@@ -651,14 +739,14 @@ def scale_attractive_repulsive_forces(parts, force_func, **options):
 
     # Find attractive forces when they are maximized by random part placement.
     random_placement(parts, **options)
-    attractive_forces_sum = sum(
-        force_func(p, parts, alpha=0, scale=1, **options).magnitude for p in parts
+    attractive_forces_sum = sum_force_magnitudes(
+        parts, force_func, scale=1, alpha=0, **options
     )
 
     # Find repulsive forces when they are maximized by compacted part placement.
     central_placement(parts, **options)
-    repulsive_forces_sum = sum(
-        force_func(p, parts, alpha=1, scale=1, **options).magnitude for p in parts
+    repulsive_forces_sum = sum_force_magnitudes(
+        parts, force_func, scale=1, alpha=1, **options
     )
 
     # Restore original part placement.
@@ -831,6 +919,17 @@ def push_and_pull(anchored_parts, mobile_parts, nets, force_func, **options):
     # Set scale factor between attractive net forces and repulsive part overlap forces.
     scale = scale_attractive_repulsive_forces(parts, force_func, **options)
 
+    # Compute the forces on all the mobile parts at once with arrays if that's enabled.
+    array_forces = get_array_forces(parts, mobile_parts, force_func, **options)
+
+    if not array_forces:
+        # Otherwise, index the part bounding boxes so the overlap force on a part
+        # only has to be computed with the parts near it. The index is updated as parts move.
+        bbox_index = BBoxIndex.from_bboxes(
+            (part, part.place_bbox * part.tx) for part in parts
+        )
+        options["bbox_index"] = bbox_index
+
     # Setup the schedule for adjusting the alpha coefficient that weights the
     # combination of the attractive net forces and the repulsive part overlap forces.
     # Start at 0 (all attractive) and gradually progress to 1 (all repulsive).
@@ -861,6 +960,10 @@ def push_and_pull(anchored_parts, mobile_parts, nets, force_func, **options):
             # For general placement, use forces between all anchor/pull pins.
             restore_anchor_pull_pins(mobile_parts)
 
+        if array_forces:
+            # Recompute the attractive forces from the current anchor/pull pins.
+            array_forces.set_attraction()
+
         # This stores the threshold below which all the parts are assumed to be stabilized.
         # Since it can never be negative, set it to -1 to indicate it's uninitialized.
         stable_threshold = -1
@@ -868,29 +971,39 @@ def push_and_pull(anchored_parts, mobile_parts, nets, force_func, **options):
         # Move parts for this alpha until they all settle into fixed positions.
         # Place an iteration limit to prevent an infinite loop.
         for _ in range(1000):  # HACK: Ad-hoc iteration limit.
-            # Compute forces exerted on the parts by each other.
-            sum_of_forces = 0
-            for part in mobile_parts:
-                part.force = force_func(
-                    part, parts, scale=scale, alpha=alpha, **options
-                )
-                # Mask X or Y component of force during part alignment.
-                part.force = part.force.mask(force_mask)
-                sum_of_forces += part.force.magnitude
-
-            if rmv_drift:
-                # Calculate the drift force across all parts and subtract it from each part
-                # to prevent them from continually drifting in one direction.
-                drift_force = force_sum([part.force for part in mobile_parts]) / len(
-                    mobile_parts
-                )
-                for part in mobile_parts:
-                    part.force -= drift_force
+            if array_forces:
+                # Compute, mask and apply the forces on all the mobile parts at once.
+                forces = array_forces.forces(scale, alpha) * force_mask
+                sum_of_forces = array_forces.magnitude(forces)
+                if rmv_drift:
+                    forces -= forces.mean(axis=0)
+                array_forces.move(forces * speed)
 
-            # Apply movements to part positions.
-            for part in mobile_parts:
-                part.mv = part.force * speed
-                part.tx *= Tx(dx=part.mv.x, dy=part.mv.y)
+            else:
+                # Compute forces exerted on the parts by each other.
+                sum_of_forces = 0
+                for part in mobile_parts:
+                    part.force = force_func(
+                        part, parts, scale=scale, alpha=alpha, **options
+                    )
+                    # Mask X or Y component of force during part alignment.
+                    part.force = part.force.mask(force_mask)
+                    sum_of_forces += part.force.magnitude
+
+                if rmv_drift:
+                    # Calculate the drift force across all parts and subtract it from each part
+                    # to prevent them from continually drifting in one direction.
+                    drift_force = force_sum([part.force for part in mobile_parts]) / len(
+                        mobile_parts
+                    )
+                    for part in mobile_parts:
+                        part.force -= drift_force
+
+                # Apply movements to part positions.
+                for part in mobile_parts:
+                    part.mv = part.force * speed
+                    part.tx *= Tx(dx=part.mv.x, dy=part.mv.y)
+                    bbox_index.move(part, part.place_bbox * part.tx)
 
             # Keep iterating until all the parts are still.
             if stable_threshold < 0:
@@ -906,6 +1019,10 @@ def push_and_pull(anchored_parts, mobile_parts, nets, force_func, **options):
                 # the forces may start to decrease.
                 speed *= 0.50
 
+        if array_forces:
+            # Move the parts to where the forces put them.
+            array_forces.store(forces)
+
         if scr:
             # Draw current part placement for debugging purposes.
             draw_placement(parts, nets, scr, tx, font)
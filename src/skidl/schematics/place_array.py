@@ -0,0 +1,249 @@
+# -*- coding: utf-8 -*-
+
+# The MIT License (MIT) - Copyright (c) Dave Vandenbout.
+
+"""
+Array-based force calculations for the autoplacer.
+
+The force-directed placement in place.py computes the force on each part by
+transforming the bounding boxes and pins of every other part with Tx matrices
+on each iteration. Parts aren't rotated or flipped while they're pushed and
+pulled, so the transformed bounding boxes and pins of a part only differ by the
+part's translation. The ArrayForces class stores the rotated bounding boxes
+and pin points along with the translation of each part in NumPy arrays and
+computes the forces on all the mobile parts at once:
+
+* The attractive forces (net_force_dist() and similarity_force()) are linear in
+  the pin positions, so they reduce to a constant plus a matrix of coefficients
+  multiplied by the part translations.
+
+* The repulsive overlap_force() is found for all the pairs of overlapping
+  bounding boxes at once.
+
+NumPy is only needed if the vectorize_forces placement option is enabled.
+"""
+
+import random
+
+import numpy as np
+
+from skidl.geometry import Tx, Vector
+
+
+__all__ = ["ArrayForces"]
+
+
+class ArrayForces:
+    """
+    Positions and bounding boxes of parts stored in arrays for computing placement forces.
+
+    Args:
+        parts (list): All the parts that exert forces on each other.
+        mobile_parts (list): The parts that are moved by the forces. These must also be in parts.
+        similarity (dict, optional): Similarity score for any pair of parts used as keys.
+            If given, the attractive forces are computed like similarity_force().
+            Otherwise, they're computed from the nets like net_force_dist().
+        options (dict): Dict of options and values that enable/disable functions.
+    """
+
+    def __init__(self, parts, mobile_parts, similarity=None, **options):
+        self.parts = list(parts)
+        self.mobile_parts = list(mobile_parts)
+        self.similarity = similarity
+        self.options = options
+
+        self.index = {id(part): i for i, part in enumerate(self.parts)}
+        self.mobile = np.array(
+            [self.index[id(part)] for part in self.mobile_parts], dtype=np.intp
+        )
+
+        # Random offsets for breaking symmetry come from the same seeded
+        # generator the rest of the placement uses.
+        self.rng = np.random.default_rng(random.getrandbits(64))
+
+        self.load_positions()
+        self.set_attraction()
+
+    def load_positions(self):
+        """Get the rotations, rotated bounding boxes and translations of the parts from their Tx matrices."""
+
+        # The rotation/flip of each part stays fixed while its translation changes.
+        self.rot_txs = [
+            Tx(a=part.tx.a, b=part.tx.b, c=part.tx.c, d=part.tx.d)
+            for part in self.parts
+        ]
+
+        self.offsets = np.array(
+            [(part.tx.dx, part.tx.dy) for part in self.parts], dtype=float
+        ).reshape(-1, 2)
+
+        bbox_lo = []
+        bbox_hi = []
+        for part, rot_tx in zip(self.parts, self.rot_txs):
+            bbox = part.place_bbox * rot_tx
+            bbox_lo.append((bbox.min.x, bbox.min.y))
+            bbox_hi.append((bbox.max.x, bbox.max.y))
+        self.bbox_lo = np.array(bbox_lo, dtype=float).reshape(-1, 2)
+        self.bbox_hi = np.array(bbox_hi, dtype=float).reshape(-1, 2)
+
+    def set_attraction(self):
+        """
+        Compute the terms of the attractive forces from the anchor and pull pins of the mobile parts.
+
+        The attractive force on each mobile part is a weighted sum of the positions of
+        anchor and pull pins. Each pin position is a point fixed to its part plus the
+        translation of that part, so the forces are stored as a constant for each mobile
+        part plus coefficients that multiply the translations of the parts.
+        This has to be called again if the anchor or pull pins are changed.
+        """
+
+        num_mobile = len(self.mobile_parts)
+        self.attr_const = np.zeros((num_mobile, 2))
+        self.attr_coefs = np.zeros((num_mobile, len(self.parts)))
+
+        if self.similarity is None:
+            self._add_net_terms()
+        else:
+            self._add_similarity_terms()
+
+    def _add_pin_term(self, row, pin, coef):
+        """Add the position of a pin multiplied by a coefficient to the attractive force on a mobile part."""
+
+        i = self.index.get(id(pin.part))
+        if i is None:
+            # Pins on parts that aren't being placed stay where they are.
+            pt = pin.place_pt * pin.part.tx
+        else:
+            pt = pin.place_pt * self.rot_txs[i]
+            self.attr_coefs[row, i] += coef
+        self.attr_const[row] += (coef * pt.x, coef * pt.y)
+
+    def _add_net_terms(self):
+        """Add the attractive forces of the nets on the mobile parts like net_force_dist()."""
+
+        pt_to_pt_mult = self.options.get("pt_to_pt_mult", 1)
+        pin_normalize = self.options.get("pin_normalize")
+        net_normalize = self.options.get("net_normalize")
+
+        for row, part in enumerate(self.mobile_parts):
+            net_normalizer = 0
+            for net, anchor_pins in part.anchor_pins.items():
+                pull_pins = part.pull_pins.get(net)
+                if not anchor_pins or not pull_pins:
+                    # Skip nets without pulling or anchor points.
+                    continue
+
+                # The force from a net is the sum of the vectors from every anchor
+                # point to every pull point, so each anchor point is subtracted once
+                # for each pull point and each pull point is added once for each anchor.
+                weight = pt_to_pt_mult if len(pull_pins) <= 1 else 1
+                if pin_normalize:
+                    weight /= len(anchor_pins) * len(pull_pins)
+                for pin in anchor_pins:
+                    self._add_pin_term(row, pin, -len(pull_pins) * weight)
+                for pin in pull_pins:
+                    self._add_pin_term(row, pin, len(anchor_pins) * weight)
+                net_normalizer += 1
+
+            if net_normalize and net_normalizer:
+                # Normalize the total force across all the nets.
+                self.attr_const[row] /= net_normalizer
+                self.attr_coefs[row] /= net_normalizer
+
+    def _add_similarity_terms(self):
+        """Add the attractive forces between similar parts on the mobile parts like similarity_force()."""
+
+        for row, part in enumerate(self.mobile_parts):
+            anchor_pin = part.anchor_pins["similarity"][0]
+            for pull_pin in part.pull_pins["similarity"]:
+                coef = self.similarity[part][pull_pin.part]
+                self._add_pin_term(row, pull_pin, coef)
+                self._add_pin_term(row, anchor_pin, -coef)
+
+    def attractive_forces(self):
+        """Return an array with the attractive force on each mobile part."""
+        return self.attr_const + self.attr_coefs @ self.offsets
+
+    def repulsive_forces(self):
+        """Return an array with the repulsive force on each mobile part from overlapping other parts."""
+
+        lo = self.bbox_lo + self.offsets
+        hi = self.bbox_hi + self.offsets
+        mob_lo = lo[self.mobile]
+        mob_hi = hi[self.mobile]
+
+        # Find the pairs of overlapping bboxes (excluding each part with itself).
+        overlaps = np.all(
+            (mob_lo[:, None, :] < hi[None, :, :]) & (mob_hi[:, None, :] > lo[None, :, :]),
+            axis=2,
+        )
+        overlaps[np.arange(len(self.mobile)), self.mobile] = False
+        rows, others = np.nonzero(overlaps)
+
+        forces = np.zeros((len(self.mobile), 2))
+        if not len(rows):
+            return forces
+
+        # Compute the movement needed to separate the bboxes in left/right/up/down directions.
+        # Add some small random offset to break symmetry when parts exactly overlay each other.
+        rnd = self.rng.random((len(rows), 2)) - 0.5
+        moves = np.stack(
+            (
+                lo[others, 0] - mob_hi[rows, 0] - rnd[:, 0],
+                hi[others, 0] - mob_lo[rows, 0] - rnd[:, 0],
+                hi[others, 1] - mob_lo[rows, 1] - rnd[:, 1],
+                lo[others, 1] - mob_hi[rows, 1] - rnd[:, 1],
+            ),
+            axis=1,
+        )
+
+        # Select the smallest move that separates each pair of parts and add it to the force on the part.
+        best = np.argmin(np.abs(moves), axis=1)
+        move = moves[np.arange(len(rows)), best]
+        np.add.at(forces[:, 0], rows[best < 2], move[best < 2])
+        np.add.at(forces[:, 1], rows[best >= 2], move[best >= 2])
+        return forces
+
+    def forces(self, scale, alpha):
+        """
+        Return the weighted total of attractive and repulsive forces on the mobile parts.
+
+        Args:
+            scale (float): Scaling factor for attractive forces to make them equivalent to overlap forces.
+            alpha (float): Fraction of the total that is the overlap force (range [0,1]).
+
+        Returns:
+            numpy.ndarray: Array with the (x,y) force on each mobile part.
+        """
+        forces = np.zeros((len(self.mobile), 2))
+        if alpha != 1:
+            forces += scale * (1 - alpha) * self.attractive_forces()
+        if alpha != 0:
+            forces += alpha * self.repulsive_forces()
+        return forces
+
+    @staticmethod
+    def magnitude(forces):
+        """Return the sum of the magnitudes of an array of forces."""
+        return float(np.hypot(forces[:, 0], forces[:, 1]).sum())
+
+    def move(self, moves):
+        """Add an array of (x,y) movements to the translations of the mobile parts."""
+        self.offsets[self.mobile] += moves
+
+    def store(self, forces=None):
+        """
+        Update the Tx matrices of the mobile parts with their translations.
+
+        Args:
+            forces (numpy.ndarray, optional): Forces on the mobile parts that are
+                stored in each part for debug drawing.
+        """
+        for row, (part, i) in enumerate(zip(self.mobile_parts, self.mobile)):
+            dx, dy = self.offsets[i]
+            rot_tx = self.rot_txs[i]
+            part.tx = Tx(
+                a=rot_tx.a, b=rot_tx.b, c=rot_tx.c, d=rot_tx.d, dx=float(dx), dy=float(dy)
+            )
+            if forces is not None:
+                part.force = Vector(float(forces[row, 0]), float(forces[row, 1]))
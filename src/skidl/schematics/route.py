@@ -11,12 +11,15 @@ import random
 import sys
 from collections import Counter, defaultdict
 from enum import Enum
-from itertools import chain, zip_longest
+from heapq import heappop, heappush
+from itertools import chain, count, zip_longest
+from types import SimpleNamespace
 
 from skidl import Part
+from skidl.logger import active_logger
 from skidl.utilities import export_to_all, rmv_attr
 from .debug_draw import draw_end, draw_endpoint, draw_routing, draw_seg, draw_start, draw_text
-from skidl.geometry import BBox, Point, Segment, Tx, Vector, tx_rot_90
+from skidl.geometry import BBox, BBoxIndex, Point, Segment, Tx, Vector, tx_rot_90
 
 
 __all__ = ["RoutingFailure", "GlobalRoutingFailure", "SwitchboxRoutingFailure"]
@@ -85,6 +88,10 @@ for direction in Direction:
     globals()[direction.name] = direction.value
 
 
+# Number of times a net that can't be globally routed may rip-up other nets before giving up.
+MAX_RIP_UPS = 3
+
+
 # Dictionary for storing colors to visually distinguish routed nets.
 net_colors = defaultdict(
     lambda: (random.randint(0, 200), random.randint(0, 200), random.randint(0, 200))
@@ -327,6 +334,21 @@ class NetInterval(Interval):
         return None
 
 
+def bbox_gap(bbox1, bbox2):
+    """Return the Manhattan distance between the closest points of two bounding boxes.
+
+    Args:
+        bbox1 (BBox): One bounding box.
+        bbox2 (BBox): The other bounding box.
+
+    Returns:
+        float: The sum of the horizontal and vertical gaps between the boxes (zero if they intersect).
+    """
+    gap_x = max(bbox1.min.x - bbox2.max.x, bbox2.min.x - bbox1.max.x, 0)
+    gap_y = max(bbox1.min.y - bbox2.max.y, bbox2.min.y - bbox1.max.y, 0)
+    return gap_x + gap_y
+
+
 class Adjacency:
     def __init__(self, from_face, to_face):
         """Define an adjacency between two Faces.
@@ -1384,6 +1406,65 @@ class SwitchBox:
             or self.right_face.has_nets()
         )
 
+    def route_or_flip(self, **options):
+        """Route the switchbox from left-to-right or, if that fails, from top-to-bottom.
+
+        Args:
+            options (dict, optional): Dictionary of options and values.
+
+        Raises:
+            RoutingFailure: Raised if routing could not be completed in either direction.
+
+        Returns:
+            dict: Lists of wiring Segments for each net routed thru the switchbox.
+        """
+
+        try:
+            # Try routing switchbox from left-to-right.
+            self.route(**options)
+
+        except RoutingFailure:
+            # Routing failed, so try routing top-to-bottom instead.
+            self.flip_xy()
+            # If this fails, then a routing exception will terminate the whole routing process.
+            self.route(**options)
+            self.flip_xy()
+
+        return self.segments
+
+    def detach(self, net_refs):
+        """Return a copy of the switchbox that can be pickled and routed in another process.
+
+        The faces of the copy only keep the track coordinates and whether they have any
+        terminals with nets because that's all that's needed to route the switchbox.
+        The nets along the sides are replaced with NetRefs.
+
+        Args:
+            net_refs (dict): NetRef for each Net. NetRefs are added for any new nets.
+
+        Returns:
+            SwitchBox: Copy of the switchbox.
+        """
+
+        def net_ref(net):
+            if net is None:
+                return None
+            if net not in net_refs:
+                net_refs[net] = NetRef(len(net_refs))
+            return net_refs[net]
+
+        swbx = copy.copy(self)
+        swbx.top_face = DetachedFace(self.top_face)
+        swbx.bottom_face = DetachedFace(self.bottom_face)
+        swbx.left_face = DetachedFace(self.left_face)
+        swbx.right_face = DetachedFace(self.right_face)
+        swbx.top_nets = [net_ref(net) for net in self.top_nets]
+        swbx.bottom_nets = [net_ref(net) for net in self.bottom_nets]
+        swbx.left_nets = [net_ref(net) for net in self.left_nets]
+        swbx.right_nets = [net_ref(net) for net in self.right_nets]
+        swbx.segments = defaultdict(list)
+        return swbx
+
     def route(self, **options):
         """Route wires between terminals on the switchbox faces.
 
@@ -2008,6 +2089,239 @@ class SwitchBox:
             draw_end()
 
 
+class NetRef:
+    """Stand-in for a Net in a switchbox that's routed in another process."""
+
+    def __init__(self, index):
+        """Reference to a net.
+
+        Args:
+            index (int): Index of the net in the list of nets referenced for a node.
+
+        Note: Switchbox routing compares nets by identity and pickling keeps the
+            identity of the NetRefs in a switchbox, so the NetRefs must be
+            pickled together with the switchboxes that use them.
+        """
+        self.index = index
+
+    def __hash__(self):
+        # Hash by index so sets of NetRefs are iterated in the same order
+        # in every process and the routing doesn't depend on object ids.
+        return self.index
+
+
+class DetachedFace:
+    """Stand-in for a Face of a switchbox that's routed in another process."""
+
+    def __init__(self, face):
+        """Keep the parts of a Face needed to route a switchbox.
+
+        Args:
+            face (Face): Face of a switchbox.
+        """
+        self.track = SimpleNamespace(coord=face.track.coord)
+        self.nets = face.has_nets()
+
+    def has_nets(self):
+        """Return True if any Terminal on the Face was attached to a net."""
+        return self.nets
+
+
+# Root node of the hierarchy being routed by a RoutePool. This is set before the
+# worker processes are forked so each of them can find the child nodes it's asked to route.
+forked_root_node = None
+
+
+def set_forked_root_node(root):
+    """Store the root node for the worker processes forked after this."""
+    global forked_root_node
+    forked_root_node = root
+
+
+def route_forked_node(path, tool, options):
+    """Route a node and its children in a forked worker process.
+
+    Args:
+        path (tuple): Names of the nodes leading from the root node to the node being routed.
+        tool (str): Backend tool for schematics.
+        options (dict): Dictionary of options and values.
+
+    Returns:
+        list: For the node and each of its children, a tuple with its path relative to the
+            node and the wires and junctions of its nets. The nets are given by their id(),
+            which is the same as in the parent process because the worker was forked from it.
+        tuple: Final state of the random number generator after routing.
+    """
+
+    node = forked_root_node
+    for name in path:
+        node = node.children[name]
+
+    node.route(tool=tool, **options)
+
+    routing = []
+
+    def collect_routing(n, rel_path):
+        wires = {id(net): segments for net, segments in n.wires.items()}
+        junctions = {id(net): points for net, points in n.junctions.items()}
+        routing.append((rel_path, wires, junctions))
+        for name, child in n.children.items():
+            collect_routing(child, rel_path + (name,))
+
+    collect_routing(node, ())
+    return routing, random.getstate()
+
+
+def route_detached_switchboxes(switchboxes, options):
+    """Route a batch of detached switchboxes in a worker process.
+
+    Args:
+        switchboxes (list): Switchboxes created by SwitchBox.detach().
+        options (dict): Dictionary of options and values.
+
+    Returns:
+        list: Segments for each NetRef routed thru each switchbox.
+    """
+    return [swbx.route_or_flip(**options) for swbx in switchboxes]
+
+
+class RoutePool:
+    """Pool of processes for routing child nodes and switchboxes in parallel."""
+
+    def __init__(self, root, workers):
+        """Start a pool of processes forked from this one.
+
+        Args:
+            root (Node): Root node of the hierarchy being routed.
+            workers (int): Number of processes.
+
+        Note: The worker processes are forked so they get a copy of the node hierarchy
+            without pickling it. Only the routing options, the detached switchboxes and
+            the routing results are passed between processes. The executor only forks
+            its processes when work is submitted, so they all see the root node stored here.
+            The pool uses the default start method, so use create() to check it's fork.
+        """
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        self.root = root
+        self.workers = workers
+        set_forked_root_node(root)
+        self.executor = ProcessPoolExecutor(max_workers=workers)
+
+    @staticmethod
+    def create(root, workers):
+        """Return a RoutePool or None if worker processes aren't started with fork by default."""
+
+        import multiprocessing
+
+        # Only fork where it's the default (or was chosen with set_start_method()) since
+        # other platforms (like macOS) default to another method because forking isn't safe there.
+        # The first of all the start methods is the default one.
+        start_method = (
+            multiprocessing.get_start_method(allow_none=True)
+            or multiprocessing.get_all_start_methods()[0]
+        )
+        if start_method != "fork":
+            active_logger.warning(
+                "Parallel routing needs processes started with fork, so routing will be done serially."
+            )
+            return None
+        return RoutePool(root, workers)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.executor.shutdown()
+        set_forked_root_node(None)
+
+    @staticmethod
+    def worker_options(options):
+        """Remove the pool from the options so the workers route serially."""
+        return {
+            k: v
+            for k, v in options.items()
+            if k not in ("route_pool", "route_workers")
+        }
+
+    def path(self, node):
+        """Return the names of the nodes leading from the root node to a node."""
+        path = []
+        while node is not self.root:
+            parent = node.parent
+            path.append(
+                next(name for name, child in parent.children.items() if child is node)
+            )
+            node = parent
+        return tuple(reversed(path))
+
+    def route_children(self, node, tool, **options):
+        """Route the child nodes of a node in parallel.
+
+        The children are routed in the worker processes and their wires and junctions
+        are merged into the child nodes in the order of the children. The random number
+        generator is left in the state it had after routing the last child, just like
+        when the children are routed serially.
+
+        Args:
+            node (Node): Node whose children will be routed.
+            tool (str): Backend tool for schematics.
+            options (dict): Dictionary of options and values.
+
+        Raises:
+            RoutingFailure: Raised for the first child (in order) that couldn't be routed.
+        """
+
+        path = self.path(node)
+        worker_options = self.worker_options(options)
+        futures = [
+            self.executor.submit(route_forked_node, path + (name,), tool, worker_options)
+            for name in node.children
+        ]
+
+        for child, future in zip(node.children.values(), futures):
+            routing, random_state = future.result()
+            for rel_path, wires, junctions in routing:
+                n = child
+                for name in rel_path:
+                    n = n.children[name]
+                nets = {id(pin.net): pin.net for part in n.parts for pin in part}
+                for net_id, segments in wires.items():
+                    n.wires[nets[net_id]].extend(segments)
+                for net_id, points in junctions.items():
+                    n.junctions[nets[net_id]].extend(points)
+
+        random.setstate(random_state)
+
+    def route_switchboxes(self, switchboxes, **options):
+        """Route switchboxes in parallel.
+
+        Args:
+            switchboxes (list): Switchboxes created by SwitchBox.detach() to be individually routed.
+            options (dict): Dictionary of options and values.
+
+        Raises:
+            RoutingFailure: Raised for the first switchbox (in order) that couldn't be routed.
+
+        Returns:
+            list: Dict of wiring Segments for each NetRef routed thru each switchbox.
+        """
+
+        # Split the switchboxes into contiguous batches, several for each process.
+        batch_size = max(1, -(-len(switchboxes) // (self.workers * 4)))
+        batches = [
+            switchboxes[i : i + batch_size]
+            for i in range(0, len(switchboxes), batch_size)
+        ]
+        worker_options = self.worker_options(options)
+        futures = [
+            self.executor.submit(route_detached_switchboxes, batch, worker_options)
+            for batch in batches
+        ]
+        return [segments for future in futures for segments in future.result()]
+
+
 @export_to_all
 class Router:
     """Mixin to add routing function to Node class."""
@@ -2187,11 +2501,17 @@ class Router:
             for face in track:
                 face.set_capacity()
 
-    def global_router(node, nets):
+    def global_router(node, nets, **options):
         """Globally route a list of nets from face to face.
 
         Args:
             nets (list): List of Nets to be routed.
+            options (dict, optional): Dictionary of options and values:
+                "rip_up_reroute": If a net can't be routed because the faces it needs
+                    are filled by the routes of other nets, then rip-up those routes,
+                    route the net and then reroute the other nets.
+                "max_rip_ups": Number of times a net may fail to route and cause other
+                    nets to be ripped-up before giving up (default MAX_RIP_UPS).
 
         Returns:
             List: List of GlobalRoutes.
@@ -2214,14 +2534,23 @@ class Router:
         #           contiguous routes while reducing the number of
         #           unrouted start faces.
         #        d. Add the faces on the new route to the stop_faces list.
+        #
+        # Each route is found with an A* search that keeps the frontier of faces
+        # in a priority queue ordered by the distance from the start face plus
+        # an estimate of the remaining distance to the closest stop face.
 
         # Core routing function.
-        def rt_srch(start_face, stop_faces):
+        def rt_srch(net, net_pin_faces, start_face, stop_faces, used_faces, blocked_faces):
             """Return a minimal-distance path from the start face to one of the stop faces.
 
             Args:
+                net (Net): Net being routed.
+                net_pin_faces (set): Faces with pins on the net.
                 start_face (Face): Face from which path search begins
-                stop_faces (List): List of Faces at which search will end.
+                stop_faces (set): Set of Faces at which search will end.
+                used_faces (list): The faces whose routing capacity is used by the path are added to this.
+                blocked_faces (set): Faces the search couldn't enter because their capacity
+                    was used up are added to this.
 
             Raises:
                 RoutingFailure: No path was found.
@@ -2234,10 +2563,6 @@ class Router:
             if start_face in stop_faces or not stop_faces:
                 return GlobalWire(net)
 
-            # Record faces that have been visited and their distance from the start face.
-            visited_faces = [start_face]
-            start_face.dist_from_start = 0
-
             # Path searches are allowed to touch a Face on a Part if it
             # has a Pin on the net being routed or if it is one of the stop faces.
             # This is necessary to allow a search to terminate on a stop face or to
@@ -2245,119 +2570,199 @@ class Router:
             # to one of the stop faces.
             unconstrained_faces = stop_faces | net_pin_faces
 
-            # Search through faces until a path is found & returned or a routing exception occurs.
-            while True:
-                # Set up for finding the closest unvisited face.
-                closest_dist = float("inf")
-                closest_face = None
-
-                # Search for the closest face adjacent to the visited faces.
-                visited_faces.sort(key=lambda f: f.dist_from_start)
-                for visited_face in visited_faces:
-                    if visited_face.dist_from_start > closest_dist:
-                        # Visited face is already further than the current
-                        # closest face, so no use continuing search since
-                        # any remaining visited faces are even more distant.
-                        break
-
-                    # Get the distances to the faces adjacent to this previously-visited face
-                    # and update the closest face if appropriate.
-                    for adj in visited_face.adjacent:
-                        if adj.face in visited_faces:
-                            # Don't re-visit faces that have already been visited.
-                            continue
-
-                        if (
-                            adj.face not in unconstrained_faces
-                            and adj.face.capacity <= 0
-                        ):
-                            # Skip faces with insufficient routing capacity.
-                            continue
-
-                        # Compute distance of this adjacent face to the start face.
-                        dist = visited_face.dist_from_start + adj.dist
-
-                        if dist < closest_dist:
-                            # Record the closest face seen so far.
-                            closest_dist = dist
-                            closest_face = adj.face
-                            closest_face.prev_face = visited_face
-
-                if not closest_face:
-                    # Exception raised if couldn't find a path from start to stop faces.
-                    raise GlobalRoutingFailure(
-                        f"Global routing failure: {net.name} {net} {start_face.pins}"
-                    )
-
-                # Add the closest adjacent face to the list of visited faces.
-                closest_face.dist_from_start = closest_dist
-                visited_faces.append(closest_face)
+            # Estimate the remaining distance from a face as the Manhattan distance to the
+            # closest stop face. It's halved so it never exceeds the adjacency distances
+            # that have to be covered to get there, so the shortest path is still found.
+            stop_bboxes = [face.bbox for face in stop_faces]
+
+            def remaining_dist(face):
+                bbox = face.bbox
+                return min(bbox_gap(bbox, stop_bbox) for stop_bbox in stop_bboxes) / 2
+
+            # Record the distance of each face reached from the start face, the face it
+            # was reached from, and the faces whose shortest distance is settled.
+            dist_from_start = {start_face: 0}
+            prev_faces = {}
+            visited_faces = set()
+
+            # Priority queue of (estimated path length, distance from start, tie-breaker, face).
+            tie_breaker = count()
+            frontier = [(remaining_dist(start_face), 0, next(tie_breaker), start_face)]
+
+            # Search through faces until a path is found & returned or there are no more faces to search.
+            while frontier:
+                # Visit the face on the frontier with the shortest estimated path length.
+                _, dist, _, face = heappop(frontier)
+                if face in visited_faces:
+                    # Skip stale entries for faces that were already reached by a shorter path.
+                    continue
+                visited_faces.add(face)
 
-                if closest_face in stop_faces:
+                if face in stop_faces:
                     # The newest, closest face is actually on the list of stop faces, so the search is done.
                     # Now search back from this face to find the path back to the start face.
-                    face_path = [closest_face]
+                    face_path = [face]
                     while face_path[-1] is not start_face:
-                        face_path.append(face_path[-1].prev_face)
+                        face_path.append(prev_faces[face_path[-1]])
 
                     # Decrement the routing capacities of the path faces to account for this new routing.
                     # Don't decrement the stop face because any routing through it was accounted for
                     # during a previous routing.
-                    for face in face_path[:-1]:
-                        if face.capacity > 0:
-                            face.capacity -= 1
+                    for path_face in face_path[:-1]:
+                        if path_face.capacity > 0:
+                            path_face.capacity -= 1
+                            used_faces.append(path_face)
 
                     # Reverse face path to go from start-to-stop face and return it.
                     return GlobalWire(net, reversed(face_path))
 
-        # Key function for setting the order in which nets will be globally routed.
-        def rank_net(net):
-            """Rank net based on W/H of bounding box of pins and the # of pins."""
+                # Add the faces adjacent to this face to the frontier if this is the shortest path to them.
+                for adj in face.adjacent:
+                    adj_face = adj.face
+                    if adj_face in visited_faces:
+                        # Don't re-visit faces that have already been visited.
+                        continue
 
-            # Nets with a small bounding box probably have fewer routing resources
-            # so they should be routed first.
+                    if adj_face not in unconstrained_faces and adj_face.capacity <= 0:
+                        # Skip faces with insufficient routing capacity.
+                        blocked_faces.add(adj_face)
+                        continue
 
-            bbox = BBox()
-            for pin in node.get_internal_pins(net):
-                bbox.add(pin.route_pt)
-            return (bbox.w + bbox.h, len(net.pins))
+                    # Compute distance of this adjacent face to the start face.
+                    adj_dist = dist + adj.dist
+                    if adj_dist < dist_from_start.get(adj_face, float("inf")):
+                        dist_from_start[adj_face] = adj_dist
+                        prev_faces[adj_face] = face
+                        heappush(
+                            frontier,
+                            (
+                                adj_dist + remaining_dist(adj_face),
+                                adj_dist,
+                                next(tie_breaker),
+                                adj_face,
+                            ),
+                        )
 
-        # Set order in which nets will be routed.
-        nets.sort(key=rank_net)
+            # Exception raised if couldn't find a path from start to stop faces.
+            raise GlobalRoutingFailure(
+                f"Global routing failure: {net.name} {net} {start_face.pins}"
+            )
 
-        # Globally route each net.
-        global_routes = []
+        def route_net(net, blocked_faces):
+            """Globally route a net.
+
+            Args:
+                net (Net): Net to be routed.
+                blocked_faces (set): Faces with no routing capacity left that blocked the routing are added to this.
+
+            Raises:
+                RoutingFailure: The net couldn't be routed. Any routing capacity it used is restored.
+
+            Returns:
+                GlobalRoute: The wires connecting the pins of the net.
+                list: The faces whose routing capacity was used by the net.
+            """
 
-        for net in nets:
             # List for storing GlobalWires connecting pins on net.
             global_route = GlobalRoute()
+            used_faces = []
 
             # Faces with pins from which paths/routing originate.
             net_pin_faces = {pin.face for pin in node.get_internal_pins(net)}
             start_faces = set(net_pin_faces)
 
-            # Select a random start face and look for a route to *any* of the other start faces.
-            start_face = random.choice(list(start_faces))
-            start_faces.discard(start_face)
-            stop_faces = set(start_faces)
-            initial_route = rt_srch(start_face, stop_faces)
-            global_route.append(initial_route)
+            try:
+                # Select a random start face and look for a route to *any* of the other start faces.
+                start_face = random.choice(list(start_faces))
+                start_faces.discard(start_face)
+                stop_faces = set(start_faces)
+                initial_route = rt_srch(
+                    net, net_pin_faces, start_face, stop_faces, used_faces, blocked_faces
+                )
+                global_route.append(initial_route)
+
+                # The faces on the route that was found now become the stopping faces for any further routing.
+                stop_faces = set(initial_route)
+
+                # Go thru the other start faces looking for a connection to any existing route.
+                for start_face in start_faces:
+                    next_route = rt_srch(
+                        net, net_pin_faces, start_face, stop_faces, used_faces, blocked_faces
+                    )
+                    global_route.append(next_route)
 
-            # The faces on the route that was found now become the stopping faces for any further routing.
-            stop_faces = set(initial_route)
+                    # Update the set of stopping faces with the faces on the newest route.
+                    stop_faces |= set(next_route)
 
-            # Go thru the other start faces looking for a connection to any existing route.
-            for start_face in start_faces:
-                next_route = rt_srch(start_face, stop_faces)
-                global_route.append(next_route)
+            except GlobalRoutingFailure:
+                # Give back the routing capacity used by the part of the net that was routed.
+                release_faces(used_faces)
+                raise
 
-                # Update the set of stopping faces with the faces on the newest route.
-                stop_faces |= set(next_route)
+            return global_route, used_faces
 
-            # Add the complete global route for this net to the list of global routes.
-            global_routes.append(global_route)
+        def release_faces(used_faces):
+            """Restore the routing capacity of faces used by a net."""
+            for face in used_faces:
+                face.capacity += 1
 
-        return global_routes
+        # Key function for setting the order in which nets will be globally routed.
+        def rank_net(net):
+            """Rank net based on W/H of bounding box of pins and the # of pins."""
+
+            # Nets with a small bounding box probably have fewer routing resources
+            # so they should be routed first.
+
+            bbox = BBox()
+            for pin in node.get_internal_pins(net):
+                bbox.add(pin.route_pt)
+            return (bbox.w + bbox.h, len(net.pins))
+
+        # Set order in which nets will be routed.
+        nets.sort(key=rank_net)
+
+        if not options.get("rip_up_reroute"):
+            # Globally route each net.
+            return [route_net(net, set())[0] for net in nets]
+
+        # Globally route each net. If a net can't be routed because faces it needs are
+        # full, rip-up the other nets using those faces and route them after this net.
+        max_rip_ups = options.get("max_rip_ups", MAX_RIP_UPS)
+        routes = {}
+        failures = Counter()
+        unrouted_nets = list(nets)
+        while unrouted_nets:
+            net = unrouted_nets.pop(0)
+            blocked_faces = set()
+            try:
+                routes[net] = route_net(net, blocked_faces)
+                continue
+            except GlobalRoutingFailure:
+                failures[net] += 1
+                if failures[net] > max_rip_ups:
+                    # This net has ripped-up other nets enough times, so give up.
+                    raise
+
+            # Find the routed nets that are using the faces that blocked this net.
+            ripped_nets = [
+                routed_net
+                for routed_net, (_, used_faces) in routes.items()
+                if blocked_faces.intersection(used_faces)
+            ]
+            if not ripped_nets:
+                # The net wasn't blocked by other nets, so rip-up won't help.
+                raise GlobalRoutingFailure(
+                    f"Global routing failure: {net.name} {net}"
+                )
+
+            # Rip-up the blocking nets and route them again after this net.
+            for ripped_net in ripped_nets:
+                _, used_faces = routes.pop(ripped_net)
+                release_faces(used_faces)
+            unrouted_nets[:0] = [net] + ripped_nets
+
+        # Return the global routes in the same order as the nets were ranked.
+        return [routes[net][0] for net in nets]
 
     def create_switchboxes(node, h_tracks, v_tracks, **options):
         """Create routing switchboxes from the faces in the horz/vert tracks.
@@ -2420,23 +2825,25 @@ class Router:
             None
         """
 
-        # Do detailed routing inside each switchbox.
-        # TODO: Switchboxes are independent so could they be routed in parallel?
-        for swbx in switchboxes:
-            try:
-                # Try routing switchbox from left-to-right.
-                swbx.route(**options)
-
-            except RoutingFailure:
-                # Routing failed, so try routing top-to-bottom instead.
-                swbx.flip_xy()
-                # If this fails, then a routing exception will terminate the whole routing process.
-                swbx.route(**options)
-                swbx.flip_xy()
+        # Do detailed routing inside each switchbox. Copies of the switchboxes with their
+        # nets replaced by NetRefs are routed so the result doesn't depend on the object ids
+        # of the nets and is the same whether the switchboxes are routed one-by-one or in
+        # parallel on a pool of processes.
+        net_refs = {}
+        detached_swbxs = [swbx.detach(net_refs) for swbx in switchboxes]
+        nets = list(net_refs.keys())
+        route_pool = options.get("route_pool")
+        if route_pool and len(switchboxes) > 1:
+            swbx_segments = route_pool.route_switchboxes(detached_swbxs, **options)
+        else:
+            swbx_segments = (swbx.route_or_flip(**options) for swbx in detached_swbxs)
 
-            # Add switchbox routes to existing node wiring.
-            for net, segments in swbx.segments.items():
-                node.wires[net].extend(segments)
+        # Replace the net references in the routed segments with the nets and add them
+        # to the switchboxes and the existing node wiring in the same order as the switchboxes.
+        for swbx, segments_dict in zip(switchboxes, swbx_segments):
+            for ref, segments in segments_dict.items():
+                swbx.segments[nets[ref.index]].extend(segments)
+                node.wires[nets[ref.index]].extend(segments)
 
     def cleanup_wires(node):
         """Try to make wire segments look prettier."""
@@ -2813,15 +3220,15 @@ class Router:
             # Return updated segments. If no segments for this net were updated, then stop is True.
             return segments, stop
 
-        def remove_jogs(net, segments, wires, net_bboxes, part_bboxes):
+        def remove_jogs(net, segments, wires, net_index, part_index):
             """Remove jogs and staircases in wiring segments.
 
             Args:
                 net (Net): Net whose wire segments will be modified.
                 segments (list): List of wire segments for the given net.
                 wires (dict): Dict of lists of wire segments indexed by nets.
-                net_bboxes (dict): Dict of BBoxes for wire segments indexed by nets.
-                part_bboxes (list): List of BBoxes for the placed parts.
+                net_index (BBoxIndex): BBoxes for wire segments indexed by nets.
+                part_index (BBoxIndex): BBoxes for the placed parts.
             """
 
             def obstructed(segment):
@@ -2829,9 +3236,8 @@ class Router:
 
                 # Obstructed if segment bbox intersects one of the part bboxes.
                 segment_bbox = BBox(segment.p1, segment.p2)
-                for part_bbox in part_bboxes:
-                    if part_bbox.intersects(segment_bbox):
-                        return True
+                if part_index.query(segment_bbox):
+                    return True
 
                 # BBoxes don't intersect if they line up exactly edge-to-edge.
                 # So expand the segment bbox slightly so intersections with bboxes of
@@ -2839,16 +3245,12 @@ class Router:
                 segment_bbox = segment_bbox.resize(Vector(2, 2))
 
                 # Look for an overlay intersection with a segment of another net.
-                for nt, nt_bbox in net_bboxes.items():
+                # Only the nets whose bbox intersects this segment need to be checked.
+                for nt in net_index.query(segment_bbox):
                     if nt is net:
                         # Don't check this segment with other segments of its own net.
                         continue
 
-                    if not segment_bbox.intersects(nt_bbox):
-                        # Don't check this segment against segments of another net whose
-                        # bbox doesn't even intersect this segment.
-                        continue
-
                     # Check for overlay intersectionss between this segment and the
                     # parallel segments of the other net.
                     for seg in wires[nt]:
@@ -2965,11 +3367,13 @@ class Router:
                         # Return updated segments and set stop flag to false because segments were modified.
                         return segments, False
 
-        # Get part bounding boxes so parts can be avoided when modifying net segments.
-        part_bboxes = [p.bbox * p.tx for p in node.parts]
+        # Get index of part bounding boxes so parts can be avoided when modifying net segments.
+        part_index = BBoxIndex.from_bboxes(enumerate(p.bbox * p.tx for p in node.parts))
 
-        # Get dict of bounding boxes for the nets in this node.
-        net_bboxes = {net: segments_bbox(segs) for net, segs in node.wires.items()}
+        # Get index of bounding boxes for the nets in this node.
+        net_index = BBoxIndex.from_bboxes(
+            (net, segments_bbox(segs)) for net, segs in node.wires.items()
+        )
 
         # Get locations for part pins of each net. (For use when splitting net segments.)
         net_pin_pts = dict()
@@ -3018,7 +3422,7 @@ class Router:
 
                     # Remove unnecessary wire jogs.
                     segments, stop = remove_jogs(
-                        net, segments, node.wires, net_bboxes, part_bboxes
+                        net, segments, node.wires, net_index, part_index
                     )
 
                     # Keep only non zero-length segments.
@@ -3041,7 +3445,7 @@ class Router:
                         break
 
                     # Recalculate the net bounding box after modifying its segments.
-                    net_bboxes[net] = segments_bbox(segments)
+                    net_index.move(net, segments_bbox(segments))
 
                     keep_cleaning = True
 
@@ -3119,7 +3523,8 @@ class Router:
             tool (str): Backend tool for schematics.
             options (dict, optional): Dictionary of options and values:
                 "allow_routing_failure", "draw", "draw_all_terminals", "show_capacities",
-                "draw_switchbox", "draw_routing", "draw_channels"
+                "draw_switchbox", "draw_routing", "draw_channels", "rip_up_reroute", "max_rip_ups",
+                "route_workers": Number of processes for routing child nodes and switchboxes in parallel.
         """
 
         # Inject the constants for the backend tool into this module.
@@ -3130,15 +3535,27 @@ class Router:
         this_module = sys.modules[__name__]
         this_module.__dict__.update(tool_modules[tool].constants.__dict__)
 
+        # If enabled, start a pool of processes to route this node and its children in parallel.
+        if (options.get("route_workers") or 1) > 1 and "route_pool" not in options:
+            route_pool = RoutePool.create(node, options["route_workers"])
+            if not route_pool:
+                return node.route(tool=tool, route_pool=None, **options)
+            with route_pool:
+                return node.route(tool=tool, route_pool=route_pool, **options)
+
         random.seed(options.get("seed"))
 
         # Remove any stuff leftover from a previous place & route run.
         node.rmv_routing_stuff()
 
-        # First, recursively route any children of this node.
-        # TODO: Child nodes are independent so could they be processed in parallel?
-        for child in node.children.values():
-            child.route(tool=tool, **options)
+        # First, route any children of this node. The child nodes are independent,
+        # so they can be routed in parallel if there's a pool of processes for it.
+        route_pool = options.get("route_pool")
+        if route_pool and len(node.children) > 1:
+            route_pool.route_children(node, tool, **options)
+        else:
+            for child in node.children.values():
+                child.route(tool=tool, **options)
 
         # Exit if no parts to route in this node.
         if not node.parts:
@@ -3174,7 +3591,7 @@ class Router:
                 )
 
             # Do global routing of nets internal to the node.
-            global_routes = node.global_router(internal_nets)
+            global_routes = node.global_router(internal_nets, **options)
 
             # Convert the global face-to-face routes into terminals on the switchboxes.
             for route in global_routes:
@@ -9,10 +9,12 @@ This module provides classes and functions for loading, managing, and
 accessing schematic component libraries from different ECAD tools.
 """
 
+import json
 import re
 
 from .alias import Alias
 from .logger import active_logger
+from .name_index import NameIndex
 from .utilities import (
     consistent_hash,
     cnvt_to_var_name,
@@ -39,6 +41,11 @@ class SchLib(object):
     Attributes:
         filename (str): The name of the file from which the parts were read.
         parts (list): The list of parts (composed of Part objects) in the library.
+        part_names (NameIndex): Index of the names and aliases of the library parts.
+        _symbol_index (dict): For lazily-loaded libraries, the location of each part
+            definition in the library file.
+        _unloaded (dict): For lazily-loaded libraries, the lowercased names of parts
+            mapped to the names of parts in the library file that haven't been loaded yet.
         _cache (dict): Class variable that caches libraries for faster loading.
 
     Args:
@@ -47,6 +54,7 @@ class SchLib(object):
         lib_section (str, optional): The section of the library to access (for SPICE, only).
         use_cache (bool, optional): If true, use a cache of libraries to speed up loading.
         use_pickle (bool, optional): If true, pickle the library for faster loading next time.
+        lazy (bool, optional): If true, only index the library file and load parts when they're used.
 
     Keyword Args:
         attribs: Key/value pairs of attributes to add to the library.
@@ -63,6 +71,7 @@ class SchLib(object):
         lib_section=None,
         use_cache=True,
         use_pickle=True,
+        lazy=None,
         **attribs
     ):
         """
@@ -74,6 +83,9 @@ class SchLib(object):
             lib_section (str, optional): Section of library for SPICE libs.
             use_cache (bool, optional): Use cached libraries for speed. Defaults to True.
             use_pickle (bool, optional): Pickle library for future access. Defaults to True.
+            lazy (bool, optional): Index the library file and only load parts from it when
+                they're requested. Only libraries whose tool supports this are loaded lazily.
+                Defaults to skidl.config.lazy_libs.
             
         Keyword Args:
             attribs: Additional attributes to assign to the library.
@@ -82,6 +94,7 @@ class SchLib(object):
         import os
         import pickle
         import skidl
+        from skidl import SKIDL
 
         from .tools import tool_modules, lib_suffixes
 
@@ -89,6 +102,7 @@ class SchLib(object):
 
         # Library starts off empty of parts.
         self.parts = []
+        self.part_names = NameIndex("aliases")
 
         # Attach attributes to the library.
         for k, v in list(attribs.items()):
@@ -134,6 +148,24 @@ class SchLib(object):
         if lib_pickle_abs_fn in self._cache:
             self.__dict__.update(self._cache[lib_pickle_abs_fn].__dict__)
 
+        # Index the schematic part library file and load parts only when they're needed.
+        # The index is stored next to the pickle files so the library file doesn't have
+        # to be scanned again until it changes.
+        elif self._can_load_lazily(tool, abs_filename, lazy):
+            self.filename = filename
+            self.filepath = abs_filename
+            self._tool = tool
+            self._symbol_index = tool_modules[tool].index_sch_lib(
+                abs_filename,
+                os.path.splitext(lib_pickle_abs_fn)[0] + ".idx" if use_pickle else None,
+            )
+            self._unloaded = {}
+            for name in self._symbol_index:
+                self._unloaded.setdefault(name.lower(), []).append(name)
+            # Cache a reference to the library.
+            if use_cache:
+                self._cache[lib_pickle_abs_fn] = self
+
         # Load this Schlib from the pickle file if it exists and it's more recent
         # than the original part library file.
         elif (
@@ -150,11 +182,13 @@ class SchLib(object):
         # Otherwise, load from a schematic part library file.
         else:
             # Use the tool name to find the function for loading the library.
+            # SKiDL libraries also keep a binary version with the pickled libraries.
             tool_modules[tool].load_sch_lib(
                 self,
                 abs_filename,
                 # skidl.lib_search_paths[tool],
                 lib_section=lib_section,
+                **({"use_pickle": use_pickle} if tool == SKIDL else {}),
             )
             self.filename = filename
             self.filepath = abs_filename
@@ -176,6 +210,64 @@ class SchLib(object):
                         # Delete the file
                         os.remove(lib_pickle_abs_fn)
 
+    @staticmethod
+    def _can_load_lazily(tool, abs_filename, lazy):
+        """
+        Return True if a library file will be indexed and its parts loaded when needed.
+
+        Args:
+            tool (str): Format of the library file.
+            abs_filename (str): Absolute path or URL of the library file.
+            lazy (bool): Requested loading mode, or None to use skidl.config.lazy_libs.
+
+        Returns:
+            bool: True if lazy loading was requested and the library supports it.
+        """
+
+        import skidl
+
+        from .tools import tool_modules
+
+        if lazy is None:
+            lazy = skidl.config.lazy_libs
+        return (
+            bool(lazy)
+            and hasattr(tool_modules[tool], "index_sch_lib")
+            and not is_url(abs_filename)
+        )
+
+    def _load_parts(self, *names):
+        """
+        Load parts with the given names (ignoring case) from a lazily-loaded library.
+
+        Args:
+            *names (str): Names of the parts to load. Parts that are already loaded are skipped.
+        """
+
+        from .tools import tool_modules
+
+        unloaded = self.__dict__.get("_unloaded")
+        if not unloaded:
+            return
+
+        to_load = []
+        for name in names:
+            to_load.extend(unloaded.pop(str(name).lower(), []))
+        if to_load:
+            tool_modules[self._tool].load_sch_lib_symbols(
+                self, self.filepath, self._symbol_index, to_load
+            )
+
+    def _load_all_parts(self):
+        """Load all the parts that haven't been loaded yet from a lazily-loaded library."""
+        unloaded = self.__dict__.get("_unloaded")
+        if unloaded:
+            self._load_parts(*list(unloaded))
+            # Put the parts in the same order as the library file like they would be
+            # if the whole library had been loaded at once. Parts added from elsewhere go last.
+            order = {name: i for i, name in enumerate(self._symbol_index)}
+            self.parts.sort(key=lambda part: order.get(part.name, len(order)))
+
     def __str__(self):
         """
         Return a list of the part names in this library as a string.
@@ -183,6 +275,7 @@ class SchLib(object):
         Returns:
             str: A string listing all parts in the library with their descriptions.
         """
+        self._load_all_parts()
         return "\n".join([f"{p.name}: {p.description}" for p in self.parts])
 
     __repr__ = __str__
@@ -194,8 +287,19 @@ class SchLib(object):
         Returns:
             int: The count of parts in the library.
         """
+        self._load_all_parts()
         return len(self.parts)
 
+    def __bool__(self):
+        """
+        Return True if the library has any parts.
+
+        Returns:
+            bool: True if the library has loaded parts or parts that can be loaded.
+        """
+        # Don't use __len__() because that would load all the parts of a lazy library.
+        return bool(self.parts or self.__dict__.get("_unloaded"))
+
     def __getitem__(self, id):
         """
         Get part by name or alias.
@@ -227,6 +331,7 @@ class SchLib(object):
         Returns:
             iterator: An iterator over the parts in the library.
         """
+        self._load_all_parts()
         return iter(self.parts)
 
     @classmethod
@@ -239,12 +344,16 @@ class SchLib(object):
         """
         cls._cache = {}
 
-    def add_parts(self, *parts):
+    def add_parts(self, *parts, copy=True):
         """
         Add one or more parts to a library.
         
         Args:
             *parts: One or more Part objects to add to the library.
+            copy (bool, optional): If true, a template copy of each part is
+                stored in the library. Library loaders that build parts solely
+                for the library set this false to store the parts themselves.
+                Defaults to True.
             
         Returns:
             SchLib: The library with parts added.
@@ -256,14 +365,19 @@ class SchLib(object):
 
         from .part import TEMPLATE
 
+        part_names = self._get_part_names()
+
         for part in flatten(parts):
             # Parts with the same name are not allowed in the library.
-            if not self.get_parts_by_name(
-                part.name, be_thorough=False, allow_failure=True
-            ):
-                self.parts.append(part.copy(dest=TEMPLATE))
-                # Place a pointer to this library into the added part.
-                self.parts[-1].lib = self
+            name = part.name
+            if self._find_parts(Alias(name, name.lower(), name.upper())):
+                continue
+            if copy:
+                part = part.copy(dest=TEMPLATE)
+            self.parts.append(part)
+            part_names.add(part)
+            # Place a pointer to this library into the added part.
+            part.lib = self
         return self
 
     def get_parts(self, use_backup_lib=True, **criteria):
@@ -285,6 +399,7 @@ class SchLib(object):
 
         import skidl
 
+        self._load_all_parts()
         parts = filter_list(self.parts, **criteria)
         if not parts and use_backup_lib and skidl.config.query_backup_lib:
             try:
@@ -304,7 +419,32 @@ class SchLib(object):
         Returns:
             list: List of parts matching the name or alias.
         """
-        return [prt for prt in self.parts if prt.aliases == name]
+        self._load_parts(*Alias(name))
+        return self._find_parts(name)
+
+    def _find_parts(self, name):
+        """Return the parts already loaded into the library that match a name or alias."""
+        # The index ignores case, so keep only the parts with an exact match.
+        parts = self._get_part_names().get("aliases", *Alias(name))
+        return [prt for prt in parts if prt.aliases == name]
+
+    def _get_part_names(self):
+        """
+        Get the index of part names and aliases, rebuilding it if needed.
+
+        The index is rebuilt for libraries pickled before it existed or if
+        parts were added to or removed from the list of parts directly.
+
+        Returns:
+            NameIndex: Index of the names and aliases of the library parts.
+        """
+        part_names = self.__dict__.get("part_names")
+        if part_names is None or len(part_names) != len(self.parts):
+            part_names = NameIndex("aliases")
+            for part in self.parts:
+                part_names.add(part)
+            self.part_names = part_names
+        return part_names
 
     def get_parts_by_name(
         self,
@@ -358,7 +498,7 @@ class SchLib(object):
 
         return parts
 
-    def export(self, libname, file_=None, tool=None, addtl_part_attrs=None):
+    def export(self, libname, file_=None, tool=None, addtl_part_attrs=None, binary=False):
         """
         Export a library into a file.
 
@@ -370,35 +510,174 @@ class SchLib(object):
             tool (str, optional): The CAD tool library format to be used. Currently, this can
                 only be SKIDL.
             addtl_part_attrs (list, optional): List of additional part attribute names to include in export.
+            binary (bool, optional): If true, export the library in the compact binary SKiDL
+                format that loads parts only when they're needed. Defaults to False.
         """
 
-        def prettify(s):
-            """Breakup and indent library export string."""
-            s = re.sub(r"(Part\()", r"\n        \1", s)
-            s = re.sub(r"(Pin\()", r"\n            \1", s)
-            return s
-
         from skidl import SKIDL
         from skidl.tools import lib_suffixes
 
         if tool is None:
             tool = SKIDL
 
+        if binary:
+            from skidl.tools.skidl.binary_lib import bin_lib_suffix, write_binary_lib
+
+            write_binary_lib(self, file_ or (libname + bin_lib_suffix), addtl_part_attrs)
+            return
+
         file_ = file_ or (libname + lib_suffixes[tool])
 
-        export_str = "from collections import defaultdict\n"
-        export_str += "from skidl import Pin, Part, Alias, SchLib, SKIDL, TEMPLATE\n\n"
-        export_str += "from skidl.pin import pin_types\n\n"
-        export_str += "SKIDL_lib_version = '0.0.1'\n\n"
+        self._load_all_parts()
+
         part_export_str = ",".join(
-            [p.export(addtl_part_attrs=addtl_part_attrs) for p in self.parts]
+            [_prettify_export(p.export(addtl_part_attrs=addtl_part_attrs)) for p in self.parts]
         )
-        export_str += f"{cnvt_to_var_name(libname)} = SchLib(tool=SKIDL).add_parts(*[{part_export_str}])"
-        export_str = prettify(export_str)
+        export_str = _export_header(libname) + part_export_str + "])"
         with opened(file_, "w") as f:
             f.write(export_str)
 
 
+def _export_header(libname):
+    """Return the Python code that starts an exported SKiDL library up to its list of parts."""
+    return (
+        "from collections import defaultdict\n"
+        "from skidl import Pin, Part, Alias, SchLib, SKIDL, TEMPLATE\n\n"
+        "from skidl.pin import pin_types\n\n"
+        "SKIDL_lib_version = '0.0.1'\n\n"
+        f"{cnvt_to_var_name(libname)} = SchLib(tool=SKIDL).add_parts(*["
+    )
+
+
+def _prettify_export(s):
+    """Breakup and indent the export string of a part."""
+    s = re.sub(r"(Part\()", r"\n        \1", s)
+    s = re.sub(r"(Pin\()", r"\n            \1", s)
+    return s
+
+
+# Starts the comment line at the end of a backup library that lists the
+# signature and length of the exported code for each of its parts.
+BACKUP_INDEX_TAG = "# SKiDL backup index: "
+
+
+def _backup_signature(part):
+    """
+    Return a signature of everything about a part that is exported to the backup library.
+
+    Args:
+        part (Part): Part that goes into the backup library.
+
+    Returns:
+        str: Hash of the library, name, attributes, pins and units of the part.
+    """
+    from .part import PartUnit
+
+    pins = tuple(
+        tuple(getattr(pin, k, None) for k in ("num", "name", "func", "unit"))
+        for pin in part.pins
+    )
+    units = tuple(
+        unit.export() for unit in part.unit.values() if isinstance(unit, PartUnit)
+    )
+    lib = getattr(getattr(part, "lib", None), "filename", None)
+    return consistent_hash(repr((lib, part.name, part.export_attrs(), pins, units)))
+
+
+def _read_backup_lib(file_, libname):
+    """
+    Get the exported code for the parts of a backup library written by write_backup_lib().
+
+    Args:
+        file_ (str): The backup library file.
+        libname (str): Name of the library.
+
+    Returns:
+        tuple: The text of the file (or None if it couldn't be read) and a dict
+            of the exported code for each part keyed by its signature. The dict
+            is empty if the file wasn't written by write_backup_lib().
+    """
+    try:
+        with open(file_, encoding="utf-8") as f:
+            text = f.read()
+    except (OSError, UnicodeDecodeError):
+        return None, {}
+
+    header = _export_header(libname)
+    body, _, index = text.rpartition("])\n" + BACKUP_INDEX_TAG)
+    if not body.startswith(header):
+        return text, {}
+
+    # Cut the exported code for each part from the file using the lengths in the index.
+    entries = {}
+    pos = len(header)
+    try:
+        for signature, length in json.loads(index):
+            entries[signature] = body[pos : pos + length]
+            pos += length + 1  # Skip the comma between parts.
+    except (TypeError, ValueError):
+        return text, {}
+    if (pos - 1 if entries else pos) != len(body):
+        return text, {}  # The parts don't fill the library so something's wrong.
+    return text, entries
+
+
+@export_to_all
+def write_backup_lib(parts, libname, file_):
+    """
+    Write a backup library with the parts of a circuit, reusing what's already in the file.
+
+    Like a SchLib of the parts exported to a file, the library only stores the first
+    part with each name. The code for each part is stored in the library file along
+    with a signature of the part, so a part is only exported if its signature isn't
+    found in the existing library. The file isn't rewritten if nothing changed.
+
+    Args:
+        parts (list): Parts to store in the backup library.
+        libname (str): Name of the library.
+        file_ (str or file object): The file the library will be written to.
+
+    Returns:
+        bool: True if the library file was written.
+    """
+
+    if isinstance(file_, str):
+        prior_text, prior_entries = _read_backup_lib(file_, libname)
+    else:
+        prior_text, prior_entries = None, {}
+
+    names = set()
+    entries = []
+    index = []
+    for part in parts:
+        # Parts with the same name or alias as a part already in the library are skipped.
+        name = part.name
+        if not names.isdisjoint((name, name.lower(), name.upper())):
+            continue
+        names.add(name)
+        names.update(part.aliases)
+
+        part.parse()  # Make sure everything that will be exported is present.
+        signature = _backup_signature(part)
+        entry = prior_entries.get(signature)
+        if entry is None:
+            entry = _prettify_export(part.export())
+        entries.append(entry)
+        index.append([signature, len(entry)])
+
+    text = _export_header(libname) + ",".join(entries) + "])"
+    text += "\n" + BACKUP_INDEX_TAG + json.dumps(index) + "\n"
+    if text == prior_text:
+        return False
+    if isinstance(file_, str):
+        # Use the same encoding as _read_backup_lib() so the file can be compared next time.
+        with open(file_, "w", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        file_.write(text)
+    return True
+
+
 @export_to_all
 @norecurse
 def load_backup_lib():
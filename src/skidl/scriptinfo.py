@@ -99,49 +99,125 @@ def get_script_name():
     return os.path.splitext(scriptinfo()["name"])[0]
 
 
+# Directory of the SKiDL package. Calls to functions in here are left out of traces.
+_skidl_dir = os.path.dirname(os.path.abspath(__file__))
+
+# Source file names mapped to True if they're in the SKiDL package.
+_in_skidl = {}
+
+# Source file names mapped to their absolute paths.
+_abs_paths = {}
+
+
+@export_to_all
+class SkidlTrace(object):
+    """
+    Trace of the function calls that led to the creation of a SKiDL object.
+
+    Only the code object and line number of each call are stored when the trace
+    is captured. They're converted into (file_path, line_number) tuples the first
+    time the trace is used (e.g., by src_line() or when a netlist is generated with
+    track_src enabled), so creating objects doesn't pay for building file paths.
+
+    Args:
+        frames (list): (code, line number) tuples for the calls, oldest first.
+    """
+
+    __slots__ = ("_frames", "_trace")
+
+    def __init__(self, frames=()):
+        self._frames = frames
+        self._trace = None
+
+    def _resolve(self):
+        """Return the list of (file_path, line_number) tuples for the trace."""
+        if self._trace is None:
+            trace = []
+            for code, lineno in self._frames:
+                filename = code.co_filename
+                try:
+                    path = _abs_paths[filename]
+                except KeyError:
+                    path = _abs_paths[filename] = os.path.abspath(filename)
+                trace.append((path, str(lineno)))
+            self._trace = trace
+            self._frames = None  # Release the code objects.
+        return self._trace
+
+    def __len__(self):
+        return len(self._resolve())
+
+    def __getitem__(self, i):
+        return self._resolve()[i]
+
+    def __iter__(self):
+        return iter(self._resolve())
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    def __repr__(self):
+        return repr(self._resolve())
+
+    def __reduce__(self):
+        # Code objects can't be pickled, so store the resolved trace.
+        return (list, (self._resolve(),))
+
+
 @export_to_all
 def get_skidl_trace():
     """
     Get a trace of function calls excluding internal SKiDL functions.
     
-    This function examines the current call stack and creates a trace that
+    This function walks the current call stack and creates a trace that
     excludes calls to internal SKiDL library functions. The resulting trace
     is useful for debugging and for identifying where SKiDL objects were created
     in user code.
+
+    Frames are walked with sys._getframe() instead of inspect.stack() because
+    the latter reads the source code around every call and is far slower.
     
     Returns:
-        list: A list of tuples containing (file_path, line_number) for each relevant
+        SkidlTrace: A sequence of tuples containing (file_path, line_number) for each relevant
               call in the stack, ordered from the oldest call to the most recent.
     """
 
-    # To determine where this object was created, trace the function
-    # calls that led to it and place into a field
-    # but strip off all the calls to internal SKiDL functions.
+    # Record code:line_num for each call while skipping every function
+    # found in the SKiDL package (no use recording internal calls).
+    frames = []
+    frame = sys._getframe(1)
+    while frame:
+        code = frame.f_code
+        filename = code.co_filename
+        try:
+            in_skidl = _in_skidl[filename]
+        except KeyError:
+            in_skidl = _in_skidl[filename] = filename.startswith(_skidl_dir)
+        if not in_skidl:
+            frames.append((code, frame.f_lineno))
+        frame = frame.f_back
 
-    call_stack = inspect.stack()  # Get function call stack.
+    # Order the trace starting from the bottom of the stack.
+    frames.reverse()
+    return SkidlTrace(frames)
 
-    # Use the function at the top of the stack to
-    # determine the location of the SKiDL library functions.
-    try:
-        skidl_dir, _ = os.path.split(call_stack[0].filename)
-    except AttributeError:
-        skidl_dir, _ = os.path.split(call_stack[0][1])
 
-    # Record file_name:line_num starting from the bottom of the stack
-    # while skipping every function found in the SKiDL package
-    # (no use recording internal calls).
-    skidl_trace = []
-    for frame in reversed(call_stack):
-        try:
-            filename = frame.filename
-            lineno = frame.lineno
-        except AttributeError:
-            filename = frame[1]
-            lineno = frame[2]
-        if filename.startswith(skidl_dir):
-            # Skip functions in the SKiDL package.
-            continue
+@export_to_all
+def get_creation_trace():
+    """
+    Get the trace for where a SKiDL object is being created.
+
+    Tracing can be turned off with skidl.config.record_trace to speed up the
+    creation of large circuits. Objects created while it's off have empty traces.
+
+    Returns:
+        SkidlTrace: The trace from get_skidl_trace(), or an empty trace if tracing is disabled.
+    """
 
-        skidl_trace.append((os.path.abspath(filename), str(lineno)))
+    from . import skidl
 
-    return skidl_trace
+    # The configuration doesn't exist yet while the default circuit is being created.
+    config = getattr(skidl, "config", None)
+    if config is not None and not config.get("record_trace", True):
+        return SkidlTrace()
+    return get_skidl_trace()
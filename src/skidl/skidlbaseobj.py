@@ -41,6 +41,9 @@ class SkidlBaseObject(object):
     erc_list = list()
     erc_assertion_list = list()
 
+    # Attributes that change the outcome of the ERC of the object when they change.
+    _erc_attrs = frozenset()
+
     def __init__(self):
         """Initialize a new SkidlBaseObject with empty fields dictionary."""
         self.fields = {}
@@ -79,6 +82,28 @@ class SkidlBaseObject(object):
             super().__setattr__(key, value)
         else:
             self.fields[key] = value
+        if key in self._erc_attrs:
+            self._erc_changed()
+
+    def __delattr__(self, key):
+        """
+        Delete an attribute of the object.
+
+        Args:
+            key: The attribute name to delete.
+        """
+        super().__delattr__(key)
+        if key in self._erc_attrs:
+            self._erc_changed()
+
+    def _erc_changed(self):
+        """
+        Respond to a change that affects the ERC of this object.
+
+        This does nothing by default. Subclasses override it to tell the
+        circuit they're in to recheck them during an incremental ERC.
+        """
+        pass
 
     def copy(self):
         """
@@ -207,6 +232,7 @@ class SkidlBaseObject(object):
         del self.name  # Remove any pre-existing name.
         self.aliases += nm
         self._name = nm
+        self._names_changed()
 
     @name.deleter
     def name(self):
@@ -216,6 +242,17 @@ class SkidlBaseObject(object):
             self._name = None
         except AttributeError:
             pass
+        else:
+            self._names_changed()
+
+    def _names_changed(self):
+        """
+        Respond to a change in the name or aliases of this object.
+
+        This does nothing by default. Subclasses override it to update any
+        indexes used to look up the object by name.
+        """
+        pass
 
     @property
     def tag(self):
@@ -293,9 +330,11 @@ class SkidlBaseObject(object):
         Args:
             name_or_list: A name or list of names to use as aliases.
         """
-        if not name_or_list:
-            return
-        self._aliases = Alias(name_or_list)
+        if name_or_list:
+            self._aliases = Alias(name_or_list)
+        # Report the change even if nothing was assigned since an empty
+        # list may be the result of removing aliases in-place (e.g., -=).
+        self._names_changed()
 
     @aliases.deleter
     def aliases(self):
@@ -304,6 +343,8 @@ class SkidlBaseObject(object):
             del self._aliases
         except AttributeError:
             pass
+        else:
+            self._names_changed()
 
     @property
     def notes(self):
@@ -153,7 +153,9 @@ def load_sch_lib(lib, filename=None, lib_search_paths_=None, lib_section=None):
                 datasheet="",
                 description="",
                 search_text="",
-            )
+            ),
+            # Parts built here are only used by the library, so don't copy them.
+            copy=False,
         )
 
     # Now add information from any associated DCM file.
@@ -202,6 +204,75 @@ def load_sch_lib(lib, filename=None, lib_search_paths_=None, lib_section=None):
         part.search_text = "\n".join(search_text_pieces)
 
 
+@export_to_all
+def scan_sch_lib(filename):
+    """
+    Get the searchable information about the parts in a KiCad schematic library file.
+
+    This is much faster than loading the library because no Part objects are created.
+    The descriptions and keywords come from the DCM file next to the library file.
+
+    Args:
+        filename (str): The absolute path of the KiCad schematic library file.
+
+    Returns:
+        list: A (name, aliases, description, keywords) tuple for each part in the file.
+    """
+
+    with open(filename, "rb") as f:
+        lib_txt = f.read().decode("latin_1")
+
+    part_defns = lib_txt.split("\nDEF ")
+    header = part_defns.pop(0)  # Stuff before first DEF is the header.
+    if not header.startswith("EESchema-LIBRARY"):
+        raise RuntimeError(f"The file {filename} is not a KiCad Schematic Library File.")
+
+    # Get the name of each part and the aliases on its first ALIAS line.
+    # Also find the parts for each name or alias that might be used in the DCM file.
+    parts = []
+    parts_by_alias = {}
+    for part_defn in part_defns:
+        part_defn = part_defn.split("\n")
+        name = part_defn[0].split()[0]
+        aliases = [name]
+        for line in part_defn:
+            if line.startswith("ALIAS "):
+                aliases.extend(line.split()[1:])
+                break
+        part = {"name": name, "aliases": list(dict.fromkeys(aliases))}
+        parts.append(part)
+        for alias in part["aliases"]:
+            parts_by_alias.setdefault(alias, []).append(part)
+
+    # Add the descriptions and keywords from the DCM file.
+    try:
+        with open(os.path.splitext(filename)[0] + ".dcm", "rb") as f:
+            dcm_txt = f.read().decode("latin_1")
+    except OSError:
+        dcm_txt = ""
+    part_desc = {}
+    for line in dcm_txt.split("\n"):
+        if line.startswith("#"):
+            pass
+        elif line.startswith("$CMP"):
+            part_desc["name"] = line.split()[-1]
+        elif part_desc:
+            if line.startswith("D"):
+                part_desc["description"] = " ".join(line.split()[1:])
+            elif line.startswith("K"):
+                part_desc["keywords"] = " ".join(line.split()[1:])
+            elif line.startswith("$ENDCMP"):
+                for part in parts_by_alias.get(part_desc["name"], []):
+                    part["description"] = part_desc.get("description", "")
+                    part["keywords"] = part_desc.get("keywords", "")
+                part_desc = {}
+
+    return [
+        (part["name"], part["aliases"], part.get("description", ""), part.get("keywords", ""))
+        for part in parts
+    ]
+
+
 @export_to_all
 def parse_lib_part(part, partial_parse):
     """
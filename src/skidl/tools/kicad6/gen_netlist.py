@@ -6,92 +6,22 @@
 Generate KiCad 8 netlist.
 """
 
+import io
 import os.path
 import time
-import uuid
 from simp_sexp import Sexp
 
 from skidl.pckg_info import __version__
 from skidl.scriptinfo import scriptinfo, get_script_dir
+from skidl.tools.kicad_netlist import write_export
+from skidl.tools.kicad_sheetpath import (
+    gen_part_tstamp,
+    gen_sheetpath,
+    gen_sheetpath_tstamp,
+    namespace_uuid,
+)
 from skidl.utilities import export_to_all
 
-# This UUID was generated using uuidgen for passing as the namespace argument to uuid.uuid5().
-namespace_uuid = uuid.UUID("7026fcc6-e1a0-409e-aaf4-6a17ea82654f")
-
-
-def gen_sheetpath(hierarchy):
-    """
-    Generate a sheetpath string from a hierarchical path tuple.
-
-    A sheetpath is a string representation of the hierarchical path
-    in a KiCad project. This function converts the given hierarchy
-    tuple into a valid sheetpath format by joining the elements of the
-    hierarchy tuple with '/' and ensuring it starts and ends with '/'.
-
-    Args:
-        hierarchy (tuple): A tuple of strings with the name of each level
-            of the hierarchy.
-
-    Returns:
-        str: The generated sheetpath string. If the input hierarchy
-             is empty or None, the function returns "/".
-    """
-
-    assert hierarchy[0] == "", "Top level of hierarchy must be an empty string."
-    return f"{'/'.join(hierarchy)}/"
-
-
-def gen_part_tstamp(part):
-    """
-    Generate a unique timestamp for a given part based on its hierarchical name.
-
-    This function uses a UUID version 5 (SHA-1 hash) to create a deterministic
-    and unique identifier for the part. The UUID is generated using a namespace
-    UUID and the hierarchical name of the part.
-
-    Args:
-        part: An object representing the part. It is expected to have a
-              'hiername' attribute that uniquely identifies the part
-              within its hierarchy.
-
-    Returns:
-        str: A string representation of the generated UUID.
-    """
-
-    part_tstamp = str(uuid.uuid5(namespace_uuid, part.hiername))
-    return part_tstamp
-
-
-def gen_sheetpath_tstamp(hierarchy):
-    """
-    Generate a timestamp from a hierarchical path tuple.
-
-    This function creates a unique timestamp for a hierarchical path
-    in a KiCad project. If the hierarchy is empty, the timestamp
-    will be "/". Otherwise, it generates a UUID for each
-    entry of the tuple and combines them into a single timestamp.
-
-    Args:
-        hierarchy (tuple): A tuple of strings with the name of each level
-            of the hierarchy.
-
-    Returns:
-        str: A timestamp for the sheetpath. For the root path, it returns "/".
-             For other paths, it returns a UUID-based timestamp in the format
-             "/<UUID>/<UUID>/.../<UUID>/", where each UUID corresponds to a
-             segment of the sheetpath.
-    """
-
-    assert hierarchy[0] == "", "Top level of hierarchy must be an empty string."
-    if len(hierarchy) == 1:
-        tstamp = "/"
-    else:
-        tstamp = "/".join(
-            [str(uuid.uuid5(namespace_uuid, level)) for level in hierarchy[1:]]
-        )
-        tstamp = "/" + tstamp + "/"
-    return tstamp
-
 
 def gen_netlist_sheet(hierarchy, number, src_file, **kwargs):
     """
@@ -253,9 +183,8 @@ def gen_netlist(circuit, **kwargs):
     """
     Generate a netlist for a given circuit.
 
-    This function creates a netlist representation of the circuit, which includes
-    information about components, nets, and design metadata. The netlist is formatted
-    as a nested list structure and converted to S-expression format using the Sexp class.
+    This function writes the netlist of the circuit into a string using
+    write_netlist(). See that function for the contents of the netlist.
 
     Args:
         circuit (Circuit): The circuit object containing parts, nets, and other
@@ -263,6 +192,28 @@ def gen_netlist(circuit, **kwargs):
 
     Returns:
         str: The netlist in S-expression format.
+    """
+
+    netlist = io.StringIO()
+    write_netlist(circuit, netlist, **kwargs)
+    return netlist.getvalue()
+
+
+@export_to_all
+def write_netlist(circuit, f, **kwargs):
+    """
+    Write the netlist for a given circuit to a file.
+
+    This function writes a netlist representation of the circuit, which includes
+    information about components, nets, and design metadata. Each component and
+    net is converted into a nested list structure and written to the file in
+    S-expression format as soon as it's made, so the netlist for a large circuit
+    is never held in memory all at once.
+
+    Args:
+        circuit (Circuit): The circuit object containing parts, nets, and other
+            design information.
+        f (file): File object the netlist is written to.
 
     Notes:
         - The function performs checks for empty footprints and randomly-assigned
@@ -270,7 +221,8 @@ def gen_netlist(circuit, **kwargs):
         - The netlist includes metadata such as the source file, date, and tool
           version.
         - Components and nets are sorted for consistent output.
-        - The Sexp class is used to create a properly formatted S-expression.
+        - The output is the same as converting the entire netlist into an Sexp object
+          and then into a string.
     """
 
     # If track_src, track_abs_path is not specified in kwargs, use values from the circuit attributes.
@@ -299,37 +251,21 @@ def gen_netlist(circuit, **kwargs):
     date = time.strftime("%m/%d/%Y %I:%M %p")
     tool = f"SKiDL ({__version__})"
 
-    sheets = Sexp()
-    for num, node_name in enumerate(circuit.get_node_names(), 1):
-        sheets.append(gen_netlist_sheet(node_name, num, src_file, **kwargs))
+    sheets = [
+        gen_netlist_sheet(node_name, num, src_file, **kwargs)
+        for num, node_name in enumerate(circuit.get_node_names(), 1)
+    ]
+    design = ["design", ["source", src_file], ["date", date], ["tool", tool], *sheets]
 
-    components = Sexp()
-    for p in sorted(circuit.parts, key=lambda p: str(p.ref)):
-        components.append(gen_netlist_comp(p, **kwargs))
-
-    nets = Sexp()
-    sorted_nets = sorted(circuit.get_nets(), key=lambda n: str(n.name))
-    for code, net in enumerate(sorted_nets, 1):
-        net.code = code
-        nets.append(gen_netlist_net(net, **kwargs))
-
-    netlist = Sexp([
-        "export",
-        ["version", "D"],
-        [
-            "design",
-            ["source", src_file],
-            ["date", date],
-            ["tool", tool],
-            *sheets,
-        ],
-        ["components", *components],
-        ["nets", *nets],
-    ])
+    def components():
+        for p in sorted(circuit.parts, key=lambda p: str(p.ref)):
+            yield gen_netlist_comp(p, **kwargs)
 
-    # Add quotes to all strings following the initial keyword in each S-expression of the netlist.
-    netlist.add_quotes(lambda s: True)
+    def nets():
+        sorted_nets = sorted(circuit.get_nets(), key=lambda n: str(n.name))
+        for code, net in enumerate(sorted_nets, 1):
+            net.code = code
+            yield gen_netlist_net(net, **kwargs)
 
-    # For some reason, KiCad's PCBNEW expects a space after the beginning export keyword
-    # or else it rejects the netlist file.
-    return netlist.to_str().replace("(export\n", "(export \n", 1)
+    # Write the components and nets as they're made so the whole netlist is never in memory.
+    write_export(f, design, components(), nets())
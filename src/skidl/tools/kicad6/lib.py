@@ -23,6 +23,11 @@ from skidl.utilities import (
     to_list,
     add_unique_attr,
 )
+from skidl.tools.kicad_sym_index import (
+    load_symbol_index,
+    read_symbols,
+    scan_symbol_properties,
+)
 
 
 __all__ = ["lib_suffix"]
@@ -84,7 +89,7 @@ def load_sch_lib(lib, filename=None, lib_search_paths_=None, lib_section=None):
         lib_section: Only used for SPICE simulations.
     """
 
-    from skidl import Part, KICAD6
+    from skidl import KICAD6
     from skidl.tools import lib_suffixes
 
     # Try to open the file using allowable suffixes for the versions of KiCAD.
@@ -114,6 +119,72 @@ def load_sch_lib(lib, filename=None, lib_search_paths_=None, lib_section=None):
         # File contents were already decoded.
         pass
 
+    add_sch_lib_symbols(lib, filename, lib_txt)
+
+
+@export_to_all
+def index_sch_lib(filename, index_filename=None):
+    """
+    Get the index of where each part is stored in a KiCad schematic library file.
+
+    Args:
+        filename (str): The absolute path of the KiCad schematic library file.
+        index_filename (str, optional): File for storing the index so the library
+            doesn't have to be scanned again until it changes.
+
+    Returns:
+        OrderedDict: Part names mapped to the location of their definitions in the file.
+    """
+    return load_symbol_index(filename, index_filename)
+
+
+@export_to_all
+def load_sch_lib_symbols(lib, filename, symbol_index, names):
+    """
+    Load only some of the parts from a KiCad schematic library file.
+
+    Args:
+        lib (SchLib): SKiDL library object.
+        filename (str): The absolute path of the KiCad schematic library file.
+        symbol_index (dict): Index of the parts in the file from index_sch_lib().
+        names (list): Names of the parts to load. Any parts they extend are also loaded.
+    """
+    add_sch_lib_symbols(lib, filename, read_symbols(filename, symbol_index, names))
+
+
+@export_to_all
+def scan_sch_lib(filename):
+    """
+    Get the searchable information about the parts in a KiCad schematic library file.
+
+    This is much faster than loading the library because no Part objects are created.
+
+    Args:
+        filename (str): The absolute path of the KiCad schematic library file.
+
+    Returns:
+        list: A (name, aliases, description, keywords) tuple for each part in the file.
+    """
+    with open(filename, "rb") as f:
+        symbols = scan_symbol_properties(f.read())
+    return [
+        (name, [name], properties.get("description", ""), properties.get("ki_keywords", ""))
+        for name, properties in symbols.items()
+    ]
+
+
+def add_sch_lib_symbols(lib, filename, lib_txt):
+    """
+    Add the parts defined in the text of a KiCad schematic library to a library object.
+
+    Args:
+        lib (SchLib): SKiDL library object.
+        filename (str): The name of the KiCad schematic library file.
+        lib_txt (str): Text of the library.
+    """
+
+    from skidl import Part, KICAD6
+
     # Convert library text into an S-expression object.
     try:
         lib_sexp = Sexp(lib_txt)
@@ -173,7 +244,9 @@ def load_sch_lib(lib, filename=None, lib_search_paths_=None, lib_section=None):
                 datasheet=datasheet,
                 description=description,
                 search_text=search_text,
-            )
+            ),
+            # Parts built here are only used by the library, so don't copy them.
+            copy=False,
         )
 
 
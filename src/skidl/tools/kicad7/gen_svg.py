@@ -10,6 +10,7 @@ import math
 from collections import namedtuple
 
 from skidl.geometry import Tx, Point, BBox, tx_flip_y
+from skidl.tools.kicad_svg_cache import SYMBOL_NAME, cached_unit_svg
 from skidl.utilities import export_to_all
 
 
@@ -69,8 +70,11 @@ def bbox_to_svg(bbox, stroke_wid):
     ).format(**locals())
 
 
-def draw_cmd_to_svg(draw_cmd, tx, part, net_stubs, max_stub_len):
-    """Convert symbol drawing command into SVG string and an associated bounding box.
+def draw_cmd_to_shape(draw_cmd, tx, part, net_stubs, max_stub_len):
+    """Convert symbol drawing command into a function that makes its SVG and an associated bounding box.
+
+    The SVG is made by a function so it can be moved after the bounding box of
+    all the shapes in a symbol is known without transforming the shape again.
 
     Args:
         draw_cmd (str): Contains textual information about the shape to be drawn.
@@ -80,8 +84,9 @@ def draw_cmd_to_svg(draw_cmd, tx, part, net_stubs, max_stub_len):
         max_stub_len (int): Maximum length of a net stub name.
 
     Returns:
-        shape_svg (str): SVG command for the shape.
-        shape_bbox (BBox): Bounding box for the shape.
+        shape_to_svg (function): Called with a Point to return the SVG command
+            for the shape moved by that offset.
+        shape_bbox (BBox): Bounding box for the shape (without any offset).
     """
 
     # Use this when determining width of a text string based on its number of characters.
@@ -182,19 +187,21 @@ def draw_cmd_to_svg(draw_cmd, tx, part, net_stubs, max_stub_len):
     if shape_type == "polyline":
         points = [Point(*pt[0:2]) * tx for pt in shape["pts"]["xy"]]
         bbox = BBox(*points)
-        points_str = points_to_str(*points)
         stroke = (shape["stroke"]["type"],)
         stroke_width = abs(shape["stroke"]["width"] * tx_scale)
         fill = shape["fill"]["type"]
-        svg = " ".join(
-            [
-                "<polyline",
-                'points="{points_str}"',
-                'style="stroke-width:{stroke_width:.3f}"',
-                'class="$cell_id symbol {fill}"',
-                "/>",
-            ]
-        ).format(**locals())
+
+        def shape_to_svg(offset):
+            points_str = points_to_str(*(pt + offset for pt in points))
+            return " ".join(
+                [
+                    "<polyline",
+                    'points="{points_str}"',
+                    'style="stroke-width:{stroke_width:.3f}"',
+                    'class="$cell_id symbol {fill}"',
+                    "/>",
+                ]
+            ).format(points_str=points_str, stroke_width=stroke_width, fill=fill)
 
     elif shape_type == "circle":
         ctr = Point(*shape["center"]) * tx
@@ -204,15 +211,17 @@ def draw_cmd_to_svg(draw_cmd, tx, part, net_stubs, max_stub_len):
         stroke = shape["stroke"]["type"]
         stroke_width = abs(shape["stroke"]["width"] * tx_scale)
         fill = shape["fill"]["type"]
-        svg = " ".join(
-            [
-                "<circle",
-                'cx="{ctr.x:.3f}" cy="{ctr.y:.3f}" r="{r:.3f}"',
-                'style="stroke-width:{stroke_width:.3f}"',
-                'class="$cell_id symbol {fill}"',
-                "/>",
-            ]
-        ).format(**locals())
+
+        def shape_to_svg(offset):
+            return " ".join(
+                [
+                    "<circle",
+                    'cx="{ctr.x:.3f}" cy="{ctr.y:.3f}" r="{r:.3f}"',
+                    'style="stroke-width:{stroke_width:.3f}"',
+                    'class="$cell_id symbol {fill}"',
+                    "/>",
+                ]
+            ).format(ctr=ctr + offset, r=r, stroke_width=stroke_width, fill=fill)
 
     elif shape_type == "rectangle":
         start = Point(*shape["start"]) * tx
@@ -221,16 +230,18 @@ def draw_cmd_to_svg(draw_cmd, tx, part, net_stubs, max_stub_len):
         stroke = shape["stroke"]["type"]
         stroke_width = abs(shape["stroke"]["width"] * tx_scale)
         fill = shape["fill"]["type"]
-        svg = " ".join(
-            [
-                "<rect",
-                'x="{bbox.min.x:.3f}" y="{bbox.min.y:.3f}"',
-                'width="{bbox.w:.3f}" height="{bbox.h:.3f}"',
-                'style="stroke-width:{stroke_width:.3f}"',
-                'class="$cell_id symbol {fill}"',
-                "/>",
-            ]
-        ).format(**locals())
+
+        def shape_to_svg(offset):
+            return " ".join(
+                [
+                    "<rect",
+                    'x="{min.x:.3f}" y="{min.y:.3f}"',
+                    'width="{bbox.w:.3f}" height="{bbox.h:.3f}"',
+                    'style="stroke-width:{stroke_width:.3f}"',
+                    'class="$cell_id symbol {fill}"',
+                    "/>",
+                ]
+            ).format(min=bbox.min + offset, bbox=bbox, stroke_width=stroke_width, fill=fill)
 
     elif shape_type == "arc":
         a = Point(*shape["start"]) * tx
@@ -251,19 +262,29 @@ def draw_cmd_to_svg(draw_cmd, tx, part, net_stubs, max_stub_len):
         stroke = shape["stroke"]["type"]
         stroke_width = abs(shape["stroke"]["width"] * tx_scale)
         fill = shape["fill"]["type"]
-        svg = " ".join(
-            [
-                "<path",
-                'd="M {a.x:.3f} {a.y:.3f} A {r:.3f} {r:.3f} 0 {large_arc} {sweep} {b.x:.3f} {b.y:.3f}"',
-                'style="stroke-width:{stroke_width:.3f}"',
-                'class="$cell_id symbol {fill}"',
-                "/>",
-            ]
-        ).format(**locals())
+
+        def shape_to_svg(offset):
+            return " ".join(
+                [
+                    "<path",
+                    'd="M {a.x:.3f} {a.y:.3f} A {r:.3f} {r:.3f} 0 {large_arc} {sweep} {b.x:.3f} {b.y:.3f}"',
+                    'style="stroke-width:{stroke_width:.3f}"',
+                    'class="$cell_id symbol {fill}"',
+                    "/>",
+                ]
+            ).format(
+                a=a + offset,
+                b=b + offset,
+                r=r,
+                large_arc=large_arc,
+                sweep=sweep,
+                stroke_width=stroke_width,
+                fill=fill,
+            )
 
     elif shape_type == "property":
         if "hide" in shape["effects"]:
-            svg, bbox = "", BBox()
+            shape_to_svg, bbox = lambda offset: "", BBox()
         else:
             if shape["misc"][0].lower() == "reference":
                 class_ = "part_ref_text"
@@ -291,7 +312,9 @@ def draw_cmd_to_svg(draw_cmd, tx, part, net_stubs, max_stub_len):
             char_wid *= tx_scale
             char_hgt *= tx_scale
             text = shape["misc"][1]
-            svg = text_to_svg(text, side, start, char_wid, class_, attr)
+            shape_to_svg = lambda offset: text_to_svg(
+                text, side, start + offset, char_wid, class_, attr
+            )
             bbox = text_bbox(text, start, (end - start).norm, char_wid, char_hgt)
 
     elif shape_type == "pin":
@@ -356,30 +379,33 @@ def draw_cmd_to_svg(draw_cmd, tx, part, net_stubs, max_stub_len):
         stroke_width = abs(shape["stroke"]["width"] * tx_scale)
         fill = shape["fill"]["type"]
         circle_stroke_width = 2 * stroke_width
-
-        points_str = points_to_str(start, end)
-        pin_svg = f'<polyline points="{points_str}" style="stroke-width:{stroke_width:.3f}" class="$cell_id symbol {fill}" />\n'
-        # pin_circle_svg = f'<circle cx="{start.x:.3f}" cy="{start.y:.3f}" r="{circle_stroke_width:.3f}" style="stroke-width:{circle_stroke_width:.3f}" class="$cell_id symbol {fill}" />\n'
-        pin_circle_svg = ""
-        pin_num_svg = pin_text_to_svg(pin_num, "pin_num", side, end, num_char_wid)
-        pin_name_svg = pin_text_to_svg(pin_name, "pin_name", side, end, name_char_wid)
-        if pin.net in net_stubs:
-            net_name_svg = pin_text_to_svg(
-                pin.net.name, "net_name", side, start, net_name_char_wid
+        is_stub = pin.net in net_stubs
+
+        def shape_to_svg(offset):
+            start_pt, end_pt = start + offset, end + offset
+            points_str = points_to_str(start_pt, end_pt)
+            pin_svg = f'<polyline points="{points_str}" style="stroke-width:{stroke_width:.3f}" class="$cell_id symbol {fill}" />\n'
+            # pin_circle_svg = f'<circle cx="{start_pt.x:.3f}" cy="{start_pt.y:.3f}" r="{circle_stroke_width:.3f}" style="stroke-width:{circle_stroke_width:.3f}" class="$cell_id symbol {fill}" />\n'
+            pin_circle_svg = ""
+            pin_num_svg = pin_text_to_svg(pin_num, "pin_num", side, end_pt, num_char_wid)
+            pin_name_svg = pin_text_to_svg(pin_name, "pin_name", side, end_pt, name_char_wid)
+            if is_stub:
+                net_name_svg = pin_text_to_svg(
+                    pin.net.name, "net_name", side, start_pt, net_name_char_wid
+                )
+            else:
+                net_name_svg = ""
+            connection_svg = f'<g s:x="{start_pt.x:.3f}" s:y="{start_pt.y:.3f}" s:pid="{pin_num}" s:position="{side}"/>\n'
+            return "".join(
+                [
+                    pin_svg,
+                    pin_circle_svg,
+                    pin_num_svg,
+                    pin_name_svg,
+                    net_name_svg,
+                    connection_svg,
+                ]
             )
-        else:
-            net_name_svg = ""
-        connection_svg = f'<g s:x="{start.x:.3f}" s:y="{start.y:.3f}" s:pid="{pin_num}" s:position="{side}"/>\n'
-        svg = "".join(
-            [
-                pin_svg,
-                pin_circle_svg,
-                pin_num_svg,
-                pin_name_svg,
-                net_name_svg,
-                connection_svg,
-            ]
-        )
 
     elif shape_type == "text":
         class_ = "text"
@@ -397,13 +423,104 @@ def draw_cmd_to_svg(draw_cmd, tx, part, net_stubs, max_stub_len):
         char_wid *= tx_scale
         char_hgt *= tx_scale
         text = shape["misc"]
-        svg = text_to_svg(text, side, start, char_wid, class_, attr)
+        shape_to_svg = lambda offset: text_to_svg(
+            text, side, start + offset, char_wid, class_, attr
+        )
         bbox = text_bbox(text, start, (end - start).norm, char_wid, char_hgt)
 
     else:
         raise RuntimeError(f"Unrecognized shape type: {shape_type}")
 
-    return svg, bbox
+    return shape_to_svg, bbox
+
+
+def draw_cmd_to_svg(draw_cmd, tx, part, net_stubs, max_stub_len):
+    """Convert symbol drawing command into SVG string and an associated bounding box.
+
+    Args:
+        draw_cmd (str): Contains textual information about the shape to be drawn.
+        tx (Tx): Transformation matrix to be applied to the shape.
+        part (Part): Part object that the drawing command belongs to (used to get pin information.)
+        net_stubs (list): List of Net objects whose names will be connected to part symbol pins as connection stubs.
+        max_stub_len (int): Maximum length of a net stub name.
+
+    Returns:
+        shape_svg (str): SVG command for the shape.
+        shape_bbox (BBox): Bounding box for the shape.
+    """
+    shape_to_svg, bbox = draw_cmd_to_shape(draw_cmd, tx, part, net_stubs, max_stub_len)
+    return shape_to_svg(Point(0, 0)), bbox
+
+
+def gen_svg_unit(part, unit_num, tx, net_stubs, max_stub_len):
+    """
+    Generate SVG for a unit of a component.
+
+    The drawing commands are transformed once to get both their SVG and the
+    bounding box of the unit. Then the SVG is moved so the bounding box starts
+    at (0,0). (netlistsvg seems to malfunction, otherwise.)
+
+    Args:
+        part: Part object for which an SVG symbol will be created.
+        unit_num: Number of the part unit.
+        tx: Transformation matrix for the symbol.
+        net_stubs: List of Net objects whose names will be connected to
+            part symbol pins as connection stubs.
+        max_stub_len: Maximum length of a net stub name.
+
+    Returns: SVG for the part unit with SYMBOL_NAME where the name of the symbol goes.
+    """
+
+    # Compute the bounding box of the part symbol along with its shapes.
+    bbox = BBox()
+    shapes = []
+    for cmd in part.draw_cmds[unit_num]:
+        shape_to_svg, bb = draw_cmd_to_shape(cmd, tx, part, net_stubs, max_stub_len)
+        bbox.add(bb)
+        shapes.append(shape_to_svg)
+
+    # Move the shapes so the part's bounding box starts at (0,0).
+    offset = -bbox.min
+    unit_svg = [shape_to_svg(offset) for shape_to_svg in shapes]
+    bbox = BBox(bbox.min + offset, bbox.max + offset)
+
+    # Begin SVG for part unit. Translate it so the bbox.min is at (0,0).
+    symbol_name = SYMBOL_NAME
+    translate = -bbox.min
+    svg = [
+        " ".join(
+            [
+                "<g",
+                's:type="{symbol_name}"',
+                's:width="{bbox.w:.3f}"',
+                's:height="{bbox.h:.3f}"',
+                'transform="translate({translate.x:.3f} {translate.y:.3f})"',
+                ">\n",
+            ]
+        ).format(**locals())
+    ]
+
+    # Add part alias.
+    svg.append(f'<s:alias val="{symbol_name}"/>\n')
+
+    for item in unit_svg:
+        if "text" not in item:
+            svg.append(item)
+
+    for item in unit_svg:
+        if "text" in item:
+            svg.append(item)
+
+    # Place a visible bounding-box around symbol for trouble-shooting.
+    show_bbox = False
+    bbox_stroke_width = tx.scale * 0.1
+    if show_bbox:
+        svg.append(bbox_to_svg(bbox, bbox_stroke_width))
+
+    # Finish SVG for part unit.
+    svg.append("</g>\n")
+
+    return "".join(svg)
 
 
 @export_to_all
@@ -420,6 +537,8 @@ def gen_svg_comp(part, symtx, net_stubs=None):
     Returns: SVG for the part symbol.
     """
 
+    from skidl import KICAD7
+
     # Create transformation matrix for the symbol from symtx, flip Y axis, and scale.
     px = 96  # Pixels per inch. SVG uses pixels.
     mm = 25.4  # Millimeters per inch. KiCad uses millimeters.
@@ -442,24 +561,6 @@ def gen_svg_comp(part, symtx, net_stubs=None):
     svg = []
     for unit in part.unit.values():
 
-        # First, compute the bounding box of the part symbol.
-        bbox = BBox()
-        for cmd in part.draw_cmds[unit.num]:
-            _, bb = draw_cmd_to_svg(cmd, tx, part, net_stubs, max_stub_len)
-            bbox.add(bb)
-
-        # Add translation to the transformation matrix so the part's bounding box
-        # starts at (0,0). (netlistsvg seems to malfunction, otherwise.)
-        trans_tx = tx.move(-bbox.min)
-
-        # Finally, recalculate the part symbol with the added translation.
-        bbox = BBox()
-        unit_svg = []
-        for cmd in part.draw_cmds[unit.num]:
-            s, bb = draw_cmd_to_svg(cmd, trans_tx, part, net_stubs, max_stub_len)
-            bbox.add(bb)
-            unit_svg.append(s)
-
         # Assign part unit name.
         if max_stub_len:
             # If net stubs are attached to symbol, then it's only to be used
@@ -471,39 +572,17 @@ def gen_svg_comp(part, symtx, net_stubs=None):
             # also has no net stubs, so don't tag it with a specific part reference.
             symbol_name = f"{part.name}_{unit.num}_{symtx}"
 
-        # Begin SVG for part unit. Translate it so the bbox.min is at (0,0).
-        translate = -bbox.min
+        # Get the SVG for the part unit from the cache or draw it if it's not there.
         svg.append(
-            " ".join(
-                [
-                    "<g",
-                    's:type="{symbol_name}"',
-                    's:width="{bbox.w:.3f}"',
-                    's:height="{bbox.h:.3f}"',
-                    'transform="translate({translate.x:.3f} {translate.y:.3f})"',
-                    ">\n",
-                ]
-            ).format(**locals())
+            cached_unit_svg(
+                KICAD7,
+                part,
+                unit.num,
+                symtx,
+                net_stubs,
+                symbol_name,
+                lambda: gen_svg_unit(part, unit.num, tx, net_stubs, max_stub_len),
+            )
         )
 
-        # Add part alias.
-        svg.append(f'<s:alias val="{symbol_name}"/>\n')
-
-        for item in unit_svg:
-            if "text" not in item:
-                svg.append(item)
-
-        for item in unit_svg:
-            if "text" in item:
-                svg.append(item)
-
-        # Place a visible bounding-box around symbol for trouble-shooting.
-        show_bbox = False
-        bbox_stroke_width = scale * 0.1
-        if show_bbox:
-            svg.append(bbox_to_svg(bbox, bbox_stroke_width))
-
-        # Finish SVG for part unit.
-        svg.append("</g>\n")
-
     return "".join(svg)
@@ -6,12 +6,15 @@ from . import constants
 from .bboxes import calc_symbol_bbox, calc_hier_label_bbox
 from .gen_schematic import *
 from .gen_svg import *
-from .gen_netlist import gen_netlist
+from .gen_netlist import gen_netlist, write_netlist
 from .gen_pcb import gen_pcb
-from .gen_xml import gen_xml
+from .gen_xml import gen_xml, write_xml
 from .lib import (
     get_fp_lib_tbl_dir,
     load_sch_lib,
+    index_sch_lib,
+    scan_sch_lib,
+    load_sch_lib_symbols,
     parse_lib_part,
     lib_suffix,
     default_lib_paths,
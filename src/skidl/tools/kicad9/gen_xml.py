@@ -6,6 +6,7 @@
 Generate KiCad XML.
 """
 
+import io
 import os.path
 import time
 import os
@@ -63,21 +64,31 @@ def gen_xml_comp(part):
 
 
 def gen_xml_net(net):
+    """Generate the XML describing a net.
+
+    Args:
+        net (Net): Net object.
+
+    Returns:
+        str: String containing the XML for the net.
+    """
     code = net.code
     name = net.name
-    txt = f'    <net code="{code}" name="{name}">'
+    txt = [f'    <net code="{code}" name="{name}">']
     for p in net.pins:
         part_ref = p.part.ref
         pin_num = p.num
-        txt += f'\n      <node ref="{part_ref}" pin="{pin_num}"/>'
-    txt += "\n    </net>"
-    return txt
+        txt.append(f'\n      <node ref="{part_ref}" pin="{pin_num}"/>')
+    txt.append("\n    </net>")
+    return "".join(txt)
 
 
 @export_to_all
 def gen_xml(circuit):
     """Generate the XML describing a circuit.
 
+    The XML is written into a string using write_xml().
+
     Args:
         circuit (Circuit): Circuit object.
 
@@ -85,6 +96,23 @@ def gen_xml(circuit):
         str: String containing the XML for the circuit.
     """
 
+    xml = io.StringIO()
+    write_xml(circuit, xml)
+    return xml.getvalue()
+
+
+@export_to_all
+def write_xml(circuit, f):
+    """Write the XML describing a circuit to a file.
+
+    The XML for each component and net is written as soon as it's made,
+    so the XML for a large circuit is never held in memory all at once.
+
+    Args:
+        circuit (Circuit): Circuit object.
+        f (file): File object the XML is written to.
+    """
+
     scr_dict = scriptinfo()
     src_file = os.path.join(scr_dict["dir"], scr_dict["source"])
     date = time.strftime("%m/%d/%Y %I:%M %p")
@@ -98,15 +126,14 @@ def gen_xml(circuit):
         + "    <tool>{tool}</tool>\n"
         + "  </design>\n"
     )
-    netlist = template.format(**locals())
-    netlist += "  <components>"
+    f.write(template.format(**locals()))
+    f.write("  <components>")
     for p in circuit.parts:
-        netlist += "\n" + gen_xml_comp(p)
-    netlist += "\n  </components>\n"
-    netlist += "  <nets>"
+        f.write("\n" + gen_xml_comp(p))
+    f.write("\n  </components>\n")
+    f.write("  <nets>")
     for code, n in enumerate(circuit.get_nets()):
         n.code = code
-        netlist += "\n" + gen_xml_net(n)
-    netlist += "\n  </nets>\n"
-    netlist += "</export>\n"
-    return netlist
+        f.write("\n" + gen_xml_net(n))
+    f.write("\n  </nets>\n")
+    f.write("</export>\n")
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+
+# The MIT License (MIT) - Copyright (c) Dave Vandenbout.
+
+"""
+Streaming writer for KiCad netlists.
+
+Building the whole netlist as a tree of S-expressions, quoting every string in
+the tree and then converting it into one big string takes a lot of memory for
+large circuits. The functions in this module write each S-expression of the
+netlist to a file as soon as it's made, quoting each token as it goes. The
+output is the same as converting the tree with ``Sexp.add_quotes(lambda s: True)``
+followed by ``Sexp.to_str()``, so the KiCad back-ends can share this writer
+and still produce the same netlist files as before.
+"""
+
+from skidl.utilities import export_to_all
+
+
+# Indentation added for each nesting level of the S-expressions.
+INDENT = "  "
+
+
+def sexp_token(item):
+    """
+    Convert an element of an S-expression into a token of the netlist.
+
+    Strings are surrounded by double-quotes with any double-quotes inside them
+    escaped. Anything else (like a number) is converted with str(). Newlines are
+    removed just as Sexp.to_str() does.
+
+    Args:
+        item: An element of an S-expression that is not a list.
+
+    Returns:
+        str: The token for the element.
+    """
+    if isinstance(item, str):
+        return '"' + item.replace("\n", "").replace('"', '\\"') + '"'
+    return str(item).replace("\n", "")
+
+
+@export_to_all
+def write_sexp(f, sexp, level=0):
+    """
+    Write a nested list as an S-expression with a line for each nested list.
+
+    The first element of each list is written as is while the remaining strings
+    are quoted. Each nested list starts on a new line indented to its level.
+
+    Args:
+        f (file): File object the S-expression is written to.
+        sexp (list): Nested list with the S-expression.
+        level (int, optional): Nesting level of the S-expression. Defaults to 0.
+    """
+    write = f.write
+    if level:
+        write("\n" + INDENT * level)
+    write("(")
+    for i, item in enumerate(sexp):
+        if isinstance(item, list):
+            write_sexp(f, item, level + 1)
+        elif i == 0:
+            write(str(item).replace("\n", ""))
+        else:
+            write(" " + sexp_token(item))
+    write(")")
+
+
+@export_to_all
+def write_export(f, design, components, nets):
+    """
+    Write a KiCad netlist to a file one component and net at a time.
+
+    Args:
+        f (file): File object the netlist is written to.
+        design (list): Nested list with the design section of the netlist.
+        components (iterable): Nested lists with the components of the netlist.
+            This can be a generator so the components are only made as they're written.
+        nets (iterable): Nested lists with the nets of the netlist.
+            This can also be a generator.
+    """
+    # For some reason, KiCad's PCBNEW expects a space after the beginning export keyword
+    # or else it rejects the netlist file.
+    f.write("(export \n" + INDENT + '(version "D")')
+    write_sexp(f, design, 1)
+    for section, sexps in (("components", components), ("nets", nets)):
+        f.write("\n" + INDENT + "(" + section)
+        for sexp in sexps:
+            write_sexp(f, sexp, 2)
+        f.write(")")
+    f.write(")")
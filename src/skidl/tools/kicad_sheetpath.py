@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+
+# The MIT License (MIT) - Copyright (c) Dave Vandenbout.
+
+"""
+Sheet paths and timestamps for KiCad netlists.
+
+KiCad identifies each sheet of the hierarchy and each component with UUIDs.
+SKiDL derives these from the names of the hierarchy levels so they stay the
+same each time the netlist is generated. Every component in a sheet shares
+the same sheet path, so the paths and timestamps computed for each hierarchy
+tuple are remembered instead of hashing the same level names over and over.
+Since they're keyed by the names themselves, renaming a node just leads to a
+different hierarchy tuple and there's nothing stale to clear out. The caches
+are limited in size so they don't keep growing in long sessions that build
+many circuits, and they're cleared when a circuit is reset.
+"""
+
+import functools
+import uuid
+
+from skidl.utilities import export_to_all
+
+
+# This UUID was generated using uuidgen for passing as the namespace argument to uuid.uuid5().
+namespace_uuid = uuid.UUID("7026fcc6-e1a0-409e-aaf4-6a17ea82654f")
+
+# Maximum number of level names and hierarchy tuples remembered by each cache.
+# This is far more than the number of sheets in a design.
+_CACHE_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def _level_tstamp(level):
+    """Return the UUID string for the name of a level of the hierarchy."""
+    return str(uuid.uuid5(namespace_uuid, level))
+
+
+@export_to_all
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def gen_sheetpath(hierarchy):
+    """
+    Generate a sheetpath string from a hierarchical path tuple.
+
+    A sheetpath is a string representation of the hierarchical path
+    in a KiCad project. This function converts the given hierarchy
+    tuple into a valid sheetpath format by joining the elements of the
+    hierarchy tuple with '/' and ensuring it starts and ends with '/'.
+
+    Args:
+        hierarchy (tuple): A tuple of strings with the name of each level
+            of the hierarchy.
+
+    Returns:
+        str: The generated sheetpath string. If the input hierarchy
+             is empty or None, the function returns "/".
+    """
+
+    assert hierarchy[0] == "", "Top level of hierarchy must be an empty string."
+    return f"{'/'.join(hierarchy)}/"
+
+
+@export_to_all
+def gen_part_tstamp(part):
+    """
+    Generate a unique timestamp for a given part based on its hierarchical name.
+
+    This function uses a UUID version 5 (SHA-1 hash) to create a deterministic
+    and unique identifier for the part. The UUID is generated using a namespace
+    UUID and the hierarchical name of the part.
+
+    Args:
+        part: An object representing the part. It is expected to have a
+              'hiername' attribute that uniquely identifies the part
+              within its hierarchy.
+
+    Returns:
+        str: A string representation of the generated UUID.
+    """
+
+    # Hierarchical part names are unique so there's no point in remembering these.
+    return str(uuid.uuid5(namespace_uuid, part.hiername))
+
+
+@export_to_all
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def gen_sheetpath_tstamp(hierarchy):
+    """
+    Generate a timestamp from a hierarchical path tuple.
+
+    This function creates a unique timestamp for a hierarchical path
+    in a KiCad project. If the hierarchy is empty, the timestamp
+    will be "/". Otherwise, it generates a UUID for each
+    entry of the tuple and combines them into a single timestamp.
+
+    Args:
+        hierarchy (tuple): A tuple of strings with the name of each level
+            of the hierarchy.
+
+    Returns:
+        str: A timestamp for the sheetpath. For the root path, it returns "/".
+             For other paths, it returns a UUID-based timestamp in the format
+             "/<UUID>/<UUID>/.../<UUID>/", where each UUID corresponds to a
+             segment of the sheetpath.
+    """
+
+    assert hierarchy[0] == "", "Top level of hierarchy must be an empty string."
+    if len(hierarchy) == 1:
+        tstamp = "/"
+    else:
+        tstamp = "/".join([_level_tstamp(level) for level in hierarchy[1:]])
+        tstamp = "/" + tstamp + "/"
+    return tstamp
+
+
+@export_to_all
+def clear_sheetpath_caches():
+    """Forget the sheet paths and timestamps remembered for hierarchy tuples and level names."""
+    _level_tstamp.cache_clear()
+    gen_sheetpath.cache_clear()
+    gen_sheetpath_tstamp.cache_clear()
@@ -0,0 +1,238 @@
+# -*- coding: utf-8 -*-
+
+# The MIT License (MIT) - Copyright (c) Dave Vandenbout.
+
+"""
+Cache of the SVG generated for the units of part symbols.
+
+Drawing the SVG for a part symbol means parsing and transforming every drawing
+command of the part, and generate_svg() does it for every part each time it's
+run. The SVG for a part unit only depends on the library the part came from,
+the name of the part, the unit, the transformation of the symbol and how the
+pins are connected to nets (because pins get extended and labeled for net stubs).
+So the SVG is stored under a hash of these things, both in memory and in files
+of the svg_cache_dir directory so other runs can use it.
+
+The name of the symbol is kept out of the stored SVG (because it holds the
+reference of a part attached to net stubs) and is filled in when the SVG is used.
+"""
+
+import os
+import tempfile
+
+from skidl.utilities import consistent_hash, export_to_all
+
+
+# Increment this if the SVG made by the back-ends changes so stored SVG isn't used.
+SVG_CACHE_VERSION = 1
+
+# Stands in for the name of the symbol in the stored SVG.
+SYMBOL_NAME = "{symbol_name}"
+
+# Hashes of library files keyed by their path, modification time and size.
+_lib_file_hashes = {}
+
+
+def _lib_file_hash(path):
+    """
+    Return a hash of the contents of a library file.
+
+    The hash is only computed again if the modification time or size of the file changes.
+
+    Args:
+        path (str): Path to the library file.
+
+    Returns:
+        str: Hash of the file contents or None if the file can't be read.
+    """
+    try:
+        stat = os.stat(path)
+        file_key = (path, stat.st_mtime, stat.st_size)
+        if file_key not in _lib_file_hashes:
+            with open(path, "rb") as f:
+                _lib_file_hashes[file_key] = consistent_hash(
+                    f.read().decode("utf-8", errors="replace")
+                )
+        return _lib_file_hashes[file_key]
+    except (OSError, TypeError):
+        return None
+
+
+def _symbol_source_hash(part):
+    """
+    Return a hash of where the drawing commands for a part symbol came from.
+
+    This is the hash of the library file of the part or, if the part didn't come
+    from a library file, a hash of its drawing commands.
+
+    Args:
+        part (Part): Part whose symbol is drawn.
+
+    Returns:
+        str: Hash of the library file or drawing commands.
+    """
+    lib_file = getattr(getattr(part, "lib", None), "filepath", None)
+    lib_hash = _lib_file_hash(lib_file) if lib_file else None
+    if lib_hash is None:
+        draw_cmds = getattr(part, "draw_cmds", None) or getattr(part, "draw", None)
+        lib_hash = consistent_hash(repr(draw_cmds))
+    return lib_hash
+
+
+def _stub_signature(part, net_stubs):
+    """
+    Return a signature of how the pins of a part are connected for drawing its symbol.
+
+    Args:
+        part (Part): Part whose symbol is drawn.
+        net_stubs (list): Nets whose names are attached to pins as stubs.
+
+    Returns:
+        tuple: For each pin, its number, whether it's unconnected, attached to
+            a stub or routed, and the names of the stubs on the pin.
+    """
+    no_nets = [None, NC]
+    signature = []
+    for pin in part:
+        if pin.net in no_nets:
+            state = "nc"
+        elif pin.net in net_stubs:
+            state = "stub"
+        else:
+            state = "net"
+        stub_names = tuple(
+            net.name for net in pin.nets if net not in no_nets and net in net_stubs
+        )
+        signature.append((pin.num, state, stub_names))
+    return tuple(signature)
+
+
+@export_to_all
+def symbol_svg_key(tool, part, unit_num, symtx, net_stubs):
+    """
+    Return the key for the SVG of a part unit in the SVG symbol cache.
+
+    Args:
+        tool (str): Tool whose back-end draws the SVG.
+        part (Part): Part whose symbol is drawn.
+        unit_num (int): Number of the part unit.
+        symtx (str): String such as "HR" that indicates symbol mirroring/rotation.
+        net_stubs (list): Nets whose names are attached to pins as stubs.
+
+    Returns:
+        str: Hash of everything the SVG for the part unit depends on.
+    """
+    return consistent_hash(
+        repr(
+            (
+                SVG_CACHE_VERSION,
+                tool,
+                _symbol_source_hash(part),
+                part.name,
+                unit_num,
+                symtx,
+                _stub_signature(part, net_stubs or []),
+            )
+        )
+    )
+
+
+@export_to_all
+class SvgSymbolCache(dict):
+    """
+    Dict of the SVG for part units that is backed by files in a directory.
+
+    SVG that isn't found in the dict is looked for in the directory given by
+    skidl.config.svg_cache_dir (if that's set), and SVG added to the dict is
+    also stored there.
+    """
+
+    def _cache_file(self, key):
+        """Return the file for storing the SVG with the key or None if there's no cache directory."""
+        import skidl
+
+        cache_dir = getattr(skidl.config, "svg_cache_dir", None)
+        if not cache_dir:
+            return None
+        return os.path.join(cache_dir, key + ".svg")
+
+    def get(self, key):
+        """
+        Get the SVG with the key from memory or from its file.
+
+        Args:
+            key (str): Key made by symbol_svg_key().
+
+        Returns:
+            str: The stored SVG or None if it wasn't found.
+        """
+        try:
+            return self[key]
+        except KeyError:
+            pass
+        cache_file = self._cache_file(key)
+        if cache_file:
+            try:
+                with open(cache_file, encoding="utf-8") as f:
+                    self[key] = f.read()
+                    return self[key]
+            except (OSError, UnicodeDecodeError):
+                pass
+        return None
+
+    def put(self, key, svg):
+        """
+        Store the SVG with the key in memory and in its file.
+
+        Args:
+            key (str): Key made by symbol_svg_key().
+            svg (str): SVG for a part unit with SYMBOL_NAME where its name goes.
+        """
+        self[key] = svg
+        cache_file = self._cache_file(key)
+        if cache_file:
+            # Write to a temporary file and then rename it so another process
+            # never reads a partially-written file.
+            try:
+                os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+                with tempfile.NamedTemporaryFile(
+                    "w",
+                    encoding="utf-8",
+                    dir=os.path.dirname(cache_file),
+                    suffix=".tmp",
+                    delete=False,
+                ) as f:
+                    f.write(svg)
+                os.replace(f.name, cache_file)
+            except OSError:
+                pass
+
+
+# Cache of the SVG for part units that's shared by the back-ends.
+svg_symbol_cache = SvgSymbolCache()
+
+
+@export_to_all
+def cached_unit_svg(tool, part, unit_num, symtx, net_stubs, symbol_name, draw_unit):
+    """
+    Return the SVG for a part unit from the SVG symbol cache, drawing it if it's not there.
+
+    Args:
+        tool (str): Tool whose back-end draws the SVG.
+        part (Part): Part whose symbol is drawn.
+        unit_num (int): Number of the part unit.
+        symtx (str): String such as "HR" that indicates symbol mirroring/rotation.
+        net_stubs (list): Nets whose names are attached to pins as stubs.
+        symbol_name (str): Name of the symbol for the part unit.
+        draw_unit (function): Called with no arguments to draw the SVG for the
+            part unit with SYMBOL_NAME where the name of the symbol goes.
+
+    Returns:
+        str: SVG for the part unit.
+    """
+    key = symbol_svg_key(tool, part, unit_num, symtx, net_stubs)
+    svg = svg_symbol_cache.get(key)
+    if svg is None:
+        svg = draw_unit()
+        svg_symbol_cache.put(key, svg)
+    return svg.replace(SYMBOL_NAME, symbol_name)
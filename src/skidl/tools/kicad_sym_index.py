@@ -0,0 +1,234 @@
+# -*- coding: utf-8 -*-
+
+# The MIT License (MIT) - Copyright (c) Dave Vandenbout.
+
+"""
+Index of the symbols stored in KiCad V6+ schematic library files.
+
+Parsing an entire .kicad_sym file into S-expressions is slow for large libraries,
+especially when only a few of its symbols are used. The functions in this module
+scan a library file once to find where each symbol is stored (along with the name
+of the symbol it extends, if any) and keep that index in a file so later sessions
+can extract and parse just the text of the symbols they actually need.
+"""
+
+import json
+import os
+import re
+from collections import OrderedDict
+
+from skidl.utilities import export_to_all
+
+
+# Increment this if the format of the stored index changes.
+INDEX_VERSION = 1
+
+# Quoted strings (which may contain parentheses) and parentheses.
+_TOKEN_RE = re.compile(rb'"(?:[^"\\]|\\.)*"|[()]', re.DOTALL)
+
+# The start of a symbol or extends S-expression and the name that follows it.
+_NAME_PATTERN = rb'\s+("(?:[^"\\]|\\.)*"|[^\s()"]+)'
+_SYMBOL_RE = re.compile(rb"\(\s*symbol" + _NAME_PATTERN, re.IGNORECASE | re.DOTALL)
+_EXTENDS_RE = re.compile(rb"\(\s*extends" + _NAME_PATTERN, re.IGNORECASE | re.DOTALL)
+
+# The start of a property S-expression and the name and value that follow it.
+_PROPERTY_RE = re.compile(
+    rb"\(\s*property" + _NAME_PATTERN + _NAME_PATTERN, re.IGNORECASE | re.DOTALL
+)
+
+
+def _unquote(name):
+    """Convert a symbol name from the library file into a string."""
+    name = name.decode("latin_1")
+    if name.startswith('"'):
+        name = re.sub(r"\\(.)", r"\1", name[1:-1])
+    return name
+
+
+@export_to_all
+def scan_symbols(data):
+    """
+    Find the location of each top-level symbol in the contents of a library file.
+
+    Args:
+        data (bytes): Contents of a KiCad V6+ schematic library file.
+
+    Returns:
+        OrderedDict: Symbol names (in file order) mapped to (start, end, parent) tuples
+            where data[start:end] is the S-expression for the symbol and parent is the
+            name of the symbol it extends or None.
+    """
+
+    symbols = OrderedDict()
+    depth = 0
+    name = start = parent = None
+    for token in _TOKEN_RE.finditer(data):
+        char = token.group()
+        if char == b"(":
+            depth += 1
+            if depth == 2:
+                # The symbols of the library are the children of kicad_symbol_lib.
+                match = _SYMBOL_RE.match(data, token.start())
+                if match:
+                    name = _unquote(match.group(1))
+                    start, parent = token.start(), None
+            elif depth == 3 and name is not None:
+                match = _EXTENDS_RE.match(data, token.start())
+                if match:
+                    parent = _unquote(match.group(1))
+        elif char == b")":
+            if depth == 2 and name is not None:
+                # The first of any symbols with the same name is kept, like the
+                # one that gets kept when the whole library is loaded.
+                symbols.setdefault(name, (start, token.end(), parent))
+                name = None
+            depth -= 1
+    return symbols
+
+
+@export_to_all
+def scan_symbol_properties(data):
+    """
+    Find the properties of each top-level symbol in the contents of a library file.
+
+    This gets the searchable information about the symbols (like their descriptions
+    and keywords) without parsing the whole library into S-expressions.
+
+    Args:
+        data (bytes): Contents of a KiCad V6+ schematic library file.
+
+    Returns:
+        OrderedDict: Symbol names (in file order) mapped to dicts of their property
+            values keyed by the lowercase property names. A symbol that extends
+            another gets any properties of its parent that it doesn't set itself.
+    """
+
+    symbols = OrderedDict()
+    depth = 0
+    name = parent = properties = None
+    for token in _TOKEN_RE.finditer(data):
+        char = token.group()
+        if char == b"(":
+            depth += 1
+            if depth == 2:
+                match = _SYMBOL_RE.match(data, token.start())
+                if match:
+                    name = _unquote(match.group(1))
+                    parent, properties = None, {}
+            elif depth == 3 and name is not None:
+                match = _PROPERTY_RE.match(data, token.start())
+                if match:
+                    # Only escaped quotes and backslashes are converted, like
+                    # when the library is parsed into S-expressions.
+                    value = match.group(2).decode("latin_1")
+                    if value.startswith('"'):
+                        value = re.sub(r'\\(["\\])', r"\1", value[1:-1])
+                    properties[_unquote(match.group(1)).lower()] = value
+                else:
+                    match = _EXTENDS_RE.match(data, token.start())
+                    if match:
+                        parent = _unquote(match.group(1))
+        elif char == b")":
+            if depth == 2 and name is not None:
+                symbols.setdefault(name, (parent, properties))
+                name = None
+            depth -= 1
+
+    symbol_properties = OrderedDict()
+    for name, (parent, properties) in symbols.items():
+        if parent in symbols:
+            properties = {**symbols[parent][1], **properties}
+        symbol_properties[name] = properties
+    return symbol_properties
+
+
+@export_to_all
+def load_symbol_index(filename, index_filename=None):
+    """
+    Get the index of the symbols in a library file, scanning the file if needed.
+
+    Args:
+        filename (str): Absolute path to a KiCad V6+ schematic library file.
+        index_filename (str, optional): File where the index is stored. A stored index
+            is used if it was made from the current version of the library file.
+            Otherwise, the library file is scanned and the index is stored for next time.
+            The index isn't stored if this is None.
+
+    Returns:
+        OrderedDict: Symbol names mapped to (start, end, parent) tuples as returned
+            by scan_symbols().
+    """
+
+    stat = os.stat(filename)
+    source = {"size": stat.st_size, "mtime": stat.st_mtime}
+
+    # Use the stored index if it matches the library file.
+    if index_filename:
+        try:
+            with open(index_filename, "r") as f:
+                stored = json.load(f)
+            if stored["version"] == INDEX_VERSION and stored["source"] == source:
+                return OrderedDict(
+                    (name, (start, end, parent))
+                    for name, start, end, parent in stored["symbols"]
+                )
+        except (OSError, ValueError, KeyError, TypeError):
+            # Missing or damaged index, so make a new one.
+            pass
+
+    with open(filename, "rb") as f:
+        symbols = scan_symbols(f.read())
+
+    if index_filename:
+        try:
+            os.makedirs(os.path.dirname(index_filename), exist_ok=True)
+            with open(index_filename, "w") as f:
+                json.dump(
+                    {
+                        "version": INDEX_VERSION,
+                        "source": source,
+                        "symbols": [
+                            [name, start, end, parent]
+                            for name, (start, end, parent) in symbols.items()
+                        ],
+                    },
+                    f,
+                )
+        except OSError:
+            # The index just won't be reused if it can't be stored.
+            pass
+
+    return symbols
+
+
+@export_to_all
+def read_symbols(filename, symbol_index, names):
+    """
+    Extract the text for some symbols from a library file.
+
+    Args:
+        filename (str): Absolute path to a KiCad V6+ schematic library file.
+        symbol_index (dict): Index of the symbols in the file from load_symbol_index().
+        names (list): Names of the symbols to extract. The symbols they extend are
+            also extracted because their properties and pins are needed.
+
+    Returns:
+        str: Text of a library with just the requested symbols, their parents coming
+            before the symbols that extend them.
+    """
+
+    # Add the chain of parents for each symbol and sort them in file order
+    # so parents are always processed before their children.
+    needed = set()
+    for name in names:
+        while name in symbol_index and name not in needed:
+            needed.add(name)
+            name = symbol_index[name][2]
+    ranges = sorted(symbol_index[name][:2] for name in needed)
+
+    symbols_txt = []
+    with open(filename, "rb") as f:
+        for start, end in ranges:
+            f.seek(start)
+            symbols_txt.append(f.read(end - start).decode("latin_1"))
+    return "(kicad_symbol_lib\n" + "\n".join(symbols_txt) + "\n)"
@@ -5,6 +5,7 @@
 from .skidl import (
     lib_suffix,
     load_sch_lib,
+    load_sch_lib_symbols,
     parse_lib_part,
     default_lib_paths,
     get_fp_lib_tbl_dir,
@@ -0,0 +1,627 @@
+# -*- coding: utf-8 -*-
+
+# The MIT License (MIT) - Copyright (c) Dave Vandenbout.
+
+"""
+Compact binary format for SKiDL part libraries.
+
+Executing a *_sklib.py library creates every Part and Pin in it even if only one
+part is needed. The binary format stores the same information in a single file
+that can be memory-mapped so the parts are only created when they're requested:
+
+    * Header: magic bytes, format version and the offsets and sizes of each section.
+    * String table: offsets into a block of UTF-8 strings that are shared by all
+      the parts and pins (pin names like "GND" are only stored once).
+    * Part records: the name, aliases and range of pin records for each part plus
+      the offset of its other attributes in the attribute block.
+    * Alias table: string numbers for the aliases of each part.
+    * Pin records: fixed-size records with the number, name, function and unit of each
+      pin plus the offset of its aliases and any other attributes in the attribute block.
+      Numbers, names and units that don't fit in a record field (like a unit named "A"
+      or a number too large for 32 bits) are stored in the attribute block instead.
+    * Attribute block: the remaining part and pin attributes (descriptions, footprints,
+      units, etc.) encoded as tagged values.
+
+Parts with attribute values that can't be encoded (like the functions in the
+PySpice library) can't be stored, so write_binary_lib() raises a TypeError for them.
+"""
+
+import mmap
+import os
+import struct
+from collections import OrderedDict
+
+from skidl.logger import active_logger
+from skidl.utilities import consistent_hash, export_to_all, is_url
+
+
+__all__ = ["bin_lib_suffix"]
+
+# File suffix for binary SKiDL libraries.
+bin_lib_suffix = ".sklib"
+
+_MAGIC = b"SKLB"
+
+# Increment this whenever the binary library format changes.
+_VERSION = 2
+
+# Magic, version, string/part/alias/pin counts and the offsets of the sections.
+_HEADER = struct.Struct("<4sHIIIIQQQQQQ")
+
+# Name string, attribute offset, first alias, number of aliases, first pin, number of pins.
+_PART_RECORD = struct.Struct("<IIIIII")
+
+# Number, name, function string, unit, attribute offset, and flags for integer numbers and names.
+_PIN_RECORD = struct.Struct("<iiiiiB")
+_NUM_IS_INT = 1
+_NAME_IS_INT = 2
+
+# Integers that can be kept in a pin record field. (-1 marks a missing value.)
+_MAX_PIN_FIELD = 2**31 - 1
+
+_STR_NUM = struct.Struct("<I")
+_INT = struct.Struct("<q")
+_FLOAT = struct.Struct("<d")
+
+# Public part attributes that aren't stored because they're rebuilt when the part is made.
+# (Private attributes hold the internal state of the part, so they're never stored.)
+_UNSTORED_PART_ATTRS = frozenset(("pins", "unit", "p", "n", "lib", "circuit", "tool"))
+
+# Public pin attributes that aren't stored because they're in the pin record or are rebuilt.
+_UNSTORED_PIN_ATTRS = frozenset(("func", "unit", "nets", "part"))
+
+# Pin attributes that only need storing if they differ from the values Pin() gives them.
+_PIN_DEFAULTS = {"stub": False, "do_erc": True, "fields": {}}
+
+# Tags for the types of part attribute values.
+_NONE, _STR, _INT_VAL, _FLOAT_VAL, _TRUE, _FALSE, _LIST, _TUPLE, _SET, _ALIAS, _DICT = range(11)
+
+
+class _StringTable(object):
+    """Collects the unique strings stored in a binary library and numbers them."""
+
+    def __init__(self):
+        self.nums = {}
+
+    def __call__(self, s):
+        """Return the number for a string, adding it to the table if needed."""
+        try:
+            return self.nums[s]
+        except KeyError:
+            return self.nums.setdefault(s, len(self.nums))
+
+    def pack(self):
+        """Return the packed table of string offsets and the block of strings."""
+        data = [s.encode("utf-8") for s in self.nums]
+        offsets = [0]
+        for d in data:
+            offsets.append(offsets[-1] + len(d))
+        return struct.pack(f"<{len(offsets)}I", *offsets), b"".join(data)
+
+
+def _encode_value(value, strings, out):
+    """Append the tagged encoding of a part attribute value to a bytearray."""
+
+    from skidl import Alias
+
+    if value is None:
+        out.append(_NONE)
+    elif value is True:
+        out.append(_TRUE)
+    elif value is False:
+        out.append(_FALSE)
+    elif isinstance(value, str):
+        out.append(_STR)
+        out += _STR_NUM.pack(strings(value))
+    elif isinstance(value, int):
+        out.append(_INT_VAL)
+        out += _INT.pack(value)
+    elif isinstance(value, float):
+        out.append(_FLOAT_VAL)
+        out += _FLOAT.pack(value)
+    elif isinstance(value, dict):
+        out.append(_DICT)
+        out += _STR_NUM.pack(len(value))
+        for k, v in value.items():
+            _encode_value(k, strings, out)
+            _encode_value(v, strings, out)
+    elif isinstance(value, (list, tuple, set)):
+        # Alias is a kind of set, so check for it first. Sets are sorted
+        # so the same library always produces the same file.
+        if isinstance(value, Alias):
+            out.append(_ALIAS)
+            value = sorted(value, key=str)
+        elif isinstance(value, set):
+            out.append(_SET)
+            value = sorted(value, key=str)
+        else:
+            out.append(_LIST if isinstance(value, list) else _TUPLE)
+        out += _STR_NUM.pack(len(value))
+        for v in value:
+            _encode_value(v, strings, out)
+    else:
+        # Not logged since the SKiDL loader handles this by executing the library instead.
+        raise TypeError(
+            f"Can't store a value of type {type(value).__name__} in a binary SKiDL library: {value!r}."
+        )
+
+
+def _fits_pin_field(value):
+    """Return True if a pin number, name or unit is an integer that can be kept in a pin record."""
+    return type(value) is int and 0 <= value <= _MAX_PIN_FIELD
+
+
+@export_to_all
+def write_binary_lib(lib, file_, addtl_part_attrs=None, all_attrs=False):
+    """
+    Store the parts of a library in the binary SKiDL library format.
+
+    Args:
+        lib (SchLib): Library of parts to store.
+        file_ (str or file object): File name or binary file object where the library is written.
+        addtl_part_attrs (list, optional): List of additional part attribute names to store.
+        all_attrs (bool, optional): Store every public attribute of the parts and pins
+            instead of just the ones that are exported to a library. This is used when
+            the binary library takes the place of a *_sklib.py library. Defaults to False.
+
+    Raises:
+        TypeError: If an attribute value can't be stored in the binary format.
+    """
+
+    from skidl import Alias
+    from skidl.part import PartUnit
+    from skidl.pin import pin_info
+
+    strings = _StringTable()
+    part_records = []
+    alias_nums = []
+    pin_records = []
+    attrs_data = bytearray()
+
+    for part in lib:
+        # Make sure the part is fully instantiated so all its pins are stored.
+        part.parse()
+
+        # Additional attributes are only stored for the parts that have them.
+        attrs = part.export_attrs(addtl_part_attrs)
+        for k in addtl_part_attrs or []:
+            if not hasattr(part, k):
+                del attrs[k]
+        if all_attrs:
+            # Store every attribute of the part (and only those) so the part made from
+            # the binary library is the same as the one made by executing the library.
+            # The units stored as part attributes are rebuilt from the unit definitions.
+            for k in list(attrs):
+                if not hasattr(part, k):
+                    del attrs[k]
+            attrs.update(
+                (k, v)
+                for k, v in vars(part).items()
+                if not k.startswith("_")
+                and k not in _UNSTORED_PART_ATTRS
+                and not isinstance(v, PartUnit)
+            )
+            if part._partclasses:
+                raise TypeError(
+                    f"Can't store the part classes of part {part.name} in a binary SKiDL library."
+                )
+        if part.unit:
+            attrs["unit_defs"] = [
+                unit.export_def()
+                for unit in part.unit.values()
+                if isinstance(unit, PartUnit)
+            ]
+
+        aliases = sorted(part.aliases, key=str)
+        part_records.append(
+            _PART_RECORD.pack(
+                strings(part.name),
+                len(attrs_data),
+                len(alias_nums),
+                len(aliases),
+                len(pin_records),
+                len(part.pins),
+            )
+        )
+        alias_nums.extend(strings(str(alias)) for alias in aliases)
+        _encode_value(attrs, strings, attrs_data)
+
+        # Pins store the same attributes as Pin.export() with missing values set to -1.
+        for pin in part.pins:
+            flags = 0
+            fields = []
+
+            # The aliases and any other attributes of the pin go in the attribute block,
+            # along with any number, name or unit that can't be kept in the pin record.
+            pin_attrs = {}
+
+            for attr, int_flag in (("num", _NUM_IS_INT), ("name", _NAME_IS_INT)):
+                v = getattr(pin, attr, None)
+                if v is None or v == "":
+                    fields.append(-1)
+                elif _fits_pin_field(v):
+                    fields.append(v)
+                    flags |= int_flag
+                elif isinstance(v, str):
+                    fields.append(strings(v))
+                else:
+                    fields.append(-1)
+                    pin_attrs[attr] = v
+            func = getattr(pin, "func", None)
+            fields.append(-1 if func is None else strings(pin_info[func]["func_str"]))
+            unit = getattr(pin, "unit", None)
+            if unit is None or _fits_pin_field(unit):
+                fields.append(-1 if unit is None else unit)
+            else:
+                fields.append(-1)
+                pin_attrs["unit"] = unit
+
+            if all_attrs:
+                for k, v in {**pin.__dict__.get("_template", {}), **vars(pin)}.items():
+                    if k.startswith("_") or k in _UNSTORED_PIN_ATTRS:
+                        continue
+                    if k in _PIN_DEFAULTS and v == _PIN_DEFAULTS[k]:
+                        continue
+                    pin_attrs[k] = v
+                aliases = pin._get_aliases()
+                if aliases:
+                    pin_attrs["aliases"] = Alias(list(aliases))
+            if pin_attrs:
+                fields.append(len(attrs_data))
+                _encode_value(pin_attrs, strings, attrs_data)
+            else:
+                fields.append(-1)
+            pin_records.append(_PIN_RECORD.pack(*fields, flags))
+
+    str_offsets, str_data = strings.pack()
+    sections = [
+        str_offsets,
+        str_data,
+        b"".join(part_records),
+        struct.pack(f"<{len(alias_nums)}I", *alias_nums),
+        b"".join(pin_records),
+        bytes(attrs_data),
+    ]
+    offsets = []
+    offset = _HEADER.size
+    for section in sections:
+        offsets.append(offset)
+        offset += len(section)
+    header = _HEADER.pack(
+        _MAGIC,
+        _VERSION,
+        len(strings.nums),
+        len(part_records),
+        len(alias_nums),
+        len(pin_records),
+        *offsets,
+    )
+
+    if isinstance(file_, str):
+        with open(file_, "wb") as f:
+            f.write(header)
+            for section in sections:
+                f.write(section)
+    else:
+        file_.write(header)
+        for section in sections:
+            file_.write(section)
+
+
+@export_to_all
+class BinaryLib(object):
+    """
+    Read-only access to the parts stored in a binary SKiDL library.
+
+    The library file is memory-mapped and Part objects are only created when
+    they're requested.
+
+    Args:
+        filename (str): The name of the binary library file.
+    """
+
+    def __init__(self, filename):
+        self.filename = filename
+        with open(filename, "rb") as f:
+            try:
+                self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty files can't be memory-mapped.
+                self.data = b""
+
+        try:
+            (
+                magic,
+                version,
+                self.num_strings,
+                self.num_parts,
+                num_aliases,
+                num_pins,
+                self._str_offsets,
+                self._str_data,
+                self._parts,
+                self._aliases,
+                self._pins,
+                self._attrs,
+            ) = _HEADER.unpack_from(self.data, 0)
+        except struct.error:
+            magic = version = None
+        if magic != _MAGIC:
+            active_logger.raise_(
+                ValueError, f"{filename} is not a binary SKiDL library file."
+            )
+        if version != _VERSION:
+            active_logger.raise_(
+                ValueError,
+                f"Binary SKiDL library {filename} has version {version} but version {_VERSION} is needed.",
+            )
+
+        self._strings = {}
+
+        # Index the parts by name.
+        self.part_nums = OrderedDict(
+            (self.string(self._part_record(i)[0]), i) for i in range(self.num_parts)
+        )
+
+    def close(self):
+        """Release the memory-mapped library file."""
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+
+    def string(self, num):
+        """Return a string from the string table."""
+        try:
+            return self._strings[num]
+        except KeyError:
+            start, end = struct.unpack_from("<2I", self.data, self._str_offsets + 4 * num)
+            s = self._strings[num] = str(
+                self.data[self._str_data + start : self._str_data + end], "utf-8"
+            )
+            return s
+
+    def _part_record(self, i):
+        """Return the fields of the record for a part."""
+        return _PART_RECORD.unpack_from(self.data, self._parts + i * _PART_RECORD.size)
+
+    def part_aliases(self, i):
+        """Return the list of aliases for a part."""
+        _, _, first_alias, num_aliases, _, _ = self._part_record(i)
+        return [
+            self.string(num)
+            for num in struct.unpack_from(
+                f"<{num_aliases}I", self.data, self._aliases + 4 * first_alias
+            )
+        ]
+
+    def _decode_value(self, offset):
+        """Return a part attribute value and the offset of the next value."""
+
+        from skidl import Alias
+
+        tag = self.data[offset]
+        offset += 1
+        if tag == _NONE:
+            return None, offset
+        if tag == _TRUE:
+            return True, offset
+        if tag == _FALSE:
+            return False, offset
+        if tag == _STR:
+            return self.string(_STR_NUM.unpack_from(self.data, offset)[0]), offset + 4
+        if tag == _INT_VAL:
+            return _INT.unpack_from(self.data, offset)[0], offset + 8
+        if tag == _FLOAT_VAL:
+            return _FLOAT.unpack_from(self.data, offset)[0], offset + 8
+
+        length = _STR_NUM.unpack_from(self.data, offset)[0]
+        offset += 4
+        if tag == _DICT:
+            value = {}
+            for _ in range(length):
+                k, offset = self._decode_value(offset)
+                value[k], offset = self._decode_value(offset)
+            return value, offset
+        items = []
+        for _ in range(length):
+            item, offset = self._decode_value(offset)
+            items.append(item)
+        container = {_LIST: list, _TUPLE: tuple, _SET: set, _ALIAS: Alias}[tag]
+        return container(items), offset
+
+    def make_part(self, name):
+        """
+        Create a template Part from the library.
+
+        Args:
+            name (str): The name of the part.
+
+        Returns:
+            Part: The part destined for a library.
+        """
+
+        from skidl import SKIDL, TEMPLATE, Part, Pin
+        from skidl.pin import pin_types
+
+        i = self.part_nums[name]
+        _, attrs_offset, _, _, first_pin, num_pins = self._part_record(i)
+        attrs, _ = self._decode_value(self._attrs + attrs_offset)
+
+        pins = []
+        for num, pin_name, func, unit, pin_attrs_offset, flags in _PIN_RECORD.iter_unpack(
+            self.data[
+                self._pins
+                + first_pin * _PIN_RECORD.size : self._pins
+                + (first_pin + num_pins) * _PIN_RECORD.size
+            ]
+        ):
+            pin_attrs = {}
+            if num != -1:
+                pin_attrs["num"] = num if flags & _NUM_IS_INT else self.string(num)
+            if pin_name != -1:
+                pin_attrs["name"] = (
+                    pin_name if flags & _NAME_IS_INT else self.string(pin_name)
+                )
+            if func != -1:
+                pin_attrs["func"] = getattr(pin_types, self.string(func))
+            if unit != -1:
+                pin_attrs["unit"] = unit
+            if pin_attrs_offset != -1:
+                # Assigned last so the stored aliases replace the ones made for the name and number.
+                pin_attrs.update(self._decode_value(self._attrs + pin_attrs_offset)[0])
+            pins.append(Pin(**pin_attrs))
+
+        return Part(name=name, dest=TEMPLATE, tool=SKIDL, pins=pins, **attrs)
+
+
+# Binary libraries that have been opened, indexed by file name.
+_open_libs = {}
+
+
+@export_to_all
+def open_binary_lib(filename):
+    """
+    Return the BinaryLib for a file, reusing it if the file hasn't changed since it was opened.
+
+    Args:
+        filename (str): The name of the binary library file.
+
+    Returns:
+        BinaryLib: Object for reading parts from the library.
+    """
+    filename = os.path.abspath(filename)
+    stat = os.stat(filename)
+    key = (stat.st_mtime, stat.st_size)
+    try:
+        lib_key, bin_lib = _open_libs[filename]
+        if lib_key == key:
+            return bin_lib
+        bin_lib.close()
+    except KeyError:
+        pass
+    bin_lib = BinaryLib(filename)
+    _open_libs[filename] = (key, bin_lib)
+    return bin_lib
+
+
+@export_to_all
+def cached_binary_lib_filename(filename):
+    """
+    Return the name of the binary library used to cache a *_sklib.py library.
+
+    Args:
+        filename (str): Absolute path to a *_sklib.py library file.
+
+    Returns:
+        str: Path for the binary library in the directory of pickled libraries.
+    """
+
+    import skidl
+
+    from .skidl import lib_suffix
+
+    base = os.path.basename(filename)
+    if base.endswith(lib_suffix):
+        base = base[: -len(lib_suffix)]
+    return os.path.join(
+        skidl.config.pickle_dir,
+        "_".join((base, "skidl", str(consistent_hash(filename)))) + bin_lib_suffix,
+    )
+
+
+@export_to_all
+def find_binary_lib(filename, use_cache=True):
+    """
+    Find an up-to-date binary version of a SKiDL library.
+
+    A binary library stored next to the *_sklib.py file is used first,
+    followed by a binary library cached in the directory of pickled libraries.
+
+    Args:
+        filename (str): Absolute path to a SKiDL library file.
+        use_cache (bool, optional): Also look in the directory of pickled libraries.
+            Defaults to True.
+
+    Returns:
+        str: Path to the binary library, or None if there isn't one that's
+            at least as recent as the library file and in the current format.
+    """
+
+    from .skidl import lib_suffix
+
+    if filename.endswith(bin_lib_suffix):
+        return filename
+    if is_url(filename) or not filename.endswith(lib_suffix):
+        return None
+
+    mtime = os.path.getmtime(filename)
+    bin_filenames = [filename[: -len(lib_suffix)] + bin_lib_suffix]
+    if use_cache:
+        bin_filenames.append(cached_binary_lib_filename(filename))
+    for bin_filename in bin_filenames:
+        if (
+            os.path.exists(bin_filename)
+            and os.path.getmtime(bin_filename) >= mtime
+            and _has_current_version(bin_filename)
+        ):
+            return bin_filename
+    return None
+
+
+def _has_current_version(bin_filename):
+    """Return True if a binary library file is in the current version of the format."""
+    try:
+        with open(bin_filename, "rb") as f:
+            magic, version = struct.unpack("<4sH", f.read(6))
+    except (OSError, struct.error):
+        return False
+    return magic == _MAGIC and version == _VERSION
+
+
+@export_to_all
+def convert_sklib(filename, bin_filename=None):
+    """
+    Convert a *_sklib.py library into a binary SKiDL library.
+
+    Args:
+        filename (str): Path to the *_sklib.py library file.
+        bin_filename (str, optional): Path of the binary library file. If None, it's stored
+            next to the original library with the *_sklib.py suffix replaced by .sklib.
+
+    Returns:
+        str: The name of the binary library file.
+    """
+
+    from skidl import SKIDL, SchLib
+
+    from .skidl import exec_sch_lib, lib_suffix
+
+    if not bin_filename:
+        base = filename[: -len(lib_suffix)] if filename.endswith(lib_suffix) else filename
+        bin_filename = base + bin_lib_suffix
+
+    lib = SchLib(tool=SKIDL)
+    exec_sch_lib(lib, filename)
+    write_binary_lib(lib, bin_filename, addtl_part_attrs=("search_text",), all_attrs=True)
+    return bin_filename
+
+
+@export_to_all
+def convert_sklibs(from_dir, to_dir=None):
+    """
+    Convert all the *_sklib.py libraries in a directory into binary SKiDL libraries.
+
+    Args:
+        from_dir (str): Directory containing the *_sklib.py libraries.
+        to_dir (str, optional): Directory where the binary libraries should be stored.
+            Defaults to from_dir.
+    """
+
+    from .skidl import lib_suffix
+
+    to_dir = to_dir or from_dir
+    for lib_file in sorted(os.listdir(from_dir)):
+        if lib_file.endswith(lib_suffix):
+            convert_sklib(
+                os.path.join(from_dir, lib_file),
+                os.path.join(to_dir, lib_file[: -len(lib_suffix)] + bin_lib_suffix),
+            )
@@ -6,9 +6,12 @@
 Handler for reading SKiDL libraries.
 """
 
+import os
 import os.path
+import struct
 
-from skidl.utilities import export_to_all
+from skidl.name_index import NameIndex
+from skidl.utilities import export_to_all, is_url
 
 
 # These aren't used here, but they are used in modules
@@ -39,12 +42,65 @@ def get_fp_lib_tbl_dir():
 
 
 @export_to_all
-def load_sch_lib(self, filename=None, lib_search_paths_=None, lib_section=None):
+def load_sch_lib(
+    self, filename=None, lib_search_paths_=None, lib_section=None, use_pickle=True
+):
     """
     Load the parts from a SKiDL schematic library file.
 
+    If there's an up-to-date binary version of the library, it's indexed and
+    its parts are only created when they're requested. Otherwise, the library
+    module is executed and (if use_pickle is true) a binary version is stored
+    with the pickled libraries for next time. Libraries with parts that can't
+    be stored in the binary format are always executed.
+
+    Args:
+        filename: The name of the SKiDL schematic library file.
+        use_pickle (bool, optional): Use and store a binary version of the library
+            in the directory of pickled libraries. Defaults to True.
+    """
+
+    from .binary_lib import (
+        cached_binary_lib_filename,
+        find_binary_lib,
+        write_binary_lib,
+    )
+
+    bin_filename = find_binary_lib(filename, use_cache=use_pickle)
+    if bin_filename:
+        index_binary_lib(self, bin_filename)
+        return
+
+    path = exec_sch_lib(self, filename, lib_search_paths_)
+
+    # Store a binary version of the library so only the parts that are
+    # needed have to be created the next time it's loaded.
+    if use_pickle and not is_url(path) and os.path.isfile(filename):
+        bin_filename = cached_binary_lib_filename(filename)
+        try:
+            os.makedirs(os.path.dirname(bin_filename), exist_ok=True)
+            write_binary_lib(
+                self, bin_filename, addtl_part_attrs=("search_text",), all_attrs=True
+            )
+        except (OSError, TypeError, ValueError, struct.error):
+            # Some attribute couldn't be stored, so just use the executed library.
+            if os.path.exists(bin_filename):
+                os.remove(bin_filename)
+        else:
+            # Keep only the index of the parts so the library pickle stays small.
+            index_binary_lib(self, bin_filename)
+
+
+def exec_sch_lib(self, filename, lib_search_paths_=None):
+    """
+    Load the parts from a SKiDL schematic library file by executing it.
+
     Args:
         filename: The name of the SKiDL schematic library file.
+        lib_search_paths_ (list): List of paths with SKiDL libraries.
+
+    Returns:
+        str: The path of the library file that was executed.
     """
 
     from skidl import SchLib, SKIDL
@@ -74,7 +130,7 @@ def load_sch_lib(self, filename=None, lib_search_paths_=None, lib_section=None):
             if isinstance(val, SchLib):
                 # Overwrite self with the new library.
                 self.__dict__.update(val.__dict__)
-                return
+                return path
 
         # Oops! No library object. Something went wrong.
         raise ValueError(f"No SchLib object found in {filename}")
@@ -85,6 +141,59 @@ def load_sch_lib(self, filename=None, lib_search_paths_=None, lib_section=None):
         raise
 
 
+def index_binary_lib(lib, bin_filename):
+    """
+    Set up a library to create parts from a binary library when they're requested.
+
+    Args:
+        lib (SchLib): SKiDL library object.
+        bin_filename (str): The name of the binary library file.
+    """
+
+    from skidl import SKIDL
+
+    from .binary_lib import open_binary_lib
+
+    bin_lib = open_binary_lib(bin_filename)
+    lib.parts = []
+    lib.part_names = NameIndex("aliases")
+    lib._tool = SKIDL
+    lib._symbol_index = bin_lib.part_nums.copy()
+    lib._unloaded = {}
+    for name, i in bin_lib.part_nums.items():
+        for alias in {name.lower()} | {a.lower() for a in bin_lib.part_aliases(i)}:
+            lib._unloaded.setdefault(alias, []).append(name)
+
+
+@export_to_all
+def load_sch_lib_symbols(lib, filename, symbol_index, names):
+    """
+    Create only some of the parts from a binary SKiDL library.
+
+    Args:
+        lib (SchLib): SKiDL library object.
+        filename (str): The name of the SKiDL schematic library file.
+        symbol_index (dict): Part names in the library.
+        names (list): Names of the parts to create.
+    """
+
+    from skidl.logger import active_logger
+
+    from .binary_lib import find_binary_lib, open_binary_lib
+
+    bin_filename = find_binary_lib(filename)
+    if not bin_filename or not os.path.exists(bin_filename):
+        active_logger.raise_(
+            FileNotFoundError,
+            f"Unable to find the binary version of SKiDL library {filename}.",
+        )
+    bin_lib = open_binary_lib(bin_filename)
+    for name in names:
+        # Parts found under several aliases may have been created already.
+        if name in bin_lib.part_nums and not lib._find_parts(name):
+            lib.add_parts(bin_lib.make_part(name), copy=False)
+
+
 @export_to_all
 def parse_lib_part(self, partial_parse=False):  # pylint: disable=unused-argument
     """
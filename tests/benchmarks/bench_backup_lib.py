@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+
+# The MIT License (MIT) - Copyright (c) Dave Vandenbout.
+
+"""
+Benchmark writing the backup library for a board with many kinds of parts.
+
+Builds a board with several instances of each of a number of different parts
+and then backs up its parts by copying every part into a SchLib and exporting
+the whole library like Circuit.backup_parts() used to do, and with
+write_backup_lib(). The backup is written again after nothing changes and
+after the footprint of a single part changes since that's what happens each
+time a design is edited and its netlist is regenerated.
+
+Usage:
+    python bench_backup_lib.py [--kinds 500] [--instances 4] [--pins 16]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from skidl import SKIDL, TEMPLATE, Circuit, Part, Pin, SchLib
+from skidl.pin import pin_types
+from skidl.schlib import write_backup_lib
+
+
+def legacy_backup(parts, libname, file_):
+    """Copy the parts into a library and export all of it like backup_parts() used to do."""
+    lib = SchLib(tool=SKIDL)
+    for p in parts:
+        lib += p
+    lib.export(libname=libname, file_=file_)
+
+
+def build(num_kinds, num_instances, num_pins):
+    """Build the board and return its parts."""
+
+    ckt = Circuit()
+    for k in range(num_kinds):
+        tmpl = Part(
+            name=f"IC{k}",
+            tool=SKIDL,
+            ref_prefix="U",
+            footprint=f"Package_SO:SOIC-{num_pins}",
+            description=f"Integrated circuit number {k}",
+            pins=[
+                Pin(num=n, name=f"P{n}", func=pin_types.BIDIR)
+                for n in range(1, num_pins + 1)
+            ],
+            dest=TEMPLATE,
+        )
+        tmpl(num_instances, circuit=ckt)
+    return ckt.parts
+
+
+def timed(func, *args):
+    """Call a function and return how long it took."""
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--kinds", type=int, default=500)
+    parser.add_argument("--instances", type=int, default=4)
+    parser.add_argument("--pins", type=int, default=16)
+    args = parser.parse_args()
+
+    parts = build(args.kinds, args.instances, args.pins)
+    print(f"{len(parts)} parts of {args.kinds} kinds with {args.pins} pins each.")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        legacy_file = os.path.join(tmp_dir, "legacy_lib_sklib.py")
+        backup_file = os.path.join(tmp_dir, "backup_lib_sklib.py")
+
+        t_legacy = timed(legacy_backup, parts, "backup", legacy_file)
+        print(f"Export whole library:   {t_legacy:.3f}s.")
+
+        t_first = timed(write_backup_lib, parts, "backup", backup_file)
+        print(f"First backup:           {t_first:.3f}s.")
+
+        # Apart from the index at the end, the backup matches the exported library.
+        with open(legacy_file) as f:
+            legacy_text = f.read()
+        with open(backup_file) as f:
+            assert f.read().startswith(legacy_text + "\n")
+
+        t_same = timed(write_backup_lib, parts, "backup", backup_file)
+        print(f"Backup with no changes: {t_same:.3f}s.")
+
+        parts[len(parts) // 2].footprint = "Package_SO:SSOP-16"
+        t_changed = timed(write_backup_lib, parts, "backup", backup_file)
+        print(f"Backup with one change: {t_changed:.3f}s.")
+
+    print(f"Speed-up with no changes: {t_legacy / t_same:.1f}x")
+    print(f"Speed-up with one change: {t_legacy / t_changed:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+
+# The MIT License (MIT) - Copyright (c) Dave Vandenbout.
+
+"""
+Benchmark finding overlapping bounding boxes with and without a BBoxIndex.
+
+Spreads blocks over an area that grows with their number and then does what
+one iteration of the force-directed placer does: compute the overlap force on
+every block and then move every block a little. This is done by checking each
+block against all the others like overlap_force() used to do, and with a
+BBoxIndex of the blocks that's updated as they move. The same is done for
+checking whether short wire segments run into any of the blocks like the
+wire cleanup of the router. The results of both are checked to be the same.
+
+Usage:
+    python bench_bbox_index.py [--parts 500] [--iters 3]
+"""
+
+import argparse
+import math
+import random
+import time
+
+from skidl.geometry import BBox, BBoxIndex, Point, Segment, Tx, Vector
+from skidl.schematics.place import overlap_force
+
+
+class Block:
+    """Rectangular stand-in for a part being placed."""
+
+    def __init__(self, w, h, pt):
+        self.place_bbox = BBox(Point(0, 0), Point(w, h))
+        self.tx = Tx().move(pt)
+
+
+def build(num_parts):
+    """Spread blocks over an area with room for about twice their number."""
+    side = math.sqrt(num_parts * 2) * 100
+    return [
+        Block(
+            random.randint(50, 150),
+            random.randint(50, 150),
+            Point(random.uniform(0, side), random.uniform(0, side)),
+        )
+        for _ in range(num_parts)
+    ], side
+
+
+def place_iterations(blocks, iters, use_index):
+    """Compute the overlap forces and move the blocks for a few iterations."""
+    options = {}
+    if use_index:
+        bbox_index = BBoxIndex.from_bboxes((blk, blk.place_bbox * blk.tx) for blk in blocks)
+        options["bbox_index"] = bbox_index
+    all_forces = []
+    for _ in range(iters):
+        forces = [overlap_force(blk, blocks, **options) for blk in blocks]
+        for blk, force in zip(blocks, forces):
+            blk.tx *= Tx(dx=force.x * 0.1, dy=force.y * 0.1)
+            if use_index:
+                bbox_index.move(blk, blk.place_bbox * blk.tx)
+        all_forces.append(forces)
+    return all_forces
+
+
+def obstructions(blocks, segments, use_index):
+    """Return a list of flags for the segments that run into a block."""
+    bboxes = [blk.place_bbox * blk.tx for blk in blocks]
+    if use_index:
+        part_index = BBoxIndex.from_bboxes(enumerate(bboxes))
+        return [bool(part_index.query(BBox(seg.p1, seg.p2))) for seg in segments]
+    return [
+        any(bbox.intersects(BBox(seg.p1, seg.p2)) for bbox in bboxes) for seg in segments
+    ]
+
+
+def timed(func, *args):
+    """Call a function and return the time taken and its result."""
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--parts", type=int, default=500)
+    parser.add_argument("--iters", type=int, default=3)
+    args = parser.parse_args()
+
+    random.seed(1)
+    blocks, side = build(args.parts)
+    start_txs = [blk.tx for blk in blocks]
+    print(f"{args.parts} blocks in a {side:.0f} x {side:.0f} area.")
+
+    # Remove the random offsets from the overlap forces so the results can be compared.
+    random_random, random.random = random.random, lambda: 0.5
+    results = {}
+    for use_index in (False, True):
+        for blk, tx in zip(blocks, start_txs):
+            blk.tx = tx
+        results[use_index] = timed(place_iterations, blocks, args.iters, use_index)
+    random.random = random_random
+    t_scan, scan_forces = results[False]
+    t_index, index_forces = results[True]
+    assert [[(f.x, f.y) for f in fs] for fs in scan_forces] == [
+        [(f.x, f.y) for f in fs] for fs in index_forces
+    ]
+    print(f"Overlap forces for {args.iters} iterations:")
+    print(f"    Check every part: {t_scan:.3f}s.")
+    print(f"    BBoxIndex:        {t_index:.3f}s ({t_scan / t_index:.1f}x).")
+
+    segments = []
+    for _ in range(args.parts):
+        pt = Point(random.uniform(0, side), random.uniform(0, side))
+        delta = Vector(random.uniform(0, 200), 0) if random.random() < 0.5 else Vector(0, random.uniform(0, 200))
+        segments.append(Segment(pt, pt + delta))
+    t_scan, scan_flags = timed(obstructions, blocks, segments, False)
+    t_index, index_flags = timed(obstructions, blocks, segments, True)
+    assert scan_flags == index_flags
+    print(f"Obstructions of {len(segments)} wire segments:")
+    print(f"    Check every part: {t_scan:.3f}s.")
+    print(f"    BBoxIndex:        {t_index:.3f}s ({t_scan / t_index:.1f}x).")
+
+
+if __name__ == "__main__":
+    main()
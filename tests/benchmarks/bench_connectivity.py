@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+
+# The MIT License (MIT) - Copyright (c) Dave Vandenbout.
+
+"""
+Benchmark the circuit connectivity index against the old fixpoint net traversal.
+
+Connects a large number of pins across many nets (and merges groups of nets)
+using the union-find connectivity index, then does the same while also running
+the net traversal that Net.connect() used to recompute after every connection.
+
+Usage:
+    python bench_connectivity.py [--pins 100000] [--nets 20000] [--merge 100]
+"""
+
+import argparse
+import time
+from copy import copy
+
+from skidl import SKIDL, Circuit, Net, Part, Pin
+from skidl.pin import PhantomPin
+
+
+def legacy_traverse(net):
+    """The fixpoint net traversal that was run after every Net.connect()."""
+    prev_nets = set([net])
+    nets = set([net])
+    prev_pins = set([])
+    pins = set(net._pins)
+    while pins != prev_pins:
+        for pin in pins - prev_pins:
+            if pin.is_connected():
+                nets |= set(pin.nets)
+        prev_pins = copy(pins)
+        for n in nets - prev_nets:
+            pins |= set(n._pins)
+        prev_nets = copy(nets)
+    pins = set([p for p in pins if not isinstance(p, PhantomPin)])
+    return list(nets), list(pins)
+
+
+def build(num_pins, num_nets, merge, traverse_each=False):
+    """Build the circuit and return it with its nets and the build time."""
+
+    ckt = Circuit()
+    pins_per_part = 1000
+    num_parts = max(1, num_pins // pins_per_part)
+    tmplt = Part(
+        name="BIG",
+        tool=SKIDL,
+        ref_prefix="U",
+        pins=[Pin(num=i + 1) for i in range(pins_per_part)],
+        dest="TEMPLATE",
+    )
+    parts = [tmplt(circuit=ckt) for _ in range(num_parts)]
+    pins = [pin for part in parts for pin in part.pins][:num_pins]
+    nets = [Net(circuit=ckt) for _ in range(num_nets)]
+
+    start = time.perf_counter()
+    for i, pin in enumerate(pins):
+        net = nets[i % num_nets]
+        net += pin
+        if traverse_each:
+            legacy_traverse(net)
+    # Merge runs of nets into larger multi-segment nets.
+    for i in range(0, num_nets - 1):
+        if (i + 1) % merge:
+            nets[i] += nets[i + 1]
+            if traverse_each:
+                legacy_traverse(nets[i])
+    return ckt, nets, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pins", type=int, default=100000)
+    parser.add_argument("--nets", type=int, default=20000)
+    parser.add_argument("--merge", type=int, default=100)
+    args = parser.parse_args()
+
+    ckt, nets, t_index = build(args.pins, args.nets, args.merge)
+    start = time.perf_counter()
+    num_pins = sum(len(net.pins) for net in nets)
+    t_query = time.perf_counter() - start
+    print(f"Connectivity index: build {t_index:.2f}s, query {t_query:.2f}s ({num_pins} pin refs).")
+
+    _, legacy_nets, t_legacy = build(args.pins, args.nets, args.merge, traverse_each=True)
+    start = time.perf_counter()
+    legacy_pins = sum(len(legacy_traverse(net)[1]) for net in legacy_nets)
+    t_legacy_query = time.perf_counter() - start
+    print(f"Legacy traversal:   build {t_legacy:.2f}s, query {t_legacy_query:.2f}s ({legacy_pins} pin refs).")
+
+    # Both methods must find the same connections.
+    assert num_pins == legacy_pins
+    for net in nets:
+        trv_nets, trv_pins = legacy_traverse(net)
+        assert set(net.nets) == set(trv_nets)
+        assert set(map(id, net.pins)) == set(map(id, trv_pins))
+
+    print(f"Speed-up: {(t_legacy + t_legacy_query) / (t_index + t_query):.1f}x")
+
+
+if __name__ == "__main__":
+    main()
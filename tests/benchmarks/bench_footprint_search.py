@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+
+# The MIT License (MIT) - Copyright (c) Dave Vandenbout.
+
+"""
+Benchmark footprint searches using the footprint search DB against reading the footprint files.
+
+A number of footprint libraries are generated in a temporary directory, each
+holding footprints with a variety of descriptions, tags and pad counts and
+about as many graphic lines as a typical KiCad footprint (and about as many
+footprints in total as KiCad ships). Then each query is run:
+
+    * the legacy way that read every footprint file at the start of a session
+      and then applied the regex for the search to the text of every footprint,
+    * with the footprint search DB, first when it is built, then when it is
+      checked for changed libraries at the start of a new session and then
+      for searches after that.
+
+The time for each is reported along with the number of footprints found.
+
+Usage:
+    python benchmarks/bench_footprint_search.py [--libs 100] [--footprints 100] [--reps 5]
+"""
+
+import argparse
+import os
+import random
+import re
+import shutil
+import tempfile
+import time
+
+import skidl
+from skidl.part_query import (
+    FootprintCache,
+    FootprintSearchDB,
+    _parse_search_terms,
+    footprint_cache,
+    footprint_search_dbs,
+    search_footprints_iter,
+)
+from skidl.utilities import fullmatch
+
+QUERIES = (
+    "resistor",
+    "smd 0805",
+    "#pads=8 soic",
+    "qfn|dfn",
+    r"R_\d+",
+)
+
+# The legacy search keeps the text of every footprint in its own cache.
+legacy_cache = FootprintCache()
+
+PACKAGES = (
+    ("R_{}", "Resistor SMD {}, reflow soldering", "resistor", 2),
+    ("C_{}", "Capacitor SMD {}, reflow soldering", "capacitor", 2),
+    ("SOIC-{}", "SOIC, {} Pin, pitch 1.27mm", "SOIC SO", 8),
+    ("QFN-{}", "QFN, {} Pin, exposed pad", "QFN NL", 16),
+    ("DFN-{}", "DFN, {} Pin, no-lead", "DFN NL", 6),
+    ("SOT-{}", "SOT, {} Pin, plastic package", "SOT TO_SOT_SMD", 3),
+)
+
+
+def make_libs(lib_dir, num_libs, num_footprints):
+    """Generate footprint libraries and return an fp-lib-table for them."""
+    random.seed(1)
+    table = ["(fp_lib_table"]
+    for lib in range(num_libs):
+        lib_name = f"Lib{lib}"
+        path = os.path.join(lib_dir, lib_name + ".pretty")
+        os.mkdir(path)
+        for fp in range(num_footprints):
+            name, descr, tags, pads = random.choice(PACKAGES)
+            size = random.choice(("0402", "0603", "0805", "1206", str(fp)))
+            name = name.format(size) + f"_{fp}"
+            pads = pads + random.randint(0, 4) * 2
+            pad_lines = "".join(
+                f"  (pad {p} smd rect (at {p} 0) (size 1 1) (layers F.Cu F.Paste F.Mask))\n"
+                for p in range(1, pads + 1)
+            )
+            # Outlines on the silkscreen, courtyard and fab layers like a real footprint has.
+            graphic_lines = "".join(
+                f"  (fp_line (start {-i} -2) (end {i} 2) (layer {layer}) (width 0.12))\n"
+                for layer in ("F.SilkS", "F.CrtYd", "F.Fab")
+                for i in range(8)
+            )
+            with open(os.path.join(path, name + ".kicad_mod"), "w") as f:
+                f.write(
+                    f"(footprint {name} (layer F.Cu)\n"
+                    f'  (descr "{descr.format(size)}")\n'
+                    f'  (tags "{tags}")\n'
+                    f"  (fp_text reference REF** (at 0 -2) (layer F.SilkS))\n"
+                    f"  (fp_text value {name} (at 0 2) (layer F.Fab))\n"
+                    f"{graphic_lines}{pad_lines}"
+                    f"  (model ${{KICAD6_3DMODEL_DIR}}/{name}.wrl (at (xyz 0 0 0)) (scale (xyz 1 1 1)))\n"
+                    ")\n"
+                )
+        table.append(f'  (lib (name "{lib_name}")(type KiCad)(uri "{path}")(options "")(descr ""))')
+    table.append(")")
+    with open(os.path.join(lib_dir, "fp-lib-table"), "w") as f:
+        f.write("\n".join(table))
+
+
+def legacy_search_footprints_iter(terms, tool):
+    """Search for footprints the way search_footprints_iter() used to."""
+    terms = _parse_search_terms(terms)
+    if not legacy_cache.valid:
+        legacy_cache.clear()
+        legacy_cache.load(skidl.footprint_search_paths[tool])
+    for fp_lib in legacy_cache:
+        path = legacy_cache[fp_lib]["path"]
+        modules = legacy_cache[fp_lib]["modules"]
+        for module_name in modules:
+            if not legacy_cache.valid:
+                file = os.path.join(path, module_name + ".kicad_mod")
+                with open(file, "r") as fp:
+                    modules[module_name] = [l.rstrip() for l in fp.readlines()]
+            module_text = tuple(modules[module_name])
+            num_pads = len(set(re.findall(r"\(\s*pad\s+([^\s)]+)", " ".join(module_text))))
+            search_text = "\n".join([f"#pads={num_pads}", fp_lib, module_name])
+            for line in module_text:
+                if "(descr " in line or "(tags " in line:
+                    search_text = "\n".join([search_text, line])
+            if fullmatch(terms, search_text, flags=re.IGNORECASE | re.MULTILINE | re.DOTALL):
+                yield "MODULE", fp_lib, module_text, module_name
+    legacy_cache.valid = True
+
+
+def time_search(search_iter, query, tool, new_session=False):
+    """Return the time to search for the query and the names of the footprints found."""
+    if new_session:
+        legacy_cache.reset()
+        footprint_cache.reset()
+    start = time.perf_counter()
+    found = [fp[3] for fp in search_iter(query, tool) if fp[0] == "MODULE"]
+    return time.perf_counter() - start, found
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--libs", type=int, default=100)
+    parser.add_argument("--footprints", type=int, default=100)
+    parser.add_argument("--reps", type=int, default=5)
+    args = parser.parse_args()
+
+    tool = skidl.get_default_tool()
+    lib_dir = tempfile.mkdtemp()
+    make_libs(lib_dir, args.libs, args.footprints)
+    skidl.footprint_search_paths[tool] = lib_dir
+    footprint_search_dbs[tool] = FootprintSearchDB(db_dir=tempfile.mkdtemp(), tool=tool)
+
+    print(f"{args.libs * args.footprints} footprints in {args.libs} libraries.")
+
+    # The first search of a session reads the footprint files or updates the DB.
+    t_legacy, _ = time_search(legacy_search_footprints_iter, QUERIES[0], tool, new_session=True)
+    t_build, _ = time_search(search_footprints_iter, QUERIES[0], tool, new_session=True)
+    t_refresh, _ = time_search(search_footprints_iter, QUERIES[0], tool, new_session=True)
+    print(f"{'First search, legacy:':32s}{t_legacy:8.2f}s")
+    print(f"{'First search, building DB:':32s}{t_build:8.2f}s")
+    print(f"{'First search, checking DB:':32s}{t_refresh:8.2f}s ({t_legacy / t_refresh:.1f}x)")
+
+    # Later searches use the cached footprint text or the DB.
+    print(f"\n{'Query':20s}{'Legacy':>16s}{'DB':>16s}{'Speed-up':>10s}")
+    totals = {"legacy": 0, "db": 0}
+    for query in QUERIES:
+        t_legacy = t_db = 0
+        for _ in range(args.reps):
+            t, legacy_found = time_search(legacy_search_footprints_iter, query, tool)
+            t_legacy += t / args.reps
+            t, db_found = time_search(search_footprints_iter, query, tool)
+            t_db += t / args.reps
+        if sorted(legacy_found) != sorted(db_found):
+            raise SystemExit(f"Different footprints found for {query!r}.")
+        totals["legacy"] += t_legacy
+        totals["db"] += t_db
+        print(
+            f"{query:20s}{t_legacy * 1000:9.1f}ms {len(legacy_found):5d}{t_db * 1000:9.1f}ms {len(db_found):5d}"
+            f"{t_legacy / t_db:9.1f}x"
+        )
+    print(f"Speed-up over all queries: {totals['legacy'] / totals['db']:.1f}x")
+
+    footprint_search_dbs.pop(tool).close()
+    shutil.rmtree(lib_dir)
+
+
+if __name__ == "__main__":
+    main()
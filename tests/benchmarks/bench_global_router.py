@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+
+# The MIT License (MIT) - Copyright (c) Dave Vandenbout.
+
+"""
+Benchmark the global router on the designs in tests/unit_tests/test_schematic.py.
+
+Runs the schematic generation tests with Router.global_router() wrapped so every
+set of nets it's asked to route is also routed by the legacy global router that
+found each path by re-sorting a list of visited faces on every step. The routing
+capacities of the faces and the state of the random number generator are put
+back before each router runs, so both route exactly the same problem. The time
+taken by each router is reported along with the total length of the paths
+they found and the number of routing problems each one failed. The schematics
+are written to tests/test_data/schematic_output like when running the tests.
+
+Usage:
+    python bench_global_router.py [-k test_gen_sch_vga] [--rip-up-reroute]
+"""
+
+import argparse
+import os
+import random
+import time
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+from skidl.geometry import BBox
+from skidl.schematics.route import GlobalRoute, GlobalRoutingFailure, GlobalWire, Router
+
+
+def legacy_global_router(node, nets):
+    """Globally route nets the way Router.global_router() used to."""
+
+    def rt_srch(start_face, stop_faces):
+        if start_face in stop_faces or not stop_faces:
+            return GlobalWire(net)
+
+        visited_faces = [start_face]
+        start_face.dist_from_start = 0
+        unconstrained_faces = stop_faces | net_pin_faces
+
+        while True:
+            closest_dist = float("inf")
+            closest_face = None
+
+            visited_faces.sort(key=lambda f: f.dist_from_start)
+            for visited_face in visited_faces:
+                if visited_face.dist_from_start > closest_dist:
+                    break
+                for adj in visited_face.adjacent:
+                    if adj.face in visited_faces:
+                        continue
+                    if adj.face not in unconstrained_faces and adj.face.capacity <= 0:
+                        continue
+                    dist = visited_face.dist_from_start + adj.dist
+                    if dist < closest_dist:
+                        closest_dist = dist
+                        closest_face = adj.face
+                        closest_face.prev_face = visited_face
+
+            if not closest_face:
+                raise GlobalRoutingFailure(
+                    f"Global routing failure: {net.name} {net} {start_face.pins}"
+                )
+
+            closest_face.dist_from_start = closest_dist
+            visited_faces.append(closest_face)
+
+            if closest_face in stop_faces:
+                face_path = [closest_face]
+                while face_path[-1] is not start_face:
+                    face_path.append(face_path[-1].prev_face)
+                for face in face_path[:-1]:
+                    if face.capacity > 0:
+                        face.capacity -= 1
+                return GlobalWire(net, reversed(face_path))
+
+    def rank_net(net):
+        bbox = BBox()
+        for pin in node.get_internal_pins(net):
+            bbox.add(pin.route_pt)
+        return (bbox.w + bbox.h, len(net.pins))
+
+    nets.sort(key=rank_net)
+
+    global_routes = []
+    for net in nets:
+        global_route = GlobalRoute()
+        net_pin_faces = {pin.face for pin in node.get_internal_pins(net)}
+        start_faces = set(net_pin_faces)
+        start_face = random.choice(list(start_faces))
+        start_faces.discard(start_face)
+        stop_faces = set(start_faces)
+        initial_route = rt_srch(start_face, stop_faces)
+        global_route.append(initial_route)
+        stop_faces = set(initial_route)
+        for start_face in start_faces:
+            next_route = rt_srch(start_face, stop_faces)
+            global_route.append(next_route)
+            stop_faces |= set(next_route)
+        global_routes.append(global_route)
+
+    return global_routes
+
+
+def routing_faces(node, nets):
+    """Return all the faces that can be reached from the pins of the nets."""
+    faces = set()
+    frontier = [pin.face for net in nets for pin in node.get_internal_pins(net)]
+    while frontier:
+        face = frontier.pop()
+        if face not in faces:
+            faces.add(face)
+            frontier.extend(adj.face for adj in face.adjacent)
+    return faces
+
+
+def route_length(global_routes):
+    """Return the total distance thru the faces of a set of global routes."""
+    length = 0
+    for global_route in global_routes:
+        for wire in global_route:
+            for face, next_face in zip(wire, wire[1:]):
+                length += min(adj.dist for adj in face.adjacent if adj.face is next_face)
+    return length
+
+
+times = Counter()
+lengths = Counter()
+failures = Counter()
+
+
+def timed_route(label, router, node, nets, **options):
+    """Route the nets, record the time and length of the routes, and return them or the exception."""
+    start = time.perf_counter()
+    try:
+        global_routes = router(node, list(nets), **options)
+    except GlobalRoutingFailure as e:
+        times[label] += time.perf_counter() - start
+        failures[label] += 1
+        return e
+    times[label] += time.perf_counter() - start
+    lengths[label] += route_length(global_routes)
+    return global_routes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("-k", default="test_gen_sch", help="Select the tests to run.")
+    parser.add_argument(
+        "--rip-up-reroute",
+        action="store_true",
+        help="Route with the rip_up_reroute option of the new router.",
+    )
+    args = parser.parse_args()
+
+    new_global_router = Router.global_router
+
+    def compare_global_routers(node, nets, **options):
+        options["rip_up_reroute"] = args.rip_up_reroute
+        faces = routing_faces(node, nets)
+        capacities = {face: face.capacity for face in faces}
+        random_state = random.getstate()
+        timed_route("Legacy", legacy_global_router, node, nets)
+
+        for face, capacity in capacities.items():
+            face.capacity = capacity
+        random.setstate(random_state)
+        result = timed_route("Priority queue", new_global_router, node, nets, **options)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    Router.global_router = compare_global_routers
+
+    # Run the tests from the tests directory so they find the part libraries listed in its .skidlcfg.
+    tests_dir = Path(__file__).resolve().parent.parent
+    os.chdir(tests_dir)
+    os.environ["SKIDL_TOOL"] = "KICAD5"
+    pytest.main(["unit_tests/test_schematic.py", "-q", "-p", "no:randomly", "-k", args.k])
+
+    print()
+    for label in ("Legacy", "Priority queue"):
+        print(
+            f"{label + ':':16s}{times[label]:8.3f}s, path length {lengths[label]:10.0f}, "
+            f"{failures[label]} failures"
+        )
+    print(f"Speed-up: {times['Legacy'] / times['Priority queue']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
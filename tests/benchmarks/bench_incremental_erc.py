@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+
+# The MIT License (MIT) - Copyright (c) Dave Vandenbout.
+
+"""
+Benchmark an incremental ERC after a small edit to a large synthetic board.
+
+Builds a board of two-pin parts wired in a chain of small nets, runs a full
+ERC, moves one part to a different net and then compares a full ERC against
+an incremental ERC that only rechecks the nets and parts around the change.
+
+Usage:
+    python bench_incremental_erc.py [--parts 10000] [--edits 1]
+"""
+
+import argparse
+import time
+
+from skidl import SKIDL, TEMPLATE, Circuit, Net, Part, Pin
+from skidl.logger import erc_logger
+from skidl.pin import pin_types
+
+
+def build(num_parts):
+    """Build the board and return the circuit, its parts and its nets."""
+
+    ckt = Circuit()
+    ckt.no_files = True
+    res = Part(
+        name="R",
+        tool=SKIDL,
+        ref_prefix="R",
+        pins=[Pin(num=1, func=pin_types.PASSIVE), Pin(num=2, func=pin_types.PASSIVE)],
+        dest=TEMPLATE,
+    )
+    parts = res(num_parts, circuit=ckt)
+    nets = [Net(circuit=ckt) for _ in range(num_parts + 1)]
+    for i, r in enumerate(parts):
+        r[1] += nets[i]
+        r[2] += nets[i + 1]
+    return ckt, parts, nets
+
+
+def edit(parts, nets, num_edits):
+    """Move the first pins of some parts to other nets."""
+    for i in range(num_edits):
+        part = parts[(i * 7919) % len(parts)]
+        part[1].disconnect()
+        nets[(i * 104729) % len(nets)] += part[1]
+
+
+def run(ckt, **kwargs):
+    """Run an ERC on the circuit and return the time and number of warnings."""
+    start = time.perf_counter()
+    ckt.ERC(**kwargs)
+    return time.perf_counter() - start, erc_logger.warning.count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--parts", type=int, default=10000)
+    parser.add_argument("--edits", type=int, default=1)
+    args = parser.parse_args()
+
+    ckt, parts, nets = build(args.parts)
+    erc_logger.setLevel("ERROR")  # Don't print the warnings.
+
+    t_first, _ = run(ckt, incremental=True)
+    print(f"First incremental ERC of {args.parts} parts: {t_first:.3f}s.")
+
+    edit(parts, nets, args.edits)
+    t_incr, incr_warnings = run(ckt, incremental=True)
+    print(f"Incremental ERC after {args.edits} edits: {t_incr:.3f}s, {incr_warnings} warnings.")
+
+    t_full, full_warnings = run(ckt)
+    print(f"Full ERC:                        {t_full:.3f}s, {full_warnings} warnings.")
+
+    # Both must find the same problems.
+    assert incr_warnings == full_warnings
+
+    print(f"Speed-up: {t_full / t_incr:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+
+# The MIT License (MIT) - Copyright (c) Dave Vandenbout.
+
+"""
+Benchmark the pin conflict check of the net ERC on a large synthetic board.
+
+Builds a board of two-pin parts where every fifth part has a pin on a shared
+ground net and the rest are wired to small signal nets, with a few output
+pins driving the ground net to create conflicts. Then the pins of every net
+are checked for conflicts by grouping them by function and by checking every
+pair of pins like the net ERC used to do.
+
+Usage:
+    python bench_net_erc.py [--parts 10000] [--gnd-every 5] [--outputs 5]
+"""
+
+import argparse
+import time
+
+from skidl import SKIDL, TEMPLATE, Circuit, Net, Part, Pin
+from skidl.erc import chk_pin_conflicts
+from skidl.logger import active_logger
+from skidl.pin import pin_types
+
+
+def legacy_chk_pin_conflicts(pins):
+    """The pairwise pin conflict check that dflt_net_erc() used to do."""
+    num_pins = len(pins)
+    for i in range(num_pins):
+        for j in range(i + 1, num_pins):
+            pins[i].chk_conflict(pins[j])
+
+
+def build(num_parts, gnd_every, num_outputs):
+    """Build the board and return its nets."""
+
+    ckt = Circuit()
+    res = Part(
+        name="R",
+        tool=SKIDL,
+        ref_prefix="R",
+        pins=[Pin(num=1, func=pin_types.PASSIVE), Pin(num=2, func=pin_types.PASSIVE)],
+        dest=TEMPLATE,
+    )
+    drv = Part(
+        name="DRV",
+        tool=SKIDL,
+        ref_prefix="U",
+        pins=[Pin(num=1, func=pin_types.OUTPUT)],
+        dest=TEMPLATE,
+    )
+    gnd = Net("GND", circuit=ckt)
+    sigs = [Net(circuit=ckt) for _ in range(num_parts // 5 + 1)]
+    for i, r in enumerate(res(num_parts, circuit=ckt)):
+        r[1] += sigs[i // 5]
+        r[2] += gnd if i % gnd_every == 0 else sigs[(i + 1) // 5]
+    for d in drv(num_outputs, circuit=ckt):
+        d[1] += gnd
+    return ckt.get_nets()
+
+
+def run(nets, chk):
+    """Check the pins of every net for conflicts and return the time and number of errors."""
+    active_logger.error.reset()
+    start = time.perf_counter()
+    for net in nets:
+        chk(net.pins)
+    return time.perf_counter() - start, active_logger.error.count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--parts", type=int, default=10000)
+    parser.add_argument("--gnd-every", type=int, default=5)
+    parser.add_argument("--outputs", type=int, default=5)
+    args = parser.parse_args()
+
+    nets = build(args.parts, args.gnd_every, args.outputs)
+    max_pins = max(len(net.pins) for net in nets)
+    print(f"{len(nets)} nets, largest has {max_pins} pins.")
+
+    t_grouped, grouped_errors = run(nets, chk_pin_conflicts)
+    print(f"Grouped by function: {t_grouped:.3f}s, {grouped_errors} error messages.")
+
+    t_pairwise, pairwise_errors = run(nets, legacy_chk_pin_conflicts)
+    print(f"Every pair of pins:  {t_pairwise:.3f}s, {pairwise_errors} error messages.")
+
+    # Both methods must find conflicts on the same nets.
+    assert bool(grouped_errors) == bool(pairwise_errors)
+
+    print(f"Speed-up: {t_pairwise / t_grouped:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+
+# The MIT License (MIT) - Copyright (c) Dave Vandenbout.
+
+"""
+Benchmark writing a KiCad netlist for a large synthetic board.
+
+Builds a board of resistors wired into a chain of nets and then writes its
+netlist by streaming each component and net to a file and by building the
+entire netlist as one Sexp tree and converting it to a string like the KiCad
+back-ends used to do. The time and peak memory of each are reported and the
+two netlists are checked to be identical.
+
+Usage:
+    python bench_netlist_stream.py [--parts 1000] [--tool kicad9]
+"""
+
+import argparse
+import importlib
+import io
+import time
+import tracemalloc
+
+from simp_sexp import Sexp
+
+from skidl import SKIDL, TEMPLATE, Circuit, Net, Part, Pin
+from skidl.pin import pin_types
+
+
+def legacy_gen_netlist(circuit, mod, **kwargs):
+    """Build the netlist as one Sexp tree and convert it to a string like gen_netlist() used to do."""
+
+    design = ["design", ["source", "bench"], ["date", "today"], ["tool", "SKiDL"]]
+    for num, node_name in enumerate(circuit.get_node_names(), 1):
+        design.append(mod.gen_netlist_sheet(node_name, num, "bench", **kwargs))
+    components = Sexp()
+    for p in sorted(circuit.parts, key=lambda p: str(p.ref)):
+        components.append(mod.gen_netlist_comp(p, **kwargs))
+    nets = Sexp()
+    sorted_nets = sorted(circuit.get_nets(), key=lambda n: str(n.name))
+    for code, net in enumerate(sorted_nets, 1):
+        net.code = code
+        nets.append(mod.gen_netlist_net(net, **kwargs))
+    netlist = Sexp(
+        ["export", ["version", "D"], design, ["components", *components], ["nets", *nets]]
+    )
+    netlist.add_quotes(lambda s: True)
+    return netlist.to_str().replace("(export\n", "(export \n", 1)
+
+
+def stream_gen_netlist(circuit, mod, **kwargs):
+    """Stream the same netlist as legacy_gen_netlist() into a file object."""
+
+    from skidl.tools.kicad_netlist import write_export
+
+    design = ["design", ["source", "bench"], ["date", "today"], ["tool", "SKiDL"]]
+    for num, node_name in enumerate(circuit.get_node_names(), 1):
+        design.append(mod.gen_netlist_sheet(node_name, num, "bench", **kwargs))
+
+    def components():
+        for p in sorted(circuit.parts, key=lambda p: str(p.ref)):
+            yield mod.gen_netlist_comp(p, **kwargs)
+
+    def nets():
+        sorted_nets = sorted(circuit.get_nets(), key=lambda n: str(n.name))
+        for code, net in enumerate(sorted_nets, 1):
+            net.code = code
+            yield mod.gen_netlist_net(net, **kwargs)
+
+    f = io.StringIO()
+    write_export(f, design, components(), nets())
+    return f.getvalue()
+
+
+def build(num_parts):
+    """Build the board."""
+
+    ckt = Circuit()
+    res = Part(
+        name="R",
+        tool=SKIDL,
+        ref_prefix="R",
+        footprint="Resistor_SMD:R_0805",
+        pins=[Pin(num=1, func=pin_types.PASSIVE), Pin(num=2, func=pin_types.PASSIVE)],
+        dest=TEMPLATE,
+    )
+    parts = res(num_parts, circuit=ckt)
+    nets = [Net(circuit=ckt) for _ in range(num_parts + 1)]
+    for i, r in enumerate(parts):
+        r.tag = str(i)
+        r[1] += nets[i]
+        r[2] += nets[i + 1]
+    return ckt
+
+
+def run(gen, *args, **kwargs):
+    """Generate a netlist and return it along with the time and then the peak memory of another run."""
+    start = time.perf_counter()
+    netlist = gen(*args, **kwargs)
+    t = time.perf_counter() - start
+    tracemalloc.start()
+    gen(*args, **kwargs)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return netlist, t, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--parts", type=int, default=1000)
+    parser.add_argument("--tool", default="kicad9")
+    args = parser.parse_args()
+
+    ckt = build(args.parts)
+    mod = importlib.import_module(f"skidl.tools.{args.tool}.gen_netlist")
+    kwargs = dict(track_src=False, track_abs_path=False)
+
+    # The streamed netlist is written to a StringIO so it can be compared, which makes
+    # the peak memory include the whole netlist text. Writing to a real file doesn't.
+    streamed, t_stream, mem_stream = run(stream_gen_netlist, ckt, mod, **kwargs)
+    print(f"Streamed:  {t_stream:.3f}s, peak {mem_stream / 2**20:.1f} MB.")
+
+    legacy, t_legacy, mem_legacy = run(legacy_gen_netlist, ckt, mod, **kwargs)
+    print(f"Sexp tree: {t_legacy:.3f}s, peak {mem_legacy / 2**20:.1f} MB.")
+
+    assert streamed == legacy
+    print(f"{len(streamed)} identical characters. Speed-up: {t_legacy / t_stream:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+
+# The MIT License (MIT) - Copyright (c) Dave Vandenbout.
+
+"""
+Benchmark routing a hierarchical schematic serially and on a pool of processes.
+
+Builds a circuit with a number of hierarchical sheets of transistor circuits
+and places its KiCad 5 schematic. Then the placed schematic is routed with a
+series of random seeds, both serially and with the route_workers option so
+the child nodes and the switchboxes are routed in parallel. The average time
+of the successful routings is reported for each along with the average number
+of wire segments and the number of routing failures. (The router sometimes
+fails, which is why generate_schematic() retries it.)
+
+Must be run from the tests directory so the part libraries listed in its
+.skidlcfg are found.
+
+Usage:
+    python benchmarks/bench_parallel_route.py [--sheets 16] [--workers 4] [--routes 5]
+"""
+
+import argparse
+import os
+import time
+from collections import defaultdict
+
+from skidl import (
+    KICAD,
+    KICAD5,
+    TEMPLATE,
+    Group,
+    Net,
+    Part,
+    lib_search_paths,
+    set_default_tool,
+)
+from skidl.config_ import SkidlConfig
+from skidl.schematics.route import RoutingFailure
+from skidl.schematics.sch_node import SchNode
+from skidl.tools import tool_modules
+from skidl.tools.kicad5.gen_schematic import finalize_parts_and_nets, preprocess_circuit
+
+
+def build(num_sheets):
+    """Build sheets of transistor circuits connected by a couple of global nets."""
+    q = Part(
+        lib="Device.lib",
+        name="Q_PNP_CBE",
+        footprint="Package_TO_SOT_SMD:SOT-223-3_TabPin2",
+        dest=TEMPLATE,
+        symtx="V",
+    )
+    r = Part("Device.lib", "R", footprint="Resistor_SMD:R_0805_2012Metric", dest=TEMPLATE)
+    vin, gnd = Net("VIN"), Net("GND")
+    for i in range(num_sheets):
+        with Group(f"S{i}"):
+            q1 = q()
+            r1, r2, r3 = r(3, value="10K")
+            vin & r1 & q1["b"] & r2 & gnd
+            vin & r3 & q1["e"]
+            q1["c"] & gnd
+
+
+def clear_wires(node):
+    """Remove the wires and junctions from a node and its children."""
+    node.wires = defaultdict(list)
+    node.junctions = defaultdict(list)
+    for child in node.children.values():
+        clear_wires(child)
+
+
+def count_segments(node):
+    """Return the number of wire segments in a node and its children."""
+    return sum(len(segs) for segs in node.wires.values()) + sum(
+        count_segments(child) for child in node.children.values()
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sheets", type=int, default=16)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--routes", type=int, default=5)
+    args = parser.parse_args()
+
+    config = SkidlConfig(KICAD)
+    for tool in lib_search_paths:
+        lib_search_paths[tool] = config.lib_search_paths[tool]
+    set_default_tool(KICAD5)
+    build(args.sheets)
+
+    # Place the schematic the same way gen_schematic() does, expanding the
+    # routing area until the placement can be routed.
+    options = {"use_push_pull": True, "rotate_parts": True, "pt_to_pt_mult": 5, "pin_normalize": True}
+    expansion_factor = 1.0
+    for _ in range(5):
+        preprocess_circuit(default_circuit, **options)
+        node = SchNode(default_circuit, tool_modules[KICAD5], ".", "bench", "", 0.0)
+        node.place(expansion_factor=expansion_factor, seed=1, **options)
+        try:
+            node.route(seed=0, **options)
+            break
+        except RoutingFailure:
+            finalize_parts_and_nets(default_circuit, **options)
+            expansion_factor *= 1.5
+
+    modes = (("Serial", 1), (f"{args.workers} workers", args.workers))
+    times = defaultdict(list)
+    segments = defaultdict(list)
+    failures = defaultdict(int)
+    for seed in range(args.routes):
+        for label, workers in modes:
+            clear_wires(node)
+            start = time.perf_counter()
+            try:
+                node.route(seed=seed, route_workers=workers, **options)
+            except RoutingFailure:
+                failures[label] += 1
+                continue
+            times[label].append(time.perf_counter() - start)
+            segments[label].append(count_segments(node))
+    finalize_parts_and_nets(default_circuit, **options)
+
+    print(f"{args.sheets} sheets routed {args.routes} times on {os.cpu_count()} CPUs.")
+    avg_times = {}
+    for label, _ in modes:
+        if not times[label]:
+            print(f"{label + ':':12s}{failures[label]} routing failures")
+            continue
+        avg_times[label] = sum(times[label]) / len(times[label])
+        avg_segments = sum(segments[label]) / len(segments[label])
+        print(
+            f"{label + ':':12s}{avg_times[label]:8.3f}s, {avg_segments:.0f} wire segments, "
+            f"{failures[label]} routing failures"
+        )
+    if len(avg_times) == 2:
+        t_serial, t_parallel = avg_times.values()
+        print(f"Speed-up: {t_serial / t_parallel:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
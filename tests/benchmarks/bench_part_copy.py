@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+
+# The MIT License (MIT) - Copyright (c) Dave Vandenbout.
+
+"""
+Benchmark making an array of identical parts in one call versus one at a time.
+
+Makes copies of a library part with a single Part.copy(num_copies=N) call,
+which does the work shared by all the copies once and adds them to the
+circuit together, then makes the same number of copies one-by-one.
+
+Usage:
+    python bench_part_copy.py [--lib Device] [--part R] [--copies 1000] [--repeat 5]
+"""
+
+import argparse
+import time
+
+from skidl import TEMPLATE, Circuit, Part
+
+
+def time_copies(part, num_copies, batched):
+    """Make copies of a part in a new circuit and return the time taken."""
+
+    ckt = Circuit()
+    start = time.perf_counter()
+    if batched:
+        copies = part(num_copies, circuit=ckt)
+    else:
+        copies = [part(circuit=ckt) for _ in range(num_copies)]
+    elapsed = time.perf_counter() - start
+    assert len(ckt.parts) == len(copies) == num_copies
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--lib", default="Device")
+    parser.add_argument("--part", default="R")
+    parser.add_argument("--copies", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    part = Part(args.lib, args.part, dest=TEMPLATE)
+
+    t_batch = min(time_copies(part, args.copies, True) for _ in range(args.repeat))
+    print(f"Part.copy({args.copies}):  {t_batch:.3f}s")
+
+    t_single = min(time_copies(part, args.copies, False) for _ in range(args.repeat))
+    print(f"{args.copies} x Part.copy(): {t_single:.3f}s")
+
+    print(f"Speed-up: {t_single / t_batch:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+
+# The MIT License (MIT) - Copyright (c) Dave Vandenbout.
+
+"""
+Benchmark building the part search DB from the libraries for a tool.
+
+The libraries listed in the .skidlcfg of the tests directory are copied into a
+temporary directory a number of times so there are enough files to spread over
+the worker processes and no pickled libraries exist for them. Then a part search
+DB is built from them three ways:
+
+    * the legacy way that loaded each library with SchLib and committed its
+      parts before going on to the next library,
+    * scanning the library files in this process,
+    * scanning the library files with a pool of processes.
+
+The time for each is reported along with the number of parts stored in the DB.
+
+Must be run from the tests directory so the part libraries listed in its
+.skidlcfg are found.
+
+Usage:
+    python benchmarks/bench_part_index.py [--tool kicad9] [--copies 4] [--workers 4]
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+import skidl
+from skidl import KICAD, lib_search_paths, set_default_tool
+from skidl.config_ import SkidlConfig
+from skidl.part_query import PartSearchDB, get_all_lib_files
+from skidl.schlib import SchLib
+
+
+def legacy_add_lib(db, lib_path, tool):
+    """Add a library to the DB the way PartSearchDB.add_lib() used to."""
+    abs_fn, parts = db._load_lib_parts(lib_path, tool)
+    mtime = os.path.getmtime(abs_fn)
+    parts_to_insert = []
+    for name, aliases, descr, keywords in parts:
+        aliases = " ".join(aliases)
+        search_text = " ".join(filter(None, [name, aliases, descr, keywords]))
+        parts_to_insert.append((name, abs_fn, search_text, aliases, descr, keywords))
+    db._cur.execute(
+        "INSERT OR REPLACE INTO libraries(lib_file, mtime) VALUES(?, ?)", (abs_fn, mtime)
+    )
+    db._cur.executemany(
+        "INSERT OR REPLACE INTO parts(part_name, lib_file, search_text, aliases, description, keywords) VALUES(?, ?, ?, ?, ?, ?)",
+        parts_to_insert,
+    )
+    db._conn.commit()
+
+
+def build_db(label, tool, add, legacy=False):
+    """Build a new DB by calling add() and print the time it took."""
+    db = PartSearchDB(db_dir=tempfile.mkdtemp(), tool=tool)
+    if legacy:
+        # The DB used the default rollback journal before.
+        db._cur.execute("PRAGMA journal_mode = DELETE")
+        db._cur.execute("PRAGMA synchronous = FULL")
+    SchLib.reset()
+    start = time.perf_counter()
+    add(db)
+    elapsed = time.perf_counter() - start
+    num_parts = db._cur.execute("SELECT COUNT(*) FROM parts").fetchone()[0]
+    db.close()
+    print(" " * 79, end="\r")
+    print(f"{label + ':':22s}{elapsed:8.2f}s, {num_parts} parts")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tool", default="kicad9")
+    parser.add_argument("--copies", type=int, default=4)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    config = SkidlConfig(KICAD)
+    for tool in lib_search_paths:
+        lib_search_paths[tool] = config.lib_search_paths[tool]
+    set_default_tool(args.tool)
+
+    # Copy the libraries (and any KiCad 5 .dcm files) so SchLib can't use pickles of them.
+    lib_dir = tempfile.mkdtemp()
+    lib_files = []
+    for lib_file in get_all_lib_files(args.tool):
+        base, ext = os.path.splitext(os.path.basename(lib_file))
+        for copy in range(args.copies):
+            copy_file = os.path.join(lib_dir, f"{base}_{copy}{ext}")
+            shutil.copy(lib_file, copy_file)
+            dcm_file = os.path.splitext(lib_file)[0] + ".dcm"
+            if os.path.exists(dcm_file):
+                shutil.copy(dcm_file, os.path.splitext(copy_file)[0] + ".dcm")
+            lib_files.append(copy_file)
+    skidl.config.pickle_dir = tempfile.mkdtemp()
+
+    print(f"Indexing {len(lib_files)} {args.tool} libraries on {os.cpu_count()} CPUs.")
+    t_legacy = build_db(
+        "Legacy",
+        args.tool,
+        lambda db: [legacy_add_lib(db, lib_file, args.tool) for lib_file in lib_files],
+        legacy=True,
+    )
+    t_serial = build_db("Scan, 1 process", args.tool, lambda db: db.add_libs(*lib_files, workers=1))
+    t_pool = build_db(
+        f"Scan, {args.workers} processes",
+        args.tool,
+        lambda db: db.add_libs(*lib_files, workers=args.workers),
+    )
+    print(f"Speed-up: {t_legacy / t_serial:.1f}x (1 process), {t_legacy / t_pool:.1f}x ({args.workers} processes)")
+    shutil.rmtree(lib_dir)
+
+
+if __name__ == "__main__":
+    main()
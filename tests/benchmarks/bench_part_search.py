@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+
+# The MIT License (MIT) - Copyright (c) Dave Vandenbout.
+
+"""
+Benchmark part searches using the full-text index against scanning the parts with LIKE.
+
+Builds a part search DB in a temporary directory from the libraries for a tool
+listed in the .skidlcfg of the tests directory. The parts are copied into the
+DB a number of times (as if they came from more libraries) to get a DB the size
+of one holding all the KiCad symbol libraries. Then each query is run with the
+full-text index and by scanning the search text of every part with LIKE, as
+PartSearchDB.search() did before. The average time per query is reported along
+with the number of parts each way of searching found.
+
+Must be run from the tests directory so the part libraries listed in its
+.skidlcfg are found.
+
+Usage:
+    python benchmarks/bench_part_search.py [--tool kicad9] [--copies 10] [--reps 20]
+"""
+
+import argparse
+import tempfile
+import time
+
+from skidl import KICAD, lib_search_paths, set_default_tool
+from skidl.config_ import SkidlConfig
+from skidl.part_query import PartSearchDB
+
+QUERIES = (
+    "resistor",
+    "opamp dual",
+    "lm358 | tl072",
+    '"zener diode"',
+    "(st | microchip) mcu",
+    "led small",
+)
+
+
+def time_search(search, tokens_groups, reps):
+    """Return the average time to search for the OR-groups of terms and the parts found."""
+    start = time.perf_counter()
+    for _ in range(reps):
+        rows = search(tokens_groups)
+    return (time.perf_counter() - start) / reps, len(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tool", default="kicad9")
+    parser.add_argument("--copies", type=int, default=10)
+    parser.add_argument("--reps", type=int, default=20)
+    args = parser.parse_args()
+
+    config = SkidlConfig(KICAD)
+    for tool in lib_search_paths:
+        lib_search_paths[tool] = config.lib_search_paths[tool]
+    set_default_tool(args.tool)
+
+    db = PartSearchDB(db_dir=tempfile.mkdtemp(), tool=args.tool)
+    db.load_from_lib_search_paths()
+    if not db.fts:
+        raise SystemExit("SQLite FTS5 is not available.")
+    for copy in range(1, args.copies):
+        db._cur.execute(
+            """
+            INSERT INTO parts(part_name, lib_file, search_text, aliases, description, keywords)
+            SELECT part_name, lib_file || ?, search_text, aliases, description, keywords
+            FROM parts WHERE lib_file NOT LIKE '%#%'
+            """,
+            (f"#{copy}",),
+        )
+    db._conn.commit()
+    num_parts = db._cur.execute("SELECT COUNT(*) FROM parts").fetchone()[0]
+
+    print(f"\n{num_parts} parts searched {args.reps} times for each query.")
+    print(f"{'Query':24s}{'LIKE':>16s}{'FTS5':>16s}{'Speed-up':>10s}")
+    totals = {"LIKE": 0, "FTS5": 0}
+    for query in QUERIES:
+        tokens_groups = db._tokenize_query(query)
+        t_like, n_like = time_search(db._search_like, tokens_groups, args.reps)
+        t_fts, n_fts = time_search(db._search_fts, tokens_groups, args.reps)
+        totals["LIKE"] += t_like
+        totals["FTS5"] += t_fts
+        print(
+            f"{query:24s}{t_like * 1000:8.2f}ms {n_like:5d}{t_fts * 1000:8.2f}ms {n_fts:5d}"
+            f"{t_like / t_fts:9.1f}x"
+        )
+    print(f"Speed-up over all queries: {totals['LIKE'] / totals['FTS5']:.1f}x")
+    db.close()
+
+
+if __name__ == "__main__":
+    main()
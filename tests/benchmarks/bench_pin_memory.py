@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+
+# The MIT License (MIT) - Copyright (c) Dave Vandenbout.
+
+"""
+Benchmark the memory used by copies of pins that share a template.
+
+Copies the pins of a library part many times and measures the memory used
+by the copies, then does the same with the pin copying that gave each copy
+its own copies of all the pin attributes.
+
+Usage:
+    python bench_pin_memory.py [--lib Device] [--part R] [--copies 10000]
+"""
+
+import argparse
+import time
+import tracemalloc
+from collections.abc import Iterable
+from copy import copy
+
+from skidl import TEMPLATE, Part, Pin
+
+
+def legacy_copy(pin):
+    """The Pin.copy() that copied every attribute into each new pin."""
+    cpy = Pin()
+    for k, v in pin.__dict__.items():
+        if k in ("nets", "num"):
+            continue
+        if isinstance(v, Iterable) and not isinstance(v, str):
+            setattr(cpy, k, copy(v))
+        else:
+            setattr(cpy, k, v)
+    if pin.is_assigned():
+        cpy.num = pin.num
+    return cpy
+
+
+def copy_pins(pins, num_copies, copier):
+    """Copy a list of pins and return the memory used per pin and the time taken."""
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    copies = [copier(pin) for _ in range(num_copies) for pin in pins]
+    elapsed = time.perf_counter() - start
+    mem = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return mem / len(copies), elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--lib", default="Device")
+    parser.add_argument("--part", default="R")
+    parser.add_argument("--copies", type=int, default=10000)
+    args = parser.parse_args()
+
+    pins = Part(args.lib, args.part, dest=TEMPLATE).pins
+
+    # Give the pins their own attributes like they had before templates were shared.
+    for pin in pins:
+        pin._detach_template()
+    legacy_mem, t_legacy = copy_pins(pins, args.copies, legacy_copy)
+    print(f"Copied attributes: {legacy_mem:.0f} bytes/pin, {t_legacy:.2f}s.")
+
+    shared_mem, t_shared = copy_pins(pins, args.copies, Pin.copy)
+    print(f"Shared template:   {shared_mem:.0f} bytes/pin, {t_shared:.2f}s.")
+
+    print(f"Memory reduction: {legacy_mem / shared_mem:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
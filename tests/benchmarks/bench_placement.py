@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+
+# The MIT License (MIT) - Copyright (c) Dave Vandenbout.
+
+"""
+Benchmark the force-directed placement of a large group of connected blocks.
+
+Builds a set of rectangular blocks with pins that are randomly connected by
+nets and then places them with push_and_pull() using forces computed
+part-by-part with Vector and BBox objects like the autoplacer has always done,
+and with the vectorize_forces option that computes the forces on all the
+parts at once with NumPy arrays. Both placements start from the same random
+arrangement. The time for each is reported along with the total distance
+between the connected pins and the total area of the overlaps between blocks
+so the quality of the placements can be compared.
+
+Usage:
+    python bench_placement.py [--parts 60] [--nets 90] [--seed 1]
+"""
+
+import argparse
+import random
+import time
+from collections import defaultdict
+from copy import copy
+
+from skidl import Pin
+from skidl.geometry import BBox, Point, Tx
+from skidl.schematics.place import push_and_pull, random_placement, total_part_force
+
+
+class Block:
+    """Rectangular stand-in for a part with anchor and pull pins for its nets."""
+
+    def __init__(self, w, h):
+        self.place_bbox = BBox(Point(0, 0), Point(w, h))
+        self.tx = Tx()
+        self.anchor_pins = defaultdict(list)
+        self.pull_pins = defaultdict(list)
+
+    def add_pin(self):
+        pin = Pin()
+        pin.part = self
+        pin.place_pt = Point(
+            random.uniform(0, self.place_bbox.max.x), random.uniform(0, self.place_bbox.max.y)
+        )
+        return pin
+
+
+def build(num_parts, num_nets):
+    """Build the blocks and connect them with nets."""
+
+    blocks = [Block(random.randint(4, 16) * 50, random.randint(4, 16) * 50) for _ in range(num_parts)]
+    for net in range(num_nets):
+        net_blocks = random.sample(blocks, random.randint(2, 4))
+        for blk in net_blocks:
+            pin = blk.add_pin()
+            blk.anchor_pins[net].append(pin)
+            for other_blk in net_blocks:
+                if other_blk is not blk:
+                    other_blk.pull_pins[net].append(pin)
+    return blocks
+
+
+def wire_length(blocks):
+    """Return the total distance from each anchor pin to the pins pulling on it."""
+    total = 0
+    for blk in blocks:
+        for net, anchor_pins in blk.anchor_pins.items():
+            for anchor_pin in anchor_pins:
+                anchor_pt = anchor_pin.place_pt * blk.tx
+                for pull_pin in blk.pull_pins[net]:
+                    total += (pull_pin.place_pt * pull_pin.part.tx - anchor_pt).magnitude
+    return total / 2
+
+
+def overlap_area(blocks):
+    """Return the total area of the overlaps between blocks."""
+    bboxes = [blk.place_bbox * blk.tx for blk in blocks]
+    area = 0
+    for i, bbox in enumerate(bboxes):
+        for other_bbox in bboxes[i + 1 :]:
+            overlap = bbox.intersection(other_bbox)
+            if overlap:
+                area += overlap.area
+    return area
+
+
+def run(blocks, start_txs, seed, **options):
+    """Place the blocks from their starting positions and return the time taken."""
+    for blk, tx in zip(blocks, start_txs):
+        blk.tx = copy(tx)
+    random.seed(seed)
+    start = time.perf_counter()
+    push_and_pull([], blocks, [], total_part_force, **options)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--parts", type=int, default=60)
+    parser.add_argument("--nets", type=int, default=90)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    blocks = build(args.parts, args.nets)
+    random_placement(blocks)
+    start_txs = [copy(blk.tx) for blk in blocks]
+    print(f"{args.parts} blocks connected by {args.nets} nets.")
+
+    options = {"use_push_pull": True, "pt_to_pt_mult": 5, "pin_normalize": True}
+    for label, vectorize in (("Part-by-part forces", False), ("Vectorized forces", True)):
+        t = run(blocks, start_txs, args.seed, vectorize_forces=vectorize, **options)
+        print(
+            f"{label + ':':21s}{t:8.3f}s, wire length {wire_length(blocks):10.0f}, "
+            f"overlap area {overlap_area(blocks):10.0f}"
+        )
+        if not vectorize:
+            t_legacy = t
+    print(f"Speed-up: {t_legacy / t:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
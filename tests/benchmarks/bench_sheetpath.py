@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+
+# The MIT License (MIT) - Copyright (c) Dave Vandenbout.
+
+"""
+Benchmark the sheet paths and timestamps of the parts in a deep hierarchy.
+
+Builds a board of resistors spread over the leaves of a tree of nested groups
+and then computes the sheet path, sheet path timestamp and part timestamp for
+every part like the KiCad netlist generators do. This is done with the stored
+values from skidl.tools.kicad_sheetpath and by rebuilding the hierarchy and
+hashing every level name for every part like the generators used to do.
+
+Usage:
+    python bench_sheetpath.py [--parts 20000] [--depth 8] [--fanout 2]
+"""
+
+import argparse
+import time
+import uuid
+
+from skidl import SKIDL, TEMPLATE, Circuit, Group, Part, Pin
+from skidl.pin import pin_types
+from skidl.tools.kicad_sheetpath import (
+    gen_part_tstamp,
+    gen_sheetpath,
+    gen_sheetpath_tstamp,
+    namespace_uuid,
+)
+
+
+def legacy_tstamps(part):
+    """Compute the sheet path and timestamps of a part like the netlist generators used to do."""
+    hiertuple = tuple(n.tag_or_name for n in part.node.hiernodes)
+    sheetpath = f"{'/'.join(hiertuple)}/"
+    if len(hiertuple) == 1:
+        sheetpath_tstamp = "/"
+    else:
+        levels = [str(uuid.uuid5(namespace_uuid, level)) for level in hiertuple[1:]]
+        sheetpath_tstamp = "/" + "/".join(levels) + "/"
+    hiername = ".".join(tuple(n.tag_or_name for n in part.node.hiernodes) + (part.tag_ref_name,))
+    part_tstamp = str(uuid.uuid5(namespace_uuid, hiername))
+    return sheetpath, sheetpath_tstamp, part_tstamp
+
+
+def tstamps(part):
+    """Compute the sheet path and timestamps of a part like the netlist generators do now."""
+    return (
+        gen_sheetpath(part.hiertuple),
+        gen_sheetpath_tstamp(part.hiertuple),
+        gen_part_tstamp(part),
+    )
+
+
+def build(num_parts, depth, fanout):
+    """Build the board and return its parts."""
+
+    ckt = Circuit()
+    res = Part(
+        name="R",
+        tool=SKIDL,
+        ref_prefix="R",
+        pins=[Pin(num=1, func=pin_types.PASSIVE), Pin(num=2, func=pin_types.PASSIVE)],
+        dest=TEMPLATE,
+    )
+    num_leaves = fanout**depth
+    per_leaf = -(-num_parts // num_leaves)
+
+    def fill(level, remaining):
+        if level == depth:
+            res(min(per_leaf, remaining), circuit=ckt)
+            return min(per_leaf, remaining)
+        used = 0
+        for i in range(fanout):
+            with Group(f"level{level}_{i}", circuit=ckt):
+                used += fill(level + 1, remaining - used)
+        return used
+
+    with ckt:
+        fill(0, num_parts)
+    return ckt.parts
+
+
+def run(func, parts):
+    """Compute the sheet paths and timestamps of all the parts and return the time and results."""
+    start = time.perf_counter()
+    results = [func(part) for part in parts]
+    return time.perf_counter() - start, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--parts", type=int, default=20000)
+    parser.add_argument("--depth", type=int, default=8)
+    parser.add_argument("--fanout", type=int, default=2)
+    args = parser.parse_args()
+
+    parts = build(args.parts, args.depth, args.fanout)
+    print(f"{len(parts)} parts in {args.fanout ** args.depth} sheets of depth {args.depth}.")
+
+    t_legacy, legacy = run(legacy_tstamps, parts)
+    print(f"Hashing every level: {t_legacy:.3f}s.")
+
+    t_stored, stored = run(tstamps, parts)
+    print(f"Stored values:       {t_stored:.3f}s.")
+
+    assert stored == legacy
+    print(f"Speed-up: {t_legacy / t_stored:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
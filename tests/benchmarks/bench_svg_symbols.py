@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+
+# The MIT License (MIT) - Copyright (c) Dave Vandenbout.
+
+"""
+Benchmark generating the netlistsvg skin of part symbols with and without the SVG symbol cache.
+
+Builds a circuit with copies of a few parts in several orientations. The ground
+net is a stub, so every part attached to it gets a symbol of its own. Then the
+SVG for the part symbols of the netlistsvg skin file is generated:
+
+    * the legacy way that transformed every drawing command of a part unit
+      twice (once for the bounding box and once for the SVG) with no cache,
+    * in a single pass without the cache,
+    * in a single pass with an empty cache (parts connected the same way share SVG),
+    * with the SVG stored in the cache directory (like a later run),
+    * with the SVG in the memory cache (like generating the skin again).
+
+The best time of several repetitions is reported for each. The skins are checked to be the same as the legacy
+one (except for the rounding of the last digit of some numbers).
+
+Must be run from the tests directory so the part libraries listed in its
+.skidlcfg are found.
+
+Usage:
+    python benchmarks/bench_svg_symbols.py [--tool kicad9] [--copies 20] [--reps 5]
+"""
+
+import argparse
+import re
+import shutil
+import tempfile
+import time
+
+import skidl
+from skidl import KICAD, TEMPLATE, Net, Part, lib_search_paths, set_default_tool
+from skidl.config_ import SkidlConfig
+from skidl.geometry import BBox, Tx, tx_flip_y
+from skidl.tools import tool_modules
+from skidl.tools.kicad_svg_cache import SYMBOL_NAME, svg_symbol_cache
+
+
+def legacy_gen_svg_comp(gen_svg):
+    """Return a gen_svg_comp() for the tool that works the way it used to."""
+
+    def gen_svg_comp(part, symtx, net_stubs=None):
+        scale = 96 / 25.4 * 2.54
+        tx = Tx.from_symtx(symtx) * tx_flip_y * scale
+        net_stubs = net_stubs or []
+        max_stub_len = 0
+        for pin in part:
+            for net in pin.nets:
+                if net in [NC, None]:
+                    continue
+                if net in net_stubs:
+                    max_stub_len = max(len(net.name), max_stub_len)
+        svg = []
+        for unit in part.unit.values():
+            bbox = BBox()
+            for cmd in part.draw_cmds[unit.num]:
+                _, bb = gen_svg.draw_cmd_to_svg(cmd, tx, part, net_stubs, max_stub_len)
+                bbox.add(bb)
+            trans_tx = tx.move(-bbox.min)
+            bbox = BBox()
+            unit_svg = []
+            for cmd in part.draw_cmds[unit.num]:
+                s, bb = gen_svg.draw_cmd_to_svg(cmd, trans_tx, part, net_stubs, max_stub_len)
+                bbox.add(bb)
+                unit_svg.append(s)
+            if max_stub_len:
+                symbol_name = f"{part.name}_{part.ref}_{unit.num}_{symtx}"
+            else:
+                symbol_name = f"{part.name}_{unit.num}_{symtx}"
+            translate = -bbox.min
+            svg.append(
+                f'<g s:type="{symbol_name}" s:width="{bbox.w:.3f}" s:height="{bbox.h:.3f}" '
+                f'transform="translate({translate.x:.3f} {translate.y:.3f})" >\n'
+            )
+            svg.append(f'<s:alias val="{symbol_name}"/>\n')
+            svg.extend(item for item in unit_svg if "text" not in item)
+            svg.extend(item for item in unit_svg if "text" in item)
+            svg.append("</g>\n")
+        return "".join(svg)
+
+    return gen_svg_comp
+
+
+def uncached_unit_svg(tool, part, unit_num, symtx, net_stubs, symbol_name, draw_unit):
+    """Draw the SVG for a part unit without looking in the SVG symbol cache."""
+    return draw_unit().replace(SYMBOL_NAME, symbol_name)
+
+
+def build(copies):
+    """Build a circuit of parts in several orientations attached to a stubbed ground."""
+    templates = [
+        Part("Device", "R", dest=TEMPLATE),
+        Part("Device", "C", dest=TEMPLATE),
+        Part("Device", "LED", dest=TEMPLATE),
+        Part("Transistor_BJT", "Q_NPN_BCE", dest=TEMPLATE),
+        Part("Amplifier_Operational", "LM358", dest=TEMPLATE),
+    ]
+    gnd, vcc = Net("GND"), Net("VCC")
+    for i in range(copies):
+        for template in templates:
+            part = template(symtx=("", "H", "V", "R", "L")[i % 5])
+            pins = list(part)
+            pins[0] += gnd
+            pins[-1] += vcc
+    return [gnd]
+
+
+def same_svg(svg1, svg2):
+    """Return True if the SVGs only differ in the rounding of their numbers."""
+    num = re.compile(r"-?\d+\.\d+")
+    nums1, nums2 = num.findall(svg1), num.findall(svg2)
+    return (
+        num.sub("#", svg1) == num.sub("#", svg2)
+        and len(nums1) == len(nums2)
+        and all(abs(float(x) - float(y)) < 0.0015 for x, y in zip(nums1, nums2))
+    )
+
+
+def time_skin(label, net_stubs, reps, setup=lambda: None, legacy_skin=None):
+    """Generate the skin after calling setup(), print the best time it took and return the skin."""
+    elapsed = float("inf")
+    for _ in range(reps):
+        setup()
+        start = time.perf_counter()
+        skin = default_circuit.generate_netlistsvg_skin(net_stubs)
+        elapsed = min(elapsed, time.perf_counter() - start)
+    check = ""
+    if legacy_skin is not None:
+        check = "same" if same_svg(legacy_skin, skin) else "DIFFERENT"
+    print(f"{label + ':':32s}{elapsed:8.3f}s {check}")
+    return skin, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tool", default="kicad9")
+    parser.add_argument("--copies", type=int, default=20)
+    parser.add_argument("--reps", type=int, default=5)
+    args = parser.parse_args()
+
+    config = SkidlConfig(KICAD)
+    for tool in lib_search_paths:
+        lib_search_paths[tool] = config.lib_search_paths[tool]
+    set_default_tool(args.tool)
+    net_stubs = build(args.copies)
+    print(f"Skin for {len(default_circuit.parts)} {args.tool} parts.")
+
+    gen_svg = tool_modules[args.tool].gen_svg
+    gen_svg_comp = gen_svg.gen_svg_comp
+    tool_modules[args.tool].gen_svg_comp = legacy_gen_svg_comp(gen_svg)
+    legacy_skin, t_legacy = time_skin("Legacy", net_stubs, args.reps)
+    tool_modules[args.tool].gen_svg_comp = gen_svg_comp
+
+    cached_unit_svg = gen_svg.cached_unit_svg
+    gen_svg.cached_unit_svg = uncached_unit_svg
+    _, t_single = time_skin("Single pass, no cache", net_stubs, args.reps, legacy_skin=legacy_skin)
+    gen_svg.cached_unit_svg = cached_unit_svg
+
+    cache_dir = tempfile.mkdtemp()
+
+    def empty_cache():
+        shutil.rmtree(cache_dir)
+        svg_symbol_cache.clear()
+
+    skidl.config.svg_cache_dir = cache_dir
+    _, t_cold = time_skin(
+        "Single pass, empty cache", net_stubs, args.reps, empty_cache, legacy_skin
+    )
+    _, t_disk = time_skin(
+        "Cached in directory", net_stubs, args.reps, svg_symbol_cache.clear, legacy_skin
+    )
+    _, t_mem = time_skin("Cached in memory", net_stubs, args.reps, legacy_skin=legacy_skin)
+    print(
+        f"Speed-up: {t_legacy / t_single:.1f}x (no cache), {t_legacy / t_cold:.1f}x (empty cache), "
+        f"{t_legacy / t_disk:.1f}x (directory), "
+        f"{t_legacy / t_mem:.1f}x (memory)"
+    )
+    shutil.rmtree(cache_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+
+# The MIT License (MIT) - Copyright (c) Dave Vandenbout.
+
+"""
+Benchmark writing the XML netlist for a large synthetic board.
+
+Builds a board of resistors wired into a chain of nets and then writes its
+XML to a file by streaming each component and net to it and by concatenating
+all of it into one string first like the KiCad back-ends used to do. The best
+time of several repetitions and the peak memory of each are reported and the
+two files are checked to be identical (except for the date).
+
+Usage:
+    python bench_xml_stream.py [--parts 1000] [--tool kicad9] [--reps 5]
+"""
+
+import argparse
+import importlib
+import os.path
+import re
+import shutil
+import tempfile
+import time
+import tracemalloc
+
+from skidl import SKIDL, TEMPLATE, Circuit, Net, Part, Pin
+from skidl.pin import pin_types
+
+
+def legacy_gen_xml(circuit, mod, file_name):
+    """Build the XML by concatenating strings and write it to a file like generate_xml() used to do."""
+
+    def gen_xml_net(net):
+        txt = f'    <net code="{net.code}" name="{net.name}">'
+        for p in net.pins:
+            txt += f'\n      <node ref="{p.part.ref}" pin="{p.num}"/>'
+        txt += "\n    </net>"
+        return txt
+
+    scr_dict = mod.scriptinfo()
+    src_file = os.path.join(scr_dict["dir"], scr_dict["source"])
+    date = time.strftime("%m/%d/%Y %I:%M %p")
+    tool = "SKiDL (" + mod.__version__ + ")"
+    netlist = (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        + '<export version="D">\n'
+        + "  <design>\n"
+        + f"    <source>{src_file}</source>\n"
+        + f"    <date>{date}</date>\n"
+        + f"    <tool>{tool}</tool>\n"
+        + "  </design>\n"
+    )
+    netlist += "  <components>"
+    for p in circuit.parts:
+        netlist += "\n" + mod.gen_xml_comp(p)
+    netlist += "\n  </components>\n"
+    netlist += "  <nets>"
+    for code, n in enumerate(circuit.get_nets()):
+        n.code = code
+        netlist += "\n" + gen_xml_net(n)
+    netlist += "\n  </nets>\n"
+    netlist += "</export>\n"
+    with open(file_name, "w") as f:
+        f.write(netlist)
+
+
+def stream_gen_xml(circuit, mod, file_name):
+    """Stream the same XML as legacy_gen_xml() into a file."""
+
+    with open(file_name, "w") as f:
+        mod.write_xml(circuit, f)
+
+
+def build(num_parts):
+    """Build the board."""
+
+    ckt = Circuit()
+    res = Part(
+        name="R",
+        tool=SKIDL,
+        ref_prefix="R",
+        footprint="Resistor_SMD:R_0805",
+        pins=[Pin(num=1, func=pin_types.PASSIVE), Pin(num=2, func=pin_types.PASSIVE)],
+        dest=TEMPLATE,
+    )
+    parts = res(num_parts, circuit=ckt)
+    nets = [Net(circuit=ckt) for _ in range(num_parts + 1)]
+    for i, r in enumerate(parts):
+        r.tag = str(i)
+        r[1] += nets[i]
+        r[2] += nets[i + 1]
+    return ckt
+
+
+def run(gen, ckt, mod, file_name, reps):
+    """Write the XML to a file and return it along with the best time of several runs and the peak memory of another."""
+    t = float("inf")
+    for _ in range(reps):
+        start = time.perf_counter()
+        gen(ckt, mod, file_name)
+        t = min(t, time.perf_counter() - start)
+    tracemalloc.start()
+    gen(ckt, mod, file_name)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    with open(file_name) as f:
+        return f.read(), t, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--parts", type=int, default=1000)
+    parser.add_argument("--tool", default="kicad9")
+    parser.add_argument("--reps", type=int, default=5)
+    args = parser.parse_args()
+
+    ckt = build(args.parts)
+    mod = importlib.import_module(f"skidl.tools.{args.tool}.gen_xml")
+
+    file_name = os.path.join(tempfile.mkdtemp(), "bench.xml")
+    streamed, t_stream, mem_stream = run(stream_gen_xml, ckt, mod, file_name, args.reps)
+    print(f"Streamed:      {t_stream:.3f}s, peak {mem_stream / 2**20:.1f} MB.")
+
+    legacy, t_legacy, mem_legacy = run(legacy_gen_xml, ckt, mod, file_name, args.reps)
+    print(f"Concatenated:  {t_legacy:.3f}s, peak {mem_legacy / 2**20:.1f} MB.")
+
+    # Ignore the date in case the minute changed between the two files.
+    date = re.compile(r"<date>[^<]*</date>")
+    assert date.sub("", streamed) == date.sub("", legacy)
+    print(f"{len(streamed)} identical characters. Speed-up: {t_legacy / t_stream:.1f}x")
+    shutil.rmtree(os.path.dirname(file_name))
+
+
+if __name__ == "__main__":
+    main()
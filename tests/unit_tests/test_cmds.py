@@ -4,7 +4,7 @@
 
 import pytest
 
-from skidl import search
+from skidl import KICAD5, get_default_tool, search
 
 
 def test_search_1(capfd):
@@ -15,3 +15,284 @@ def test_search_1(capfd):
     # RF_Module library has different # of parts in it for various versions of KiCad.
     assert out.count("RF_Module:") in (4,6,12,14,19)
 
+
+
+def make_part_search_db(db_dir):
+    """Make a part search DB holding the Device library."""
+    from skidl.part_query import PartSearchDB, get_all_lib_files
+
+    db = PartSearchDB(db_dir=str(db_dir))
+    (device_lib,) = [f for f in get_all_lib_files() if "Device." in f]
+    db.add_lib(device_lib)
+    return db, device_lib
+
+
+def part_names(rows):
+    return sorted(r["part_name"] for r in rows)
+
+
+def test_part_search_db_fts(tmp_path):
+    """Test the full-text index finds the same parts as scanning the search text."""
+    db, device_lib = make_part_search_db(tmp_path)
+    if not db.fts:
+        pytest.skip("SQLite FTS5 with trigrams is not available.")
+
+    # Terms match anywhere in the search text, in every OR-group.
+    for query in (
+        "zener",
+        "zener small",
+        "thermistor | varistor",
+        "(thermistor | varistor) zener",
+        "led",
+        "ED_Small",
+        "ED_Small | zener",
+        '"zener diode" | r',
+    ):
+        tokens_groups = db._tokenize_query(query)
+        found = [tuple(r) for r in db._search_fts(tokens_groups)]
+        assert found and found == [tuple(r) for r in db._search_like(tokens_groups)]
+    assert {"D_Zener_Small", "LED_Small"} <= set(part_names(db._search_fts([["ED_Small"], ["zener"]])))
+
+    # Terms that are too short for the index scan every part.
+    assert db._fts_query([["zener"], ["r"]]) is None
+    assert db._fts_query([["ED_Small"]]) == '("Small")'
+
+    # Matches in the part name are ranked ahead of matches in the description.
+    assert db.search("led", limit=1)[0].part_name.startswith("LED")
+
+    # The index follows parts that are replaced or removed.
+    db.add_lib(device_lib)
+    assert part_names(db._search_fts([["zener"]])) == part_names(db._search_like([["zener"]]))
+    db.rmv_lib(device_lib)
+    assert db.search("zener") == []
+    db.close()
+
+
+def test_part_search_db_fts_rebuild(tmp_path):
+    """Test the full-text index is rebuilt for a DB that was updated without it."""
+    db, device_lib = make_part_search_db(tmp_path)
+    if not db.fts:
+        pytest.skip("SQLite FTS5 with trigrams is not available.")
+    expected = part_names(db._search_fts([["zener"]]))
+    db._cur.executescript(
+        """
+        DROP TRIGGER parts_fts_insert;
+        DROP TRIGGER parts_fts_delete;
+        DROP TRIGGER parts_fts_update;
+        DELETE FROM parts_fts;
+        """
+    )
+    assert not db._search_fts([["zener"]])
+
+    assert db._init_fts()
+    assert part_names(db._search_fts([["zener"]])) == expected
+
+    # An index of words made by an earlier version is replaced with a trigram index.
+    db._cur.executescript(
+        """
+        DROP TABLE parts_fts;
+        CREATE VIRTUAL TABLE parts_fts USING fts5(
+            part_name, aliases, description, keywords,
+            content='parts', content_rowid='id', prefix='2 3'
+        );
+        """
+    )
+    assert db._init_fts()
+    assert part_names(db._search_fts([["zener"]])) == expected
+    db.close()
+
+
+def test_part_search_db_like(tmp_path):
+    """Test searching without the full-text index."""
+    db, _ = make_part_search_db(tmp_path)
+    db.fts = False
+    parts = db.search("zener small | LED_Small")
+    assert {"D_Zener_Small", "LED_Small"} <= {p.part_name for p in parts}
+    assert len(db.search("small", limit=3)) == 3
+    db.close()
+
+
+def normalize_lib_parts(parts):
+    return sorted((name, sorted(set(aliases)), descr, kw) for name, aliases, descr, kw in parts)
+
+
+def test_scan_sch_lib():
+    """Test scanning a library file gets the same part info as loading the library."""
+    from skidl.part_query import PartSearchDB, get_all_lib_files
+    from skidl.tools import tool_modules
+
+    tool = get_default_tool()
+    scan_sch_lib = getattr(tool_modules[tool], "scan_sch_lib", None)
+    if not scan_sch_lib:
+        pytest.skip(f"There's no scanner for {tool} libraries.")
+    db = PartSearchDB.__new__(PartSearchDB)
+    for lib_file in get_all_lib_files(tool):
+        if "Device." in lib_file or "power." in lib_file:
+            abs_fn, parts = db._load_lib_parts(lib_file, tool)
+            scanned_parts = scan_sch_lib(abs_fn)
+            assert scanned_parts
+            assert normalize_lib_parts(scanned_parts) == normalize_lib_parts(parts)
+
+
+def test_scan_kicad5_sch_lib(tmp_path):
+    """Test scanning a KiCad 5 library gets the aliases and the info in the DCM file."""
+    from skidl.part_query import PartSearchDB
+    from skidl.tools import tool_modules
+
+    lib_file = tmp_path / "my_lib.lib"
+    lib_file.write_text(
+        "EESchema-LIBRARY Version 2.4\n"
+        "#encoding utf-8\n"
+        "#\n# R\n#\n"
+        "DEF R R 0 0 N Y 1 F N\n"
+        'F0 "R" 80 0 50 V V C CNN\n'
+        'F1 "R" 0 0 50 V V C CNN\n'
+        "ALIAS RES RESISTOR\n"
+        "DRAW\n"
+        "X ~ 1 0 150 50 D 50 50 1 1 P\n"
+        "X ~ 2 0 -150 50 U 50 50 1 1 P\n"
+        "ENDDRAW\n"
+        "ENDDEF\n"
+        "#\n# C\n#\n"
+        "DEF C C 0 10 N Y 1 F N\n"
+        'F0 "C" 25 100 50 H V L CNN\n'
+        "DRAW\n"
+        "X ~ 1 0 150 110 D 50 50 1 1 P\n"
+        "ENDDRAW\n"
+        "ENDDEF\n"
+        "#\n#End Library\n"
+    )
+    (tmp_path / "my_lib.dcm").write_text(
+        "EESchema-DOCLIB  Version 2.0\n"
+        "#\n$CMP R\nD Resistor\nK R res resistor\nF ~\n$ENDCMP\n"
+        "#\n$CMP C\nD Unpolarized capacitor\nK cap capacitor\n$ENDCMP\n"
+        "#\n#End Doc Library\n"
+    )
+
+    scanned_parts = tool_modules[KICAD5].scan_sch_lib(str(lib_file))
+    assert normalize_lib_parts(scanned_parts) == [
+        ("C", ["C"], "Unpolarized capacitor", "cap capacitor"),
+        ("R", ["R", "RES", "RESISTOR"], "Resistor", "R res resistor"),
+    ]
+    db = PartSearchDB.__new__(PartSearchDB)
+    _, parts = db._load_lib_parts(str(lib_file), KICAD5)
+    assert normalize_lib_parts(scanned_parts) == normalize_lib_parts(parts)
+
+
+def test_part_search_db_add_libs(tmp_path):
+    """Test adding libraries with a pool of processes stores the same parts as adding them one-by-one."""
+    from skidl.part_query import PartSearchDB, get_all_lib_files
+
+    def stored_parts(db):
+        db._cur.execute("SELECT part_name, lib_file, search_text, description, keywords FROM parts")
+        return sorted(tuple(row) for row in db._cur.fetchall())
+
+    lib_files = sorted(get_all_lib_files())[:6]
+    (tmp_path / "pool").mkdir()
+    (tmp_path / "serial").mkdir()
+    db = PartSearchDB(db_dir=str(tmp_path / "pool"))
+    db.add_libs(*lib_files, workers=3)
+    assert db._cur.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    db_serial = PartSearchDB(db_dir=str(tmp_path / "serial"))
+    for lib_file in lib_files:
+        db_serial.add_libs(lib_file, workers=1)
+    assert stored_parts(db) and stored_parts(db) == stored_parts(db_serial)
+    db.close()
+    db_serial.close()
+
+
+def write_footprint(lib_dir, name, descr, tags, pads):
+    """Write a footprint module file with some pads."""
+    pad_lines = "".join(
+        f'  (pad "{pad}" smd rect (at {i} 0) (size 1 1) (layers "F.Cu"))\n'
+        for i, pad in enumerate(pads)
+    )
+    (lib_dir / f"{name}.kicad_mod").write_text(
+        f'(footprint "{name}" (version 20221018) (generator pcbnew)\n'
+        '  (layer "F.Cu")\n'
+        f'  (descr "{descr}")\n'
+        f'  (tags "{tags}")\n'
+        f"{pad_lines})\n"
+    )
+
+
+def test_search_footprints(tmp_path, monkeypatch):
+    """Test searching footprints from the footprint search DB."""
+    import os
+    import skidl
+    from skidl import part_query
+    from skidl.part_query import FootprintSearchDB, search_footprints_iter
+
+    lib_dir = tmp_path / "MyLib.pretty"
+    lib_dir.mkdir()
+    write_footprint(lib_dir, "R_0805", "Resistor SMD 0805", "resistor", ["1", "2"])
+    write_footprint(lib_dir, "C_0805", "Capacitor SMD 0805", "capacitor", ["1", "2"])
+    write_footprint(lib_dir, "SOT-23", "SOT-23, Standard", "SOT TO_SOT_SMD", ["1", "2", "3"])
+    write_footprint(lib_dir, "QFN-16", "QFN, 16 Pin", "QFN NL", [str(i) for i in range(1, 18)])
+
+    tool = get_default_tool()
+    db = FootprintSearchDB(db_dir=str(tmp_path))
+    monkeypatch.setitem(part_query.footprint_search_dbs, tool, db)
+    monkeypatch.setitem(skidl.footprint_search_paths, tool, str(lib_dir))
+
+    scanned = []
+    scan_footprint = part_query._scan_footprint
+
+    def count_scans(lib_name, module_name, filename):
+        scanned.append(module_name)
+        return scan_footprint(lib_name, module_name, filename)
+
+    monkeypatch.setattr(part_query, "_scan_footprint", count_scans)
+
+    def search(terms):
+        return sorted(fp[3] for fp in search_footprints_iter(terms, tool) if fp[0] == "MODULE")
+
+    assert search("0805") == ["C_0805", "R_0805"]
+    assert sorted(scanned) == ["C_0805", "QFN-16", "R_0805", "SOT-23"]
+    assert search("smd resistor") == ["R_0805"]
+    assert search("#pads=2 ") == ["C_0805", "R_0805"]
+    assert search("#pads=17 qfn") == ["QFN-16"]
+    assert search("qfn|sot") == ["QFN-16", "SOT-23"]
+    assert search(r"[RC]_\d+") == ["C_0805", "R_0805"]
+    assert search('"SMD 0805" cap') == ["C_0805"]
+    assert search("inductor") == []
+
+    # The module text is read for the footprints that are found.
+    (fp,) = [fp for fp in search_footprints_iter("resistor", tool) if fp[0] == "MODULE"]
+    assert '  (descr "Resistor SMD 0805")' in fp[2]
+
+    # The trigram index doesn't change what's found.
+    for terms in ("0805", "smd resistor", "#pads=2 ", "qfn|sot", '"SMD 0805" cap', "sot-23 to_sot"):
+        with_fts = db.search(terms)
+        db.fts = False
+        assert [tuple(r) for r in db.search(terms)] == [tuple(r) for r in with_fts]
+        db.fts = True
+
+    # Only the footprint files that changed are read again in a new session.
+    scanned.clear()
+    part_query.footprint_cache.reset()
+    assert search("0805") == ["C_0805", "R_0805"]
+    assert scanned == []
+
+    write_footprint(lib_dir, "R_0805", "Resistor SMD 0805", "resistor", ["1", "2", "3"])
+    os.remove(lib_dir / "C_0805.kicad_mod")
+    mtime = os.path.getmtime(lib_dir) + 10
+    os.utime(lib_dir / "R_0805.kicad_mod", (mtime, mtime))
+    os.utime(lib_dir, (mtime, mtime))
+    part_query.footprint_cache.reset()
+    assert search("0805") == ["R_0805"]
+    assert scanned == ["R_0805"]
+    assert search("#pads=3 ") == ["R_0805", "SOT-23"]
+
+    # A footprint file that's changed in place is read again even if the
+    # modification time of the library directory stays the same.
+    scanned.clear()
+    lib_mtime = os.path.getmtime(lib_dir)
+    write_footprint(lib_dir, "SOT-23", "SOT-23, Standard", "SOT TO_SOT_SMD", ["1", "2", "3", "4"])
+    mtime += 10
+    os.utime(lib_dir / "SOT-23.kicad_mod", (mtime, mtime))
+    os.utime(lib_dir, (lib_mtime, lib_mtime))
+    part_query.footprint_cache.reset()
+    assert search("#pads=4 ") == ["SOT-23"]
+    assert scanned == ["SOT-23"]
+    db.close()
@@ -2,6 +2,8 @@
 
 # The MIT License (MIT) - Copyright (c) Dave Vandenbout.
 
+import logging
+
 import pytest
 
 import skidl
@@ -28,6 +30,26 @@ from skidl.pin import pin_types
 skidl.empty_footprint_handler = lambda part: None
 
 
+class ErcMessages(logging.Handler):
+    """Logging handler that collects the messages from the ERC logger."""
+
+    def __init__(self):
+        super().__init__()
+        self.msgs = []
+
+    def emit(self, record):
+        self.msgs.append(record.getMessage())
+
+
+@pytest.fixture
+def erc_messages():
+    """Collect the messages from the ERC logger while a test runs."""
+    handler = ErcMessages()
+    erc_logger.addHandler(handler)
+    yield handler
+    erc_logger.removeHandler(handler)
+
+
 def test_nc_1():
     """Test no-connect pins."""
     # Create a resistor part template.
@@ -348,3 +370,154 @@ def test_assert_2():
     # Run ERC and check assertions.
     ERC()
     assert len(default_circuit.erc_assertion_list) == 3
+
+
+def test_conflict_grouped_1():
+    """Test conflicts between many pins are reported once per pair of pin functions."""
+    drv = Part(
+        tool=SKIDL,
+        name="drv",
+        ref_prefix="U",
+        dest=TEMPLATE,
+        pins=[Pin(num=1, func=pin_types.OUTPUT), Pin(num=2, func=pin_types.INPUT)],
+    )
+    drvs = drv(20)
+    n = Net("N")
+    for d in drvs:
+        n += d[1], d[2]
+
+    # 190 conflicting pairs of outputs give one error.
+    ERC()
+    assert erc_logger.warning.count == 0
+    assert erc_logger.error.count == 1
+
+
+def test_conflict_grouped_2():
+    """Test a conflict matrix that depends on the order of the pins on a net."""
+    from skidl.pin import conflict_matrix
+    from skidl.skidlbaseobj import WARNING
+
+    inp = Part(tool=SKIDL, name="inp", ref_prefix="U", dest=TEMPLATE,
+               pins=[Pin(num=1, func=pin_types.INPUT)])
+    out = Part(tool=SKIDL, name="out", ref_prefix="U", dest=TEMPLATE,
+               pins=[Pin(num=1, func=pin_types.OUTPUT)])
+    n = Net("N")
+    n += inp()[1], out()[1], inp()[1]
+
+    # Only an output pin before an input pin is flagged.
+    save = conflict_matrix[pin_types.OUTPUT][pin_types.INPUT]
+    conflict_matrix[pin_types.OUTPUT][pin_types.INPUT] = [WARNING, "Backwards"]
+    try:
+        ERC()
+    finally:
+        conflict_matrix[pin_types.OUTPUT][pin_types.INPUT] = save
+    assert erc_logger.warning.count == 1
+    assert erc_logger.error.count == 0
+
+
+def test_erc_parallel_1(erc_messages):
+    """Test ERC on several threads gives the same messages as a serial ERC."""
+    drv = Part(
+        tool=SKIDL,
+        name="drv",
+        ref_prefix="U",
+        dest=TEMPLATE,
+        pins=[Pin(num=1, func=pin_types.OUTPUT), Pin(num=2, func=pin_types.INPUT)],
+    )
+    drvs = drv(40)
+    nets = [Net() for _ in range(10)]
+    for i, d in enumerate(drvs[:30]):
+        nets[i % 10] += d[1]
+        nets[(i + 3) % 10] += d[2]
+
+    ERC()
+    serial = erc_messages.msgs, erc_logger.warning.count, erc_logger.error.count
+    erc_messages.msgs = []
+    ERC(workers=4)
+    parallel = erc_messages.msgs, erc_logger.warning.count, erc_logger.error.count
+    assert serial[1] > 0 and serial[2] > 0
+    assert parallel == serial
+
+
+def test_erc_incremental_1(erc_messages):
+    """Test incremental ERC only rechecks changes and gives the same messages as a full ERC."""
+    drv = Part(
+        tool=SKIDL,
+        name="drv",
+        ref_prefix="U",
+        dest=TEMPLATE,
+        pins=[Pin(num=1, func=pin_types.OUTPUT), Pin(num=2, func=pin_types.INPUT)],
+    )
+    drvs = drv(20)
+    nets = [Net() for _ in range(6)]
+    for i, d in enumerate(drvs[:15]):
+        nets[i % 6] += d[1]
+        nets[(i + 2) % 6] += d[2]
+
+    def run(**kwargs):
+        erc_messages.msgs = []
+        ERC(**kwargs)
+        return erc_messages.msgs, erc_logger.warning.count, erc_logger.error.count
+
+    checked = []
+
+    def count_checks(obj):
+        checked.append(obj)
+
+    assert run(incremental=True) == run()
+    first = run(incremental=True)
+    for obj in nets + drvs:
+        obj.add_erc_function(count_checks)
+
+    # Nothing changed so nothing is rechecked.
+    assert run(incremental=True) == first
+    assert checked == []
+
+    # Change a connection and an attribute and only their neighborhoods are rechecked.
+    nets[0] += drvs[18][1]
+    drvs[16][2].do_erc = False
+    incr = run(incremental=True)
+    assert set(checked) == {nets[0], drvs[18], drvs[16]} | set(
+        p.part for p in nets[0].pins
+    )
+    assert incr != first
+    checked.clear()
+    assert run() == incr
+
+
+def test_erc_custom_function_incremental(monkeypatch):
+    """Test an ERC function added to a circuit isn't passed the incremental option."""
+    from skidl import Circuit
+
+    monkeypatch.setattr(Circuit, "erc_list", list(Circuit.erc_list))
+    checked = []
+
+    def my_erc(ckt):
+        checked.append(ckt)
+
+    default_circuit.add_erc_function(my_erc)
+    ERC()
+    ERC(incremental=True)
+    assert checked == [default_circuit, default_circuit]
+
+
+def test_erc_custom_function_workers(monkeypatch, erc_messages):
+    """Test an ERC function added to a circuit isn't passed the workers option."""
+    from skidl import Circuit
+
+    monkeypatch.setattr(Circuit, "erc_list", list(Circuit.erc_list))
+    checked = []
+
+    def my_erc(ckt):
+        checked.append(ckt)
+
+    default_circuit.add_erc_function(my_erc)
+    n = Net("N")
+    n += Part(tool=SKIDL, name="out", ref_prefix="U", pins=[Pin(num=1, func=pin_types.OUTPUT)])[1]
+    n += Part(tool=SKIDL, name="out", ref_prefix="U", pins=[Pin(num=1, func=pin_types.OUTPUT)])[1]
+    ERC()
+    serial = erc_messages.msgs
+    erc_messages.msgs = []
+    ERC(workers=2)
+    assert checked == [default_circuit, default_circuit]
+    assert erc_messages.msgs == serial and serial
@@ -231,3 +231,42 @@ def test_stringio():
     generate_netlist(file=output)
     print(output.getvalue())
 
+
+def test_gen_netlist_stream():
+    """Test streaming the netlist to a file gives the same netlist as generating it in memory."""
+    import io
+    import re
+
+    from simp_sexp import Sexp
+
+    from skidl.tools.kicad_netlist import write_sexp
+
+    # The writer must format S-expressions just like Sexp with quotes added.
+    sexp = ["comp", ["value", '1 "K"\nx'], ["fields", ["field", ["name", "Num"], 12]], []]
+    output = io.StringIO()
+    write_sexp(output, sexp)
+    legacy = Sexp(sexp)
+    legacy.add_quotes(lambda s: True)
+    assert output.getvalue() == legacy.to_str()
+
+    hier_circuit()
+    ntlst = generate_netlist()
+    output = io.StringIO()
+    assert generate_netlist(file=output, stream=True) is None
+    # Ignore the date in case the minute changed between the two netlists.
+    date = re.compile(r'\(date "[^"]*"\)')
+    assert date.sub("", output.getvalue()) == date.sub("", ntlst)
+
+
+def test_gen_xml_stream():
+    """Test streaming the XML to a file gives the same XML as generating it in memory."""
+    import io
+    import re
+
+    hier_circuit()
+    xml = generate_xml()
+    output = io.StringIO()
+    assert generate_xml(file_=output, stream=True) is None
+    # Ignore the date in case the minute changed between the two files.
+    date = re.compile(r"<date>[^<]*</date>")
+    assert date.sub("", output.getvalue()) == date.sub("", xml)
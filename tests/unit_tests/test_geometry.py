@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+
+# The MIT License (MIT) - Copyright (c) Dave Vandenbout.
+
+import random
+
+import pytest
+
+from skidl.geometry import BBox, BBoxIndex, Point
+
+
+def random_bbox(side, max_size):
+    pt = Point(random.uniform(-side, side), random.uniform(-side, side))
+    return BBox(pt, pt + Point(random.uniform(0, max_size), random.uniform(0, max_size)))
+
+
+def brute_force_query(bboxes, bbox):
+    return {key for key, b in bboxes.items() if bbox.intersects(b)}
+
+
+def test_bbox_index_query():
+    """Test searching a BBoxIndex finds the same boxes as checking all of them."""
+    random.seed(1)
+    bboxes = {i: random_bbox(1000, 100) for i in range(300)}
+    # Add a box that covers everything and an empty box.
+    bboxes["huge"] = BBox(Point(-5000, -5000), Point(5000, 5000))
+    bboxes["empty"] = BBox()
+    index = BBoxIndex.from_bboxes(bboxes.items())
+    assert len(index) == len(bboxes)
+    assert "huge" in index.big_keys
+    for _ in range(200):
+        bbox = random_bbox(1200, 300)
+        assert index.query(bbox) == brute_force_query(bboxes, bbox)
+    assert index.query(BBox()) == set()
+    # A zero-width box still finds the boxes it passes through.
+    line = BBox(Point(0, -1000), Point(0, 1000))
+    assert index.query(line) == brute_force_query(bboxes, line)
+
+
+def test_bbox_index_move_remove():
+    """Test moving and removing boxes in a BBoxIndex."""
+    random.seed(2)
+    bboxes = {i: random_bbox(500, 50) for i in range(100)}
+    index = BBoxIndex(50, bboxes.items())
+    for _ in range(500):
+        key = random.randrange(100)
+        bboxes[key] = random_bbox(500, 50)
+        index.move(key, bboxes[key])
+    for key in range(0, 100, 3):
+        index.remove(key)
+        del bboxes[key]
+    assert len(index) == len(bboxes)
+    for _ in range(100):
+        bbox = random_bbox(600, 100)
+        assert index.query(bbox) == brute_force_query(bboxes, bbox)
+    # No empty cells are left behind.
+    assert all(index.cells.values())
+
+
+def test_bbox_index_cell_size():
+    """Test a BBoxIndex needs grid cells with a positive size."""
+    with pytest.raises(ValueError):
+        BBoxIndex(0)
+    # Cells default to a unit size if there are no boxes to size them from.
+    assert BBoxIndex.from_bboxes([]).cell_size == 1
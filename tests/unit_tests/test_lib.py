@@ -4,6 +4,7 @@
 
 import os
 import os.path
+import struct
 
 import pytest
 from simp_sexp import Sexp
@@ -28,6 +29,7 @@ from skidl import (
 )
 from skidl.logger import active_logger
 from skidl.pin import pin_types
+from skidl.schlib import write_backup_lib
 from skidl.tools import ALL_TOOLS, lib_suffixes
 from skidl.utilities import to_list, find_and_read_file
 
@@ -78,6 +80,169 @@ def test_lib_export_1():
     assert hasattr(my_res, "name")
 
 
+def test_lib_export_binary_1():
+    """Test exporting a library to the binary SKiDL format."""
+    SchLib.reset()
+    lib = SchLib("Device")
+    lib.export("./my_device", addtl_part_attrs=["value", "search_text"], binary=True)
+    my_lib = SchLib("./my_device.sklib", tool=SKIDL)
+    assert len(my_lib.parts) == 0  # Parts are only created when they're requested.
+    my_res = Part(my_lib, "R")
+    assert len(my_lib.parts) == 1
+    res = Part(lib, "R")
+    assert [(p.num, p.name, p.func) for p in my_res.pins] == [(p.num, p.name, p.func) for p in res.pins]
+    assert my_res.description == res.description
+    assert my_res.search_text == res.search_text
+    assert hasattr(my_res, "value")
+    # All the parts are created when they're all needed.
+    assert len(lib) == len(my_lib)
+    assert active_logger.error.count == 0
+
+
+def test_lib_binary_attrs_1():
+    """Test parts made from a binary SKiDL library have all the attributes of the executed parts."""
+    import io
+    import tempfile
+
+    from skidl.part import PartUnit
+    from skidl.tools.skidl.binary_lib import BinaryLib, find_binary_lib, write_binary_lib
+
+    def part_attrs(part):
+        attrs = {
+            k: v
+            for k, v in vars(part).items()
+            if not k.startswith("_")
+            and k not in ("pins", "unit", "p", "n", "lib", "circuit")
+            and not isinstance(v, PartUnit)
+        }
+        attrs.update(name=part.name, aliases=sorted(part.aliases))
+        attrs["pins"] = [
+            {
+                **{
+                    k: v
+                    for k, v in {**pin.__dict__.get("_template", {}), **vars(pin)}.items()
+                    if not k.startswith("_") and k not in ("part", "nets")
+                },
+                "num": pin.num,
+                "name": pin.name,
+                "aliases": sorted(pin.aliases),
+            }
+            for pin in part.pins
+        ]
+        attrs["units"] = [
+            (unit.label, unit.num, sorted(unit.export_def()["pin_nums"]))
+            for unit in part.unit.values()
+        ]
+        return attrs
+
+    def check_lib(lib):
+        f = io.BytesIO()
+        write_binary_lib(lib, f, addtl_part_attrs=("search_text",), all_attrs=True)
+        with tempfile.NamedTemporaryFile(suffix=".sklib", delete=False) as bin_file:
+            bin_file.write(f.getvalue())
+        bin_lib = BinaryLib(bin_file.name)
+        for part in lib.parts:
+            assert part_attrs(bin_lib.make_part(part.name)) == part_attrs(part)
+        bin_lib.close()
+        os.remove(bin_file.name)
+
+    SchLib.reset()
+    check_lib(SchLib("Device", tool=SKIDL, use_pickle=False))
+
+    # Pins and units numbered 0, pin aliases and other part and pin attributes.
+    lib = SchLib(tool=SKIDL)
+    lib += Part(
+        name="ODD",
+        tool=SKIDL,
+        dest=TEMPLATE,
+        pins=[
+            Pin(num=0, name="A", unit=0, aliases=["in", "a0"], func=Pin.types.INPUT, x=1.5),
+            Pin(num=1, name="", unit=1, stub=True),
+        ],
+        sim={"model": "odd", "params": [1, 2.5, None]},
+        weight=0.25,
+    )
+    check_lib(lib)
+
+    # The PySpice parts have attributes holding functions that can't be stored,
+    # so the library is executed each time instead.
+    SchLib.reset()
+    pyspice_lib = SchLib("pyspice", tool=SKIDL)
+    with pytest.raises(TypeError):
+        write_binary_lib(pyspice_lib, io.BytesIO(), all_attrs=True)
+    assert find_binary_lib(pyspice_lib.filepath) is None
+    res = Part(pyspice_lib, "R")
+    assert "kw" in res.pyspice
+    assert sorted(res.pins[0].aliases) == ["+", "A", "anode", "p1", "plus"]
+    assert active_logger.error.count == 0
+
+
+def test_lib_binary_use_pickle_1():
+    """Test a binary version of a SKiDL library isn't cached if use_pickle is false."""
+    from skidl.tools.skidl.binary_lib import cached_binary_lib_filename
+
+    SchLib.reset()
+    lib = SchLib("Device", tool=SKIDL, use_pickle=False)
+    bin_filename = cached_binary_lib_filename(lib.filepath)
+    if os.path.exists(bin_filename):
+        os.remove(bin_filename)
+    SchLib.reset()
+    lib = SchLib("Device", tool=SKIDL, use_pickle=False)
+    assert not os.path.exists(bin_filename)
+    assert len(lib.parts) > 0  # The library was executed.
+    SchLib.reset()
+    lib = SchLib("Device", tool=SKIDL)
+    assert os.path.exists(bin_filename)
+    assert len(lib.parts) == 0  # Parts come from the binary library when requested.
+
+
+def test_lib_binary_pin_fields_1(tmp_path, monkeypatch):
+    """Test pins with names and units that don't fit a binary pin record are cached and loaded."""
+    from skidl.tools.skidl.binary_lib import cached_binary_lib_filename
+
+    (tmp_path / "odd_pins_sklib.py").write_text(
+        "from skidl import Pin, Part, SchLib, SKIDL, TEMPLATE\n"
+        "odd_pins = SchLib(tool=SKIDL).add_parts(*[\n"
+        "    Part(name='ODD', dest=TEMPLATE, tool=SKIDL, pins=[\n"
+        "        Pin(num='1', name='A1', unit='A'),\n"
+        "        Pin(num=2, name=2**40, unit=-1),\n"
+        "    ])\n"
+        "])\n"
+    )
+    monkeypatch.setattr(skidl.config, "pickle_dir", str(tmp_path / "pickles"))
+    lib_file = str(tmp_path / "odd_pins_sklib.py")
+
+    def pin_fields(lib):
+        return sorted(
+            (str(pin.num), pin.num, pin.name, pin.unit)
+            for pin in lib["ODD"].pins
+        )
+
+    SchLib.reset()
+    executed = pin_fields(SchLib(lib_file, tool=SKIDL))
+    assert os.path.exists(cached_binary_lib_filename(lib_file))
+    SchLib.reset()
+    lib = SchLib(lib_file, tool=SKIDL)
+    assert len(lib.parts) == 0  # Parts come from the binary library when requested.
+    assert pin_fields(lib) == executed == [
+        ("1", "1", "A1", "A"),
+        ("2", "2", 2**40, -1),
+    ]
+
+    # The executed library is used if the binary library can't be written.
+    from skidl.tools.skidl import binary_lib
+
+    def fail_to_write(*args, **kwargs):
+        raise struct.error("can't pack")
+
+    monkeypatch.setattr(binary_lib, "write_binary_lib", fail_to_write)
+    monkeypatch.setattr(skidl.config, "pickle_dir", str(tmp_path / "other_pickles"))
+    SchLib.reset()
+    assert pin_fields(SchLib(lib_file, tool=SKIDL)) == executed
+    assert not os.path.exists(cached_binary_lib_filename(lib_file))
+    SchLib.reset()
+
+
 def test_lib_creation_1():
     """Test creating a library."""
     # Reset the library.
@@ -115,6 +280,49 @@ def test_lib_creation_1():
     assert len(lib["QQ"].pins) == 2
 
 
+def test_lib_creation_2():
+    """Test name lookups in a library as parts are added without copying."""
+    lib = SchLib()
+    prt1 = SkidlPart(name="Q", dest=TEMPLATE)
+    lib.add_parts(prt1, copy=False)
+    assert lib.parts[0] is prt1  # Part was stored without copying it.
+    assert prt1.lib is lib
+    # Duplicates are found regardless of case.
+    lib.add_parts(SkidlPart(name="q", dest=TEMPLATE), copy=False)
+    assert len(lib.parts) == 1
+    # Aliases added after the part is in the library are found.
+    prt1.aliases += "TRANSISTOR"
+    assert lib["TRANSISTOR"] is prt1
+    # Parts appended directly to the list of parts are found.
+    prt2 = SkidlPart(name="QQ", dest=TEMPLATE)
+    lib.parts.append(prt2)
+    assert lib["QQ"] is prt2
+
+
+# Skip this test for KiCad 5 since its libraries can't be loaded lazily.
+@pytest.mark.skipif(os.environ.get('SKIDL_TOOL', '')=='KICAD5', reason="Lazy loading not available in KiCad 5")
+def test_lib_lazy_1():
+    """Test loading parts from a library only when they're requested."""
+    SchLib.reset()
+    eager_lib = SchLib("4xxx", use_pickle=False)
+    SchLib.reset()
+    lazy_lib = SchLib("4xxx", lazy=True)
+    assert len(lazy_lib.parts) == 0  # Nothing is loaded until requested.
+    # Index of part locations in the library file is stored with the pickle files.
+    assert any(fn.startswith("4xxx_") and fn.endswith(".idx") for fn in os.listdir(skidl.config.pickle_dir))
+    # Get a part that extends another part.
+    part = lazy_lib["4528"]
+    assert {p.name for p in lazy_lib.parts} == {"4528", "4538"}
+    eager_part = eager_lib["4528"]
+    assert [(p.num, p.name, p.func) for p in part.pins] == [(p.num, p.name, p.func) for p in eager_part.pins]
+    assert part.description == eager_part.description
+    # Lazy library is fully loaded when all the parts are needed.
+    assert [p.name for p in lazy_lib] == [p.name for p in eager_lib]
+    # Reloading the library uses the stored index.
+    SchLib.reset()
+    assert len(SchLib("4xxx", lazy=True)["4528"].pins) == len(eager_part.pins)
+
+
 def test_backup_1():
     """Test creating a backup parts library."""
     # Reset the library.
@@ -181,6 +389,42 @@ def test_backup_3():
     generate_netlist()
 
 
+def test_backup_4():
+    """Test that the backup parts library is only rewritten when parts change."""
+    # Reset the library.
+    SchLib.reset()
+    # Create parts.
+    a = Part("Device", "R", footprint="null")
+    b = Part("Device", "C", footprint="null")
+    a & b
+    lib_file = skidl.config.backup_lib_file_name
+    # The first backup writes the library file.
+    assert write_backup_lib(default_circuit.parts, "backup", lib_file)
+    with open(lib_file, encoding="utf-8") as f:
+        text_1 = f.read()
+    # Nothing changed so the library file is left alone.
+    assert not write_backup_lib(default_circuit.parts, "backup", lib_file)
+    # Changing the footprint of a part causes the library to be rewritten.
+    b.footprint = "Capacitor_SMD:C_0805_2012Metric"
+    assert write_backup_lib(default_circuit.parts, "backup", lib_file)
+    with open(lib_file, encoding="utf-8") as f:
+        text_2 = f.read()
+    assert text_1 != text_2
+    # The rewritten library still loads with the changed part.
+    glb = {}
+    exec(text_2, glb)
+    backup = glb["backup"]
+    assert len(backup) == 2
+    assert backup["C"].footprint == "Capacitor_SMD:C_0805_2012Metric"
+    # Non-ASCII text is stored as UTF-8 and read back the same way, so it
+    # doesn't cause the library to be rewritten.
+    b.description = "Condensateur 10µF, ±10%"
+    assert write_backup_lib(default_circuit.parts, "backup", lib_file)
+    assert not write_backup_lib(default_circuit.parts, "backup", lib_file)
+    with open(lib_file, encoding="utf-8") as f:
+        assert "10µF, ±10%" in f.read()
+
+
 def test_lib_1():
     """Test library import and export."""
     # Reset the library.
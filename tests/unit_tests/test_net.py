@@ -4,7 +4,7 @@
 
 import pytest
 
-from skidl import Net, NetClass, Part, Pin, SubCircuit
+from skidl import SKIDL, Net, NetClass, Part, Pin, SubCircuit
 
 
 def test_nets_1():
@@ -192,3 +192,70 @@ def test_drive_2():
     assert n2.drive == 5  # Drive strength should be 5.
     n1.drive = 7  # Update drive strength.
     assert n2.drive == 7  # Drive strength should be updated.
+
+
+def test_connectivity_1():
+    """Test connectivity of multi-segment nets as pins are added and removed."""
+    r = Part(tool=SKIDL, name="R", ref_prefix="R", pins=[Pin(num=1), Pin(num=2)])
+    n1, n2, n3 = Net("a"), Net("b"), Net("c")
+    n1 += r[1]
+    n2 += r[1]  # Joins n1 and n2 through pin 1.
+    n3 += r[2]
+    assert n1.is_attached(n2)
+    assert not n1.is_attached(n3)
+    assert set(n2.nets) == {n1, n2}
+    n3 += n2  # Joins all three nets.
+    assert n1.is_attached(n3)
+    assert len(n1.pins) == 2
+    r[1].disconnect()  # Splits n1 and n2 apart, but n2 is still joined to n3.
+    assert not n1.is_attached(n2)
+    assert n2.is_attached(n3)
+    assert n1.pins == []
+    assert n2.pins == [r[2]]
+    assert r[2].is_attached(n2)
+    assert not r[2].is_attached(n1)
+
+
+def test_connectivity_2():
+    """Test connectivity of pinless nets joined together."""
+    n1, n2, n3 = Net(), Net(), Net()
+    n1 += n2
+    assert n1.is_attached(n2)
+    assert not n1.is_attached(n3)
+    assert len(n1.pins) == 0  # The phantom pin tying the nets isn't reported.
+    n2 += n3
+    assert set(n3.nets) == {n1, n2, n3}
+
+
+def test_distinct_nets_1():
+    """Test the distinct nets of a circuit are updated as connections change."""
+    r = Part(tool=SKIDL, name="R", ref_prefix="R", pins=[Pin(num=1), Pin(num=2)])
+    n1, n2, n3 = Net("a"), Net("b"), Net("c")
+    n1 += r[1]
+    n2 += r[2]
+    assert default_circuit.get_nets() == [n1, n2]
+    n3 += r[1]  # Joins n3 to n1.
+    assert default_circuit.get_nets() == [n1, n2]
+    n2 += n1  # Joins all the nets.
+    assert default_circuit.get_nets() == [n1]
+    r[1].disconnect()
+    r[2].disconnect()
+    assert default_circuit.get_nets() == []
+    n4 = Net("d")
+    n4 += r[1]
+    assert default_circuit.get_nets() == [n4]
+
+
+def test_net_get_renamed_1():
+    """Test getting nets by name and alias as they are renamed and removed."""
+    n1, n2 = Net("a"), Net("b")
+    n2.aliases += "clk"
+    assert Net.get("A") is n1  # Names are matched without regard to case.
+    assert Net.get("CLK") is n2
+    n1.name = "data"
+    assert Net.get("a") is None
+    assert Net.get("data") is n1
+    n2.aliases -= "clk"
+    assert Net.get("clk") is None
+    default_circuit.rmv_nets(n1)
+    assert Net.get("data") is None
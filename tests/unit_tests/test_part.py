@@ -529,3 +529,90 @@ def test_create_pins_empty_connections():
     initial_error_count = active_logger.error.count
     part.create_pins("EMPTY", 2, [])
     assert active_logger.error.count == initial_error_count + 1
+
+
+def test_pin_index_updates_1():
+    """Test pin lookups follow renamed, renumbered, swapped, added and removed pins."""
+    from skidl import SKIDL, Pin
+
+    u = Part(
+        tool=SKIDL,
+        name="U",
+        ref_prefix="U",
+        pins=[Pin(num=1, name="A"), Pin(num=2, name="B"), Pin(num=3, name="C")],
+    )
+    assert u["a"] is u[1]  # Name lookups ignore case.
+    u.rename_pin("A", "CLK")
+    assert u["CLK"] is u[1]
+    assert u.get_pins("A", silent=True) is None
+    u[2].name = "DATA"  # Rename without using the part.
+    assert u.DATA is u[2]
+    u.renumber_pin("C", 7)
+    assert u["C"] is u[7]
+    assert u.get_pins(3, silent=True) is None
+    clk, data = u[1], u[2]
+    u.swap_pins(1, 2)  # Pins exchange their numbers and names.
+    assert u[1] is data and u["CLK"] is data
+    assert u[2] is clk and u["DATA"] is clk
+    u += Pin(num=8, name="EN")
+    assert u.EN is u[8]
+    assert len(u[1:8]) == 4  # Slices include the new maximum pin number.
+    u.rmv_pins("EN")
+    assert u.get_pins("EN", silent=True) is None
+
+
+def test_pin_index_updates_2():
+    """Test pin lookups in part copies and units after pins are renamed."""
+    from skidl import SKIDL, Pin
+
+    u1 = Part(
+        tool=SKIDL,
+        name="U",
+        ref_prefix="U",
+        pins=[Pin(num=1, name="A"), Pin(num=2, name="B")],
+    )
+    assert u1["A"] is u1[1]
+    u2 = u1.copy()
+    assert u2["A"] is not u1["A"]  # Copy must not reuse the pins of the original.
+    assert u2["A"] is u2[1]
+    u2.make_unit("X", 1)
+    assert u2.X["A"] is u2[1]
+    u2[1].name = "Z"
+    assert u2.X["Z"] is u2[1]
+    assert u2.X.get_pins("A", silent=True) is None
+    assert u1["A"] is u1[1]
+
+
+def test_part_get_renamed_1():
+    """Test getting parts by reference and alias after they change."""
+    from skidl import SKIDL, Pin
+
+    r = Part(tool=SKIDL, name="R", ref_prefix="R", pins=[Pin(num=1), Pin(num=2)])
+    assert Part.get("r1") is r
+    r.ref = "RX"
+    assert Part.get("R1") is None
+    assert Part.get("RX") is r
+    r.aliases += "pullup"
+    assert Part.get("PULLUP") is r
+
+
+def test_part_copy_batch_1():
+    """Test making an array of part copies in one call."""
+    from skidl import TEMPLATE
+
+    vcc, gnd = Net("VCC"), Net("GND")
+    c = Part("Device", "C", dest=TEMPLATE)
+    c1 = c()
+    c1[1, 2] += vcc, gnd
+    caps = c1(10, value=["{}nF".format(i) for i in range(10)])
+    assert [cap.ref for cap in caps] == ["C{}".format(i) for i in range(2, 12)]
+    assert [cap.value for cap in caps] == ["{}nF".format(i) for i in range(10)]
+    assert len(vcc) == len(gnd) == 11  # Copies are connected like the original.
+    assert all(cap[1].part is cap and cap[1].net is vcc for cap in caps)
+    assert all(cap.uA is cap for cap in caps)  # Parts that are units of themselves.
+    assert all(cap.lib is c.lib for cap in caps)  # The library is shared.
+    assert len({id(cap.skidl_trace) for cap in caps}) == 1  # One trace for all.
+    assert default_circuit.active_node.parts[-10:] == caps
+    tmplts = c1(3, dest=TEMPLATE)
+    assert all(tmplt.circuit is None and not tmplt.is_connected() for tmplt in tmplts)
+    assert len(vcc) == 11
@@ -4,7 +4,7 @@
 
 import pytest
 
-from skidl import Part, Pin
+from skidl import TEMPLATE, Part, Pin
 from skidl.pin import pin_types
 
 
@@ -88,3 +88,42 @@ def test_pin_search_1():
     assert len(bidir) == 16  # Check bidirectional pin count.
     assert len(pwrin) == 4  # Check power input pin count.
     assert len(bidir) + len(pwrin) + len(input) + len(passive) + len(nc) == len(mem)  # Check total pin count.
+
+
+def test_pin_template_1():
+    """Test copies of pins share a template of attributes copy-on-write."""
+    r = Part("Device", "R", dest=TEMPLATE)
+    r1, r2 = r(2)
+    p1, p2 = r1[1], r2[1]
+    assert p1.__dict__["_template"] is p2.__dict__["_template"]  # Shared template.
+    assert "func" not in p1.__dict__  # Static attributes aren't stored per pin.
+    assert p1.func == p2.func == pin_types.PASSIVE
+    assert p1.part is r1 and p2.part is r2  # Each copy has its own part.
+    assert r1.p1 is p1 and r2.p1 is p2  # Aliases found without copying them.
+    assert "_aliases" not in p1.__dict__
+    p1.func = pin_types.INPUT  # Override the template for one pin.
+    assert p1.func == pin_types.INPUT and p2.func == pin_types.PASSIVE
+    p1.aliases += "IN"  # Aliases are copied before being changed.
+    assert "IN" in p1.aliases and "IN" not in p2.aliases
+    assert r1.IN is p1
+    del p2.stub  # Deleting an attribute detaches the pin from the template.
+    assert "_template" not in p2.__dict__
+    assert not hasattr(p2, "stub") and p1.stub is False
+    assert p2.num == "1" and p2.func == pin_types.PASSIVE
+
+
+def test_pin_template_2():
+    """Test the numbers and number aliases of pin copies."""
+    # Copies of a pin created without a number get its random number, like before templates.
+    pin = Pin(name="a")
+    cpy = pin.copy()
+    assert cpy.num == pin.num
+    assert sorted(cpy.aliases) == sorted(pin.aliases) == ["a", f"p{pin.num}"]
+
+    # Copies get the alias for their number even if the pin aliases were replaced.
+    pin = Pin(num=1, name="p", aliases=["+", "plus"])
+    assert sorted(pin.aliases) == ["+", "plus"]
+    cpy1, cpy2 = pin.copy(2)
+    assert cpy1.__dict__["_template"] is cpy2.__dict__["_template"]
+    assert sorted(cpy1.aliases) == sorted(cpy2.aliases) == ["+", "p1", "plus"]
+    assert sorted(pin.aliases) == ["+", "plus"]
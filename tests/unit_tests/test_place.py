@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+
+# The MIT License (MIT) - Copyright (c) Dave Vandenbout.
+
+import functools
+import random
+from collections import defaultdict
+
+import pytest
+
+from skidl import Pin
+from skidl.geometry import BBox, BBoxIndex, Point, Tx
+from skidl.schematics.place import (
+    get_array_forces,
+    overlap_force,
+    push_and_pull,
+    random_placement,
+    total_part_force,
+    total_similarity_force,
+)
+
+
+class Block:
+    """Rectangular stand-in for a part being placed."""
+
+    def __init__(self, w, h, tx):
+        self.place_bbox = BBox(Point(0, 0), Point(w, h))
+        self.tx = tx
+        self.anchor_pins = defaultdict(list)
+        self.pull_pins = defaultdict(list)
+
+    def add_pin(self):
+        pin = Pin()
+        pin.part = self
+        pin.place_pt = Point(
+            random.uniform(0, self.place_bbox.max.x),
+            random.uniform(0, self.place_bbox.max.y),
+        )
+        return pin
+
+
+def make_blocks(num_blocks, num_nets):
+    """Make rotated/flipped blocks that overlap and connect them with nets."""
+    random.seed(1)
+    txs = [Tx(), Tx().rot_90cw(), Tx().flip_x(), Tx().rot_90cw().flip_y()]
+    blocks = [
+        Block(
+            random.randint(20, 80),
+            random.randint(20, 80),
+            random.choice(txs).move(Point(random.uniform(0, 200), random.uniform(0, 200))),
+        )
+        for _ in range(num_blocks)
+    ]
+    for net in range(num_nets):
+        net_blocks = random.sample(blocks, random.randint(2, 4))
+        for blk in net_blocks:
+            for _ in range(random.randint(1, 2)):
+                pin = blk.add_pin()
+                blk.anchor_pins[net].append(pin)
+                for other_blk in net_blocks:
+                    if other_blk is not blk:
+                        other_blk.pull_pins[net].append(pin)
+    return blocks
+
+
+def assert_same_forces(array_forces, force_func, parts, mobile_parts, scale, alpha, **options):
+    forces = array_forces.forces(scale, alpha)
+    for force, part in zip(forces, mobile_parts):
+        expected = force_func(part, parts, scale=scale, alpha=alpha, **options)
+        assert force == pytest.approx((expected.x, expected.y), abs=1e-6)
+
+
+def test_array_net_forces(monkeypatch):
+    """Test the vectorized net and overlap forces match those computed part-by-part."""
+    np = pytest.importorskip("numpy")
+    options = {"vectorize_forces": True, "pt_to_pt_mult": 5, "pin_normalize": True, "net_normalize": True}
+    parts = make_blocks(30, 25)
+    mobile_parts = parts[5:]
+    array_forces = get_array_forces(parts, mobile_parts, total_part_force, **options)
+    assert_same_forces(array_forces, total_part_force, parts, mobile_parts, 2.0, 0, **options)
+
+    # Remove the random offsets from the overlap forces so they can be compared.
+    array_forces.rng = type("Rng", (), {"random": lambda self, size: np.full(size, 0.5)})()
+    monkeypatch.setattr(random, "random", lambda: 0.5)
+    assert_same_forces(array_forces, overlap_force, parts, mobile_parts, 1, 1)
+    assert np.any(array_forces.repulsive_forces())
+
+
+def test_overlap_force_bbox_index(monkeypatch):
+    """Test the overlap forces found with a BBoxIndex of the parts match checking all the parts."""
+    parts = make_blocks(30, 0)
+    bbox_index = BBoxIndex.from_bboxes((part, part.place_bbox * part.tx) for part in parts)
+    monkeypatch.setattr(random, "random", lambda: 0.5)
+    for part in parts:
+        force = overlap_force(part, parts)
+        indexed_force = overlap_force(part, parts, bbox_index=bbox_index)
+        assert (indexed_force.x, indexed_force.y) == pytest.approx((force.x, force.y))
+
+
+def test_array_similarity_forces():
+    """Test the vectorized similarity forces match those computed part-by-part."""
+    pytest.importorskip("numpy")
+    parts = make_blocks(20, 0)
+    similarity = defaultdict(lambda: defaultdict(lambda: 0))
+    all_pull_pins = []
+    for part in parts:
+        anchor_pin = part.add_pin()
+        part.anchor_pins["similarity"] = [anchor_pin]
+        part.pull_pins["similarity"] = all_pull_pins
+        all_pull_pins.append(anchor_pin)
+        for other_part in parts:
+            if other_part is not part:
+                similarity[part][other_part] = random.random()
+    force_func = functools.partial(total_similarity_force, similarity=similarity)
+    array_forces = get_array_forces(parts, parts, force_func, vectorize_forces=True)
+    assert_same_forces(array_forces, force_func, parts, parts, 0.3, 0)
+
+
+def test_array_push_and_pull():
+    """Test placement with vectorized forces pulls parts together and clears overlaps."""
+    pytest.importorskip("numpy")
+    parts = make_blocks(15, 20)
+    random_placement(parts)
+    push_and_pull([], parts, [], total_part_force, use_push_pull=True, vectorize_forces=True)
+    bboxes = [part.place_bbox * part.tx for part in parts]
+    overlaps = [
+        bbox.intersection(other_bbox)
+        for i, bbox in enumerate(bboxes)
+        for other_bbox in bboxes[i + 1 :]
+    ]
+    assert sum(overlap.area for overlap in overlaps if overlap) < sum(bbox.area for bbox in bboxes) / 10
+    assert all(isinstance(part.tx.dx, float) for part in parts)
@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+
+# The MIT License (MIT) - Copyright (c) Dave Vandenbout.
+
+import heapq
+import multiprocessing
+import random
+from collections import defaultdict
+from types import SimpleNamespace
+
+import pytest
+
+from skidl.geometry import BBox, Point
+from skidl.schematics.route import (
+    GlobalRoutingFailure,
+    RoutePool,
+    Router,
+    RoutingFailure,
+    SwitchBox,
+)
+
+
+class StubFace:
+    """Point-sized stand-in for a switchbox face."""
+
+    def __init__(self, x, y, capacity=1):
+        self.pt = Point(x, y)
+        self.bbox = BBox(self.pt)
+        self.capacity = capacity
+        self.adjacent = []
+        self.pins = []
+
+    def connect(self, other):
+        dist = abs(self.pt.x - other.pt.x) + abs(self.pt.y - other.pt.y)
+        self.adjacent.append(SimpleNamespace(face=other, dist=dist))
+        other.adjacent.append(SimpleNamespace(face=self, dist=dist))
+
+
+class StubNode:
+    """Node with the pins of each net on a pin face."""
+
+    def __init__(self, net_faces):
+        self.net_pins = {
+            net: [SimpleNamespace(face=face, route_pt=face.pt) for face in faces]
+            for net, faces in net_faces.items()
+        }
+
+    def get_internal_pins(self, net):
+        return self.net_pins[net]
+
+
+class StubNet:
+    """Net with a name and a couple of pins."""
+
+    def __init__(self, name):
+        self.name = name
+        self.pins = [None, None]
+
+
+def wire_length(wire):
+    return sum(
+        abs(f1.pt.x - f2.pt.x) + abs(f1.pt.y - f2.pt.y) for f1, f2 in zip(wire, wire[1:])
+    )
+
+
+def shortest_dist(start_face, stop_face):
+    """Find the shortest distance thru faces with routing capacity by checking every path."""
+    dists = {start_face: 0}
+    frontier = [(0, id(start_face), start_face)]
+    while frontier:
+        dist, _, face = heapq.heappop(frontier)
+        if face is stop_face:
+            return dist
+        for adj in face.adjacent:
+            adj_dist = dist + adj.dist
+            if adj.face is not stop_face and adj.face.capacity <= 0:
+                continue
+            if adj_dist < dists.get(adj.face, float("inf")):
+                dists[adj.face] = adj_dist
+                heapq.heappush(frontier, (adj_dist, id(adj.face), adj.face))
+
+
+def test_global_router_shortest_path():
+    """Test the global router finds the shortest path around faces without routing capacity."""
+    random.seed(1)
+    grid = [
+        [StubFace(x * 10, y * 10, random.choice((0, 1, 1, 1))) for x in range(20)]
+        for y in range(20)
+    ]
+    for y, row in enumerate(grid):
+        for x, face in enumerate(row):
+            if x:
+                face.connect(row[x - 1])
+            if y:
+                face.connect(grid[y - 1][x])
+    for _ in range(20):
+        start_face, stop_face = random.sample([face for row in grid for face in row], 2)
+        net = StubNet("N")
+        node = StubNode({net: [start_face, stop_face]})
+        expected = shortest_dist(start_face, stop_face)
+        if expected is None:
+            with pytest.raises(GlobalRoutingFailure):
+                Router.global_router(node, [net])
+            continue
+        saved_capacities = {face: face.capacity for row in grid for face in row}
+        (route,) = Router.global_router(node, [net])
+        wire = route[0]
+        assert {wire[0], wire[-1]} == {start_face, stop_face}
+        assert wire_length(wire) == expected
+        # Put back the routing capacity used by the wire.
+        for face, capacity in saved_capacities.items():
+            face.capacity = capacity
+
+
+def test_global_router_rip_up_reroute():
+    """Test a net blocked by the route of another net is routed after ripping-up the other net."""
+
+    def make_faces():
+        # Net A goes straight thru the shared face or around it. Net B can only go thru it.
+        shared = StubFace(0, 0)
+        a1, a2 = StubFace(-10, 0, 0), StubFace(10, 0, 0)
+        b1, b2 = StubFace(0, -30, 0), StubFace(0, 30, 0)
+        detour1, detour2 = StubFace(-10, 10), StubFace(10, 10)
+        for face in (a1, a2, b1, b2):
+            face.connect(shared)
+        a1.connect(detour1)
+        detour1.connect(detour2)
+        detour2.connect(a2)
+        net_a, net_b = StubNet("A"), StubNet("B")
+        node = StubNode({net_a: [a1, a2], net_b: [b1, b2]})
+        return node, net_a, net_b, shared
+
+    # Net A has the smaller bounding box, so it's routed first and takes the shared face.
+    node, net_a, net_b, shared = make_faces()
+    with pytest.raises(GlobalRoutingFailure):
+        Router.global_router(node, [net_b, net_a])
+
+    node, net_a, net_b, shared = make_faces()
+    route_a, route_b = Router.global_router(node, [net_b, net_a], rip_up_reroute=True)
+    assert route_a[0].net is net_a and route_b[0].net is net_b
+    assert shared in route_b[0] and shared not in route_a[0]
+    assert wire_length(route_a[0]) == 40
+    assert shared.capacity == 0
+
+
+def make_switchbox(nets, num_tracks, num_columns):
+    """Make a switchbox with random nets on its sides."""
+
+    def face(coord):
+        return SimpleNamespace(track=SimpleNamespace(coord=coord), has_nets=lambda: True)
+
+    def side_nets(length):
+        side = [random.choice(nets + [None, None]) for _ in range(length)]
+        side[0] = side[-1] = None
+        return side
+
+    swbx = SwitchBox.__new__(SwitchBox)
+    swbx.track_coords = [10 * i for i in range(num_tracks)]
+    swbx.column_coords = [10 * (i + 1) for i in range(num_columns)]
+    swbx.top_face = face(swbx.track_coords[-1])
+    swbx.bottom_face = face(0)
+    swbx.left_face = face(0)
+    swbx.right_face = face(10 * (num_columns + 1))
+    swbx.left_nets = side_nets(num_tracks)
+    swbx.right_nets = side_nets(num_tracks)
+    swbx.top_nets = side_nets(num_columns)
+    swbx.bottom_nets = side_nets(num_columns)
+    swbx.segments = defaultdict(list)
+    return swbx
+
+
+def segment_coords(segments):
+    return {
+        net: [(seg.p1.x, seg.p1.y, seg.p2.x, seg.p2.y) for seg in segs]
+        for net, segs in segments.items()
+    }
+
+
+@pytest.mark.skipif(
+    (multiprocessing.get_start_method(allow_none=True) or multiprocessing.get_all_start_methods()[0])
+    != "fork",
+    reason="Needs processes forked by default.",
+)
+def test_route_pool_switchboxes():
+    """Test switchboxes routed in parallel get the same wiring as routing them one-by-one."""
+    nets = [StubNet(name) for name in "ABCDE"]
+
+    def make_switchboxes():
+        random.seed(3)
+        switchboxes = []
+        while len(switchboxes) < 40:
+            swbx = make_switchbox(nets, random.randint(4, 8), random.randint(3, 8))
+            try:
+                swbx.detach({}).route_or_flip()
+            except RoutingFailure:
+                continue
+            switchboxes.append(swbx)
+        return switchboxes
+
+    # Route the switchboxes one-by-one and on the pool with the switchbox router.
+    serial_node = SimpleNamespace(wires=defaultdict(list))
+    serial_swbxs = make_switchboxes()
+    Router.switchbox_router(serial_node, serial_swbxs)
+
+    pooled_node = SimpleNamespace(wires=defaultdict(list))
+    pooled_swbxs = make_switchboxes()
+    with RoutePool(None, 2) as route_pool:
+        Router.switchbox_router(pooled_node, pooled_swbxs, route_pool=route_pool)
+
+    assert segment_coords(pooled_node.wires) == segment_coords(serial_node.wires)
+    assert [segment_coords(swbx.segments) for swbx in pooled_swbxs] == [
+        segment_coords(swbx.segments) for swbx in serial_swbxs
+    ]
+    assert all(swbx.segments for swbx in serial_swbxs)
+
+
+def test_route_pool_create(monkeypatch):
+    """Test a routing pool is only made where processes are forked by default."""
+    monkeypatch.setattr(multiprocessing, "get_start_method", lambda allow_none=False: None)
+    monkeypatch.setattr(multiprocessing, "get_all_start_methods", lambda: ["spawn", "fork"])
+    assert RoutePool.create(None, 2) is None
+
+    monkeypatch.setattr(multiprocessing, "get_all_start_methods", lambda: ["fork", "spawn"])
+    with RoutePool.create(None, 2) as route_pool:
+        assert isinstance(route_pool, RoutePool)
+
+
+def test_route_workers_none():
+    """Test routing with route_workers=None is done serially."""
+
+    class Routed(Exception):
+        pass
+
+    def rmv_routing_stuff():
+        raise Routed
+
+    node = SimpleNamespace(rmv_routing_stuff=rmv_routing_stuff)
+    with pytest.raises(Routed):
+        Router.route(node, route_workers=None)
@@ -45,6 +45,7 @@ sch_options["retries"] = 3
 # sch_options["compress_before_place"] = True
 # sch_options["use_optimizer"] = True
 # sch_options["use_push_pull"] = True
+# sch_options["vectorize_forces"] = True
 # sch_options["allow_jumps"] = True
 # sch_options["align_parts"] = True
 # sch_options["remove_overlaps"] = True
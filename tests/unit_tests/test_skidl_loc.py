@@ -2,9 +2,13 @@
 
 # The MIT License (MIT) - Copyright (c) Dave Vandenbout.
 
+import os
+import pickle
+
 import pytest
 
-from skidl import TEMPLATE, Part, generate_netlist
+import skidl
+from skidl import TEMPLATE, Net, Part, generate_netlist
 
 
 def test_skidl_loc():
@@ -20,3 +24,19 @@ def test_skidl_loc():
     
     # Generate the netlist.
     generate_netlist()
+
+
+def test_skidl_loc_trace():
+    """Test recording where objects are created and turning it off."""
+    n1 = Net()
+    path, line = n1.skidl_trace[-1]
+    assert path == os.path.abspath(__file__)
+    assert n1.src_line(True) == path + ":" + line
+    # Traces survive pickling.
+    assert pickle.loads(pickle.dumps(n1.skidl_trace))[-1] == (path, line)
+    skidl.config.record_trace = False
+    try:
+        n2 = Net()
+    finally:
+        skidl.config.record_trace = True
+    assert n2.src_line(True) == ""
@@ -231,6 +231,55 @@ def test_hierarchical_names_3():
         pass  # Expected exception for duplicate hierarchical name.
 
 
+def test_hierarchical_names_4():
+    """Test hierarchical names follow renamed and re-parented nodes."""
+    from skidl.tools.kicad_sheetpath import gen_sheetpath, gen_sheetpath_tstamp
+
+    with Group("outer") as outer:
+        with Group("inner") as inner:
+            r = Part("Device", "R")
+    outer_name, inner_name = outer.name, inner.name
+    assert r.hiertuple == ("", outer_name, inner_name)
+    tstamp = gen_sheetpath_tstamp(r.hiertuple)
+
+    outer.name = "top"
+    assert r.hiertuple == ("", "top", inner_name)
+    assert r.hiername.startswith(".top.")
+    assert gen_sheetpath(r.hiertuple) == f"/top/{inner_name}/"
+    assert gen_sheetpath_tstamp(r.hiertuple) != tstamp
+
+    inner.tag = "sub"
+    assert r.hiertuple == ("", "top", "sub")
+    inner.parent = outer.parent
+    assert r.hiertuple == ("", "sub")
+
+    # Going back to the original names gives the same timestamp as before.
+    inner.parent = outer
+    outer.name = outer_name
+    inner.tag = None
+    assert gen_sheetpath_tstamp(r.hiertuple) == tstamp
+
+
+def test_hierarchical_names_5():
+    """Test the sheet path caches are cleared when the circuit is reset."""
+    from skidl.tools.kicad_sheetpath import gen_sheetpath, gen_sheetpath_tstamp
+
+    with Group("outer"):
+        r = Part("Device", "R")
+    hiertuple = r.hiertuple
+    tstamp = gen_sheetpath_tstamp(hiertuple)
+    gen_sheetpath(hiertuple)
+    assert gen_sheetpath.cache_info().currsize > 0
+    assert gen_sheetpath_tstamp.cache_info().maxsize is not None
+
+    default_circuit.reset()
+    assert gen_sheetpath.cache_info().currsize == 0
+    assert gen_sheetpath_tstamp.cache_info().currsize == 0
+
+    # The timestamps are regenerated identically after the reset.
+    assert gen_sheetpath_tstamp(hiertuple) == tstamp
+
+
 def test_group_1():
     """Test the grouping of parts in a circuit."""
     
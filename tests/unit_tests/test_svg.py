@@ -448,3 +448,98 @@ def test_svg_12():
 
     ERC()  # Run error checks.
     generate_svg()
+
+
+def svg_tool_module():
+    """Return the module of a tool whose SVG symbols are cached or skip the test."""
+    import skidl
+    from skidl.tools import tool_modules
+
+    tool = skidl.get_default_tool()
+    if tool not in ("kicad6", "kicad7", "kicad8", "kicad9"):
+        pytest.skip(f"SVG symbols aren't cached for {tool}.")
+    return tool_modules[tool].gen_svg
+
+
+def test_svg_symbol_cache(tmp_path, monkeypatch):
+    """Test the SVG for part symbols is reused from memory and from the cache directory."""
+    import skidl
+    from skidl.tools.kicad_svg_cache import svg_symbol_cache
+
+    gen_svg = svg_tool_module()
+    monkeypatch.setattr(skidl.config, "svg_cache_dir", str(tmp_path))
+    svg_symbol_cache.clear()
+
+    drawn = []
+    gen_svg_unit = gen_svg.gen_svg_unit
+
+    def count_units(part, unit_num, *args):
+        drawn.append((part.ref, unit_num))
+        return gen_svg_unit(part, unit_num, *args)
+
+    monkeypatch.setattr(gen_svg, "gen_svg_unit", count_units)
+
+    r1, r2, r3 = Part("Device", "R", dest=TEMPLATE) * 3
+    vin, gnd = Net("VIN"), Net("GND")
+    r1[1, 2] += vin, gnd
+    r2[1, 2] += vin, gnd
+    r3[1] += vin
+
+    svg1 = r1.generate_svg_component(symtx="H", net_stubs=[gnd])
+    assert drawn == [("R1", 1)]
+    assert 's:type="R_R1_1_H"' in svg1 and "GND" in svg1
+    assert len(list(tmp_path.glob("*.svg"))) == 1
+
+    # A part connected the same way reuses the SVG with its own symbol name.
+    svg2 = r2.generate_svg_component(symtx="H", net_stubs=[gnd])
+    assert drawn == [("R1", 1)]
+    assert svg2 == svg1.replace("R_R1_1_H", "R_R2_1_H")
+
+    # A different transformation or different connections need new SVG.
+    r1.generate_svg_component(symtx="V", net_stubs=[gnd])
+    r3.generate_svg_component(symtx="H", net_stubs=[gnd])
+    r1.generate_svg_component(symtx="H", net_stubs=[vin])
+    assert drawn == [("R1", 1), ("R1", 1), ("R3", 1), ("R1", 1)]
+
+    # The SVG stored in the cache directory is used by later runs.
+    svg_symbol_cache.clear()
+    assert r2.generate_svg_component(symtx="H", net_stubs=[gnd]) == svg2
+    assert len(drawn) == 4
+
+    # Without a cache directory, the SVG is the same.
+    monkeypatch.setattr(skidl.config, "svg_cache_dir", None)
+    svg_symbol_cache.clear()
+    assert r2.generate_svg_component(symtx="H", net_stubs=[gnd]) == svg2
+    assert len(drawn) == 5
+    svg_symbol_cache.clear()
+
+
+def test_svg_single_pass(monkeypatch):
+    """Test the symbol SVG starts at (0,0) and has the size of the bounding box of its shapes."""
+    import re
+
+    import skidl
+    from skidl.geometry import BBox, Tx, tx_flip_y
+    from skidl.tools.kicad_svg_cache import svg_symbol_cache
+
+    gen_svg = svg_tool_module()
+    monkeypatch.setattr(skidl.config, "svg_cache_dir", None)
+    svg_symbol_cache.clear()
+
+    opamp = Part("Amplifier_Operational", "LM358")
+    opamp.uA.p1 += Net("OUT")
+    opamp.uA.p2 += Net("IN")
+    for symtx in ("", "H", "V", "R", "L", "HR"):
+        svg = opamp.generate_svg_component(symtx=symtx, net_stubs=[opamp.uA.p2.net])
+        units = re.findall(r'<g s:type="[^"]*" s:width="([^"]*)" s:height="([^"]*)"', svg)
+        assert len(units) == len(opamp.unit)
+        tx = Tx.from_symtx(symtx) * tx_flip_y * (96 / 25.4 * 2.54)
+        for (width, height), unit in zip(units, opamp.unit.values()):
+            bbox = BBox()
+            for cmd in opamp.draw_cmds[unit.num]:
+                bbox.add(gen_svg.draw_cmd_to_svg(cmd, tx, opamp, [opamp.uA.p2.net], len("IN"))[1])
+            assert float(width) == pytest.approx(bbox.w, abs=0.001)
+            assert float(height) == pytest.approx(bbox.h, abs=0.001)
+        for x, y in re.findall(r's:x="([^"]*)" s:y="([^"]*)"', svg):
+            assert float(x) >= -0.001 and float(y) >= -0.001
+    svg_symbol_cache.clear()